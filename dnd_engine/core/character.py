@@ -1,14 +1,19 @@
 # ABOUTME: Player Character class extending Creature
 # ABOUTME: Adds class, level, XP, proficiency bonus, combat bonuses, and skill tracking
 
+import logging
 from enum import Enum
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Callable, Optional, List, Dict, Any, Tuple
 from dnd_engine.core.creature import Creature, Abilities
 from dnd_engine.core.dice import DiceRoller
-from dnd_engine.core.spell import Spell
+from dnd_engine.core.spell import Spell, is_combat_spell, is_out_of_combat_spell
+from dnd_engine.rules.item_registry import ItemRecord, ItemRegistry
+from dnd_engine.rules.spell_catalog import SpellCatalog
 from dnd_engine.systems.inventory import Inventory
 from dnd_engine.systems.resources import ResourcePool
 
+logger = logging.getLogger(__name__)
+
 
 class CharacterClass(Enum):
     """Available character classes"""
@@ -28,8 +33,38 @@ class Character(Creature):
     - Proficiency bonus
     - Attack and damage bonuses
     - Inventory management
+
+    Derived combat stats (attack/damage bonus per weapon, save modifier per
+    ability, skill modifiers, spell attack/save DC) are cached. Reassigning
+    an input attribute (level, abilities, proficiency lists, spellcasting
+    ability, inventory), equipping or unequipping, and adding or removing
+    conditions invalidate the cache. In-place edits (e.g., changing an
+    ability score or appending a proficiency) must call
+    invalidate_derived_stats(); set verify_derived_stats to check every
+    cached value against a fresh computation.
     """
 
+    # Ad-hoc extension attributes (e.g., tool_proficiencies) go in __dict__, which is
+    # only allocated when one is set
+    __slots__ = (
+        "character_class", "level", "xp", "race", "subclass", "inventory",
+        "saving_throw_proficiencies", "skill_proficiencies", "expertise_skills",
+        "weapon_proficiencies", "armor_proficiencies", "resource_pools",
+        "spellcasting_ability", "known_spells", "prepared_spells",
+        "death_save_successes", "death_save_failures", "stabilized", "darkvision_range",
+        "_derived_stats", "_derived_equipment_version", "__dict__"
+    )
+
+    # Attributes whose reassignment invalidates the derived-stat cache
+    _DERIVED_STAT_INPUTS = frozenset({
+        "level", "abilities", "saving_throw_proficiencies", "skill_proficiencies",
+        "expertise_skills", "weapon_proficiencies", "armor_proficiencies",
+        "spellcasting_ability", "inventory"
+    })
+
+    # Debug switch: recompute cached stats on every lookup and log stale entries
+    verify_derived_stats = False
+
     def __init__(
         self,
         name: str,
@@ -76,6 +111,10 @@ class Character(Creature):
             known_spells: List of spell IDs the character knows
             prepared_spells: List of spell IDs the character has prepared
         """
+        # Derived stat cache: key -> (data the stat was computed from, value)
+        self._derived_stats: Dict[tuple, Tuple[Any, int]] = {}
+        self._derived_equipment_version = 0
+
         super().__init__(
             name=name,
             max_hp=max_hp,
@@ -111,6 +150,63 @@ class Character(Creature):
         # Darkvision range in feet (0 if no darkvision)
         self.darkvision_range: int = 0
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in Character._DERIVED_STAT_INPUTS:
+            self._derived_stats.clear()
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+        # The cache holds references to items/skills data; don't copy or pickle it
+        state = super().__getstate__()
+        dict_state, slot_state = state if isinstance(state, tuple) else (state, {})
+        slot_state = dict(slot_state or {})
+        slot_state["_derived_stats"] = {}
+        return dict_state, slot_state
+
+    def __setstate__(self, state: Tuple[Optional[Dict[str, Any]], Dict[str, Any]]) -> None:
+        dict_state, slot_state = state
+        if dict_state:
+            self.__dict__.update(dict_state)
+        for name, value in slot_state.items():
+            object.__setattr__(self, name, value)
+
+    def invalidate_derived_stats(self) -> None:
+        """Drop every cached derived stat (call after editing abilities or proficiency lists in place)."""
+        self._derived_stats.clear()
+
+    def _derived_stat(self, key: tuple, source: Any, compute: Callable[..., int], *args: Any) -> int:
+        """
+        Get a derived stat from the cache, computing it on a miss.
+
+        Args:
+            key: Cache key: stat name plus weapon, skill or ability
+            source: Data the stat is computed from (a different object is a miss)
+            compute: Computes the stat from scratch
+            *args: Arguments for compute
+
+        Returns:
+            The stat value
+        """
+        if self._derived_equipment_version != self.inventory.equipment_version:
+            self._derived_stats.clear()
+            self._derived_equipment_version = self.inventory.equipment_version
+
+        cached = self._derived_stats.get(key)
+        if cached is not None and cached[0] is source:
+            if not Character.verify_derived_stats:
+                return cached[1]
+            value = compute(*args)
+            if value != cached[1]:
+                logger.warning(
+                    "Stale derived stat %s for %s: cached %s, actual %s",
+                    key, self.name, cached[1], value
+                )
+        else:
+            value = compute(*args)
+
+        self._derived_stats[key] = (source, value)
+        return value
+
     @property
     def proficiency_bonus(self) -> int:
         """
@@ -168,6 +264,10 @@ class Character(Creature):
         Raises:
             ValueError: If ability name is invalid
         """
+        return self._derived_stat(("save", ability.lower()), None, self._compute_saving_throw_modifier, ability)
+
+    def _compute_saving_throw_modifier(self, ability: str) -> int:
+        """Compute the saving throw modifier for an ability (uncached)."""
         # Map short ability names to full names and vice versa
         short_to_full = {
             "str": "strength", "dex": "dexterity", "con": "constitution",
@@ -261,10 +361,10 @@ class Character(Creature):
             ability_short = full_to_short[ability_lower]
         else:
             raise ValueError(f"Invalid ability name: {ability}")
+        advantage, disadvantage = self.save_roll_mode(ability_short, advantage, disadvantage)
 
         # Roll the saving throw
-        roller = DiceRoller()
-        roll_result = roller.roll("d20", advantage=advantage, disadvantage=disadvantage)
+        roll_result = self._dice_roller.roll("d20", advantage=advantage, disadvantage=disadvantage)
 
         # Get the saving throw modifier
         modifier = self.get_saving_throw_modifier(ability)
@@ -273,7 +373,7 @@ class Character(Creature):
         total = roll_result.total + modifier
 
         # Determine success
-        success = total >= dc
+        success = total >= dc and not self.auto_fails_save(ability_short)
 
         # Create result dict
         result = {
@@ -328,7 +428,7 @@ class Character(Creature):
         ability_mod = max(self.abilities.str_mod, self.abilities.dex_mod)
         return self.proficiency_bonus + ability_mod
 
-    def get_attack_bonus(self, weapon_id: str, items_data: dict) -> int:
+    def get_attack_bonus(self, weapon_id: str, items_data: ItemRegistry | dict) -> int:
         """
         Get appropriate attack bonus based on equipped weapon properties.
 
@@ -340,7 +440,7 @@ class Character(Creature):
 
         Args:
             weapon_id: ID of the weapon (e.g., "longsword", "longbow")
-            items_data: Dictionary of all items data from items.json
+            items_data: ItemRegistry or dictionary of all items data from items.json
 
         Returns:
             Attack bonus for the weapon (includes proficiency bonus only if proficient)
@@ -348,22 +448,20 @@ class Character(Creature):
         Raises:
             KeyError: If weapon_id doesn't exist in items_data
         """
-        # Get weapon data from items.json
-        weapon_data = items_data.get("weapons", {}).get(weapon_id)
-        if not weapon_data:
-            raise KeyError(f"Weapon '{weapon_id}' not found in items data")
+        return self._derived_stat(("attack", weapon_id), items_data, self._compute_attack_bonus, weapon_id, items_data)
 
-        properties = weapon_data.get("properties", [])
-        category = weapon_data.get("category", "melee")
+    def _compute_attack_bonus(self, weapon_id: str, items_data: ItemRegistry | dict) -> int:
+        """Compute the attack bonus for a weapon (uncached)."""
+        weapon = self._get_weapon_record(weapon_id, items_data)
 
         # Check if character is proficient with this weapon
-        is_proficient = self.is_proficient_with_weapon(weapon_id, items_data)
+        is_proficient = self._is_proficient_with_weapon_record(weapon)
 
         # Determine attack type and base ability modifier
-        if "finesse" in properties:
+        if weapon.is_finesse:
             # Finesse weapon: use highest of STR or DEX
             ability_mod = max(self.abilities.str_mod, self.abilities.dex_mod)
-        elif category == "ranged":
+        elif weapon.is_ranged:
             # Ranged weapon: use DEX
             ability_mod = self.abilities.dex_mod
         else:
@@ -376,7 +474,7 @@ class Character(Creature):
         else:
             return ability_mod
 
-    def get_damage_bonus(self, weapon_id: str, items_data: dict) -> int:
+    def get_damage_bonus(self, weapon_id: str, items_data: ItemRegistry | dict) -> int:
         """
         Get damage bonus based on weapon properties.
 
@@ -385,7 +483,7 @@ class Character(Creature):
 
         Args:
             weapon_id: ID of the weapon (e.g., "longsword", "longbow")
-            items_data: Dictionary of all items data from items.json
+            items_data: ItemRegistry or dictionary of all items data from items.json
 
         Returns:
             Damage bonus modifier for the weapon
@@ -393,26 +491,24 @@ class Character(Creature):
         Raises:
             KeyError: If weapon_id doesn't exist in items_data
         """
-        # Get weapon data from items.json
-        weapon_data = items_data.get("weapons", {}).get(weapon_id)
-        if not weapon_data:
-            raise KeyError(f"Weapon '{weapon_id}' not found in items data")
+        return self._derived_stat(("damage", weapon_id), items_data, self._compute_damage_bonus, weapon_id, items_data)
 
-        properties = weapon_data.get("properties", [])
-        category = weapon_data.get("category", "melee")
+    def _compute_damage_bonus(self, weapon_id: str, items_data: ItemRegistry | dict) -> int:
+        """Compute the damage bonus for a weapon (uncached)."""
+        weapon = self._get_weapon_record(weapon_id, items_data)
 
         # Determine damage bonus based on weapon type
-        if "finesse" in properties:
+        if weapon.is_finesse:
             # Finesse weapon: use highest of STR or DEX
             return max(self.abilities.str_mod, self.abilities.dex_mod)
-        elif category == "ranged":
+        elif weapon.is_ranged:
             # Ranged weapon: use DEX
             return self.abilities.dex_mod
         else:
             # Standard melee: use STR
             return self.abilities.str_mod
 
-    def is_proficient_with_weapon(self, weapon_id: str, items_data: dict) -> bool:
+    def is_proficient_with_weapon(self, weapon_id: str, items_data: ItemRegistry | dict) -> bool:
         """
         Check if character is proficient with a weapon.
 
@@ -422,7 +518,7 @@ class Character(Creature):
 
         Args:
             weapon_id: ID of the weapon (e.g., "longsword", "dagger")
-            items_data: Dictionary of all items data from items.json
+            items_data: ItemRegistry or dictionary of all items data from items.json
 
         Returns:
             True if character is proficient with the weapon, False otherwise
@@ -430,16 +526,43 @@ class Character(Creature):
         Raises:
             KeyError: If weapon_id doesn't exist in items_data
         """
-        weapon_data = items_data.get("weapons", {}).get(weapon_id)
-        if not weapon_data:
-            raise KeyError(f"Weapon '{weapon_id}' not found in items data")
+        return self._is_proficient_with_weapon_record(self._get_weapon_record(weapon_id, items_data))
 
-        weapon_type = weapon_data.get("weapon_type", "")
+    def _is_proficient_with_weapon_record(self, weapon: ItemRecord) -> bool:
+        """Check weapon proficiency against a compiled weapon record."""
+        weapon_id = weapon.item_id
+        weapon_type = weapon.weapon_type or ""
         # Check both weapon type (e.g., "martial") and specific weapon name (e.g., "rapiers")
         # Convert weapon_id to plural form for comparison (e.g., "rapier" -> "rapiers")
         weapon_name_plural = f"{weapon_id}s" if not weapon_id.endswith('s') else weapon_id
         return weapon_type in self.weapon_proficiencies or weapon_name_plural in self.weapon_proficiencies
 
+    @staticmethod
+    def _get_weapon_record(weapon_id: str, items_data: ItemRegistry | dict) -> ItemRecord:
+        """
+        Resolve a weapon to its compiled record.
+
+        Uses the registry's precompiled record when given an ItemRegistry and
+        compiles the definition on the fly for a plain items.json dict.
+
+        Args:
+            weapon_id: ID of the weapon
+            items_data: ItemRegistry or dictionary of all items data from items.json
+
+        Returns:
+            ItemRecord for the weapon
+
+        Raises:
+            KeyError: If weapon_id doesn't exist in items_data
+        """
+        if isinstance(items_data, ItemRegistry):
+            return items_data.get_weapon(weapon_id)
+
+        weapon_data = items_data.get("weapons", {}).get(weapon_id)
+        if not weapon_data:
+            raise KeyError(f"Weapon '{weapon_id}' not found in items data")
+        return ItemRecord.compile(weapon_id, "weapons", weapon_data)
+
     def is_proficient_with_armor(self, armor_id: str, items_data: dict) -> bool:
         """
         Check if character is proficient with armor.
@@ -499,6 +622,9 @@ class Character(Creature):
 
         return False
 
+    def _conditions_changed(self) -> None:
+        self._derived_stats.clear()
+
     def _level_up(self, data_loader, event_bus=None) -> None:
         """
         Perform level-up: increase level, HP, and grant class features.
@@ -518,6 +644,7 @@ class Character(Creature):
 
         # Grant class features for new level
         self._grant_class_features(data_loader, event_bus)
+        self.invalidate_derived_stats()
 
         # Emit level-up event
         if event_bus is not None:
@@ -617,6 +744,10 @@ class Character(Creature):
         Raises:
             KeyError: If skill is not found in skills_data
         """
+        return self._derived_stat(("skill", skill), skills_data, self._compute_skill_modifier, skill, skills_data)
+
+    def _compute_skill_modifier(self, skill: str, skills_data: dict) -> int:
+        """Compute the modifier for a skill (uncached)."""
         if skill not in skills_data:
             raise KeyError(f"Unknown skill: {skill}")
 
@@ -1419,6 +1550,10 @@ class Character(Creature):
         Raises:
             ValueError: If character has no spellcasting ability
         """
+        return self._derived_stat(("spell_attack",), None, self._compute_spell_attack_modifier)
+
+    def _compute_spell_attack_modifier(self) -> int:
+        """Compute the spell attack modifier (uncached)."""
         if self.spellcasting_ability is None:
             raise ValueError(f"{self.name} has no spellcasting ability")
 
@@ -1439,6 +1574,10 @@ class Character(Creature):
         Raises:
             ValueError: If character has no spellcasting ability
         """
+        return self._derived_stat(("spell_save_dc",), None, self._compute_spell_save_dc)
+
+    def _compute_spell_save_dc(self) -> int:
+        """Compute the spell save DC (uncached)."""
         if self.spellcasting_ability is None:
             raise ValueError(f"{self.name} has no spellcasting ability")
 
@@ -1564,7 +1703,8 @@ class Character(Creature):
         (which count toward preparation limit).
 
         Args:
-            spells_data: Dictionary of all spell definitions from spells.json
+            spells_data: SpellCatalog (indexed lookup) or dictionary of all
+                spell definitions from spells.json
 
         Returns:
             Tuple of (cantrip_ids, leveled_spell_tuples) where:
@@ -1575,6 +1715,13 @@ class Character(Creature):
         if not self.known_spells:
             return ([], [])
 
+        if isinstance(spells_data, SpellCatalog):
+            known = spells_data.select(self.known_spells)
+            cantrips = [spell_id for spell_id, _ in known if spell_id in spells_data.cantrip_ids]
+            leveled_spells = [entry for entry in known if entry[0] not in spells_data.cantrip_ids]
+            leveled_spells.sort(key=lambda x: spells_data.sort_key(x[0]))
+            return (cantrips, leveled_spells)
+
         cantrips = []
         leveled_spells = []
 
@@ -1594,6 +1741,23 @@ class Character(Creature):
 
         return (cantrips, leveled_spells)
 
+    def _get_castable_spell_list(self) -> List[str]:
+        """
+        Get the spell list the character casts from.
+
+        Prepared casters (Wizard, Cleric) cast from prepared_spells; known casters
+        (future: Sorcerer, Bard, Warlock, Ranger) cast from known_spells directly.
+
+        Returns:
+            List of spell IDs
+        """
+        prepared_caster_classes = {CharacterClass.WIZARD, CharacterClass.CLERIC}
+
+        if self.character_class in prepared_caster_classes:
+            return self.prepared_spells if self.prepared_spells else []
+        # Known casters or non-casters
+        return self.known_spells if self.known_spells else []
+
     def get_castable_spells(self, spells_data: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
         """
         Get all spells the character can cast in combat.
@@ -1603,7 +1767,8 @@ class Character(Creature):
         spells, and reaction spells.
 
         Args:
-            spells_data: Dictionary of all spell definitions from spells.json
+            spells_data: SpellCatalog (indexed lookup) or dictionary of all
+                spell definitions from spells.json
 
         Returns:
             List of (spell_id, spell_data) tuples for castable spells
@@ -1614,37 +1779,21 @@ class Character(Creature):
             - UI should indicate when spell slots are unavailable
             - Excludes out-of-combat rituals and non-combat utility spells
         """
-        # Determine which spell list to use based on class
-        # Prepared casters (Wizard, Cleric) use prepared_spells
-        # Known casters (future: Sorcerer, Bard, Warlock, Ranger) use known_spells directly
-        prepared_caster_classes = {CharacterClass.WIZARD, CharacterClass.CLERIC}
+        spell_list = self._get_castable_spell_list()
 
-        if self.character_class in prepared_caster_classes:
-            spell_list = self.prepared_spells if self.prepared_spells else []
+        # Include spell if it has any of these combat-relevant properties:
+        # 1. Has an attack roll (spell attack)
+        # 2. Has a saving throw (AoE, debuff, etc.)
+        # 3. Has damage (even if no attack/save, like Magic Missile)
+        # 4. Is a reaction spell (Shield, Counterspell, etc.)
+        if isinstance(spells_data, SpellCatalog):
+            castable = spells_data.select(spell_list, spells_data.combat_ids)
         else:
-            # Known casters or non-casters
-            spell_list = self.known_spells if self.known_spells else []
-
-        castable = []
-        for spell_id in spell_list:
-            spell_data = spells_data.get(spell_id)
-            if not spell_data:
-                continue
-
-            # Include spell if it has any of these combat-relevant properties:
-            # 1. Has an attack roll (spell attack)
-            # 2. Has a saving throw (AoE, debuff, etc.)
-            # 3. Has damage (even if no attack/save, like Magic Missile)
-            # 4. Is a reaction spell (Shield, Counterspell, etc.)
-
-            has_attack = spell_data.get("attack_type") is not None
-            has_save = spell_data.get("saving_throw_type") is not None
-            has_damage = spell_data.get("damage") is not None
-            is_reaction = spell_data.get("casting_time") == "1 reaction"
-
-            # Include if combat-relevant
-            if has_attack or has_save or has_damage or is_reaction:
-                castable.append((spell_id, spell_data))
+            castable = []
+            for spell_id in spell_list:
+                spell_data = spells_data.get(spell_id)
+                if spell_data and is_combat_spell(spell_data):
+                    castable.append((spell_id, spell_data))
 
         # Sort by spell level (cantrips first, then by level)
         castable.sort(key=lambda x: x[1].get("level", 0))
@@ -1660,7 +1809,8 @@ class Character(Creature):
         utility spells, ritual spells, and buff spells.
 
         Args:
-            spells_data: Dictionary of all spell definitions from spells.json
+            spells_data: SpellCatalog (indexed lookup) or dictionary of all
+                spell definitions from spells.json
 
         Returns:
             List of (spell_id, spell_data) tuples for out-of-combat spells
@@ -1671,39 +1821,21 @@ class Character(Creature):
             - UI should indicate when spell slots are unavailable
             - Excludes pure combat spells (attack/damage only with no other utility)
         """
-        # Determine which spell list to use based on class
-        prepared_caster_classes = {CharacterClass.WIZARD, CharacterClass.CLERIC}
+        spell_list = self._get_castable_spell_list()
 
-        if self.character_class in prepared_caster_classes:
-            spell_list = self.prepared_spells if self.prepared_spells else []
+        # Include spell if it has any of these out-of-combat properties:
+        # 1. Has healing (Cure Wounds, Healing Word, etc.)
+        # 2. Is a ritual spell (Detect Magic, Identify, etc.)
+        # 3. Has utility effects (Light, Mage Armor - any spell without attack/damage)
+        # 4. Has buffs (Bless, Shield of Faith - duration-based beneficial spells)
+        if isinstance(spells_data, SpellCatalog):
+            out_of_combat = spells_data.select(spell_list, spells_data.out_of_combat_ids)
         else:
-            # Known casters or non-casters
-            spell_list = self.known_spells if self.known_spells else []
-
-        out_of_combat = []
-        for spell_id in spell_list:
-            spell_data = spells_data.get(spell_id)
-            if not spell_data:
-                continue
-
-            # Include spell if it has any of these out-of-combat properties:
-            # 1. Has healing (Cure Wounds, Healing Word, etc.)
-            # 2. Is a ritual spell (Detect Magic, Identify, etc.)
-            # 3. Has utility effects (Light, Mage Armor - any spell without attack/damage)
-            # 4. Has buffs (Bless, Shield of Faith - duration-based beneficial spells)
-
-            has_healing = spell_data.get("healing") is not None
-            is_ritual = spell_data.get("ritual") is True
-            has_attack = spell_data.get("attack_type") is not None
-            has_damage = spell_data.get("damage") is not None
-
-            # Utility spell: no attack and no damage (includes Light, Detect Magic, Mage Armor, etc.)
-            is_utility = not has_attack and not has_damage
-
-            # Include if it's useful outside combat
-            # (healing, ritual, or utility - basically anything except pure attack/damage spells)
-            if has_healing or is_ritual or is_utility:
-                out_of_combat.append((spell_id, spell_data))
+            out_of_combat = []
+            for spell_id in spell_list:
+                spell_data = spells_data.get(spell_id)
+                if spell_data and is_out_of_combat_spell(spell_data):
+                    out_of_combat.append((spell_id, spell_data))
 
         # Sort by spell level (cantrips first, then by level)
         out_of_combat.sort(key=lambda x: x[1].get("level", 0))
@@ -2,13 +2,17 @@
 # ABOUTME: Handles attack rolls, critical hits, damage calculation, and applying damage to creatures
 
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
-from dnd_engine.core.dice import DiceRoller
+from fractions import Fraction
+from typing import Dict, Any, List, Optional, Tuple
+from dnd_engine.core.dice import DiceRoller, compile_dice
+from dnd_engine.core.dice_distribution import AttackOdds, Distribution, attack_odds, crit_chance, hit_chance
 from dnd_engine.core.creature import Creature
+from dnd_engine.core.squad import SquadMember
+from dnd_engine.rules.condition_table import resolve_attack_advantage
 from dnd_engine.utils.events import Event, EventType
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackResult:
     """
     Result of an attack roll.
@@ -122,6 +126,9 @@ class CombatEngine:
         Returns:
             AttackResult containing full attack details including sneak attack if applicable
         """
+        # Conditions on either side add advantage/disadvantage (e.g., attacking a paralyzed target)
+        advantage, disadvantage = resolve_attack_advantage(attacker, defender, advantage, disadvantage)
+
         # Roll attack (1d20 + bonus)
         attack_roll_result = self.dice_roller.roll(
             "1d20",
@@ -208,6 +215,92 @@ class CombatEngine:
             sneak_attack_dice=sneak_attack_dice
         )
 
+    def get_hit_chance(
+        self,
+        attack_bonus: int,
+        target_ac: int,
+        advantage: bool = False,
+        disadvantage: bool = False
+    ) -> Fraction:
+        """
+        Get the exact chance that an attack hits, using the same rules as resolve_attack.
+
+        Args:
+            attack_bonus: Total attack bonus
+            target_ac: Defender's armor class
+            advantage: Attack with advantage
+            disadvantage: Attack with disadvantage
+
+        Returns:
+            Probability of a hit (including critical hits)
+        """
+        return hit_chance(target_ac, attack_bonus, advantage, disadvantage)
+
+    def get_crit_chance(self, advantage: bool = False, disadvantage: bool = False) -> Fraction:
+        """
+        Get the exact chance of a critical hit.
+
+        Args:
+            advantage: Attack with advantage
+            disadvantage: Attack with disadvantage
+
+        Returns:
+            Probability of a natural 20
+        """
+        return crit_chance(advantage, disadvantage)
+
+    def get_damage_distribution(
+        self,
+        attack_bonus: int,
+        target_ac: int,
+        damage_dice: str,
+        advantage: bool = False,
+        disadvantage: bool = False
+    ) -> Distribution:
+        """
+        Get the exact distribution of damage dealt by one attack (0 on a miss).
+
+        Args:
+            attack_bonus: Total attack bonus
+            target_ac: Defender's armor class
+            damage_dice: Damage dice notation (e.g., "1d8+3")
+            advantage: Attack with advantage
+            disadvantage: Attack with disadvantage
+
+        Returns:
+            Damage distribution, including doubled dice on critical hits
+        """
+        return self.get_attack_odds(attack_bonus, target_ac, damage_dice, advantage, disadvantage).damage
+
+    def get_attack_odds(
+        self,
+        attack_bonus: int,
+        target_ac: int,
+        damage_dice: str,
+        advantage: bool = False,
+        disadvantage: bool = False
+    ) -> AttackOdds:
+        """
+        Get hit chance, crit chance, and damage distribution for an attack.
+
+        Computed exactly rather than by simulation and memoized per
+        (damage dice, AC, attack bonus), so the UI can show odds cheaply.
+
+        Args:
+            attack_bonus: Total attack bonus
+            target_ac: Defender's armor class
+            damage_dice: Damage dice notation (e.g., "1d8+3")
+            advantage: Attack with advantage
+            disadvantage: Attack with disadvantage
+
+        Returns:
+            AttackOdds for the attack
+
+        Raises:
+            ValueError: If damage_dice is invalid
+        """
+        return attack_odds(damage_dice, target_ac, attack_bonus, advantage, disadvantage)
+
     def _calculate_damage(self, damage_dice: str, critical_hit: bool) -> int:
         """
         Calculate damage from dice notation.
@@ -233,7 +326,7 @@ class CombatEngine:
         """
         Double the dice for a critical hit.
 
-        Converts "1d8+3" to "2d8+3", "2d6+2" to "4d6+2", etc.
+        Converts "1d8+3" to "2d8+3", "1d8+2d6+3" to "2d8+4d6+3", etc.
 
         Args:
             damage_dice: Original damage dice notation
@@ -241,27 +334,12 @@ class CombatEngine:
         Returns:
             Modified notation with doubled dice
         """
-        # Parse the dice notation
-        import re
-        pattern = re.compile(r'^(\d*)d(\d+)(([+-])(\d+))?$', re.IGNORECASE)
-        match = pattern.match(damage_dice.strip())
-
-        if not match:
+        try:
+            return compile_dice(damage_dice).crit().notation
+        except ValueError:
             # If we can't parse it, just return the original
             return damage_dice
 
-        # Extract components
-        count_str = match.group(1)
-        count = int(count_str) if count_str else 1
-        sides = match.group(2)
-        modifier_part = match.group(3) if match.group(3) else ""
-
-        # Double the count
-        doubled_count = count * 2
-
-        # Reconstruct the notation
-        return f"{doubled_count}d{sides}{modifier_part}"
-
     def resolve_saving_throw_effect(
         self,
         target: Creature,
@@ -554,10 +632,14 @@ class CombatEngine:
 
         Handles spell save mechanics:
         1. Calculate caster's spell save DC
-        2. Each target makes a saving throw
-        3. Roll damage for the spell
+        2. Roll damage for the spell
+        3. Roll every target's saving throw, batched by advantage/disadvantage
         4. Apply damage based on save result (full, half, or none)
-        5. Emit spell save events
+        5. Emit a single SPELL_SAVE event with per-target results
+
+        Targets don't roll through make_saving_throw, so no per-target
+        SAVING_THROW events are emitted. Squad members are damaged with one
+        vectorized update per squad.
 
         Args:
             caster: The creature casting the spell (must have get_spell_save_dc method)
@@ -636,53 +718,66 @@ class CombatEngine:
         # Roll damage once for the spell
         base_damage = self._roll_spell_save_damage(spell, damage_info, spell_level, actual_level)
 
-        # Process each target
-        target_results = []
-        for target in targets:
-            # Target makes saving throw
-            save_result = target.make_saving_throw(
-                ability=save_ability,
-                dc=save_dc,
-                advantage=False,
-                disadvantage=False,
-                event_bus=event_bus
+        # Gather every target's save modifier, then roll the d20s in one batch per
+        # roll mode (conditions such as restrained impose disadvantage)
+        save_ability_short = save_ability.lower()[:3]
+        modifiers = [target.get_saving_throw_modifier(save_ability) for target in targets]
+        roll_groups: Dict[Tuple[bool, bool], List[int]] = {}
+        for position, target in enumerate(targets):
+            roll_groups.setdefault(target.save_roll_mode(save_ability_short), []).append(position)
+        rolls = [0] * len(targets)
+        for (advantage, disadvantage), positions in roll_groups.items():
+            group_rolls = self.dice_roller.roll_many(
+                "1d20", len(positions), advantage=advantage, disadvantage=disadvantage
             )
+            for position, roll in zip(positions, group_rolls, strict=True):
+                rolls[position] = int(roll)
+
+        # Damage by save result: full on a failure, per on_success on a success
+        if on_success == "half":
+            saved_damage = base_damage // 2
+        elif on_success == "none" or on_success == "negates":
+            saved_damage = 0
+        else:
+            saved_damage = base_damage  # Unknown effect, take full damage
 
-            # Determine damage based on save result
-            if save_result["success"]:
-                if on_success == "half":
-                    damage = base_damage // 2
-                elif on_success == "none" or on_success == "negates":
-                    damage = 0
-                else:
-                    damage = base_damage  # Unknown effect, take full damage
-            else:
-                damage = base_damage
+        if damage_info:
+            damage_type = damage_info.get("damage_type") if isinstance(damage_info, dict) else damage_info.damage_type
+        else:
+            damage_type = None
+
+        target_results = []
+        squad_damage: Dict[int, Any] = {}  # id(squad) -> (squad, member indices, damage)
+        for target, roll, modifier in zip(targets, rolls, modifiers, strict=True):
+            total = roll + modifier
+            success = total >= save_dc and not target.auto_fails_save(save_ability_short)
+            damage = saved_damage if success else base_damage
 
-            # Apply damage if requested
+            # Apply damage if requested (squad members are applied per squad below)
             if apply_damage and damage > 0:
+                if isinstance(target, SquadMember):
+                    _, members, amounts = squad_damage.setdefault(id(target.squad), (target.squad, [], []))
+                    members.append(target.index)
+                    amounts.append(damage)
                 # Check if target's take_damage accepts event_bus (Character) or not (Creature)
-                if hasattr(target.take_damage, '__code__') and 'event_bus' in target.take_damage.__code__.co_varnames:
+                elif hasattr(target.take_damage, '__code__') and 'event_bus' in target.take_damage.__code__.co_varnames:
                     target.take_damage(damage, event_bus=event_bus)
                 else:
                     target.take_damage(damage)
 
-            # Get damage type
-            if damage_info:
-                damage_type = damage_info.get("damage_type") if isinstance(damage_info, dict) else damage_info.damage_type
-            else:
-                damage_type = None
-
             target_results.append({
                 "name": target.name,
-                "roll": save_result["roll"],
-                "modifier": save_result["modifier"],
-                "total": save_result["total"],
-                "success": save_result["success"],
+                "roll": roll,
+                "modifier": modifier,
+                "total": total,
+                "success": success,
                 "damage": damage,
                 "damage_type": damage_type
             })
 
+        for squad, members, amounts in squad_damage.values():
+            squad.damage_many(members, amounts)
+
         # Emit spell save event
         if event_bus is not None:
             event = Event(
@@ -695,7 +790,10 @@ class CombatEngine:
                     "slot_level": actual_level,
                     "save_dc": save_dc,
                     "save_ability": save_ability,
-                    "targets": target_results
+                    "targets": target_results,
+                    "successes": sum(1 for result in target_results if result["success"]),
+                    "failures": sum(1 for result in target_results if not result["success"]),
+                    "total_damage": sum(result["damage"] for result in target_results)
                 }
             )
             event_bus.emit(event)
@@ -2,6 +2,28 @@
 # ABOUTME: Handles HP, abilities, conditions, damage, and healing
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from dnd_engine.rules.condition_table import ConditionEffect, get_condition_table
+
+if TYPE_CHECKING:
+    from dnd_engine.core.dice import DiceRoller
+    from dnd_engine.rules.action_table import ActionTable
+
+
+# Ability name (short or full) -> Abilities modifier property
+ABILITY_MODIFIER_ATTRIBUTES = {
+    "str": "str_mod", "strength": "str_mod",
+    "dex": "dex_mod", "dexterity": "dex_mod",
+    "con": "con_mod", "constitution": "con_mod",
+    "int": "int_mod", "intelligence": "int_mod",
+    "wis": "wis_mod", "wisdom": "wis_mod",
+    "cha": "cha_mod", "charisma": "cha_mod",
+}
+
+_INCAPACITATED = ConditionEffect.INCAPACITATED.value
+_AUTO_FAIL_STR_DEX_SAVES = ConditionEffect.AUTO_FAIL_STR_DEX_SAVES.value
+_DEX_SAVES_HAVE_DISADVANTAGE = ConditionEffect.DEX_SAVES_HAVE_DISADVANTAGE.value
 
 
 @dataclass
@@ -57,13 +79,19 @@ class Creature:
     Handles core D&D 5E mechanics: HP, AC, abilities, conditions, damage, and healing.
     """
 
+    __slots__ = (
+        "name", "max_hp", "current_hp", "ac", "abilities", "monster_id",
+        "active_conditions", "condition_mask", "_timed_condition_mask", "_dice_roller", "action_table"
+    )
+
     def __init__(
         self,
         name: str,
         max_hp: int,
         ac: int,
         abilities: Abilities,
-        current_hp: int | None = None
+        current_hp: int | None = None,
+        monster_id: str | None = None
     ):
         """
         Initialize a creature.
@@ -74,15 +102,25 @@ class Creature:
             ac: Armor class (target number for attacks)
             abilities: Ability scores (STR, DEX, CON, INT, WIS, CHA)
             current_hp: Starting HP (defaults to max_hp if not specified)
+            monster_id: ID of the monster template this creature was spawned from
         """
         self.name = name
         self.max_hp = max_hp
         self.current_hp = current_hp if current_hp is not None else max_hp
         self.ac = ac
         self.abilities = abilities
+        self.monster_id = monster_id
         # Condition tracking with metadata for duration and repeat saves
         # Maps condition name -> metadata dict
         self.active_conditions: dict[str, dict] = {}
+        # Condition bits (see ConditionTable); the timed mask holds conditions
+        # that count down or allow repeat saves at end of turn
+        self.condition_mask = 0
+        self._timed_condition_mask = 0
+        # Dice roller for saving throws (None rolls with a fresh roller each time)
+        self._dice_roller: Optional["DiceRoller"] = None
+        # Compiled attack options, set when spawned from a monster template
+        self.action_table: Optional["ActionTable"] = None
 
     @property
     def is_alive(self) -> bool:
@@ -130,8 +168,11 @@ class Creature:
             condition: Name of the condition to add
         """
         condition_name = condition.lower()
-        if condition_name not in self.active_conditions:
+        bit = get_condition_table().bit(condition_name)
+        if not self.condition_mask & bit:
             self.active_conditions[condition_name] = {}
+            self.condition_mask |= bit
+            self._conditions_changed()
 
     def apply_condition_with_metadata(
         self,
@@ -164,6 +205,13 @@ class Creature:
             "allow_repeat_save": allow_repeat_save,
             "repeat_timing": repeat_timing
         }
+        bit = get_condition_table().bit(condition_name)
+        self.condition_mask |= bit
+        if duration_type == "rounds" or allow_repeat_save:
+            self._timed_condition_mask |= bit
+        else:
+            self._timed_condition_mask &= ~bit
+        self._conditions_changed()
 
     def remove_condition(self, condition: str) -> None:
         """
@@ -173,7 +221,20 @@ class Creature:
             condition: Name of the condition to remove
         """
         condition_name = condition.lower()
-        self.active_conditions.pop(condition_name, None)
+        bit = get_condition_table().bits.get(condition_name, 0)
+        if self.condition_mask & bit:
+            del self.active_conditions[condition_name]
+            self.condition_mask &= ~bit
+            self._timed_condition_mask &= ~bit
+            self._conditions_changed()
+
+    def clear_conditions(self) -> None:
+        """Remove every condition from the creature."""
+        if self.condition_mask:
+            self.active_conditions.clear()
+            self.condition_mask = 0
+            self._timed_condition_mask = 0
+            self._conditions_changed()
 
     def has_condition(self, condition: str) -> bool:
         """
@@ -185,19 +246,32 @@ class Creature:
         Returns:
             True if the creature has the condition
         """
-        return condition.lower() in self.active_conditions
+        return bool(self.condition_mask & get_condition_table().bits.get(condition.lower(), 0))
+
+    @property
+    def condition_effects(self) -> int:
+        """Combined ConditionEffect bits of the creature's conditions."""
+        return get_condition_table().effects(self.condition_mask)
+
+    @property
+    def has_timed_conditions(self) -> bool:
+        """Check if end-of-turn processing has anything to do (durations or repeat saves)."""
+        return bool(self._timed_condition_mask)
+
+    def _conditions_changed(self) -> None:
+        """Hook called after a condition is added or removed (subclasses may cache condition-dependent state)."""
 
     def can_take_actions(self) -> bool:
         """
         Check if creature can take actions (not incapacitated).
 
-        Incapacitating conditions: paralyzed, stunned, unconscious, petrified
+        Incapacitating conditions are those with the "incapacitated" effect in
+        conditions.json (incapacitated, paralyzed, petrified, stunned, unconscious).
 
         Returns:
             True if creature can act
         """
-        incapacitating = ["paralyzed", "stunned", "unconscious", "petrified"]
-        return not any(cond in self.active_conditions for cond in incapacitating)
+        return not self.condition_effects & _INCAPACITATED
 
     def process_end_of_turn_conditions(self, event_bus=None) -> list[dict]:
         """
@@ -210,8 +284,15 @@ class Creature:
             List of dicts describing save results and expired conditions
         """
         results = []
-
-        for condition_name, metadata in list(self.active_conditions.items()):
+        if not self._timed_condition_mask:
+            return results
+
+        bits = get_condition_table().bits
+        timed = [
+            (condition_name, metadata) for condition_name, metadata in self.active_conditions.items()
+            if self._timed_condition_mask & bits[condition_name]
+        ]
+        for condition_name, metadata in timed:
             # Process repeat saves if allowed
             if metadata.get("allow_repeat_save") and metadata.get("repeat_timing") == "end_of_turn":
                 if metadata.get("dc") and metadata.get("ability"):
@@ -254,6 +335,57 @@ class Creature:
         """
         return set(self.active_conditions.keys())
 
+    def get_saving_throw_modifier(self, ability: str) -> int:
+        """
+        Get the saving throw modifier for an ability.
+
+        Creatures save with the plain ability modifier. Characters override
+        this to add proficiency bonuses.
+
+        Args:
+            ability: Ability name, short or full (e.g., "dex", "dexterity")
+
+        Returns:
+            Saving throw modifier
+
+        Raises:
+            ValueError: If ability name is invalid
+        """
+        attribute = ABILITY_MODIFIER_ATTRIBUTES.get(ability.lower())
+        if attribute is None:
+            raise ValueError(f"Invalid ability name: {ability}")
+        return getattr(self.abilities, attribute)
+
+    def auto_fails_save(self, ability: str) -> bool:
+        """
+        Check if the creature's conditions make it fail a saving throw automatically.
+
+        Args:
+            ability: Ability, short form (e.g., "dex")
+
+        Returns:
+            True for Strength/Dexterity saves while paralyzed, petrified, stunned or unconscious
+        """
+        return ability in ("str", "dex") and bool(self.condition_effects & _AUTO_FAIL_STR_DEX_SAVES)
+
+    def save_roll_mode(self, ability: str, advantage: bool = False, disadvantage: bool = False) -> tuple[bool, bool]:
+        """
+        Apply condition disadvantage to a saving throw (advantage and disadvantage cancel).
+
+        Args:
+            ability: Ability, short form (e.g., "dex")
+            advantage: Advantage from other sources
+            disadvantage: Disadvantage from other sources
+
+        Returns:
+            Tuple of (advantage, disadvantage) to roll the save with
+        """
+        if ability == "dex" and self.condition_effects & _DEX_SAVES_HAVE_DISADVANTAGE:
+            disadvantage = True
+        if advantage and disadvantage:
+            return False, False
+        return advantage, disadvantage
+
     def make_saving_throw(
         self,
         ability: str,
@@ -308,6 +440,7 @@ class Creature:
             ability_full = ability_lower
         else:
             raise ValueError(f"Invalid ability name: {ability}")
+        advantage, disadvantage = self.save_roll_mode(ability_short, advantage, disadvantage)
 
         # Get ability modifier
         if ability_full == "strength":
@@ -326,14 +459,14 @@ class Creature:
             raise ValueError(f"Invalid ability name: {ability}")
 
         # Roll the saving throw
-        roller = DiceRoller()
+        roller = self._dice_roller or DiceRoller()
         roll_result = roller.roll("d20", advantage=advantage, disadvantage=disadvantage)
 
         # Calculate total
         total = roll_result.total + modifier
 
         # Determine success
-        success = total >= dc
+        success = total >= dc and not self.auto_fails_save(ability_short)
 
         # Create result dict
         result = {
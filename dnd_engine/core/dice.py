@@ -4,10 +4,17 @@
 import re
 import random
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple
 
+np: Any
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch rolls fall back to pure Python
+    np = None
 
-@dataclass
+
+@dataclass(slots=True)
 class DiceRoll:
     """
     Represents the result of a dice roll.
@@ -56,6 +63,187 @@ class DiceRoll:
         return f"{self.notation}{adv_status}: {self.rolls} + {self.modifier} = {self.total}"
 
 
+@dataclass(frozen=True)
+class DiceTerm:
+    """
+    A group of identical dice in an expression (e.g., the "2d6" in "1d8+2d6+3").
+
+    Attributes:
+        count: Number of dice
+        sides: Number of sides on each die
+        sign: 1 to add the dice, -1 to subtract them
+    """
+    count: int
+    sides: int
+    sign: int = 1
+
+    def __str__(self) -> str:
+        return f"{self.count}d{self.sides}"
+
+
+@dataclass(frozen=True)
+class DiceExpression:
+    """
+    Immutable, parsed dice expression.
+
+    Built by compile_dice, which caches one instance per notation string, so
+    the notation is parsed once no matter how often it's rolled.
+
+    Attributes:
+        notation: Notation the expression was compiled from
+        terms: Dice groups in the expression
+        modifier: Sum of the flat modifiers
+    """
+    notation: str
+    terms: Tuple[DiceTerm, ...]
+    modifier: int
+
+    @property
+    def canonical(self) -> str:
+        """Normalized notation (e.g., "1d8+2d6+3")."""
+        parts = []
+        for term in self.terms:
+            if term.sign < 0:
+                parts.append(f"-{term}")
+            elif parts:
+                parts.append(f"+{term}")
+            else:
+                parts.append(str(term))
+        return format_dice_with_modifier("".join(parts), self.modifier)
+
+    @property
+    def is_single_die(self) -> bool:
+        """True for one added die plus an optional modifier (e.g., "1d20+5")."""
+        return len(self.terms) == 1 and self.terms[0].count == 1 and self.terms[0].sign > 0
+
+    @property
+    def dice_count(self) -> int:
+        """Total number of dice rolled."""
+        return sum(term.count for term in self.terms)
+
+    @property
+    def min(self) -> int:
+        """Lowest possible total."""
+        return self.modifier + sum(
+            term.count if term.sign > 0 else -term.count * term.sides
+            for term in self.terms
+        )
+
+    @property
+    def max(self) -> int:
+        """Highest possible total."""
+        return self.modifier + sum(
+            term.count * term.sides if term.sign > 0 else -term.count
+            for term in self.terms
+        )
+
+    @property
+    def mean(self) -> float:
+        """Expected total."""
+        return self.modifier + sum(
+            term.sign * term.count * (term.sides + 1) / 2
+            for term in self.terms
+        )
+
+    def crit(self) -> "DiceExpression":
+        """
+        Get the critical hit version of this expression (dice doubled, modifier unchanged).
+
+        Returns:
+            Compiled expression, e.g. "2d8+4d6+3" for "1d8+2d6+3"
+        """
+        return _compile_crit(self)
+
+    def roll(self, roller: "DiceRoller") -> "DiceRoll":
+        """
+        Roll this expression.
+
+        Args:
+            roller: Dice roller that supplies the randomness
+
+        Returns:
+            DiceRoll with the individual dice and modifier
+        """
+        return roller.roll_expression(self)
+
+    def roll_many(self, roller: "DiceRoller", n: int, faces: bool = False) -> Any:
+        """
+        Roll this expression many times (see DiceRoller.roll_many).
+
+        Args:
+            roller: Dice roller that supplies the randomness
+            n: Number of times to roll
+            faces: Also return the individual die faces
+
+        Returns:
+            Totals, or a tuple of (totals, faces) if faces is True
+        """
+        return roller.roll_many(self, n, faces=faces)
+
+
+# Matches one signed term of an expression: a dice group ("2d6", "d20") or a flat number
+_TERM_PATTERN = re.compile(r'([+-]?)(?:(\d*)d(\d+)|(\d+))', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def compile_dice(notation: str) -> DiceExpression:
+    """
+    Parse dice notation into a cached DiceExpression.
+
+    Supports any sum of dice groups and flat modifiers, e.g. "1d20", "d20-1",
+    "2d6+3", "1d8+2d6+3". Results are cached (LRU), so repeated rolls of the
+    same notation skip parsing.
+
+    Args:
+        notation: Dice notation string
+
+    Returns:
+        Compiled, immutable expression
+
+    Raises:
+        ValueError: If notation is invalid, has no dice, or has a group with no dice or no sides
+    """
+    if not notation:
+        raise ValueError("Dice notation cannot be empty")
+
+    text = notation.replace(" ", "")
+    terms: List[DiceTerm] = []
+    modifier = 0
+    position = 0
+
+    while position < len(text):
+        match = _TERM_PATTERN.match(text, position)
+        # Every term after the first needs an explicit sign
+        if not match or (position > 0 and not match.group(1)):
+            raise ValueError(f"Invalid dice notation: {notation}")
+
+        sign = -1 if match.group(1) == "-" else 1
+        if match.group(3) is not None:
+            count = int(match.group(2)) if match.group(2) else 1
+            sides = int(match.group(3))
+            if count < 1 or sides < 1:
+                raise ValueError(f"Invalid dice notation: {notation}")
+            terms.append(DiceTerm(count=count, sides=sides, sign=sign))
+        else:
+            modifier += sign * int(match.group(4))
+        position = match.end()
+
+    if not terms:
+        raise ValueError(f"Invalid dice notation: {notation}")
+
+    return DiceExpression(notation=notation, terms=tuple(terms), modifier=modifier)
+
+
+@lru_cache(maxsize=1024)
+def _compile_crit(expression: DiceExpression) -> DiceExpression:
+    doubled = DiceExpression(
+        notation="",
+        terms=tuple(DiceTerm(term.count * 2, term.sides, term.sign) for term in expression.terms),
+        modifier=expression.modifier
+    )
+    return compile_dice(doubled.canonical)
+
+
 class DiceRoller:
     """
     Handles dice rolling with D&D 5E notation.
@@ -65,11 +253,10 @@ class DiceRoller:
     - Modifiers: 1d20+5, 2d6-2
     - Implicit single die: d20 (treated as 1d20)
     - Advantage/disadvantage: Roll 2d20 and take best/worst
+    - Compound expressions: 1d8+2d6+3, 2d6-1d4 (compiled once and cached)
+    - Batch rolls: roll_many/roll_matrix for simulations (NumPy-backed when installed)
     """
 
-    # Regex pattern for parsing dice notation: NdS+M or NdS-M
-    DICE_PATTERN = re.compile(r'^(\d*)d(\d+)(([+-])(\d+))?$', re.IGNORECASE)
-
     def __init__(self, seed: Optional[int] = None):
         """
         Initialize the dice roller.
@@ -82,6 +269,9 @@ class DiceRoller:
         else:
             self.random = random.Random()
 
+        self.seed = seed
+        self._batch_rng: Any = None
+
     def roll(
         self,
         notation: str,
@@ -92,7 +282,7 @@ class DiceRoller:
         Roll dice according to standard D&D notation.
 
         Args:
-            notation: Dice notation string (e.g., "1d20", "2d6+3", "d20-1")
+            notation: Dice notation string (e.g., "1d20", "2d6+3", "d20-1", "1d8+2d6+3")
             advantage: Roll 2d20 and take the higher result
             disadvantage: Roll 2d20 and take the lower result
 
@@ -102,24 +292,57 @@ class DiceRoller:
         Raises:
             ValueError: If notation is invalid or advantage/disadvantage used incorrectly
         """
+        return self.roll_expression(
+            compile_dice(notation), advantage=advantage, disadvantage=disadvantage, notation=notation
+        )
+
+    def roll_expression(
+        self,
+        expression: DiceExpression,
+        advantage: bool = False,
+        disadvantage: bool = False,
+        notation: Optional[str] = None
+    ) -> DiceRoll:
+        """
+        Roll a compiled dice expression.
+
+        Dice in subtracted groups (e.g., the "1d4" in "2d6-1d4") are recorded
+        as negative values in DiceRoll.rolls so the total stays a plain sum.
+
+        Args:
+            expression: Expression from compile_dice
+            advantage: Roll the die twice and take the higher result
+            disadvantage: Roll the die twice and take the lower result
+            notation: Notation to record on the result (defaults to the expression's)
+
+        Returns:
+            DiceRoll object containing rolls, modifier, and total
+
+        Raises:
+            ValueError: If advantage/disadvantage used incorrectly
+        """
         if advantage and disadvantage:
             raise ValueError("Cannot have both advantage and disadvantage")
 
-        # Parse the dice notation
-        count, sides, modifier = self._parse_notation(notation)
-
         # Advantage/disadvantage only works with single die rolls
-        if (advantage or disadvantage) and count != 1:
+        if (advantage or disadvantage) and not expression.is_single_die:
             raise ValueError("Advantage/disadvantage only works with single die rolls (e.g., 1d20)")
 
         # Roll the dice
         if advantage or disadvantage:
             # Roll 2 dice for advantage/disadvantage
+            sides = expression.terms[0].sides
             rolls = [self._roll_die(sides), self._roll_die(sides)]
         else:
             # Roll the specified number of dice
-            rolls = [self._roll_die(sides) for _ in range(count)]
-
+            rolls = [
+                term.sign * self._roll_die(term.sides)
+                for term in expression.terms
+                for _ in range(term.count)
+            ]
+
+        notation = notation if notation is not None else expression.notation
+        modifier = expression.modifier
         result = DiceRoll(
             rolls=rolls,
             modifier=modifier,
@@ -143,41 +366,128 @@ class DiceRoller:
 
         return result
 
-    def _parse_notation(self, notation: str) -> tuple[int, int, int]:
+    def roll_many(
+        self,
+        notation: "str | DiceExpression",
+        n: int,
+        faces: bool = False,
+        advantage: bool = False,
+        disadvantage: bool = False
+    ) -> Any:
         """
-        Parse dice notation string into components.
+        Roll the same dice expression many times in one call.
+
+        Intended for simulation and balancing code that needs thousands or
+        millions of rolls. Uses a NumPy Generator when NumPy is installed and
+        returns arrays; otherwise falls back to pure Python and returns lists.
+        Batch rolls draw from their own stream seeded with the roller's seed,
+        so they are reproducible under a seed regardless of how many scalar
+        rolls happen in between. Batch rolls are not logged individually.
 
         Args:
-            notation: Dice notation string (e.g., "2d6+3")
+            notation: Dice notation string (e.g., "2d6+3") or compiled expression
+            n: Number of times to roll the expression
+            faces: Also return the individual die faces
+            advantage: Roll 2d20 per row and take the higher result
+            disadvantage: Roll 2d20 per row and take the lower result
 
         Returns:
-            Tuple of (count, sides, modifier)
+            Totals with shape (n,), or a tuple of (totals, faces) where faces
+            has shape (n, dice per roll) if faces is True (subtracted dice are negative)
 
         Raises:
-            ValueError: If notation is invalid
+            ValueError: If notation or n is invalid, or advantage/disadvantage used incorrectly
         """
-        if not notation:
-            raise ValueError("Dice notation cannot be empty")
+        if n < 0:
+            raise ValueError("Number of rolls cannot be negative")
+        if advantage and disadvantage:
+            raise ValueError("Cannot have both advantage and disadvantage")
 
-        match = self.DICE_PATTERN.match(notation.strip())
-        if not match:
-            raise ValueError(f"Invalid dice notation: {notation}")
+        expression = notation if isinstance(notation, DiceExpression) else compile_dice(notation)
+
+        if (advantage or disadvantage) and not expression.is_single_die:
+            raise ValueError("Advantage/disadvantage only works with single die rolls (e.g., 1d20)")
+
+        if advantage or disadvantage:
+            groups = [(2, expression.terms[0].sides, 1)]
+        else:
+            groups = [(term.count, term.sides, term.sign) for term in expression.terms]
+        modifier = expression.modifier
+        rng = self._batch_generator()
+
+        if np is not None:
+            rolled = np.concatenate([
+                sign * rng.integers(1, sides, size=(n, count), endpoint=True, dtype=np.int64)
+                for count, sides, sign in groups
+            ], axis=1)
+            if advantage:
+                base = rolled.max(axis=1)
+            elif disadvantage:
+                base = rolled.min(axis=1)
+            else:
+                base = rolled.sum(axis=1)
+            totals = base + modifier
+        else:
+            rolled = [
+                [sign * rng.randint(1, sides) for count, sides, sign in groups for _ in range(count)]
+                for _ in range(n)
+            ]
+            if advantage:
+                totals = [max(row) + modifier for row in rolled]
+            elif disadvantage:
+                totals = [min(row) + modifier for row in rolled]
+            else:
+                totals = [sum(row) + modifier for row in rolled]
+
+        return (totals, rolled) if faces else totals
+
+    def roll_matrix(self, notations: Sequence["str | DiceExpression"], n: int) -> Any:
+        """
+        Roll several dice expressions many times each.
+
+        Args:
+            notations: Dice notation strings (e.g., ["1d20+5", "2d6+3"])
+            n: Number of times to roll each expression
+
+        Returns:
+            Totals with shape (len(notations), n): one row per expression
+
+        Raises:
+            ValueError: If any notation or n is invalid
+        """
+        rows = [self.roll_many(notation, n) for notation in notations]
+        if np is not None:
+            return np.stack(rows) if rows else np.empty((0, n), dtype=np.int64)
+        return rows
 
-        # Extract count (default to 1 if not specified, e.g., "d20")
-        count_str = match.group(1)
-        count = int(count_str) if count_str else 1
+    def _batch_generator(self) -> Any:
+        """
+        Get the random stream used for batch rolls, creating it on first use.
 
-        # Extract die size
-        sides = int(match.group(2))
+        Returns:
+            numpy.random.Generator, or random.Random when NumPy isn't installed
+        """
+        if self._batch_rng is None:
+            if np is not None:
+                self._batch_rng = np.random.default_rng(self.seed)
+            else:
+                self._batch_rng = random.Random(self.seed)
+        return self._batch_rng
 
-        # Extract modifier (default to 0)
-        modifier = 0
-        if match.group(3):  # Has modifier
-            sign = match.group(4)
-            value = int(match.group(5))
-            modifier = value if sign == '+' else -value
+    def _parse_notation(self, notation: str) -> tuple[int, int, int]:
+        """
+        Parse dice notation string into components.
 
-        return count, sides, modifier
+        Args:
+            notation: Dice notation string (e.g., "2d6+3")
+
+        Returns:
+            Tuple of (count, sides, modifier)
+
+        Raises:
+            ValueError: If notation is invalid
+        """
+        return parse_dice_notation(notation)
 
     def _roll_die(self, sides: int) -> int:
         """
@@ -192,6 +502,27 @@ class DiceRoller:
         return self.random.randint(1, sides)
 
 
+def parse_dice_notation(notation: str) -> tuple[int, int, int]:
+    """
+    Parse single-group dice notation into components.
+
+    Args:
+        notation: Dice notation string (e.g., "2d6+3", "d20")
+
+    Returns:
+        Tuple of (count, sides, modifier)
+
+    Raises:
+        ValueError: If notation is invalid or has more than one dice group
+    """
+    expression = compile_dice(notation)
+    if len(expression.terms) != 1 or expression.terms[0].sign < 0:
+        raise ValueError(f"Expected a single dice group: {notation}")
+
+    term = expression.terms[0]
+    return term.count, term.sides, expression.modifier
+
+
 def format_dice_with_modifier(base_dice: str, modifier: int) -> str:
     """
     Format dice notation with modifier, handling negative values correctly.
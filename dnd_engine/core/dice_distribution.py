@@ -0,0 +1,359 @@
+# ABOUTME: Exact probability distributions for dice expressions and attack rolls
+# ABOUTME: Computes PMFs by convolution, including advantage/disadvantage and critical hit damage
+
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import lru_cache
+from math import gcd, lcm
+from typing import Iterator, Sequence, Tuple, Union
+
+from dnd_engine.core.dice import DiceExpression, compile_dice
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """
+    Exact probability mass function over integer outcomes.
+
+    Stored as integer outcome counts over a common denominator, so
+    convolution stays exact and cheap. weights[i] is the number of ways to
+    get offset + i, out of total.
+
+    Attributes:
+        offset: Smallest outcome
+        weights: Outcome counts, one per value from offset upward
+        total: Sum of the weights
+    """
+    offset: int
+    weights: Tuple[int, ...]
+    total: int
+
+    @classmethod
+    def constant(cls, value: int) -> "Distribution":
+        """Distribution that is always value."""
+        return cls(offset=value, weights=(1,), total=1)
+
+    @property
+    def min(self) -> int:
+        """Smallest possible outcome."""
+        return self.offset
+
+    @property
+    def max(self) -> int:
+        """Largest possible outcome."""
+        return self.offset + len(self.weights) - 1
+
+    @property
+    def mean(self) -> Fraction:
+        """Expected value."""
+        return Fraction(
+            sum((self.offset + i) * w for i, w in enumerate(self.weights)),
+            self.total
+        )
+
+    def probability(self, value: int) -> Fraction:
+        """
+        Get the probability of an exact outcome.
+
+        Args:
+            value: Outcome to look up
+
+        Returns:
+            Probability as an exact fraction (0 if impossible)
+        """
+        index = value - self.offset
+        if 0 <= index < len(self.weights):
+            return Fraction(self.weights[index], self.total)
+        return Fraction(0)
+
+    def at_least(self, value: int) -> Fraction:
+        """
+        Get the probability of an outcome of value or more.
+
+        Args:
+            value: Threshold
+
+        Returns:
+            Probability as an exact fraction
+        """
+        start = max(0, value - self.offset)
+        return Fraction(sum(self.weights[start:]), self.total)
+
+    def items(self) -> Iterator[Tuple[int, Fraction]]:
+        """Iterate over (outcome, probability) pairs with nonzero probability."""
+        for i, weight in enumerate(self.weights):
+            if weight:
+                yield self.offset + i, Fraction(weight, self.total)
+
+    def __add__(self, other: "Distribution") -> "Distribution":
+        """Distribution of the sum of two independent outcomes (convolution)."""
+        weights = [0] * (len(self.weights) + len(other.weights) - 1)
+        for i, a in enumerate(self.weights):
+            if a:
+                for j, b in enumerate(other.weights):
+                    weights[i + j] += a * b
+        return Distribution(self.offset + other.offset, tuple(weights), self.total * other.total)
+
+    def shift(self, amount: int) -> "Distribution":
+        """Distribution of the outcome plus a constant."""
+        return Distribution(self.offset + amount, self.weights, self.total)
+
+    def negate(self) -> "Distribution":
+        """Distribution of the negated outcome."""
+        return Distribution(-self.max, tuple(reversed(self.weights)), self.total)
+
+    def clamp_min(self, floor: int) -> "Distribution":
+        """
+        Fold every outcome below floor into floor (e.g., damage can't go below 0).
+
+        Args:
+            floor: Lowest allowed outcome
+
+        Returns:
+            Clamped distribution
+        """
+        if self.offset >= floor:
+            return self
+        cut = floor - self.offset
+        if cut >= len(self.weights):
+            return Distribution(floor, (self.total,), self.total)
+        folded = sum(self.weights[:cut + 1])
+        return Distribution(floor, (folded,) + self.weights[cut + 1:], self.total)
+
+
+def mixture(components: Sequence[Tuple[Fraction, Distribution]]) -> Distribution:
+    """
+    Combine distributions by probability (e.g., miss / hit / crit damage).
+
+    Args:
+        components: (probability, distribution) pairs whose probabilities sum to 1
+
+    Returns:
+        Mixed distribution
+
+    Raises:
+        ValueError: If the probabilities don't sum to 1
+    """
+    components = [(Fraction(p), d) for p, d in components if p]
+    if sum(p for p, _ in components) != 1:
+        raise ValueError("Mixture probabilities must sum to 1")
+
+    low = min(d.min for _, d in components)
+    high = max(d.max for _, d in components)
+    denominator = lcm(*(p.denominator * d.total for p, d in components))
+
+    weights = [0] * (high - low + 1)
+    for p, d in components:
+        scale = p.numerator * (denominator // (p.denominator * d.total))
+        for i, w in enumerate(d.weights):
+            weights[d.offset - low + i] += w * scale
+
+    divisor = gcd(denominator, *weights)
+    return Distribution(low, tuple(w // divisor for w in weights), denominator // divisor)
+
+
+@lru_cache(maxsize=None)
+def die_distribution(sides: int, advantage: bool = False, disadvantage: bool = False) -> Distribution:
+    """
+    Distribution of a single die, optionally rolled twice keeping the best or worst.
+
+    Args:
+        sides: Number of sides on the die
+        advantage: Roll twice and keep the higher result
+        disadvantage: Roll twice and keep the lower result
+
+    Returns:
+        Distribution over 1..sides
+
+    Raises:
+        ValueError: If sides < 1 or both advantage and disadvantage are set
+    """
+    if sides < 1:
+        raise ValueError("A die needs at least one side")
+    if advantage and disadvantage:
+        raise ValueError("Cannot have both advantage and disadvantage")
+
+    if advantage:
+        # P(max = k) = (k^2 - (k-1)^2) / sides^2
+        weights = tuple(2 * k - 1 for k in range(1, sides + 1))
+        return Distribution(1, weights, sides * sides)
+    if disadvantage:
+        # P(min = k) = ((sides-k+1)^2 - (sides-k)^2) / sides^2
+        weights = tuple(2 * (sides - k) + 1 for k in range(1, sides + 1))
+        return Distribution(1, weights, sides * sides)
+    return Distribution(1, (1,) * sides, sides)
+
+
+@lru_cache(maxsize=None)
+def _dice_sum_distribution(count: int, sides: int) -> Distribution:
+    """Distribution of the sum of count identical dice (by repeated squaring)."""
+    result = Distribution.constant(0)
+    power = die_distribution(sides)
+    while count:
+        if count & 1:
+            result = result + power
+        count >>= 1
+        if count:
+            power = power + power
+    return result
+
+
+@lru_cache(maxsize=1024)
+def _expression_distribution(expression: DiceExpression) -> Distribution:
+    result = Distribution.constant(expression.modifier)
+    for term in expression.terms:
+        group = _dice_sum_distribution(term.count, term.sides)
+        result = result + (group if term.sign > 0 else group.negate())
+    return result
+
+
+def dice_distribution(
+    notation: Union[str, DiceExpression],
+    advantage: bool = False,
+    disadvantage: bool = False,
+    critical: bool = False
+) -> Distribution:
+    """
+    Compute the exact distribution of a dice expression.
+
+    Args:
+        notation: Dice notation (e.g., "1d8+2d6+3") or compiled expression
+        advantage: Roll the single die twice and keep the higher result
+        disadvantage: Roll the single die twice and keep the lower result
+        critical: Double every dice group (critical hit damage)
+
+    Returns:
+        Exact distribution of the total
+
+    Raises:
+        ValueError: If notation is invalid or advantage/disadvantage used incorrectly
+    """
+    expression = notation if isinstance(notation, DiceExpression) else compile_dice(notation)
+    if critical:
+        expression = expression.crit()
+
+    if advantage or disadvantage:
+        if not expression.is_single_die:
+            raise ValueError("Advantage/disadvantage only works with single die rolls (e.g., 1d20)")
+        sides = expression.terms[0].sides
+        return die_distribution(sides, advantage, disadvantage).shift(expression.modifier)
+
+    return _expression_distribution(expression)
+
+
+@dataclass(frozen=True)
+class AttackOdds:
+    """
+    Exact odds for an attack roll against an AC.
+
+    Attributes:
+        hit_chance: Probability of hitting (including critical hits)
+        crit_chance: Probability of a critical hit (natural 20)
+        damage: Distribution of damage dealt (0 on a miss)
+    """
+    hit_chance: Fraction
+    crit_chance: Fraction
+    damage: Distribution
+
+    @property
+    def expected_damage(self) -> Fraction:
+        """Average damage per attack."""
+        return self.damage.mean
+
+
+@lru_cache(maxsize=4096)
+def _hit_chances(
+    target_ac: int,
+    attack_bonus: int,
+    advantage: bool,
+    disadvantage: bool
+) -> Tuple[Fraction, Fraction]:
+    """Probabilities of a normal hit and a critical hit (natural 20)."""
+    d20 = die_distribution(20, advantage, disadvantage)
+    normal_hit = sum(
+        (p for roll, p in d20.items() if 1 < roll < 20 and roll + attack_bonus >= target_ac),
+        Fraction(0)
+    )
+    return normal_hit, d20.probability(20)
+
+
+def hit_chance(
+    target_ac: int,
+    attack_bonus: int,
+    advantage: bool = False,
+    disadvantage: bool = False
+) -> Fraction:
+    """
+    Compute the exact chance to hit an AC.
+
+    Mirrors CombatEngine.resolve_attack: a natural 20 always hits, a natural 1
+    always misses, and otherwise d20 + bonus must meet the AC.
+
+    Args:
+        target_ac: Defender's armor class
+        attack_bonus: Total attack bonus
+        advantage: Attack with advantage
+        disadvantage: Attack with disadvantage
+
+    Returns:
+        Probability of a hit (including critical hits)
+
+    Raises:
+        ValueError: If both advantage and disadvantage are set
+    """
+    normal_hit, crit = _hit_chances(target_ac, attack_bonus, advantage, disadvantage)
+    return normal_hit + crit
+
+
+def crit_chance(advantage: bool = False, disadvantage: bool = False) -> Fraction:
+    """
+    Compute the exact chance of a critical hit (natural 20).
+
+    Args:
+        advantage: Attack with advantage
+        disadvantage: Attack with disadvantage
+
+    Returns:
+        Probability of a critical hit
+
+    Raises:
+        ValueError: If both advantage and disadvantage are set
+    """
+    return die_distribution(20, advantage, disadvantage).probability(20)
+
+
+@lru_cache(maxsize=4096)
+def attack_odds(
+    damage_dice: str,
+    target_ac: int,
+    attack_bonus: int,
+    advantage: bool = False,
+    disadvantage: bool = False
+) -> AttackOdds:
+    """
+    Compute exact attack odds, memoized per (expression, AC, bonus).
+
+    A natural 20 doubles the damage dice. Damage below 0 is dealt as 0.
+
+    Args:
+        damage_dice: Damage dice notation (e.g., "1d8+3")
+        target_ac: Defender's armor class
+        attack_bonus: Total attack bonus
+        advantage: Attack with advantage
+        disadvantage: Attack with disadvantage
+
+    Returns:
+        AttackOdds with hit chance, crit chance, and damage distribution
+
+    Raises:
+        ValueError: If damage_dice is invalid or both advantage and disadvantage are set
+    """
+    normal_hit, crit = _hit_chances(target_ac, attack_bonus, advantage, disadvantage)
+
+    damage = mixture([
+        (1 - normal_hit - crit, Distribution.constant(0)),
+        (normal_hit, dice_distribution(damage_dice).clamp_min(0)),
+        (crit, dice_distribution(damage_dice, critical=True).clamp_min(0)),
+    ])
+
+    return AttackOdds(hit_chance=normal_hit + crit, crit_chance=crit, damage=damage)
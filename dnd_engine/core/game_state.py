@@ -6,8 +6,11 @@ from dnd_engine.core.character import Character
 from dnd_engine.core.party import Party
 from dnd_engine.core.creature import Creature
 from dnd_engine.core.dice import DiceRoller
+from dnd_engine.core.spell import Spell
 from dnd_engine.core.combat import CombatEngine, AttackResult
 from dnd_engine.systems.initiative import InitiativeTracker
+from dnd_engine.systems.enemy_ai import Battlefield, EnemyAttack, EnemyPolicy, EnemyTurnResult, FocusWeakestPolicy
+from dnd_engine.rules.action_table import ActionTable
 from dnd_engine.systems.action_economy import ActionType
 from dnd_engine.systems.time_manager import TimeManager, ActiveEffect, EffectType, parse_duration_to_minutes
 from dnd_engine.rules.loader import DataLoader
@@ -63,7 +66,8 @@ class GameState:
         dungeon_name: str,
         event_bus: Optional[EventBus] = None,
         data_loader: Optional[DataLoader] = None,
-        dice_roller: Optional[DiceRoller] = None
+        dice_roller: Optional[DiceRoller] = None,
+        enemy_policy: Optional[EnemyPolicy] = None
     ):
         """
         Initialize the game state.
@@ -74,6 +78,7 @@ class GameState:
             event_bus: Event bus for game events (creates new if not provided)
             data_loader: Data loader for loading content (creates new if not provided)
             dice_roller: Dice roller (creates new if not provided)
+            enemy_policy: Enemy AI (defaults to FocusWeakestPolicy)
         """
         self.party = party
         self.event_bus = event_bus or EventBus()
@@ -93,7 +98,11 @@ class GameState:
         self.in_combat = False
         self.initiative_tracker: Optional[InitiativeTracker] = None
         self.active_enemies: List[Creature] = []
+        self.battlefield: Optional[Battlefield] = None
+        self.group_initiative = False  # Identical monsters share one initiative roll
+        self.squad_threshold: Optional[int] = None  # Identical monsters at or above this count spawn as a squad
         self.combat_engine = CombatEngine(self.dice_roller)
+        self.enemy_policy: EnemyPolicy = enemy_policy or FocusWeakestPolicy()
 
         # Navigation tracking for flee mechanic
         self.last_entry_direction: Optional[str] = None
@@ -133,9 +142,93 @@ class GameState:
         """
         self.previous_room_id = self.current_room_id
 
-    def get_effective_lighting(self, character: "Character") -> str:
+    def get_adjacent_room_ids(self, include_locked: bool = False) -> List[str]:
         """
-        Calculate the effective lighting level for a character in the current room.
+        Get the rooms reachable through the current room's exits.
+
+        Args:
+            include_locked: Include rooms behind locked exits
+
+        Returns:
+            Destination room IDs in exit order, without duplicates
+        """
+        room_ids: List[str] = []
+        for direction in self.get_current_room().get("exits", {}):
+            exit_info = self.get_exit_info(direction)
+            if exit_info.get("locked", False) and not include_locked:
+                continue
+            destination = exit_info["destination"]
+            if destination not in room_ids and destination in self.dungeon["rooms"]:
+                room_ids.append(destination)
+        return room_ids
+
+    def build_room_narrative_data(self, room_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the room data the LLM enhancer uses to describe a room.
+
+        For the current room this reflects the party's view right now. For
+        another room it is the view on arriving there from the current room,
+        which lets the enhancer prepare descriptions of neighboring rooms
+        under the same cache keys the real visit will use.
+
+        Args:
+            room_id: Room to describe (defaults to the current room)
+
+        Returns:
+            Room data for LLMEnhancer.get_room_description_sync()
+        """
+        if room_id is None or room_id == self.current_room_id:
+            room_id = self.current_room_id
+            previous_room_id = self.previous_room_id
+        else:
+            previous_room_id = self.current_room_id
+
+        room = self.dungeon["rooms"][room_id]
+        room_name = room.get("name", "Unknown Room")
+
+        # Monster display names
+        monsters_data = self.data_loader.load_monsters()
+        monster_names = [
+            monsters_data[enemy_id]["name"]
+            for enemy_id in room.get("enemies", [])
+            if enemy_id in monsters_data
+        ]
+
+        # Characters who cast Light spells (for narrative purposes)
+        from dnd_engine.systems.time_manager import EffectType
+        light_casters = []
+        for effect in self.time_manager.active_effects:
+            if effect.effect_type == EffectType.SPELL and effect.source.lower() == "light":
+                if effect.caster_name and effect.caster_name not in light_casters:
+                    light_casters.append(effect.caster_name)
+
+        party_lighting = [
+            {
+                "character": char.name,
+                "lighting": self.get_effective_lighting(char, room_id),
+                "has_darkvision": char.darkvision_range > 0
+            }
+            for char in self.party.characters
+        ]
+
+        return {
+            "id": room.get("id", room_name.lower().replace(" ", "_")),
+            "name": room_name,
+            "description": room.get("description", ""),
+            "monsters": monster_names,  # Include monster info for LLM
+            # Combat starts if there are enemies and we're not already in combat
+            "combat_starting": bool(room.get("enemies")) and not self.in_combat,
+            "monsters_data": monsters_data,  # Full monster definitions for creature-aware prompts
+            "party_size": len(self.party.characters),  # Party size for combat context
+            "base_lighting": room.get("lighting", "bright"),  # Room's base lighting level
+            "party_lighting": party_lighting,  # Effective lighting for each party member
+            "light_casters": light_casters,  # Characters who cast Light spells
+            "previous_room_id": previous_room_id  # Previous room for transition narrative
+        }
+
+    def get_effective_lighting(self, character: "Character", room_id: Optional[str] = None) -> str:
+        """
+        Calculate the effective lighting level for a character in a room.
 
         Takes into account:
         - Base room lighting
@@ -144,11 +237,12 @@ class GameState:
 
         Args:
             character: Character to calculate lighting for
+            room_id: Room to check (defaults to the current room)
 
         Returns:
             "bright", "dim", or "dark" - the effective lighting level
         """
-        room = self.get_current_room()
+        room = self.dungeon["rooms"][room_id] if room_id is not None else self.get_current_room()
         base_lighting = room.get("lighting", "bright")
 
         # Check for temporary lighting effects (Light spell, etc.)
@@ -1069,16 +1163,16 @@ class GameState:
                 "error": f"Character '{caster_name}' not found"
             }
 
-        # Load spell data
-        spell_data = self.data_loader.load_spells().get(spell_id)
-        if not spell_data:
+        # Look up the compiled spell
+        spell = self.data_loader.load_spell_catalog().get_spell(spell_id)
+        if spell is None:
             return {
                 "success": False,
                 "error": f"Spell '{spell_id}' not found"
             }
 
-        spell_name = spell_data.get("name", spell_id)
-        spell_level = spell_data.get("level", 0)
+        spell_name = spell.name
+        spell_level = spell.level
 
         # Check if character knows/has prepared this spell
         if spell_id not in caster.prepared_spells and spell_id not in caster.known_spells:
@@ -1097,7 +1191,7 @@ class GameState:
                 }
 
         # Handle healing spells
-        if spell_data.get("healing"):
+        if spell.healing:
             if not target_name:
                 return {
                     "success": False,
@@ -1112,7 +1206,7 @@ class GameState:
                 }
 
             # Roll healing: dice + spellcasting modifier
-            healing_dice = spell_data["healing"].get("dice", "1d8")
+            healing_dice = spell.healing.dice
             healing_roll = self.dice_roller.roll(healing_dice)
 
             # Get spellcasting modifier from abilities
@@ -1137,7 +1231,7 @@ class GameState:
                 caster.use_spell_slot(spell_level)
 
             # Create active effect if spell has duration
-            effect = self._create_spell_effect(spell_data, caster_name, target_name)
+            effect = self._create_spell_effect(spell, caster_name, target_name)
             if effect:
                 # If this is a concentration spell, break concentration on any previous spell
                 if effect.concentration:
@@ -1179,7 +1273,7 @@ class GameState:
                 caster.use_spell_slot(spell_level)
 
             # Create active effect if spell has duration
-            effect = self._create_spell_effect(spell_data, caster_name, target_name)
+            effect = self._create_spell_effect(spell, caster_name, target_name)
             if effect:
                 # If this is a concentration spell, break concentration on any previous spell
                 if effect.concentration:
@@ -1198,7 +1292,7 @@ class GameState:
             ))
 
             # Return spell description as flavor text
-            description = spell_data.get("description", f"{spell_name} takes effect.")
+            description = spell.description or f"{spell_name} takes effect."
 
             return {
                 "success": True,
@@ -1212,22 +1306,22 @@ class GameState:
 
     def _create_spell_effect(
         self,
-        spell_data: Dict[str, Any],
+        spell: Spell,
         caster_name: str,
         target_name: str
     ) -> Optional[ActiveEffect]:
         """
-        Create an ActiveEffect from spell data if the spell has a duration.
+        Create an ActiveEffect from a spell if it has a duration.
 
         Args:
-            spell_data: Spell data dictionary
+            spell: Compiled spell from the spell catalog
             caster_name: Name of the caster
             target_name: Name of the target
 
         Returns:
             ActiveEffect if spell has duration, None otherwise
         """
-        duration_value = spell_data.get("duration_value")
+        duration_value = spell.duration_value
         if not duration_value:
             return None
 
@@ -1237,9 +1331,9 @@ class GameState:
             return None
 
         # Create effect
-        spell_name = spell_data.get("name", "Unknown Spell")
-        concentration = spell_data.get("concentration", False)
-        description = spell_data.get("description", "")
+        spell_name = spell.name
+        concentration = spell.concentration
+        description = spell.description
 
         effect = ActiveEffect(
             effect_type=EffectType.SPELL,
@@ -1262,13 +1356,9 @@ class GameState:
             item_id: ID of the item
 
         Returns:
-            Category name ("weapons", "armor", "consumables") or None if not found
+            Category name ("weapons", "armor", "consumables", "tools") or None if not found
         """
-        items_data = self.data_loader.load_items()
-        for category in ["weapons", "armor", "consumables"]:
-            if item_id in items_data.get(category, {}):
-                return category
-        return None
+        return self.data_loader.load_item_registry().get_category(item_id)
 
     def get_room_description(self) -> str:
         """
@@ -1332,10 +1422,9 @@ class GameState:
             return  # No enemies
 
         # Create enemy creatures
-        self.active_enemies = []
-        for enemy_id in enemy_ids:
-            enemy = self.data_loader.create_monster(enemy_id)
-            self.active_enemies.append(enemy)
+        self.active_enemies = self.data_loader.create_monsters(
+            enemy_ids, squad_threshold=self.squad_threshold
+        )
 
         # Start combat
         self._start_combat()
@@ -1415,15 +1504,15 @@ class GameState:
     def _start_combat(self) -> None:
         """Initialize combat with current enemies."""
         self.in_combat = True
-        self.initiative_tracker = InitiativeTracker(self.dice_roller, self.time_manager)
-
-        # Add all living party members to initiative
-        for character in self.party.get_living_members():
-            self.initiative_tracker.add_combatant(character)
+        self.initiative_tracker = InitiativeTracker(
+            self.dice_roller,
+            self.time_manager,
+            group_initiative=self.group_initiative
+        )
+        self.battlefield = Battlefield(self.party.characters, self.active_enemies)
 
-        # Add enemies to initiative
-        for enemy in self.active_enemies:
-            self.initiative_tracker.add_combatant(enemy)
+        # Add living party members, then enemies, to initiative with one sort
+        self.initiative_tracker.add_combatants(self.party.get_living_members() + self.active_enemies)
 
         # Emit combat start event
         self.event_bus.emit(Event(
@@ -1434,6 +1523,78 @@ class GameState:
             }
         ))
 
+    def take_enemy_turn(self, enemy: Creature, condition_manager=None) -> EnemyTurnResult:
+        """
+        Play an enemy's turn as decided by the enemy policy.
+
+        The policy may spend the turn trying to end a condition; otherwise the
+        enemy makes the attacks the policy picks from its action table
+        (Multiattack by default), choosing a target before each attack.
+        Turn-start effects are the caller's job.
+
+        Args:
+            enemy: The enemy whose turn it is
+            condition_manager: ConditionManager for early condition removal
+                (conditions are ignored if not provided)
+
+        Returns:
+            EnemyTurnResult describing what happened
+        """
+        result = EnemyTurnResult()
+
+        if condition_manager is not None:
+            removable = tuple(
+                condition_id for condition_id in enemy.active_conditions
+                if condition_manager.can_attempt_early_removal(condition_id)
+            )
+            if removable:
+                choice = self.enemy_policy.choose_condition_removal(enemy, removable)
+                if choice is not None:
+                    result.condition_removal = condition_manager.attempt_condition_removal(enemy, choice)
+                    return result
+                result.ignored_conditions = removable
+
+        battlefield = self.battlefield or Battlefield(self.party.characters, self.active_enemies)
+
+        # Enemies spawned from a template carry their compiled actions
+        table = enemy.action_table
+        if table is None:
+            catalog = self.data_loader.load_monster_catalog()
+            table = catalog.get_action_table(catalog.resolve_id(enemy)) or ActionTable()
+
+        steps = self.enemy_policy.choose_attacks(enemy, table)
+        if not steps:
+            result.no_attack_available = bool(battlefield.targets_for(enemy))
+            return result
+
+        for step in steps:
+            targets = battlefield.targets_for(enemy)
+            if not targets:
+                break
+
+            target = self.enemy_policy.choose_target(enemy, step.attack, targets)
+            if target is None:
+                continue
+
+            conditions_before = set(target.active_conditions)
+            attack_result = self.combat_engine.resolve_attack(
+                attacker=enemy,
+                defender=target,
+                attack_bonus=step.attack.attack_bonus,
+                damage_dice=step.attack.damage,
+                disadvantage=step.disadvantage,
+                apply_damage=True,
+                event_bus=self.event_bus,
+                action=step.attack.action  # Pass action data for saving throw processing
+            )
+            new_conditions = tuple(
+                condition for condition in target.active_conditions
+                if condition not in conditions_before
+            )
+            result.attacks.append(EnemyAttack(step.attack, target, attack_result, new_conditions))
+
+        return result
+
     def _check_combat_end(self) -> None:
         """Check if combat should end and handle cleanup."""
         # Remove dead enemies from tracker
@@ -1453,15 +1614,11 @@ class GameState:
         """End combat and perform cleanup."""
         # Calculate XP from defeated enemies
         total_xp = 0
-        monsters = self.data_loader.load_monsters()
+        catalog = self.data_loader.load_monster_catalog()
 
         for enemy in self.active_enemies:
             if not enemy.is_alive:
-                # Find enemy XP value
-                for monster_id, monster_data in monsters.items():
-                    if monster_data["name"] == enemy.name:
-                        total_xp += monster_data.get("xp", 0)
-                        break
+                total_xp += catalog.get_xp(catalog.resolve_id(enemy))
 
         # Award XP to all party members (split evenly)
         if total_xp > 0 and len(self.party.characters) > 0:
@@ -1476,6 +1633,7 @@ class GameState:
         # Clear combat state
         self.in_combat = False
         self.initiative_tracker = None
+        self.battlefield = None
 
         # Remove defeated enemies from room
         room = self.get_current_room()
@@ -1536,57 +1694,45 @@ class GameState:
 
         if living_party and living_enemies:
             # Load monster data for attack stats
-            monsters = self.data_loader.load_monsters()
+            catalog = self.data_loader.load_monster_catalog()
 
             for enemy in living_enemies:
                 # Pick a random living party member to attack
                 import random
                 target = random.choice(living_party)
 
-                # Find enemy's attack data
-                monster_data = None
-                for monster_id, mdata in monsters.items():
-                    if mdata["name"] == enemy.name:
-                        monster_data = mdata
-                        break
-
-                if monster_data and monster_data.get("actions"):
-                    # Find first action with attack_bonus (skip Multiattack, etc.)
-                    action = None
-                    for act in monster_data["actions"]:
-                        if "attack_bonus" in act:
-                            action = act
-                            break
-
-                    if action:
-                        result = self.combat_engine.resolve_attack(
-                            attacker=enemy,
-                            defender=target,
-                            attack_bonus=action["attack_bonus"],
-                            damage_dice=action["damage"],
-                            apply_damage=True
-                        )
-                        opportunity_attacks.append(result)
-
-                        # Emit damage event if hit
-                        if result.hit:
-                            self.event_bus.emit(Event(
-                                type=EventType.DAMAGE_DEALT,
-                                data={
-                                    "attacker": enemy.name,
-                                    "defender": target.name,
-                                    "damage": result.damage,
-                                    "opportunity_attack": True
-                                }
-                            ))
-
-                        # Track casualties
-                        if not target.is_alive:
-                            casualties.append(target.name)
-                            self.event_bus.emit(Event(
-                                type=EventType.CHARACTER_DEATH,
-                                data={"name": target.name}
-                            ))
+                # Find enemy's attack data (first rollable attack, skipping Multiattack, etc.)
+                action = catalog.get_primary_attack(catalog.resolve_id(enemy))
+
+                if action:
+                    result = self.combat_engine.resolve_attack(
+                        attacker=enemy,
+                        defender=target,
+                        attack_bonus=action["attack_bonus"],
+                        damage_dice=action["damage"],
+                        apply_damage=True
+                    )
+                    opportunity_attacks.append(result)
+
+                    # Emit damage event if hit
+                    if result.hit:
+                        self.event_bus.emit(Event(
+                            type=EventType.DAMAGE_DEALT,
+                            data={
+                                "attacker": enemy.name,
+                                "defender": target.name,
+                                "damage": result.damage,
+                                "opportunity_attack": True
+                            }
+                        ))
+
+                    # Track casualties
+                    if not target.is_alive:
+                        casualties.append(target.name)
+                        self.event_bus.emit(Event(
+                            type=EventType.CHARACTER_DEATH,
+                            data={"name": target.name}
+                        ))
 
                 # Update living party list if someone died
                 living_party = self.party.get_living_members()
@@ -1596,6 +1742,7 @@ class GameState:
         # Clear combat state (no XP awarded for fleeing)
         self.in_combat = False
         self.initiative_tracker = None
+        self.battlefield = None
 
         # Enemies remain in room (can encounter them again)
         # Do NOT clear enemies from room like in _end_combat
@@ -1670,6 +1817,7 @@ class GameState:
         # Reset combat state
         self.in_combat = False
         self.initiative_tracker = None
+        self.battlefield = None
         self.active_enemies = []
 
         # Reset navigation tracking
@@ -1704,7 +1852,7 @@ class GameState:
         Removes conditions like poisoned, paralyzed, stunned, etc.
         """
         for character in self.party.characters:
-            character.conditions.clear()
+            character.clear_conditions()
 
     def use_combat_attack_item(
         self,
@@ -1731,15 +1879,9 @@ class GameState:
         Returns:
             CombatItemResult with attack outcome and display information
         """
-        # Load item data (structure: {"weapons": {...}, "armor": {...}, "consumables": {...}})
-        items_data = self.data_loader.load_items()
-
-        # Find item in categories
-        item_data = None
-        for category, category_items in items_data.items():
-            if item_id in category_items:
-                item_data = category_items[item_id]
-                break
+        # Resolve the item in any category
+        items_data = self.data_loader.load_item_registry()
+        item_data = items_data.get_item(item_id)
 
         if item_data is None:
             return CombatItemResult(
@@ -187,3 +187,112 @@ class Spell:
             return self.duration_value
         else:
             return self.duration.value
+
+    @classmethod
+    def from_dict(cls, spell_id: str, data: Dict[str, Any]) -> "Spell":
+        """
+        Build a Spell from a spells.json definition.
+
+        Args:
+            spell_id: ID of the spell
+            data: Spell definition from spells.json
+
+        Returns:
+            Spell instance
+
+        Raises:
+            KeyError: If the definition has no name, level, or school
+            ValueError: If the school or duration type is unknown
+        """
+        components = data.get("components") or {}
+        damage = data.get("damage")
+        healing = data.get("healing")
+        saving_throw = data.get("saving_throw")
+
+        # Older definitions only name the ability in saving_throw_type
+        if saving_throw is None and data.get("saving_throw_type"):
+            saving_throw = {"ability": data["saving_throw_type"], "on_success": "none"}
+
+        return cls(
+            id=spell_id,
+            name=data["name"],
+            level=data["level"],
+            school=SpellSchool(data["school"]),
+            casting_time=data.get("casting_time", CastingTime.ACTION.value),
+            range_ft=data.get("range_ft", 0),
+            components=SpellComponents(
+                verbal=components.get("verbal", False),
+                somatic=components.get("somatic", False),
+                material=components.get("material", False),
+                material_description=components.get("material_description"),
+                material_cost=components.get("material_cost"),
+                material_consumed=components.get("material_consumed", False)
+            ),
+            duration=DurationType(data.get("duration", DurationType.INSTANTANEOUS.value)),
+            description=data.get("description", ""),
+            duration_value=data.get("duration_value"),
+            concentration=data.get("concentration", False),
+            ritual=data.get("ritual", False),
+            damage=SpellDamage(
+                dice=damage["dice"],
+                damage_type=damage.get("damage_type", ""),
+                higher_levels=damage.get("higher_levels")
+            ) if damage else None,
+            healing=SpellHealing(
+                dice=healing["dice"],
+                higher_levels=healing.get("higher_levels")
+            ) if healing else None,
+            saving_throw=SavingThrow(
+                ability=saving_throw["ability"],
+                on_success=saving_throw.get("on_success", "none")
+            ) if saving_throw else None,
+            attack_type=data.get("attack_type"),
+            area_of_effect=data.get("area_of_effect"),
+            higher_levels=data.get("higher_levels"),
+            classes=list(data.get("classes", [])),
+            source=data.get("source", "D&D 5E SRD (CC BY 4.0)")
+        )
+
+
+def is_combat_spell(spell_data: Dict[str, Any]) -> bool:
+    """
+    Check whether a spell definition is useful in combat.
+
+    Combat spells have an attack roll, damage, or a legacy saving_throw_type,
+    or are cast as a reaction (Shield, Counterspell). Save-only spells such as
+    Hold Person are left out: the combat cast command resolves spell attacks only.
+
+    Args:
+        spell_data: Spell definition from spells.json
+
+    Returns:
+        True if the spell belongs in the combat spell menu
+    """
+    return (
+        spell_data.get("attack_type") is not None
+        or spell_data.get("saving_throw_type") is not None
+        or spell_data.get("damage") is not None
+        or spell_data.get("casting_time") == CastingTime.REACTION.value
+    )
+
+
+def is_out_of_combat_spell(spell_data: Dict[str, Any]) -> bool:
+    """
+    Check whether a spell definition is useful outside combat.
+
+    Includes healing and ritual spells, plus utility spells with no attack
+    roll and no damage (Light, Mage Armor, Detect Magic).
+
+    Args:
+        spell_data: Spell definition from spells.json
+
+    Returns:
+        True if the spell belongs in the exploration spell menu
+    """
+    has_attack = spell_data.get("attack_type") is not None
+    has_damage = spell_data.get("damage") is not None
+    return (
+        spell_data.get("healing") is not None
+        or spell_data.get("ritual") is True
+        or (not has_attack and not has_damage)
+    )
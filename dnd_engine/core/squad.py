@@ -0,0 +1,430 @@
+# ABOUTME: Array-backed monster squads for horde encounters
+# ABOUTME: Stores HP, conditions and initiative for many identical monsters in parallel columns behind per-member Creature views
+
+from array import array
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from dnd_engine.core.creature import ABILITY_MODIFIER_ATTRIBUTES, Abilities, Creature
+from dnd_engine.rules.condition_table import get_condition_table
+
+np: Any
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; squads fall back to the array module
+    np = None
+
+
+# Condition masks are signed 64-bit columns, so one bit is kept clear
+MAX_SQUAD_CONDITIONS = 63
+_MAX_SQUAD_CONDITION_BIT = 1 << (MAX_SQUAD_CONDITIONS - 1)
+
+
+def _int_column(values: Sequence[int], typecode: str = "i") -> Any:
+    """Build an integer column (NumPy array, or array.array without NumPy)."""
+    if np is not None:
+        return np.array(values, dtype=np.int32 if typecode == "i" else np.int64)
+    return array(typecode, values)
+
+
+@dataclass
+class SquadSaves:
+    """
+    Saving throws rolled by several squad members at once.
+
+    Columns are NumPy arrays when NumPy is installed, lists otherwise.
+
+    Attributes:
+        members: Member indices that rolled, in order
+        rolls: d20 results (after advantage/disadvantage)
+        totals: Rolls plus the ability modifier
+        successes: True where the total met the DC
+        modifier: Ability modifier added to every roll
+        dc: Difficulty class
+        ability: Ability saved with
+    """
+    members: Any
+    rolls: Any
+    totals: Any
+    successes: Any
+    modifier: int
+    dc: int
+    ability: str
+
+    @property
+    def success_count(self) -> int:
+        """Number of members that saved."""
+        return int(sum(self.successes))
+
+
+class MonsterSquad:
+    """
+    N identical monsters stored column-wise.
+
+    The squad keeps one copy of the stat block (name, AC, abilities, action
+    table) and per-member state in parallel columns: max HP, current HP,
+    a condition bitmask (bits from the shared ConditionTable, like a
+    Creature's condition_mask), and initiative rolls. Condition metadata
+    (duration, repeat-save DC) and timed-condition masks are stored
+    sparsely, only for members that have them.
+
+    Each member is exposed as a SquadMember, a Creature whose state lives
+    in the squad's columns, so members can be listed in active_enemies,
+    targeted by number or name, attacked, and given conditions exactly
+    like individually spawned creatures. Whole-squad operations
+    (save_many, damage_many, add_condition_many) work on the columns
+    directly.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ac: int,
+        abilities: Abilities,
+        hit_points: Sequence[int],
+        monster_id: Optional[str] = None,
+        action_table: Any = None
+    ):
+        """
+        Create a squad.
+
+        Args:
+            name: Name shared by every member (e.g., "Goblin")
+            ac: Armor class shared by every member
+            abilities: Ability scores shared by every member
+            hit_points: Rolled maximum HP, one per member
+            monster_id: ID of the monster template the squad was spawned from
+            action_table: Compiled attack options shared by every member
+        """
+        self.name = name
+        self.ac = ac
+        self.abilities = abilities
+        self.monster_id = monster_id
+        self.action_table = action_table
+        self._dice_roller = None
+
+        size = len(hit_points)
+        self.max_hp = _int_column(hit_points)
+        self.hp = _int_column(hit_points)
+        self.condition_mask = _int_column([0] * size, "q")
+        self.initiative = _int_column([0] * size)
+        self._condition_metadata: Dict[Tuple[int, str], dict] = {}  # (member, condition) -> metadata
+        self._timed_condition_masks: Dict[int, int] = {}  # member -> timed condition bits
+
+        self.members: List["SquadMember"] = [SquadMember(self, index) for index in range(size)]
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __iter__(self) -> Iterator["SquadMember"]:
+        return iter(self.members)
+
+    def living_indices(self) -> Any:
+        """Get the indices of members with HP above 0."""
+        if np is not None:
+            return np.flatnonzero(self.hp > 0)
+        return [index for index, hp in enumerate(self.hp) if hp > 0]
+
+    def living_members(self) -> List["SquadMember"]:
+        """Get members with HP above 0."""
+        return [self.members[index] for index in self.living_indices()]
+
+    def ability_modifier(self, ability: str) -> int:
+        """
+        Get the squad's modifier for an ability.
+
+        Args:
+            ability: Ability name, short or full (e.g., "dex", "dexterity")
+
+        Returns:
+            Ability modifier
+
+        Raises:
+            ValueError: If ability name is invalid
+        """
+        attribute = ABILITY_MODIFIER_ATTRIBUTES.get(ability.lower())
+        if attribute is None:
+            raise ValueError(f"Invalid ability name: {ability}")
+        return int(getattr(self.abilities, attribute))
+
+    def save_many(
+        self,
+        ability: str,
+        dc: int,
+        members: Optional[Sequence[int]] = None,
+        advantage: bool = False,
+        disadvantage: bool = False
+    ) -> SquadSaves:
+        """
+        Roll a saving throw for several members in one batch.
+
+        Members' conditions apply as in Creature.make_saving_throw: they can
+        impose disadvantage (members are rolled in one batch per roll mode)
+        or make the save fail automatically.
+
+        Args:
+            ability: Ability to save with (e.g., "dex")
+            dc: Difficulty class to beat
+            members: Member indices to roll for (defaults to every living member)
+            advantage: Roll with advantage
+            disadvantage: Roll with disadvantage
+
+        Returns:
+            SquadSaves with one column entry per member
+
+        Raises:
+            ValueError: If ability name is invalid
+        """
+        from dnd_engine.core.dice import DiceRoller
+
+        modifier = self.ability_modifier(ability)
+        ability_short = ability.lower()[:3]
+        if members is None:
+            members = self.living_indices()
+        indices: Any = np.asarray(members, dtype=np.intp) if np is not None else list(members)
+        roller = self._dice_roller or DiceRoller()
+
+        roll_groups: Dict[Tuple[bool, bool], List[int]] = {}
+        auto_fails = []
+        for position, index in enumerate(indices):
+            member = self.members[index]
+            roll_groups.setdefault(member.save_roll_mode(ability_short, advantage, disadvantage), []).append(position)
+            auto_fails.append(member.auto_fails_save(ability_short))
+
+        rolls: Any = np.zeros(len(indices), dtype=np.int64) if np is not None else [0] * len(indices)
+        for (group_advantage, group_disadvantage), positions in roll_groups.items():
+            group_rolls = roller.roll_many(
+                "1d20", len(positions), advantage=group_advantage, disadvantage=group_disadvantage
+            )
+            for position, roll in zip(positions, group_rolls, strict=True):
+                rolls[position] = roll
+
+        if np is not None:
+            totals = rolls + modifier
+            successes = (totals >= dc) & ~np.asarray(auto_fails, dtype=bool)
+        else:
+            totals = [roll + modifier for roll in rolls]
+            successes = [total >= dc and not failed for total, failed in zip(totals, auto_fails, strict=True)]
+
+        return SquadSaves(
+            members=indices,
+            rolls=rolls,
+            totals=totals,
+            successes=successes,
+            modifier=modifier,
+            dc=dc,
+            ability=ability_short
+        )
+
+    def damage_many(self, members: Sequence[int], amounts: Any) -> None:
+        """
+        Apply damage to several members at once (HP cannot go below 0).
+
+        Args:
+            members: Member indices to damage
+            amounts: Damage per member (same length as members), or one amount for all
+        """
+        if np is not None:
+            indices = np.asarray(members, dtype=np.intp)
+            self.hp[indices] = np.maximum(0, self.hp[indices] - np.asarray(amounts, dtype=np.int32))
+            return
+
+        if isinstance(amounts, int):
+            amounts = [amounts] * len(members)
+        for index, amount in zip(members, amounts, strict=True):
+            self.hp[index] = max(0, self.hp[index] - amount)
+
+    def add_condition_many(self, condition: str, members: Sequence[int]) -> None:
+        """
+        Add a basic condition to several members at once.
+
+        Args:
+            condition: Name of the condition to add
+            members: Member indices to give the condition
+        """
+        bit = self._condition_bit(condition.lower())
+        if np is not None:
+            self.condition_mask[np.asarray(members, dtype=np.intp)] |= bit
+            return
+        for index in members:
+            self.condition_mask[index] |= bit
+
+    def count_with_condition(self, condition: str) -> int:
+        """
+        Count the members that have a condition.
+
+        Args:
+            condition: Name of the condition
+
+        Returns:
+            Number of members with the condition
+        """
+        bit = get_condition_table().bits.get(condition.lower())
+        if bit is None or bit > _MAX_SQUAD_CONDITION_BIT:
+            return 0
+        if np is not None:
+            return int(np.count_nonzero(self.condition_mask & bit))
+        return sum(1 for mask in self.condition_mask if mask & bit)
+
+    def roll_initiative(self, dice_roller: Any) -> Any:
+        """
+        Roll initiative (1d20) for every member in one batch.
+
+        Args:
+            dice_roller: DiceRoller to roll with
+
+        Returns:
+            The squad's initiative column
+        """
+        rolls = dice_roller.roll_many("1d20", len(self.members))
+        for index, roll in enumerate(rolls):
+            self.initiative[index] = roll
+        return self.initiative
+
+    def _condition_bit(self, condition: str) -> int:
+        """Get the mask bit for a condition, checking that it fits the condition column."""
+        bit = get_condition_table().bit(condition)
+        if bit > _MAX_SQUAD_CONDITION_BIT:
+            raise ValueError(f"Squads can only track the first {MAX_SQUAD_CONDITIONS} conditions")
+        return bit
+
+    def __str__(self) -> str:
+        """String representation of the squad"""
+        return f"{self.name} squad ({len(self.living_indices())}/{len(self.members)} standing)"
+
+
+class _MemberConditions(MutableMapping):
+    """
+    active_conditions for one squad member: condition name -> metadata.
+
+    Membership lives in the squad's condition mask; metadata dicts are
+    created on first access and kept in the squad's sparse metadata store,
+    so callers can mutate them in place as they do for a Creature.
+    """
+
+    __slots__ = ("_squad", "_index")
+
+    def __init__(self, squad: MonsterSquad, index: int):
+        self._squad = squad
+        self._index = index
+
+    def __getitem__(self, condition: str) -> dict:
+        bit = get_condition_table().bits.get(condition, 0)
+        if not self._squad.condition_mask[self._index] & bit:
+            raise KeyError(condition)
+        return self._squad._condition_metadata.setdefault((self._index, condition), {})
+
+    def __setitem__(self, condition: str, metadata: dict) -> None:
+        self._squad.condition_mask[self._index] |= self._squad._condition_bit(condition)
+        if metadata:
+            self._squad._condition_metadata[(self._index, condition)] = metadata
+        else:
+            self._squad._condition_metadata.pop((self._index, condition), None)
+
+    def __delitem__(self, condition: str) -> None:
+        bit = get_condition_table().bits.get(condition, 0)
+        if not self._squad.condition_mask[self._index] & bit:
+            raise KeyError(condition)
+        self._squad.condition_mask[self._index] &= ~bit
+        self._squad._condition_metadata.pop((self._index, condition), None)
+
+    def __contains__(self, condition: object) -> bool:
+        if not isinstance(condition, str):
+            return False
+        bit = get_condition_table().bits.get(condition, 0)
+        return bool(self._squad.condition_mask[self._index] & bit)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(get_condition_table().names(int(self._squad.condition_mask[self._index])))
+
+    def __len__(self) -> int:
+        return bin(int(self._squad.condition_mask[self._index])).count("1")
+
+
+class SquadMember(Creature):
+    """
+    One monster in a MonsterSquad.
+
+    A Creature whose HP and conditions read and write the squad's columns
+    and whose stat block is the squad's. Members hold only a reference to
+    the squad and their index, and are created once per squad so they can
+    be used as dictionary keys (enemy numbers, initiative) like any creature.
+    """
+
+    __slots__ = ("squad", "index")
+
+    def __init__(self, squad: MonsterSquad, index: int):
+        """
+        Create a view of a squad member.
+
+        Args:
+            squad: Squad the member belongs to
+            index: Member's index in the squad's columns
+        """
+        self.squad = squad
+        self.index = index
+
+    # The stat block is the squad's, so these read-only views replace Creature's writable attributes
+    @property
+    def name(self) -> str:  # type: ignore[override]
+        return self.squad.name
+
+    @property
+    def ac(self) -> int:  # type: ignore[override]
+        return self.squad.ac
+
+    @property
+    def abilities(self) -> Abilities:  # type: ignore[override]
+        return self.squad.abilities
+
+    @property
+    def monster_id(self) -> Optional[str]:  # type: ignore[override]
+        return self.squad.monster_id
+
+    @property
+    def action_table(self) -> Any:  # type: ignore[override]
+        return self.squad.action_table
+
+    @property
+    def max_hp(self) -> int:  # type: ignore[override]
+        return int(self.squad.max_hp[self.index])
+
+    @property
+    def current_hp(self) -> int:
+        return int(self.squad.hp[self.index])
+
+    @current_hp.setter
+    def current_hp(self, value: int) -> None:
+        self.squad.hp[self.index] = value
+
+    @property
+    def active_conditions(self) -> _MemberConditions:  # type: ignore[override]
+        return _MemberConditions(self.squad, self.index)
+
+    @property
+    def condition_mask(self) -> int:
+        return int(self.squad.condition_mask[self.index])
+
+    @condition_mask.setter
+    def condition_mask(self, mask: int) -> None:
+        self.squad.condition_mask[self.index] = mask
+
+    @property
+    def _timed_condition_mask(self) -> int:
+        return self.squad._timed_condition_masks.get(self.index, 0)
+
+    @_timed_condition_mask.setter
+    def _timed_condition_mask(self, mask: int) -> None:
+        if mask:
+            self.squad._timed_condition_masks[self.index] = mask
+        else:
+            self.squad._timed_condition_masks.pop(self.index, None)
+
+    @property
+    def _dice_roller(self) -> Any:
+        return self.squad._dice_roller
+
+    @_dice_roller.setter
+    def _dice_roller(self, dice_roller: Any) -> None:
+        self.squad._dice_roller = dice_roller
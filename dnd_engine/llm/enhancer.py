@@ -4,10 +4,12 @@
 import asyncio
 import threading
 import time
-from typing import Dict, Optional
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional
 
 from ..utils.events import Event, EventBus, EventType
 from .base import LLMProvider
+from .narrative_cache import NarrativeCache
 from .prompts import (
     build_combat_action_prompt,
     build_combat_start_prompt,
@@ -29,7 +31,9 @@ class LLMEnhancer:
         self,
         provider: Optional[LLMProvider],
         event_bus: EventBus,
-        enable_cache: bool = True
+        enable_cache: bool = True,
+        narrative_cache: Optional[NarrativeCache] = None,
+        prefetch_concurrency: int = 2
     ) -> None:
         """
         Initialize LLM enhancer.
@@ -38,10 +42,18 @@ class LLMEnhancer:
             provider: LLM provider or None to disable
             event_bus: Game event bus to subscribe to
             enable_cache: Whether to cache enhanced descriptions
+            narrative_cache: Persistent cache shared across sessions (None disables it)
+            prefetch_concurrency: Maximum neighboring-room descriptions generated at once (0 disables prefetch)
         """
         self.provider = provider
         self.event_bus = event_bus
         self.cache: Optional[Dict[str, str]] = {} if enable_cache else None
+        self.narrative_cache = narrative_cache
+        self.prefetch_concurrency = prefetch_concurrency
+
+        # Speculative room description generations in flight, by room cache key
+        self._prefetches: Dict[str, Future] = {}
+        self._prefetch_semaphore = asyncio.Semaphore(max(prefetch_concurrency, 1))
 
         # Create background event loop for async tasks
         self._loop: Optional[asyncio.AbstractEventLoop] = None
@@ -103,13 +115,138 @@ class LLMEnhancer:
             # Timeout or other error - return None for graceful degradation
             return None
 
+    def _cached_narrative(self, prompt: str, temperature: float) -> Optional[str]:
+        """
+        Look up a prompt in the persistent narrative cache.
+
+        Args:
+            prompt: Prompt text
+            temperature: Sampling temperature
+
+        Returns:
+            Cached narrative, or None on a miss (or without a cache)
+        """
+        if self.narrative_cache is None or not self.provider:
+            return None
+        return self.narrative_cache.get(self._narrative_key(prompt, temperature))
+
+    def _narrative_key(self, prompt: str, temperature: float) -> str:
+        """Build the persistent cache key for a prompt sent to the current provider."""
+        return NarrativeCache.make_key(type(self.provider).__name__, self.provider.model, prompt, temperature)
+
+    async def _generate(
+        self,
+        prompt: str,
+        temperature: float,
+        prompt_type: str,
+        check_cache: bool = True
+    ) -> Optional[str]:
+        """
+        Generate text, serving it from the persistent narrative cache when possible.
+
+        Args:
+            prompt: Prompt text
+            temperature: Sampling temperature
+            prompt_type: Prompt type for logging (e.g. "room_description")
+            check_cache: Look up the persistent cache first (False if the caller already did)
+
+        Returns:
+            Generated text or None if generation failed
+        """
+        if check_cache:
+            cached = self._cached_narrative(prompt, temperature)
+            if cached is not None:
+                return cached
+
+        provider = self.provider
+        start_time = time.time()
+        result = await provider.generate(prompt, temperature=temperature)
+        latency_ms = (time.time() - start_time) * 1000
+
+        # Log LLM call
+        from ..utils.logging_config import get_logging_config
+        logging_config = get_logging_config()
+        if logging_config:
+            logging_config.log_llm_call(
+                prompt_type=prompt_type,
+                latency_ms=latency_ms,
+                response_length=len(result) if result else 0,
+                success=bool(result)
+            )
+
+        # Only cache if the provider wasn't swapped while generating
+        if result and self.narrative_cache is not None and provider is self.provider:
+            self.narrative_cache.put(self._narrative_key(prompt, temperature), result)
+
+        return result
+
+    def _generate_sync(self, prompt: str, temperature: float, prompt_type: str, timeout: float) -> Optional[str]:
+        """
+        Generate text synchronously, answering cache hits without a round trip to the event loop.
+
+        Args:
+            prompt: Prompt text
+            temperature: Sampling temperature
+            prompt_type: Prompt type for logging
+            timeout: Timeout in seconds
+
+        Returns:
+            Generated text or None on timeout/error
+        """
+        cached = self._cached_narrative(prompt, temperature)
+        if cached is not None:
+            return cached
+        return self._run_sync(self._generate(prompt, temperature, prompt_type, check_cache=False), timeout=timeout)
+
     def shutdown(self) -> None:
         """Shutdown the background event loop."""
+        for future in self._prefetches.values():
+            future.cancel()
+        self._prefetches.clear()
         if self._loop:
             self._loop.call_soon_threadsafe(self._loop.stop)
             if self._loop_thread:
                 self._loop_thread.join(timeout=1.0)
 
+    @staticmethod
+    def _room_cache_key(room_data: Dict) -> str:
+        """
+        Build the in-memory cache key for a room description.
+
+        The key includes monster presence, lighting, and room transition state
+        to avoid stale descriptions after combat ends, lighting changes, or when
+        re-examining a room.
+        Examples: "room_laboratory_bright_entering", "room_laboratory_combat_2_monsters_dark_looking"
+
+        Args:
+            room_data: Room data (id, monsters, party_lighting, previous_room_id)
+
+        Returns:
+            Cache key string
+        """
+        monsters = room_data.get('monsters', [])
+        monster_suffix = ""
+        if monsters:
+            monster_suffix = f"_combat_{len(monsters)}_monsters"
+
+        # Include party lighting state in cache key (use best available lighting)
+        party_lighting = room_data.get('party_lighting', [])
+        lighting_state = "dark"
+        for char_lighting in party_lighting:
+            if char_lighting.get("lighting") == "bright":
+                lighting_state = "bright"
+                break
+            elif char_lighting.get("lighting") == "dim":
+                lighting_state = "dim"
+
+        # Detect room transition
+        room_id = room_data.get('id', 'unknown')
+        previous_room_id = room_data.get('previous_room_id')
+        is_entering = previous_room_id != room_id if previous_room_id is not None else True
+        transition_suffix = "_entering" if is_entering else "_looking"
+
+        return f"room_{room_id}{monster_suffix}_{lighting_state}{transition_suffix}"
+
     def _handle_room_enter(self, event: Event) -> None:
         """
         Handle room enter event (synchronous wrapper).
@@ -159,34 +296,10 @@ class LLMEnhancer:
 
         room_data = event.data
         combat_starting = room_data.get('combat_starting', False)
-        monsters = room_data.get('monsters', [])
         monsters_data = room_data.get('monsters_data')
         party_size = room_data.get('party_size', 1)
 
-        # Build cache key that includes monster presence, lighting, and room transition state
-        # to avoid stale descriptions after combat ends, lighting changes, or when re-examining a room
-        # Examples: "room_laboratory_bright_entering", "room_laboratory_combat_2_monsters_dark_looking"
-        monster_suffix = ""
-        if monsters:
-            monster_suffix = f"_combat_{len(monsters)}_monsters"
-
-        # Include party lighting state in cache key (use best available lighting)
-        party_lighting = room_data.get('party_lighting', [])
-        lighting_state = "dark"
-        for char_lighting in party_lighting:
-            if char_lighting.get("lighting") == "bright":
-                lighting_state = "bright"
-                break
-            elif char_lighting.get("lighting") == "dim":
-                lighting_state = "dim"
-
-        # Detect room transition
-        room_id = room_data.get('id', 'unknown')
-        previous_room_id = room_data.get('previous_room_id')
-        is_entering = previous_room_id != room_id if previous_room_id is not None else True
-        transition_suffix = "_entering" if is_entering else "_looking"
-
-        cache_key = f"room_{room_id}{monster_suffix}_{lighting_state}{transition_suffix}"
+        cache_key = self._room_cache_key(room_data)
 
         # Check cache
         if self.cache is not None and cache_key in self.cache:
@@ -199,20 +312,7 @@ class LLMEnhancer:
                 monsters_data=monsters_data,
                 party_size=party_size
             )
-            start_time = time.time()
-            enhanced = await self.provider.generate(prompt)
-            latency_ms = (time.time() - start_time) * 1000
-
-            # Log LLM call
-            from ..utils.logging_config import get_logging_config
-            logging_config = get_logging_config()
-            if logging_config:
-                logging_config.log_llm_call(
-                    prompt_type="room_description",
-                    latency_ms=latency_ms,
-                    response_length=len(enhanced) if enhanced else 0,
-                    success=bool(enhanced)
-                )
+            enhanced = await self._generate(prompt, 0.7, "room_description")
 
             # Fallback if generation failed
             if not enhanced:
@@ -247,21 +347,7 @@ class LLMEnhancer:
         action_data = event.data
         prompt = build_combat_action_prompt(action_data)
 
-        # Time the LLM call
-        start_time = time.time()
-        enhanced = await self.provider.generate(prompt, temperature=0.8)
-        latency_ms = (time.time() - start_time) * 1000
-
-        # Log LLM call
-        from ..utils.logging_config import get_logging_config
-        logging_config = get_logging_config()
-        if logging_config:
-            logging_config.log_llm_call(
-                prompt_type="combat_action",
-                latency_ms=latency_ms,
-                response_length=len(enhanced) if enhanced else 0,
-                success=bool(enhanced)
-            )
+        enhanced = await self._generate(prompt, 0.8, "combat_action")
 
         # Fallback
         if not enhanced:
@@ -289,21 +375,7 @@ class LLMEnhancer:
         combat_data = event.data
         prompt = build_victory_prompt(combat_data)
 
-        # Time the LLM call
-        start_time = time.time()
-        enhanced = await self.provider.generate(prompt)
-        latency_ms = (time.time() - start_time) * 1000
-
-        # Log LLM call
-        from ..utils.logging_config import get_logging_config
-        logging_config = get_logging_config()
-        if logging_config:
-            logging_config.log_llm_call(
-                prompt_type="victory",
-                latency_ms=latency_ms,
-                response_length=len(enhanced) if enhanced else 0,
-                success=bool(enhanced)
-            )
+        enhanced = await self._generate(prompt, 0.7, "victory")
 
         # Fallback
         if not enhanced:
@@ -333,21 +405,7 @@ class LLMEnhancer:
         character_data = event.data
         prompt = build_death_prompt(character_data)
 
-        # Time the LLM call
-        start_time = time.time()
-        enhanced = await self.provider.generate(prompt, temperature=0.6)
-        latency_ms = (time.time() - start_time) * 1000
-
-        # Log LLM call
-        from ..utils.logging_config import get_logging_config
-        logging_config = get_logging_config()
-        if logging_config:
-            logging_config.log_llm_call(
-                prompt_type="death",
-                latency_ms=latency_ms,
-                response_length=len(enhanced) if enhanced else 0,
-                success=bool(enhanced)
-            )
+        enhanced = await self._generate(prompt, 0.6, "death")
 
         # Fallback
         if not enhanced:
@@ -377,25 +435,7 @@ class LLMEnhancer:
 
         prompt = build_combat_action_prompt(action_data)
 
-        async def generate():
-            start_time = time.time()
-            result = await self.provider.generate(prompt, temperature=0.8)
-            latency_ms = (time.time() - start_time) * 1000
-
-            # Log LLM call
-            from ..utils.logging_config import get_logging_config
-            logging_config = get_logging_config()
-            if logging_config:
-                logging_config.log_llm_call(
-                    prompt_type="combat_action",
-                    latency_ms=latency_ms,
-                    response_length=len(result) if result else 0,
-                    success=bool(result)
-                )
-
-            return result
-
-        return self._run_sync(generate(), timeout=timeout)
+        return self._generate_sync(prompt, 0.8, "combat_action", timeout)
 
     def get_death_narrative_sync(self, character_data: Dict, timeout: float = 20.0) -> Optional[str]:
         """
@@ -413,25 +453,7 @@ class LLMEnhancer:
 
         prompt = build_death_prompt(character_data)
 
-        async def generate():
-            start_time = time.time()
-            result = await self.provider.generate(prompt, temperature=0.6)
-            latency_ms = (time.time() - start_time) * 1000
-
-            # Log LLM call
-            from ..utils.logging_config import get_logging_config
-            logging_config = get_logging_config()
-            if logging_config:
-                logging_config.log_llm_call(
-                    prompt_type="death",
-                    latency_ms=latency_ms,
-                    response_length=len(result) if result else 0,
-                    success=bool(result)
-                )
-
-            return result
-
-        return self._run_sync(generate(), timeout=timeout)
+        return self._generate_sync(prompt, 0.6, "death", timeout)
 
     def get_room_description_sync(self, room_data: Dict, timeout: float = 20.0) -> Optional[str]:
         """
@@ -448,38 +470,27 @@ class LLMEnhancer:
             return None
 
         combat_starting = room_data.get('combat_starting', False)
-        monsters = room_data.get('monsters', [])
         monsters_data = room_data.get('monsters_data')
         party_size = room_data.get('party_size', 1)
 
-        # Build cache key that includes monster presence, lighting, and room transition state
-        # to avoid stale descriptions after combat ends, lighting changes, or when re-examining a room
-        # Examples: "room_laboratory_bright_entering", "room_laboratory_combat_2_monsters_dark_looking"
-        monster_suffix = ""
-        if monsters:
-            monster_suffix = f"_combat_{len(monsters)}_monsters"
-
-        # Include party lighting state in cache key (use best available lighting)
-        party_lighting = room_data.get('party_lighting', [])
-        lighting_state = "dark"
-        for char_lighting in party_lighting:
-            if char_lighting.get("lighting") == "bright":
-                lighting_state = "bright"
-                break
-            elif char_lighting.get("lighting") == "dim":
-                lighting_state = "dim"
-
-        # Detect room transition
-        room_id = room_data.get('id', 'unknown')
-        previous_room_id = room_data.get('previous_room_id')
-        is_entering = previous_room_id != room_id if previous_room_id is not None else True
-        transition_suffix = "_entering" if is_entering else "_looking"
-
-        cache_key = f"room_{room_id}{monster_suffix}_{lighting_state}{transition_suffix}"
+        cache_key = self._room_cache_key(room_data)
 
         # Check cache first
         if self.cache and cache_key in self.cache:
             return self.cache[cache_key]
+
+        # A prefetch for this room may already be underway
+        pending = self._prefetches.pop(cache_key, None)
+        if pending is not None:
+            try:
+                result = pending.result(timeout=timeout)
+            except FutureTimeoutError:
+                return None
+            except Exception:
+                result = None  # Cancelled or failed; generate it now
+            if result:
+                return result
+
         prompt = build_room_description_prompt(
             room_data,
             combat_starting=combat_starting,
@@ -487,29 +498,74 @@ class LLMEnhancer:
             party_size=party_size
         )
 
-        async def generate():
-            start_time = time.time()
-            result = await self.provider.generate(prompt, temperature=0.7)
-            latency_ms = (time.time() - start_time) * 1000
+        result = self._generate_sync(prompt, 0.7, "room_description", timeout)
+
+        # Cache the result
+        if result and self.cache is not None:
+            self.cache[cache_key] = result
+
+        return result
 
-            # Log LLM call
-            from ..utils.logging_config import get_logging_config
-            logging_config = get_logging_config()
-            if logging_config:
-                logging_config.log_llm_call(
-                    prompt_type="room_description",
-                    latency_ms=latency_ms,
-                    response_length=len(result) if result else 0,
-                    success=bool(result)
-                )
+    def prefetch_room_descriptions(self, rooms_data: List[Dict]) -> None:
+        """
+        Speculatively generate descriptions of rooms the party may enter next.
+
+        Generation runs on the background event loop, at most
+        prefetch_concurrency at a time, and lands in the same caches
+        get_room_description_sync() reads. Prefetches for rooms not in
+        rooms_data (left over from an earlier room) are cancelled.
+
+        Args:
+            rooms_data: Room data for each neighboring room, as the party
+                would see it on arrival (see GameState.build_room_narrative_data)
+        """
+        if not self.provider or self.prefetch_concurrency <= 0:
+            return
+        if self.cache is None and self.narrative_cache is None:
+            return  # Nowhere to keep the results
 
-            # Cache the result
-            if result and self.cache is not None:
-                self.cache[cache_key] = result
+        wanted = {self._room_cache_key(room_data): room_data for room_data in rooms_data}
 
-            return result
+        # Cancel work that is no longer relevant and forget finished work
+        for cache_key, future in list(self._prefetches.items()):
+            if cache_key not in wanted or future.done():
+                future.cancel()
+                del self._prefetches[cache_key]
+
+        if not self._loop or self._loop.is_closed():
+            return
+
+        for cache_key, room_data in wanted.items():
+            if cache_key in self._prefetches or (self.cache is not None and cache_key in self.cache):
+                continue
+            self._prefetches[cache_key] = asyncio.run_coroutine_threadsafe(
+                self._prefetch_room_description(room_data, cache_key),
+                self._loop
+            )
+
+    async def _prefetch_room_description(self, room_data: Dict, cache_key: str) -> Optional[str]:
+        """
+        Generate and cache one room description within the prefetch concurrency budget.
+
+        Args:
+            room_data: Room data as the party would see it on arrival
+            cache_key: In-memory cache key for the room
+
+        Returns:
+            Generated description or None if generation failed
+        """
+        async with self._prefetch_semaphore:
+            prompt = build_room_description_prompt(
+                room_data,
+                combat_starting=room_data.get('combat_starting', False),
+                monsters_data=room_data.get('monsters_data'),
+                party_size=room_data.get('party_size', 1)
+            )
+            result = await self._generate(prompt, 0.7, "room_prefetch")
 
-        return self._run_sync(generate(), timeout=timeout)
+        if result and self.cache is not None:
+            self.cache[cache_key] = result
+        return result
 
     def get_combat_start_narrative_sync(self, combat_data: Dict, timeout: float = 20.0) -> Optional[str]:
         """
@@ -527,22 +583,4 @@ class LLMEnhancer:
 
         prompt = build_combat_start_prompt(combat_data)
 
-        async def generate():
-            start_time = time.time()
-            result = await self.provider.generate(prompt, temperature=0.8)
-            latency_ms = (time.time() - start_time) * 1000
-
-            # Log LLM call
-            from ..utils.logging_config import get_logging_config
-            logging_config = get_logging_config()
-            if logging_config:
-                logging_config.log_llm_call(
-                    prompt_type="combat_start",
-                    latency_ms=latency_ms,
-                    response_length=len(result) if result else 0,
-                    success=bool(result)
-                )
-
-            return result
-
-        return self._run_sync(generate(), timeout=timeout)
+        return self._generate_sync(prompt, 0.8, "combat_start", timeout)
@@ -0,0 +1,174 @@
+# ABOUTME: Persistent SQLite cache of LLM narratives shared across game sessions
+# ABOUTME: Keyed by a hash of provider, model, prompt and temperature, with TTL and LRU size cap
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".dnd_terminal" / "llm_cache.sqlite3"
+
+
+class NarrativeCache:
+    """
+    On-disk cache of generated narratives.
+
+    Entries expire ttl_seconds after they were written. When more than
+    max_entries are stored, the least recently used entries are evicted.
+    The cache is safe to use from the game-loop thread and the enhancer's
+    background event loop at the same time.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_seconds: Optional[float] = 30 * 24 * 60 * 60,
+        max_entries: int = 5000,
+        clock: Callable[[], float] = time.time
+    ) -> None:
+        """
+        Open (or create) a narrative cache.
+
+        Args:
+            path: SQLite file (defaults to ~/.dnd_terminal/llm_cache.sqlite3; ":memory:" for a private cache)
+            ttl_seconds: Seconds an entry stays valid (None keeps entries until evicted)
+            max_entries: Maximum number of stored entries
+            clock: Time source (seconds since the epoch)
+        """
+        self.path = Path(path) if path is not None else DEFAULT_CACHE_PATH
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        if str(self.path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS narratives ("
+                "key TEXT PRIMARY KEY, text TEXT NOT NULL, created_at REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS narratives_last_used ON narratives (last_used)"
+            )
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str, temperature: float) -> str:
+        """
+        Build the cache key for a generation request.
+
+        Args:
+            provider: Provider identifier (e.g. class name)
+            model: Model name
+            prompt: Full prompt text
+            temperature: Sampling temperature
+
+        Returns:
+            SHA-256 hex digest identifying the request
+        """
+        payload = json.dumps([provider, model, prompt, round(temperature, 4)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a narrative.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached text, or None if missing or expired
+        """
+        now = self._clock()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT text, created_at FROM narratives WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            text, created_at = row
+            with self._connection:
+                if self.ttl_seconds is not None and now - created_at >= self.ttl_seconds:
+                    self._connection.execute("DELETE FROM narratives WHERE key = ?", (key,))
+                    self.expirations += 1
+                    self.misses += 1
+                    return None
+
+                self._connection.execute("UPDATE narratives SET last_used = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return str(text)
+
+    def put(self, key: str, text: str) -> None:
+        """
+        Store a narrative, evicting least recently used entries over max_entries.
+
+        Args:
+            key: Key from make_key()
+            text: Generated text
+        """
+        now = self._clock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO narratives (key, text, created_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, text, now, now)
+            )
+            excess = self._count() - self.max_entries
+            if excess > 0:
+                self._connection.execute(
+                    "DELETE FROM narratives WHERE key IN "
+                    "(SELECT key FROM narratives ORDER BY last_used LIMIT ?)",
+                    (excess,)
+                )
+                self.evictions += excess
+
+    def clear(self) -> None:
+        """Remove every stored narrative."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM narratives")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics for this session.
+
+        Returns:
+            Dictionary of entries, hits, misses, hit_rate, evictions and expirations
+        """
+        with self._lock:
+            entries = self._count()
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        """Get the number of stored narratives."""
+        with self._lock:
+            return self._count()
+
+    def _count(self) -> int:
+        """Count stored narratives (caller holds the lock)."""
+        return int(self._connection.execute("SELECT COUNT(*) FROM narratives").fetchone()[0])
@@ -2,7 +2,9 @@
 # ABOUTME: Orchestrates new main menu, save slots, character vault, and game loop
 
 import argparse
+import sqlite3
 import sys
+from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
@@ -11,6 +13,7 @@ from dotenv import load_dotenv
 from dnd_engine.core.game_state import GameState
 from dnd_engine.llm.enhancer import LLMEnhancer
 from dnd_engine.llm.factory import create_llm_provider
+from dnd_engine.llm.narrative_cache import NarrativeCache
 from dnd_engine.ui.main_menu_v2 import MainMenuV2
 from dnd_engine.ui.cli import CLI
 from dnd_engine.core.save_slot_manager import SaveSlotManager
@@ -33,10 +36,12 @@ def parse_arguments() -> argparse.Namespace:
 Examples:
   dnd-game                          # Start with new menu system
   dnd-game --no-llm                 # Disable LLM enhancement
+  dnd-game --no-llm-cache           # Don't reuse narratives from earlier sessions
   dnd-game --llm-provider openai    # Use OpenAI (default)
   dnd-game --llm-provider anthropic # Use Anthropic Claude
   dnd-game --llm-provider debug     # Debug mode
   dnd-game --debug                  # Enable debug logging
+  dnd-game --content-pack packs/homebrew  # Load a compiled homebrew content pack
         """
     )
 
@@ -46,12 +51,27 @@ Examples:
         help="Disable LLM narrative enhancement"
     )
 
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Disable the on-disk LLM narrative cache shared across sessions"
+    )
+
     parser.add_argument(
         "--llm-provider",
         choices=["openai", "anthropic", "debug", "none"],
         help="Override LLM provider (default: from LLM_PROVIDER env var)"
     )
 
+    parser.add_argument(
+        "--content-pack",
+        action="append",
+        type=Path,
+        default=[],
+        metavar="DIR",
+        help="Load a compiled homebrew content pack (repeatable; earlier packs win)"
+    )
+
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -92,6 +112,19 @@ def initialize_llm(args: argparse.Namespace) -> Optional:
         return None
 
 
+def initialize_narrative_cache(args: argparse.Namespace) -> Optional[NarrativeCache]:
+    """Open the on-disk narrative cache, or continue without one if it can't be used."""
+    if args.no_llm_cache:
+        return None
+
+    try:
+        return NarrativeCache()
+    except (OSError, sqlite3.Error) as e:
+        print_status_message(f"LLM narrative cache unavailable: {e}", "warning")
+        print_status_message("Continuing without cached narratives...", "info")
+        return None
+
+
 class SaveSlotCLIAdapter:
     """
     Adapter to make CLI work with SaveSlotManager.
@@ -180,11 +213,12 @@ def main() -> None:
     if llm_provider:
         from dnd_engine.utils.events import EventBus
         event_bus = EventBus()
-        llm_enhancer = LLMEnhancer(llm_provider, event_bus)
+        narrative_cache = initialize_narrative_cache(args)
+        llm_enhancer = LLMEnhancer(llm_provider, event_bus, narrative_cache=narrative_cache)
 
     try:
         # Show new main menu (handles migration automatically)
-        menu = MainMenuV2()
+        menu = MainMenuV2(content_packs=args.content_pack)
 
         result = menu.run()
 
@@ -0,0 +1,213 @@
+# ABOUTME: Compiled monster action tables built once per stat block
+# ABOUTME: Parses attack actions, saving throw riders, reach/range, and Multiattack routines
+
+import re
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Sequence, Tuple
+
+from dnd_engine.core.dice import compile_dice
+
+
+# Number words used in Multiattack descriptions
+_COUNTS = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5}
+_ORDINALS = {"first": 0, "second": 1, "third": 2, "fourth": 3, "fifth": 4}
+
+# "makes two scimitar attacks"
+_REPEATED_ATTACK = re.compile(r"makes (\w+) ([a-z][a-z ]*?) attacks", re.IGNORECASE)
+# "one with its bite and one with its claws"
+_NAMED_ATTACK = re.compile(r"(\w+) with its ([a-z][a-z ]*?)(?=,| and |\.|$)", re.IGNORECASE)
+# "The second attack has disadvantage."
+_DISADVANTAGE = re.compile(r"the (\w+) attack has disadvantage", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class AttackOption:
+    """
+    A rollable attack action from a stat block.
+
+    Attributes:
+        name: Action name (e.g., "Scimitar")
+        attack_bonus: Bonus to the attack roll
+        damage: Damage dice notation (e.g., "1d6+2")
+        damage_type: Damage type (e.g., "slashing")
+        melee: True if the attack can be made in melee
+        ranged: True if the attack can be made at range
+        expected_damage: Average damage on a hit
+        saving_throw: Saving throw rider applied on a hit, if any
+        action: Raw action definition (passed to CombatEngine.resolve_attack)
+    """
+    name: str
+    attack_bonus: int
+    damage: str
+    damage_type: str
+    melee: bool
+    ranged: bool
+    expected_damage: float
+    saving_throw: Optional[Mapping[str, Any]]
+    action: Mapping[str, Any]
+
+    @classmethod
+    def compile(cls, action: Mapping[str, Any]) -> Optional["AttackOption"]:
+        """
+        Compile an action definition into an attack option.
+
+        Args:
+            action: Action from a monster's "actions" list
+
+        Returns:
+            AttackOption, or None if the action isn't a rollable attack
+
+        Raises:
+            ValueError: If the damage notation is invalid
+        """
+        if "attack_bonus" not in action or "damage" not in action:
+            return None
+
+        action_type = action.get("type", "")
+        ranged = "ranged" in action_type or ("range" in action and "reach" not in action)
+        melee = "melee" in action_type or "reach" in action or not ranged
+
+        return cls(
+            name=action.get("name", "Attack"),
+            attack_bonus=action["attack_bonus"],
+            damage=action["damage"],
+            damage_type=action.get("damage_type", ""),
+            melee=melee,
+            ranged=ranged,
+            expected_damage=float(compile_dice(action["damage"]).mean),
+            saving_throw=action.get("saving_throw"),
+            action=action
+        )
+
+
+@dataclass(frozen=True)
+class AttackStep:
+    """
+    One attack within a turn.
+
+    Attributes:
+        attack: Attack to make
+        disadvantage: True if this attack is rolled with disadvantage
+    """
+    attack: AttackOption
+    disadvantage: bool = False
+
+
+@dataclass(frozen=True)
+class ActionTable:
+    """
+    Precompiled attack options for a monster.
+
+    Attributes:
+        attacks: Rollable attacks, in stat block order
+        multiattack: Attacks made on a turn with Multiattack (empty if none)
+    """
+    attacks: Tuple[AttackOption, ...] = ()
+    multiattack: Tuple[AttackStep, ...] = ()
+
+    @classmethod
+    def compile(cls, actions: Sequence[Mapping[str, Any]]) -> "ActionTable":
+        """
+        Compile a monster's actions.
+
+        Multiattack descriptions are parsed for the attacks they name
+        ("makes two scimitar attacks", "one with its bite and one with its
+        claws") and for a disadvantaged attack ("the second attack has
+        disadvantage"). A description that can't be matched to the monster's
+        attacks is ignored, so the monster falls back to its primary attack.
+
+        Args:
+            actions: Monster's "actions" list
+
+        Returns:
+            Compiled ActionTable
+
+        Raises:
+            ValueError: If an attack's damage notation is invalid
+        """
+        attacks = tuple(
+            option for option in (AttackOption.compile(action) for action in actions)
+            if option is not None
+        )
+
+        multiattack: Tuple[AttackStep, ...] = ()
+        for action in actions:
+            if action.get("name", "").lower() == "multiattack":
+                multiattack = _parse_multiattack(action.get("description", ""), attacks)
+                break
+
+        return cls(attacks=attacks, multiattack=multiattack)
+
+    @property
+    def primary(self) -> Optional[AttackOption]:
+        """First rollable attack, or None if the monster has none."""
+        return self.attacks[0] if self.attacks else None
+
+    @property
+    def melee_attacks(self) -> Tuple[AttackOption, ...]:
+        """Attacks usable in melee."""
+        return tuple(attack for attack in self.attacks if attack.melee)
+
+    @property
+    def ranged_attacks(self) -> Tuple[AttackOption, ...]:
+        """Attacks usable at range."""
+        return tuple(attack for attack in self.attacks if attack.ranged)
+
+    @property
+    def turn_attacks(self) -> Tuple[AttackStep, ...]:
+        """Attacks made on a full attack turn (Multiattack, or the primary attack)."""
+        if self.multiattack:
+            return self.multiattack
+        if self.attacks:
+            return (AttackStep(self.attacks[0]),)
+        return ()
+
+    def find(self, name: str) -> Optional[AttackOption]:
+        """
+        Find an attack by name.
+
+        Args:
+            name: Attack name, case-insensitive, singular or plural (e.g., "claws")
+
+        Returns:
+            AttackOption, or None if no attack matches
+        """
+        wanted = name.strip().lower()
+        for attack in self.attacks:
+            attack_name = attack.name.lower()
+            if wanted in (attack_name, attack_name + "s") or attack_name in (wanted, wanted + "s"):
+                return attack
+        return None
+
+
+def _parse_multiattack(description: str, attacks: Tuple[AttackOption, ...]) -> Tuple[AttackStep, ...]:
+    """Parse a Multiattack description into attack steps (empty if unrecognized)."""
+    table = ActionTable(attacks=attacks)
+    named = []
+
+    repeated = _REPEATED_ATTACK.search(description)
+    if repeated:
+        count = _COUNTS.get(repeated.group(1).lower())
+        attack = table.find(repeated.group(2))
+        if count and attack:
+            named = [attack] * count
+    else:
+        for count_word, attack_name in _NAMED_ATTACK.findall(description):
+            count = _COUNTS.get(count_word.lower())
+            attack = table.find(attack_name)
+            if not count or not attack:
+                return ()
+            named.extend([attack] * count)
+
+    if not named:
+        return ()
+
+    disadvantaged = set()
+    for ordinal in _DISADVANTAGE.findall(description):
+        if ordinal.lower() in _ORDINALS:
+            disadvantaged.add(_ORDINALS[ordinal.lower()])
+
+    return tuple(
+        AttackStep(attack, disadvantage=index in disadvantaged)
+        for index, attack in enumerate(named)
+    )
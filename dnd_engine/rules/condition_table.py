@@ -0,0 +1,193 @@
+# ABOUTME: Condition bitsets and effect flags compiled once from conditions.json
+# ABOUTME: Maps each condition to a bit and each set of conditions to its combined mechanical effects
+
+import threading
+from enum import IntFlag
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+
+class ConditionEffect(IntFlag):
+    """
+    Mechanical effects a condition can have, named as in conditions.json "effects".
+
+    ATTACKS_* apply to the creature's own attack rolls, ATTACKED_* to attack
+    rolls made against it.
+    """
+    NONE = 0
+    INCAPACITATED = 1 << 0
+    SPEED_ZERO = 1 << 1
+    ATTACKS_HAVE_ADVANTAGE = 1 << 2
+    ATTACKS_HAVE_DISADVANTAGE = 1 << 3
+    ATTACKED_WITH_ADVANTAGE = 1 << 4
+    ATTACKED_WITH_DISADVANTAGE = 1 << 5
+    AUTO_FAIL_STR_DEX_SAVES = 1 << 6
+    DEX_SAVES_HAVE_DISADVANTAGE = 1 << 7
+    ABILITY_CHECKS_HAVE_DISADVANTAGE = 1 << 8
+
+
+_ATTACKS_HAVE_ADVANTAGE = ConditionEffect.ATTACKS_HAVE_ADVANTAGE.value
+_ATTACKS_HAVE_DISADVANTAGE = ConditionEffect.ATTACKS_HAVE_DISADVANTAGE.value
+_ATTACKED_WITH_ADVANTAGE = ConditionEffect.ATTACKED_WITH_ADVANTAGE.value
+_ATTACKED_WITH_DISADVANTAGE = ConditionEffect.ATTACKED_WITH_DISADVANTAGE.value
+
+
+class ConditionTable:
+    """
+    Condition names compiled to bits, with the effects of every condition.
+
+    Creatures store their conditions as a bitmask built from these bits, so
+    membership tests and effect lookups are integer operations. Conditions
+    that aren't defined in conditions.json (e.g. item buffs) get the next
+    free bit on first use and have no effects. Bits are never reassigned,
+    so a mask stays valid for the life of the table.
+    """
+
+    def __init__(self) -> None:
+        self.bits: Dict[str, int] = {}  # condition name -> bit
+        self._names: List[str] = []  # bit position -> condition name
+        # Effects are kept as plain ints: IntFlag operators are far slower than int ones
+        self._effects: List[int] = []  # bit position -> ConditionEffect bits
+        self._mask_effects: Dict[int, int] = {0: 0}  # mask -> combined ConditionEffect bits
+        self._lock = threading.Lock()
+
+    @classmethod
+    def compile(cls, conditions: Mapping[str, Mapping[str, Any]]) -> "ConditionTable":
+        """
+        Compile condition definitions.
+
+        Args:
+            conditions: The "conditions" mapping from conditions.json
+
+        Returns:
+            Compiled ConditionTable
+
+        Raises:
+            ValueError: If a condition names an unknown effect
+        """
+        table = cls()
+        for condition_id, definition in conditions.items():
+            effects = 0
+            for effect in definition.get("effects", ()):
+                try:
+                    effects |= ConditionEffect[effect.upper()].value
+                except KeyError:
+                    raise ValueError(f"Unknown effect '{effect}' for condition '{condition_id}'") from None
+            table._add(condition_id.lower(), effects)
+        return table
+
+    def _add(self, condition: str, effects: int) -> int:
+        """Assign the next bit to a condition."""
+        bit = 1 << len(self._names)
+        self._names.append(condition)
+        self._effects.append(effects)
+        self.bits[condition] = bit
+        return bit
+
+    def bit(self, condition: str) -> int:
+        """
+        Get the bit for a condition, assigning one to an undefined condition on first use.
+
+        Args:
+            condition: Lowercase condition name
+
+        Returns:
+            The condition's bit
+        """
+        bit = self.bits.get(condition)
+        if bit is None:
+            with self._lock:
+                bit = self.bits.get(condition)
+                if bit is None:
+                    bit = self._add(condition, 0)
+        return bit
+
+    def effects(self, mask: int) -> int:
+        """
+        Get the combined effects of a set of conditions.
+
+        Args:
+            mask: Condition bitmask
+
+        Returns:
+            ConditionEffect bits of every condition in the mask
+        """
+        effects = self._mask_effects.get(mask)
+        if effects is None:
+            effects = 0
+            for position in range(mask.bit_length()):
+                if mask >> position & 1:
+                    effects |= self._effects[position]
+            self._mask_effects[mask] = effects
+        return effects
+
+    def names(self, mask: int) -> Tuple[str, ...]:
+        """
+        Get the names of the conditions in a mask.
+
+        Args:
+            mask: Condition bitmask
+
+        Returns:
+            Condition names, in bit order
+        """
+        return tuple(
+            self._names[position] for position in range(mask.bit_length())
+            if mask >> position & 1
+        )
+
+
+_condition_table: Optional[ConditionTable] = None
+_condition_table_lock = threading.Lock()
+
+
+def get_condition_table() -> ConditionTable:
+    """
+    Get the process-wide condition table, compiled from the SRD conditions.json on first use.
+
+    Returns:
+        The shared ConditionTable
+    """
+    global _condition_table
+    if _condition_table is None:
+        with _condition_table_lock:
+            if _condition_table is None:
+                from dnd_engine.rules.loader import get_content_cache
+
+                conditions_file = Path(__file__).parent.parent / "data" / "srd" / "conditions.json"
+                data = get_content_cache().get(conditions_file)
+                _condition_table = ConditionTable.compile(data.get("conditions", {}))
+    return _condition_table
+
+
+def resolve_attack_advantage(
+    attacker: Any,
+    defender: Any,
+    advantage: bool = False,
+    disadvantage: bool = False
+) -> Tuple[bool, bool]:
+    """
+    Combine an attack's advantage/disadvantage with both creatures' conditions.
+
+    Advantage and disadvantage from any sources cancel out (5E rule).
+
+    Args:
+        attacker: Attacking creature
+        defender: Creature being attacked
+        advantage: Advantage from other sources
+        disadvantage: Disadvantage from other sources
+
+    Returns:
+        (advantage, disadvantage) to roll with
+    """
+    attacker_effects = attacker.condition_effects
+    defender_effects = defender.condition_effects
+    advantage = advantage or bool(
+        attacker_effects & _ATTACKS_HAVE_ADVANTAGE or defender_effects & _ATTACKED_WITH_ADVANTAGE
+    )
+    disadvantage = disadvantage or bool(
+        attacker_effects & _ATTACKS_HAVE_DISADVANTAGE or defender_effects & _ATTACKED_WITH_DISADVANTAGE
+    )
+    if advantage and disadvantage:
+        return False, False
+    return advantage, disadvantage
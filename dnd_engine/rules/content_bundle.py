@@ -0,0 +1,159 @@
+# ABOUTME: Build step and reader for the prebuilt binary content bundle
+# ABOUTME: Snapshots data/srd and data/content JSON into one checksummed, versioned file for fast startup
+
+import argparse
+import hashlib
+import json
+import logging
+import pickle
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from dnd_engine.rules.loader import freeze_content
+
+
+logger = logging.getLogger(__name__)
+
+# File name of the bundle inside the data directory
+CONTENT_BUNDLE_NAME = "content.bundle"
+
+# Bump whenever the payload layout or the frozen content types change
+BUNDLE_FORMAT_VERSION = 1
+
+# Header: magic, format version, SHA-256 of the payload
+_MAGIC = b"DNDCONT"
+_HEADER = struct.Struct(f">{len(_MAGIC)}sH32s")
+
+# Directories under the data path that are compiled into the bundle
+BUNDLED_DIRECTORIES = ("srd", "content")
+
+# Map of path relative to the data directory -> (mtime_ns, size, frozen content)
+BundleEntries = Dict[str, Tuple[int, int, Any]]
+
+
+def iter_content_files(data_path: Path) -> List[Path]:
+    """
+    List the JSON content files that belong in the bundle.
+
+    Args:
+        data_path: Path to the data directory
+
+    Returns:
+        Sorted list of JSON file paths
+    """
+    files: List[Path] = []
+    for directory in BUNDLED_DIRECTORIES:
+        root = data_path / directory
+        if root.is_dir():
+            files.extend(root.rglob("*.json"))
+    return sorted(files)
+
+
+def build_bundle(data_path: Path, bundle_path: Optional[Path] = None) -> Path:
+    """
+    Compile every content file into a single bundle.
+
+    Each file is stored with the mtime and size it had when it was parsed,
+    so readers can tell per file whether the snapshot is still fresh.
+
+    Args:
+        data_path: Path to the data directory
+        bundle_path: Where to write the bundle (defaults to data_path/content.bundle)
+
+    Returns:
+        Path of the written bundle
+    """
+    data_path = Path(data_path)
+    if bundle_path is None:
+        bundle_path = data_path / CONTENT_BUNDLE_NAME
+
+    entries: BundleEntries = {}
+    for content_file in iter_content_files(data_path):
+        stat = content_file.stat()
+        with open(content_file, 'r') as f:
+            content = freeze_content(json.load(f))
+        relative = content_file.relative_to(data_path).as_posix()
+        entries[relative] = (stat.st_mtime_ns, stat.st_size, content)
+
+    payload = pickle.dumps(entries, protocol=pickle.HIGHEST_PROTOCOL)
+    header = _HEADER.pack(_MAGIC, BUNDLE_FORMAT_VERSION, hashlib.sha256(payload).digest())
+
+    # Write to a temporary file first so readers never see a partial bundle
+    temp_path = bundle_path.with_name(bundle_path.name + ".tmp")
+    with open(temp_path, 'wb') as f:
+        f.write(header)
+        f.write(payload)
+    temp_path.replace(bundle_path)
+
+    return bundle_path
+
+
+def read_bundle(bundle_path: Path, data_path: Path) -> Optional[Dict[Path, Tuple[int, int, Any]]]:
+    """
+    Read and verify a content bundle.
+
+    Args:
+        bundle_path: Path to the bundle file
+        data_path: Data directory the bundle's relative paths are resolved against
+
+    Returns:
+        Map of absolute content path -> (mtime_ns, size, frozen content), or None
+        if the bundle is missing, from another format version, or corrupt
+    """
+    try:
+        with open(bundle_path, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return None
+
+    if len(raw) < _HEADER.size:
+        logger.warning(f"Ignoring truncated content bundle: {bundle_path}")
+        return None
+
+    magic, version, checksum = _HEADER.unpack_from(raw)
+    if magic != _MAGIC or version != BUNDLE_FORMAT_VERSION:
+        logger.info(f"Ignoring content bundle with unsupported format: {bundle_path}")
+        return None
+
+    payload = memoryview(raw)[_HEADER.size:]
+    if hashlib.sha256(payload).digest() != checksum:
+        logger.warning(f"Ignoring content bundle with bad checksum: {bundle_path}")
+        return None
+
+    entries: BundleEntries = pickle.loads(payload)
+    return {
+        data_path / relative: entry
+        for relative, entry in entries.items()
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Build the content bundle from the command line.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Compile game content JSON into a binary bundle")
+    parser.add_argument(
+        "--data-path",
+        type=Path,
+        default=Path(__file__).parent.parent / "data",
+        help="Data directory containing srd/ and content/"
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help=f"Bundle path (defaults to <data-path>/{CONTENT_BUNDLE_NAME})"
+    )
+    args = parser.parse_args(argv)
+
+    bundle_path = build_bundle(args.data_path, args.output)
+    file_count = len(iter_content_files(args.data_path))
+    print(f"Wrote {file_count} content files to {bundle_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,403 @@
+# ABOUTME: Lazy, sharded on-disk content store for very large homebrew content packs
+# ABOUTME: Looks up individual monsters/spells/items by ID through a memory-mapped index with an LRU of hot entries
+
+import argparse
+import hashlib
+import json
+import mmap
+import struct
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from dnd_engine.rules.loader import freeze_content
+
+
+# Bump whenever the shard layout changes
+STORE_FORMAT_VERSION = 1
+
+# Manifest written next to the shard files
+STORE_MANIFEST_NAME = "store.json"
+
+# Item categories compiled into separate stores (same layout as items.json)
+ITEM_CATEGORIES = ("weapons", "armor", "consumables", "tools")
+
+# Shard header: magic, format version, record count
+_MAGIC = b"DNDSHRD"
+_SHARD_HEADER = struct.Struct(f">{len(_MAGIC)}sHI")
+
+# Index entry: key hash, record offset, record length (sorted by key hash)
+_INDEX_ENTRY = struct.Struct(">QQI")
+
+# Record prefix: key length (followed by key bytes, then the JSON payload)
+_KEY_LENGTH = struct.Struct(">H")
+
+
+def _key_hash(key: str) -> int:
+    """
+    Compute the stable 64-bit hash used to shard and index a key.
+
+    Args:
+        key: Content ID
+
+    Returns:
+        Unsigned 64-bit hash
+    """
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _shard_name(shard: int) -> str:
+    return f"shard_{shard:04d}.bin"
+
+
+def build_content_store(entries: Mapping[str, Any], store_dir: Path, shard_count: int = 16) -> Path:
+    """
+    Write content entries to a sharded on-disk store.
+
+    Each shard holds a sorted fixed-width index of (key hash, offset, length)
+    followed by the JSON-encoded records, so readers can binary-search the
+    index in a memory map and decode only the records they need.
+
+    Args:
+        entries: Content keyed by ID (e.g., a monsters.json dict)
+        store_dir: Directory to write the store into
+        shard_count: Number of shard files to spread entries across
+
+    Returns:
+        Path of the store directory
+
+    Raises:
+        ValueError: If shard_count is less than 1
+    """
+    if shard_count < 1:
+        raise ValueError("shard_count must be at least 1")
+
+    store_dir = Path(store_dir)
+    store_dir.mkdir(parents=True, exist_ok=True)
+
+    shards: List[List[Tuple[int, bytes]]] = [[] for _ in range(shard_count)]
+    for key, value in entries.items():
+        key_bytes = key.encode("utf-8")
+        record = _KEY_LENGTH.pack(len(key_bytes)) + key_bytes + json.dumps(value).encode("utf-8")
+        key_hash = _key_hash(key)
+        shards[key_hash % shard_count].append((key_hash, record))
+
+    for shard, records in enumerate(shards):
+        records.sort(key=lambda item: item[0])
+        data_start = _SHARD_HEADER.size + _INDEX_ENTRY.size * len(records)
+
+        index = bytearray()
+        offset = data_start
+        for key_hash, record in records:
+            index += _INDEX_ENTRY.pack(key_hash, offset, len(record))
+            offset += len(record)
+
+        with open(store_dir / _shard_name(shard), 'wb') as f:
+            f.write(_SHARD_HEADER.pack(_MAGIC, STORE_FORMAT_VERSION, len(records)))
+            f.write(index)
+            for _, record in records:
+                f.write(record)
+
+    manifest = {
+        "format_version": STORE_FORMAT_VERSION,
+        "shard_count": shard_count,
+        "record_count": len(entries)
+    }
+    with open(store_dir / STORE_MANIFEST_NAME, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    return store_dir
+
+
+class LazyContentStore(Mapping[str, Any]):
+    """
+    Read-only mapping over a sharded on-disk store.
+
+    Shards are memory-mapped on first use and entries are decoded only when
+    requested, so resident memory is bounded by the LRU of hot entries rather
+    than by the size of the content pack. Returned entries are read-only
+    (FrozenDict/FrozenList), matching DataLoader content.
+    """
+
+    def __init__(self, store_dir: Path, cache_size: int = 256):
+        """
+        Open a content store.
+
+        Args:
+            store_dir: Directory written by build_content_store
+            cache_size: Number of decoded entries to keep in the LRU
+
+        Raises:
+            FileNotFoundError: If the store manifest doesn't exist
+            ValueError: If the store was written by another format version
+        """
+        self.store_dir = Path(store_dir)
+        with open(self.store_dir / STORE_MANIFEST_NAME, 'r') as f:
+            manifest = json.load(f)
+
+        if manifest.get("format_version") != STORE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported content store format: {self.store_dir}")
+
+        self.shard_count: int = manifest["shard_count"]
+        self.record_count: int = manifest["record_count"]
+        self.cache_size = cache_size
+
+        self._shards: Dict[int, Tuple[mmap.mmap, int]] = {}
+        self._lru: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _open_shard(self, shard: int) -> Tuple[mmap.mmap, int]:
+        """Memory-map a shard file and validate its header (caller holds the lock)."""
+        opened = self._shards.get(shard)
+        if opened is not None:
+            return opened
+
+        with open(self.store_dir / _shard_name(shard), 'rb') as f:
+            view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count = _SHARD_HEADER.unpack_from(view)
+        if magic != _MAGIC or version != STORE_FORMAT_VERSION:
+            view.close()
+            raise ValueError(f"Corrupt content store shard: {shard}")
+
+        self._shards[shard] = (view, count)
+        return view, count
+
+    def _find_record(self, key: str) -> Optional[Tuple[mmap.mmap, int, int]]:
+        """
+        Locate a record by binary-searching its shard's index (caller holds the lock).
+
+        Returns:
+            (shard view, payload offset, payload length), or None if missing
+        """
+        key_hash = _key_hash(key)
+        view, count = self._open_shard(key_hash % self.shard_count)
+
+        low, high = 0, count
+        while low < high:
+            mid = (low + high) // 2
+            mid_hash = _INDEX_ENTRY.unpack_from(view, _SHARD_HEADER.size + mid * _INDEX_ENTRY.size)[0]
+            if mid_hash < key_hash:
+                low = mid + 1
+            else:
+                high = mid
+
+        key_bytes = key.encode("utf-8")
+        # Walk every entry with this hash in case of collisions
+        for position in range(low, count):
+            entry_hash, offset, length = _INDEX_ENTRY.unpack_from(
+                view, _SHARD_HEADER.size + position * _INDEX_ENTRY.size
+            )
+            if entry_hash != key_hash:
+                break
+            key_length = _KEY_LENGTH.unpack_from(view, offset)[0]
+            key_start = offset + _KEY_LENGTH.size
+            if view[key_start:key_start + key_length] == key_bytes:
+                payload_start = key_start + key_length
+                return view, payload_start, length - (payload_start - offset)
+
+        return None
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return self._lru[key]
+
+            record = self._find_record(key)
+            if record is None:
+                raise KeyError(key)
+
+            view, start, length = record
+            value = freeze_content(json.loads(view[start:start + length]))
+
+            self.misses += 1
+            self._lru[key] = value
+            if len(self._lru) > self.cache_size:
+                self._lru.popitem(last=False)
+
+            return value
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        with self._lock:
+            return key in self._lru or self._find_record(key) is not None
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over every key, shard by shard, without decoding payloads."""
+        for shard in range(self.shard_count):
+            with self._lock:
+                view, count = self._open_shard(shard)
+            for position in range(count):
+                offset = _INDEX_ENTRY.unpack_from(view, _SHARD_HEADER.size + position * _INDEX_ENTRY.size)[1]
+                key_length = _KEY_LENGTH.unpack_from(view, offset)[0]
+                key_start = offset + _KEY_LENGTH.size
+                yield bytes(view[key_start:key_start + key_length]).decode("utf-8")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get LRU counters.
+
+        Returns:
+            Dictionary with hits, misses, cached entry count, and open shards
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "cached": len(self._lru),
+                "open_shards": len(self._shards)
+            }
+
+    def close(self) -> None:
+        """Unmap all open shards and drop cached entries."""
+        with self._lock:
+            for view, _ in self._shards.values():
+                view.close()
+            self._shards.clear()
+            self._lru.clear()
+
+
+class ContentPack:
+    """
+    A homebrew content pack made of lazy stores for monsters, spells, and items.
+
+    Pack layout (as written by build_content_pack):
+        <pack_dir>/monsters/, <pack_dir>/spells/, <pack_dir>/items_<category>/
+    Any of the stores may be missing.
+    """
+
+    def __init__(self, pack_dir: Path, cache_size: int = 256):
+        """
+        Open a compiled content pack.
+
+        Args:
+            pack_dir: Directory written by build_content_pack
+            cache_size: LRU size for each store
+        """
+        self.pack_dir = Path(pack_dir)
+        self.name = self.pack_dir.name
+        self.stores: Dict[str, LazyContentStore] = {}
+
+        for kind in ("monsters", "spells") + tuple(f"items_{c}" for c in ITEM_CATEGORIES):
+            store_dir = self.pack_dir / kind
+            if (store_dir / STORE_MANIFEST_NAME).exists():
+                self.stores[kind] = LazyContentStore(store_dir, cache_size=cache_size)
+
+    def _get(self, kind: str, content_id: str) -> Optional[Any]:
+        store = self.stores.get(kind)
+        if store is None:
+            return None
+        try:
+            return store[content_id]
+        except KeyError:
+            return None
+
+    def get_monster(self, monster_id: str) -> Optional[Mapping[str, Any]]:
+        """
+        Get a monster definition from the pack.
+
+        Args:
+            monster_id: ID of the monster
+
+        Returns:
+            Monster definition, or None if the pack doesn't have it
+        """
+        return self._get("monsters", monster_id)
+
+    def get_spell(self, spell_id: str) -> Optional[Mapping[str, Any]]:
+        """
+        Get a spell definition from the pack.
+
+        Args:
+            spell_id: ID of the spell
+
+        Returns:
+            Spell definition, or None if the pack doesn't have it
+        """
+        return self._get("spells", spell_id)
+
+    def get_item(self, item_id: str) -> Optional[Tuple[str, Mapping[str, Any]]]:
+        """
+        Get an item definition and its category from the pack.
+
+        Args:
+            item_id: ID of the item
+
+        Returns:
+            Tuple of (category, item data), or None if the pack doesn't have it
+        """
+        for category in ITEM_CATEGORIES:
+            item = self._get(f"items_{category}", item_id)
+            if item is not None:
+                return category, item
+        return None
+
+    def close(self) -> None:
+        """Close every store in the pack."""
+        for store in self.stores.values():
+            store.close()
+
+
+def build_content_pack(source_dir: Path, pack_dir: Path, shard_count: int = 16) -> Path:
+    """
+    Compile a homebrew pack's JSON files into lazy stores.
+
+    Reads monsters.json, spells.json, and items.json (same layout as the SRD
+    files) from source_dir; missing files are skipped.
+
+    Args:
+        source_dir: Directory with the pack's JSON files
+        pack_dir: Directory to write the compiled pack into
+        shard_count: Number of shards per store
+
+    Returns:
+        Path of the compiled pack directory
+    """
+    source_dir = Path(source_dir)
+    pack_dir = Path(pack_dir)
+
+    for kind in ("monsters", "spells"):
+        source = source_dir / f"{kind}.json"
+        if source.exists():
+            with open(source, 'r') as f:
+                build_content_store(json.load(f), pack_dir / kind, shard_count)
+
+    items_source = source_dir / "items.json"
+    if items_source.exists():
+        with open(items_source, 'r') as f:
+            items = json.load(f)
+        for category in ITEM_CATEGORIES:
+            if category in items:
+                build_content_store(items[category], pack_dir / f"items_{category}", shard_count)
+
+    return pack_dir
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Compile a homebrew content pack from the command line.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Compile a homebrew content pack into lazy stores")
+    parser.add_argument("source_dir", type=Path, help="Directory with monsters.json, spells.json, items.json")
+    parser.add_argument("pack_dir", type=Path, help="Output directory for the compiled pack")
+    parser.add_argument("--shards", type=int, default=16, help="Shards per store (default: 16)")
+    args = parser.parse_args(argv)
+
+    pack_dir = build_content_pack(args.source_dir, args.pack_dir, args.shards)
+    print(f"Wrote content pack to {pack_dir}")
+
+
+if __name__ == "__main__":
+    main()
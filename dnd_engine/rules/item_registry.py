@@ -0,0 +1,216 @@
+# ABOUTME: Flat item registry built once from items.json
+# ABOUTME: Maps item IDs to their category and a compiled record with precomputed combat and value fields
+
+import copy
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterator, Mapping, Optional, Tuple
+
+from dnd_engine.core.dice import DiceExpression, compile_dice, parse_dice_notation
+
+
+# Copper pieces per gold piece (item values in items.json are in gold)
+CP_PER_GP = 100
+
+
+@dataclass(frozen=True)
+class ItemRecord:
+    """
+    Immutable, precompiled item definition.
+
+    Holds the raw definition alongside the fields combat and inventory code
+    derive from it, so they're computed once instead of on every attack.
+    """
+    item_id: str
+    category: str
+    name: str
+    data: Mapping[str, Any]
+    value: float
+    value_cp: int
+    properties: FrozenSet[str]
+    damage: Optional[str] = None
+    damage_dice: Optional[Tuple[int, int, int]] = None
+    damage_expression: Optional[DiceExpression] = None
+    damage_type: Optional[str] = None
+    weapon_type: Optional[str] = None
+    is_finesse: bool = False
+    is_ranged: bool = False
+    armor_type: Optional[str] = None
+    base_ac: Optional[int] = None
+
+    @classmethod
+    def compile(cls, item_id: str, category: str, data: Mapping[str, Any]) -> "ItemRecord":
+        """
+        Compile an item definition into a record.
+
+        Args:
+            item_id: ID of the item
+            category: Category the item is listed under (e.g., "weapons")
+            data: Item definition from items.json
+
+        Returns:
+            Compiled record
+        """
+        value = data.get("value", 0)
+        damage = data.get("damage")
+        properties = frozenset(data.get("properties", []))
+
+        # Weapons and attack consumables (Alchemist's Fire) carry damage dice
+        damage_dice = None
+        damage_expression = None
+        if isinstance(damage, str):
+            try:
+                damage_expression = compile_dice(damage)
+                damage_dice = parse_dice_notation(damage)
+            except ValueError:
+                # Compound damage (e.g., "1d8+1d6") has an expression but no single dice group
+                damage_dice = None
+
+        return cls(
+            item_id=item_id,
+            category=category,
+            name=data.get("name", item_id),
+            data=data,
+            value=value,
+            value_cp=round(value * CP_PER_GP),
+            properties=properties,
+            damage=damage,
+            damage_dice=damage_dice,
+            damage_expression=damage_expression,
+            damage_type=data.get("damage_type"),
+            weapon_type=data.get("weapon_type"),
+            is_finesse="finesse" in properties,
+            is_ranged=data.get("category") == "ranged",
+            armor_type=data.get("armor_type"),
+            base_ac=data.get("ac")
+        )
+
+
+class ItemRegistry(Mapping[str, Mapping[str, Any]]):
+    """
+    Flat lookup table over the item definitions.
+
+    Built once per version of items.json (see DataLoader.load_item_registry).
+    Behaves like the items.json dict (category -> item ID -> definition), so
+    it can be passed anywhere items data is expected, and adds O(1) item ID
+    resolution without walking the categories. A registry made by
+    with_fallback() also resolves items defined only in homebrew content
+    packs (through the ID lookups, not the category mapping).
+    """
+
+    def __init__(self, items: Mapping[str, Mapping[str, Any]]):
+        """
+        Build the registry.
+
+        Args:
+            items: Item definitions keyed by category, then item ID
+        """
+        self._categories: Dict[str, Mapping[str, Any]] = dict(items)
+        self._records: Dict[str, ItemRecord] = {}
+
+        for category, category_items in self._categories.items():
+            for item_id, data in category_items.items():
+                # First category wins if an ID is listed twice
+                if item_id not in self._records:
+                    self._records[item_id] = ItemRecord.compile(item_id, category, data)
+
+        # Lookup for items outside items.json (set by with_fallback)
+        self._fallback: Optional[Callable[[str], Optional[Tuple[str, Mapping[str, Any]]]]] = None
+        self._fallback_records: Dict[str, ItemRecord] = {}
+
+    def with_fallback(self, lookup: Callable[[str], Optional[Tuple[str, Mapping[str, Any]]]]) -> "ItemRegistry":
+        """
+        Get a view of this registry that also consults another item source.
+
+        The view shares this registry's tables. Items found through the
+        lookup are compiled once and kept by the view.
+
+        Args:
+            lookup: Function returning (category, item definition) by item ID, or None
+
+        Returns:
+            ItemRegistry that falls back to lookup for unknown IDs
+        """
+        view = copy.copy(self)
+        view._fallback = lookup
+        view._fallback_records = {}
+        return view
+
+    def _record(self, item_id: str) -> Optional[ItemRecord]:
+        """Get the record for an item, compiling it from the fallback if needed."""
+        record = self._records.get(item_id)
+        if record is None and self._fallback is not None:
+            record = self._fallback_records.get(item_id)
+            if record is None:
+                found = self._fallback(item_id)
+                if found is not None:
+                    category, data = found
+                    record = self._fallback_records[item_id] = ItemRecord.compile(item_id, category, data)
+        return record
+
+    def __getitem__(self, category: str) -> Mapping[str, Any]:
+        return self._categories[category]
+
+    def __contains__(self, category: object) -> bool:
+        return category in self._categories
+
+    def __len__(self) -> int:
+        return len(self._categories)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._categories)
+
+    def resolve(self, item_id: str) -> Optional[ItemRecord]:
+        """
+        Get the compiled record for an item.
+
+        Args:
+            item_id: ID of the item (e.g., "longsword")
+
+        Returns:
+            ItemRecord, or None if unknown
+        """
+        return self._record(item_id)
+
+    def get_category(self, item_id: str) -> Optional[str]:
+        """
+        Get the category an item is listed under.
+
+        Args:
+            item_id: ID of the item
+
+        Returns:
+            Category name (e.g., "weapons"), or None if unknown
+        """
+        record = self._record(item_id)
+        return record.category if record is not None else None
+
+    def get_item(self, item_id: str) -> Optional[Mapping[str, Any]]:
+        """
+        Get the raw definition for an item in any category.
+
+        Args:
+            item_id: ID of the item
+
+        Returns:
+            Item definition, or None if unknown
+        """
+        record = self._record(item_id)
+        return record.data if record is not None else None
+
+    def get_weapon(self, weapon_id: str) -> ItemRecord:
+        """
+        Get the compiled record for a weapon.
+
+        Args:
+            weapon_id: ID of the weapon
+
+        Returns:
+            ItemRecord for the weapon
+
+        Raises:
+            KeyError: If weapon_id isn't a known weapon
+        """
+        record = self._record(weapon_id)
+        if record is None or record.category != "weapons":
+            raise KeyError(f"Weapon '{weapon_id}' not found in items data")
+        return record
@@ -1,11 +1,281 @@
 # ABOUTME: Data loader for reading JSON game content files
-# ABOUTME: Loads monsters, items, dungeons, and character classes from JSON
+# ABOUTME: Loads monsters, items, dungeons, and character classes from JSON through a shared content cache
 
+import copy
 import json
+import threading
 from pathlib import Path
-from typing import Dict, Any
-from dnd_engine.core.creature import Creature, Abilities
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Mapping, Optional, Sequence, Tuple, TypeVar
+from dnd_engine.core.creature import Creature
 from dnd_engine.core.dice import DiceRoller
+from dnd_engine.core.squad import MonsterSquad
+from dnd_engine.rules.monster_catalog import MonsterCatalog
+from dnd_engine.rules.item_registry import ItemRegistry
+from dnd_engine.rules.spell_catalog import SpellCatalog
+
+if TYPE_CHECKING:
+    from dnd_engine.rules.content_store import ContentPack
+
+
+T = TypeVar("T")
+
+
+def _read_only(*args: Any, **kwargs: Any) -> None:
+    """Reject in-place modification of cached content."""
+    raise TypeError("Cached game content is read-only; copy it before modifying")
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict handed out by the content cache.
+
+    Behaves like a normal dict for lookups, iteration, equality and JSON
+    serialization, but refuses in-place modification so one caller can't
+    corrupt the content every other caller sees. Copying (dict(), .copy(),
+    copy.copy, copy.deepcopy) produces ordinary mutable containers; pickling
+    keeps the read-only types so content bundles load without re-freezing.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __copy__(self) -> Dict[Any, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[Any, Any]:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only list handed out by the content cache (see FrozenDict)."""
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __iadd__ = _read_only
+    __imul__ = _read_only
+    append = _read_only
+    clear = _read_only
+    extend = _read_only
+    insert = _read_only
+    pop = _read_only
+    remove = _read_only
+    reverse = _read_only
+    sort = _read_only
+
+    def __copy__(self) -> List[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Any]:
+        return [copy.deepcopy(item, memo) for item in self]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (FrozenList, (list(self),))
+
+
+def freeze_content(value: Any) -> Any:
+    """
+    Recursively convert parsed JSON into read-only containers.
+
+    Args:
+        value: Parsed JSON value (dict, list, or scalar)
+
+    Returns:
+        The same structure built from FrozenDict/FrozenList
+    """
+    if isinstance(value, dict):
+        frozen = FrozenDict()
+        for key, item in value.items():
+            dict.__setitem__(frozen, key, freeze_content(item))
+        return frozen
+    if isinstance(value, list):
+        frozen_list = FrozenList()
+        list.extend(frozen_list, (freeze_content(item) for item in value))
+        return frozen_list
+    return value
+
+
+class ContentCache:
+    """
+    Process-wide cache of parsed JSON content files.
+
+    Each file is parsed once and kept as a read-only structure. Every lookup
+    stats the file and re-reads it only when its mtime or size has changed,
+    so edited content (e.g. homebrew files) is picked up without a restart.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        # Map of resolved path -> (mtime_ns, size, frozen content)
+        self._entries: Dict[Path, Tuple[int, int, Any]] = {}
+        # Map of (path, name) -> (content it was built from, derived object)
+        self._derived: Dict[Tuple[Path, str], Tuple[Any, Any]] = {}
+        # Content bundles already read into the cache
+        self._bundles: set[Path] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+
+    def get(self, path: Path) -> Any:
+        """
+        Get the parsed content of a JSON file.
+
+        Args:
+            path: Path to the JSON file
+
+        Returns:
+            Read-only parsed content
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        path = Path(path)
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and (entry[0], entry[1]) == signature:
+                self.hits += 1
+                return entry[2]
+
+        with open(path, 'r') as f:
+            content = freeze_content(json.load(f))
+
+        with self._lock:
+            self.misses += 1
+            if entry is not None:
+                self.reloads += 1
+            self._entries[path] = (signature[0], signature[1], content)
+
+        return content
+
+    def has_bundle(self, bundle_path: Path) -> bool:
+        """
+        Check whether a content bundle has already been read into the cache.
+
+        Args:
+            bundle_path: Path to the bundle file
+
+        Returns:
+            True if preload() was called for this bundle
+        """
+        with self._lock:
+            return Path(bundle_path) in self._bundles
+
+    def preload(self, bundle_path: Path, entries: Dict[Path, Tuple[int, int, Any]]) -> None:
+        """
+        Seed the cache with content from a prebuilt bundle.
+
+        Entries keep the mtime and size recorded at build time, so get() serves
+        them only while the source file is unchanged and re-reads stale files
+        from JSON. Files already in the cache are left alone.
+
+        Args:
+            bundle_path: Path to the bundle the entries came from
+            entries: Map of content path -> (mtime_ns, size, frozen content)
+        """
+        with self._lock:
+            self._bundles.add(Path(bundle_path))
+            for path, entry in entries.items():
+                self._entries.setdefault(Path(path), entry)
+
+    def get_derived(self, path: Path, name: str, build: Callable[[Any], T]) -> T:
+        """
+        Get an object derived from a content file (e.g. an index), building it once.
+
+        The derived object is rebuilt whenever the underlying file is re-read.
+
+        Args:
+            path: Path to the JSON file
+            name: Name identifying the derived object
+            build: Function that builds the object from the parsed content
+
+        Returns:
+            The derived object
+        """
+        path = Path(path)
+        content = self.get(path)
+
+        with self._lock:
+            derived = self._derived.get((path, name))
+            if derived is not None and derived[0] is content:
+                return derived[1]
+
+        value = build(content)
+
+        with self._lock:
+            self._derived[(path, name)] = (content, value)
+
+        return value
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """
+        Drop cached content.
+
+        Args:
+            path: File to drop (drops every file if not provided)
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._derived.clear()
+                self._bundles.clear()
+            else:
+                path = Path(path)
+                self._entries.pop(path, None)
+                for key in [key for key in self._derived if key[0] == path]:
+                    del self._derived[key]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hits, misses, reloads (misses caused by a changed
+            file), and the number of cached files
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "files": len(self._entries)
+            }
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters without dropping cached content."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.reloads = 0
+
+
+# Shared by every DataLoader in the process
+_content_cache = ContentCache()
+
+
+def get_content_cache() -> ContentCache:
+    """
+    Get the process-wide content cache.
+
+    Returns:
+        The shared ContentCache instance
+    """
+    return _content_cache
 
 
 class DataLoader:
@@ -14,14 +284,37 @@ class DataLoader:
 
     Responsible for reading monster stats, items, dungeons, and character classes
     from the data directory and converting them into usable game objects.
+
+    Content files are parsed once per process through the shared ContentCache.
+    The load_* methods return read-only views; load_dungeon returns a fresh
+    mutable copy because game state writes room flags into it.
+
+    If a prebuilt content bundle (see rules/content_bundle.py) exists in the
+    data directory, it is read once to seed the cache; files changed since the
+    bundle was built fall back to JSON.
+
+    Homebrew content packs (see rules/content_store.py) are consulted by the
+    single-entry lookups (get_spell, get_monster, create_monsters, the monster
+    catalog and the item registry) when an ID
+    isn't in the SRD data. Their entries are decoded on demand, never
+    materialized as a whole.
     """
 
-    def __init__(self, data_path: Path | None = None):
+    def __init__(
+        self,
+        data_path: Path | None = None,
+        content_cache: Optional[ContentCache] = None,
+        use_bundle: bool = True,
+        content_packs: Sequence[Path] = ()
+    ):
         """
         Initialize the data loader.
 
         Args:
             data_path: Path to the data directory (defaults to dnd_engine/data)
+            content_cache: Cache for parsed content (defaults to the process-wide cache)
+            use_bundle: Whether to seed the cache from a prebuilt content bundle
+            content_packs: Compiled homebrew pack directories, searched in order
         """
         if data_path is None:
             # Default to the data directory in the package
@@ -30,6 +323,51 @@ class DataLoader:
             self.data_path = Path(data_path)
 
         self.dice_roller = DiceRoller()
+        self.content_cache = content_cache or get_content_cache()
+
+        if use_bundle:
+            self._load_bundle()
+
+        self.content_packs: List["ContentPack"] = []
+        if content_packs:
+            from dnd_engine.rules.content_store import ContentPack
+            self.content_packs = [ContentPack(pack_dir) for pack_dir in content_packs]
+
+        # (shared table, pack-aware view of it), see load_monster_catalog and load_item_registry
+        self._pack_catalog: Optional[Tuple[MonsterCatalog, MonsterCatalog]] = None
+        self._pack_registry: Optional[Tuple[ItemRegistry, ItemRegistry]] = None
+
+    def _load_bundle(self) -> None:
+        """Seed the content cache from the data directory's bundle, once per cache."""
+        from dnd_engine.rules.content_bundle import CONTENT_BUNDLE_NAME, read_bundle
+
+        bundle_path = self.data_path / CONTENT_BUNDLE_NAME
+        if self.content_cache.has_bundle(bundle_path):
+            return
+
+        entries = read_bundle(bundle_path, self.data_path)
+        self.content_cache.preload(bundle_path, entries or {})
+
+    def _load_json(self, *parts: str) -> Any:
+        """
+        Load a JSON file under the data directory through the content cache.
+
+        Args:
+            *parts: Path components relative to the data directory
+
+        Returns:
+            Read-only parsed content
+        """
+        return self.content_cache.get(self.data_path.joinpath(*parts))
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Get hit/miss counters for the content cache.
+
+        Returns:
+            Dictionary with hits, misses, reloads, and cached file count
+        """
+        return self.content_cache.stats()
 
     def load_monsters(self) -> Dict[str, Any]:
         """
@@ -38,9 +376,30 @@ class DataLoader:
         Returns:
             Dictionary mapping monster IDs to monster data
         """
-        monsters_file = self.data_path / "srd" / "monsters.json"
-        with open(monsters_file, 'r') as f:
-            return json.load(f)
+        return self._load_json("srd", "monsters.json")
+
+    def load_monster_catalog(self) -> MonsterCatalog:
+        """
+        Get the indexed monster catalog.
+
+        The catalog is built once per version of monsters.json and shared
+        through the content cache. With content packs, the loader returns a
+        view of it that also finds monsters defined only in the packs.
+
+        Returns:
+            MonsterCatalog with name, XP, and attack lookup tables
+        """
+        catalog = self.content_cache.get_derived(
+            self.data_path / "srd" / "monsters.json", "monster_catalog", MonsterCatalog
+        )
+        if not self.content_packs:
+            return catalog
+
+        # Rebuild the view only when monsters.json (and so the shared catalog) changes
+        if self._pack_catalog is None or self._pack_catalog[0] is not catalog:
+            view = catalog.with_fallback(lambda monster_id: self._find_in_packs("get_monster", monster_id))
+            self._pack_catalog = (catalog, view)
+        return self._pack_catalog[1]
 
     def create_monster(self, monster_id: str) -> Creature:
         """
@@ -55,36 +414,122 @@ class DataLoader:
         Raises:
             KeyError: If monster_id doesn't exist
         """
-        monsters = self.load_monsters()
+        return self.create_monsters([monster_id])[0]
+
+    def create_monsters(
+        self,
+        monster_ids: Sequence[str],
+        count: int = 1,
+        squad_threshold: Optional[int] = None
+    ) -> List[Creature]:
+        """
+        Create Creature instances for several monsters in one batch.
 
-        if monster_id not in monsters:
-            raise KeyError(f"Monster '{monster_id}' not found in monster definitions")
+        Looks up every compiled template first, rolls all hit points in a
+        single pass, then clones the templates into creatures. With a
+        squad_threshold, each monster ID appearing at least that many times
+        is spawned as one MonsterSquad and its members are returned in place
+        of individual creatures.
 
-        data = monsters[monster_id]
+        Args:
+            monster_ids: IDs of the monsters to create (e.g., ["goblin", "wolf"])
+            count: Number of creatures to create for each ID
+            squad_threshold: Minimum number of identical monsters to spawn as a squad (None never does)
 
-        # Create abilities
-        abilities = Abilities(
-            strength=data["abilities"]["str"],
-            dexterity=data["abilities"]["dex"],
-            constitution=data["abilities"]["con"],
-            intelligence=data["abilities"]["int"],
-            wisdom=data["abilities"]["wis"],
-            charisma=data["abilities"]["cha"]
-        )
+        Returns:
+            Creatures in the order of monster_ids, each repeated count times
 
-        # Roll HP from dice notation
-        hp_roll = self.dice_roller.roll(data["hp"])
-        max_hp = max(1, hp_roll.total)  # Minimum 1 HP
+        Raises:
+            KeyError: If any monster_id doesn't exist
+        """
+        catalog = self.load_monster_catalog()
+
+        templates = []
+        for monster_id in monster_ids:
+            template = catalog.get_compiled(monster_id)
+            if template is None:
+                raise KeyError(f"Monster '{monster_id}' not found in monster definitions")
+            templates.extend([template] * count)
+
+        # Roll HP from dice notation (minimum 1 HP)
+        randint = self.dice_roller.random.randint
+        hit_points = [
+            max(1, sum(randint(1, t.hp_sides) for _ in range(t.hp_count)) + t.hp_modifier)
+            for t in templates
+        ]
+
+        if squad_threshold is None:
+            return [template.spawn(max_hp) for template, max_hp in zip(templates, hit_points)]
+
+        positions_by_id: Dict[str, List[int]] = {}
+        for position, template in enumerate(templates):
+            positions_by_id.setdefault(template.monster_id, []).append(position)
+
+        creatures: List[Creature] = [None] * len(templates)
+        for positions in positions_by_id.values():
+            template = templates[positions[0]]
+            if len(positions) >= squad_threshold:
+                squad = template.spawn_squad([hit_points[position] for position in positions])
+                for position, member in zip(positions, squad.members):
+                    creatures[position] = member
+            else:
+                for position in positions:
+                    creatures[position] = template.spawn(hit_points[position])
+        return creatures
+
+    def create_squad(self, monster_id: str, count: int) -> MonsterSquad:
+        """
+        Create a squad of identical monsters.
 
-        # Create the creature
-        creature = Creature(
-            name=data["name"],
-            max_hp=max_hp,
-            ac=data["ac"],
-            abilities=abilities
-        )
+        Args:
+            monster_id: ID of the monster (e.g., "goblin")
+            count: Number of members (at least 1)
+
+        Returns:
+            MonsterSquad whose members can be added to active_enemies
+
+        Raises:
+            KeyError: If monster_id doesn't exist
+            ValueError: If count is less than 1
+        """
+        if count < 1:
+            raise ValueError("A squad needs at least one member")
+        return self.create_monsters([monster_id], count=count, squad_threshold=1)[0].squad
+
+    def get_monster(self, monster_id: str) -> Mapping[str, Any]:
+        """
+        Get a specific monster definition by its ID.
+
+        Args:
+            monster_id: ID of the monster (e.g., "goblin")
+
+        Returns:
+            Monster definition from the SRD or a content pack
+
+        Raises:
+            KeyError: If monster_id doesn't exist
+        """
+        data = self.load_monster_catalog().get_template(monster_id)
+        if data is None:
+            raise KeyError(f"Monster '{monster_id}' not found in monster definitions")
+        return data
+
+    def _find_in_packs(self, lookup: str, content_id: str) -> Optional[Any]:
+        """
+        Look up an entry in the content packs, in order.
 
-        return creature
+        Args:
+            lookup: ContentPack method name (e.g., "get_spell")
+            content_id: ID to look up
+
+        Returns:
+            The first pack's entry, or None if no pack has it
+        """
+        for pack in self.content_packs:
+            entry = getattr(pack, lookup)(content_id)
+            if entry is not None:
+                return entry
+        return None
 
     def load_items(self) -> Dict[str, Any]:
         """
@@ -93,9 +538,30 @@ class DataLoader:
         Returns:
             Dictionary containing weapons, armor, and consumables
         """
-        items_file = self.data_path / "srd" / "items.json"
-        with open(items_file, 'r') as f:
-            return json.load(f)
+        return self._load_json("srd", "items.json")
+
+    def load_item_registry(self) -> ItemRegistry:
+        """
+        Get the flat item registry.
+
+        The registry is built once per version of items.json and shared
+        through the content cache. With content packs, the loader returns a
+        view of it that also resolves items defined only in the packs.
+
+        Returns:
+            ItemRegistry mapping item IDs to their category and compiled record
+        """
+        registry = self.content_cache.get_derived(
+            self.data_path / "srd" / "items.json", "item_registry", ItemRegistry
+        )
+        if not self.content_packs:
+            return registry
+
+        # Rebuild the view only when items.json (and so the shared registry) changes
+        if self._pack_registry is None or self._pack_registry[0] is not registry:
+            view = registry.with_fallback(lambda item_id: self._find_in_packs("get_item", item_id))
+            self._pack_registry = (registry, view)
+        return self._pack_registry[1]
 
     def load_dungeon(self, dungeon_name: str) -> Dict[str, Any]:
         """
@@ -105,7 +571,7 @@ class DataLoader:
             dungeon_name: Name of the dungeon file (without .json extension)
 
         Returns:
-            Dictionary containing dungeon data
+            Dictionary containing dungeon data (a private, mutable copy)
 
         Raises:
             FileNotFoundError: If dungeon file doesn't exist
@@ -115,8 +581,7 @@ class DataLoader:
         if not dungeon_file.exists():
             raise FileNotFoundError(f"Dungeon file not found: {dungeon_file}")
 
-        with open(dungeon_file, 'r') as f:
-            return json.load(f)
+        return copy.deepcopy(self.content_cache.get(dungeon_file))
 
     def load_classes(self) -> Dict[str, Any]:
         """
@@ -125,9 +590,7 @@ class DataLoader:
         Returns:
             Dictionary mapping class names to class data
         """
-        classes_file = self.data_path / "srd" / "classes.json"
-        with open(classes_file, 'r') as f:
-            return json.load(f)
+        return self._load_json("srd", "classes.json")
 
     def load_races(self) -> Dict[str, Any]:
         """
@@ -136,9 +599,7 @@ class DataLoader:
         Returns:
             Dictionary mapping race IDs to race data
         """
-        races_file = self.data_path / "srd" / "races.json"
-        with open(races_file, 'r') as f:
-            return json.load(f)
+        return self._load_json("srd", "races.json")
 
     def load_skills(self) -> Dict[str, Any]:
         """
@@ -147,9 +608,7 @@ class DataLoader:
         Returns:
             Dictionary mapping skill IDs to skill data (name and ability)
         """
-        skills_file = self.data_path / "srd" / "skills.json"
-        with open(skills_file, 'r') as f:
-            return json.load(f)
+        return self._load_json("srd", "skills.json")
 
     def load_progression(self) -> Dict[str, Any]:
         """
@@ -158,9 +617,25 @@ class DataLoader:
         Returns:
             Dictionary containing xp_by_level and proficiency_by_level
         """
-        progression_file = self.data_path / "srd" / "progression.json"
-        with open(progression_file, 'r') as f:
-            return json.load(f)
+        return self._load_json("srd", "progression.json")
+
+    def load_conditions(self) -> Dict[str, Any]:
+        """
+        Load all condition definitions from JSON.
+
+        Returns:
+            Dictionary mapping condition IDs to condition data
+        """
+        return self._load_json("srd", "conditions.json").get("conditions", {})
+
+    def load_character_templates(self) -> Dict[str, Any]:
+        """
+        Load pre-built character templates from JSON.
+
+        Returns:
+            Dictionary mapping template IDs to template data
+        """
+        return self._load_json("srd", "character_templates.json")
 
     def load_spells(self) -> Dict[str, Any]:
         """
@@ -169,9 +644,21 @@ class DataLoader:
         Returns:
             Dictionary mapping spell IDs to spell data
         """
-        spells_file = self.data_path / "srd" / "spells.json"
-        with open(spells_file, 'r') as f:
-            return json.load(f)
+        return self._load_json("srd", "spells.json")
+
+    def load_spell_catalog(self) -> SpellCatalog:
+        """
+        Get the indexed spell catalog.
+
+        The catalog is built once per version of spells.json and shared
+        through the content cache.
+
+        Returns:
+            SpellCatalog with compiled spells and class/level/school indexes
+        """
+        return self.content_cache.get_derived(
+            self.data_path / "srd" / "spells.json", "spell_catalog", SpellCatalog
+        )
 
     def get_spell(self, spell_id: str) -> Dict[str, Any]:
         """
@@ -186,9 +673,11 @@ class DataLoader:
         Raises:
             KeyError: If spell_id doesn't exist
         """
-        spells = self.load_spells()
+        spell = self.load_spells().get(spell_id)
+        if spell is None:
+            spell = self._find_in_packs("get_spell", spell_id)
 
-        if spell_id not in spells:
+        if spell is None:
             raise KeyError(f"Spell '{spell_id}' not found in spell definitions")
 
-        return spells[spell_id]
+        return spell
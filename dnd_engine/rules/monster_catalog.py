@@ -0,0 +1,281 @@
+# ABOUTME: Indexed monster catalog built once from monsters.json
+# ABOUTME: Provides compiled stat block templates and O(1) name/id, XP, and attack lookups
+
+from dataclasses import dataclass
+import copy
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from dnd_engine.core.creature import Abilities, Creature
+from dnd_engine.core.dice import parse_dice_notation
+from dnd_engine.core.squad import MonsterSquad
+from dnd_engine.rules.action_table import ActionTable
+
+
+@dataclass(frozen=True)
+class MonsterTemplate:
+    """
+    Immutable, precompiled monster stat block.
+
+    Holds everything needed to spawn a creature without touching the raw
+    JSON again: parsed hit dice, a flat tuple of ability scores, and the
+    compiled action table enemy AI picks attacks from.
+    """
+    monster_id: str
+    name: str
+    ac: int
+    hp_dice: str
+    hp_count: int
+    hp_sides: int
+    hp_modifier: int
+    ability_scores: Tuple[int, int, int, int, int, int]
+    actions: ActionTable = ActionTable()
+
+    @classmethod
+    def compile(cls, monster_id: str, data: Mapping[str, Any]) -> "MonsterTemplate":
+        """
+        Compile a monster definition into a template.
+
+        Args:
+            monster_id: ID of the monster
+            data: Monster definition from monsters.json
+
+        Returns:
+            Compiled template
+
+        Raises:
+            ValueError: If the hit dice or an attack's damage notation is invalid
+        """
+        count, sides, modifier = parse_dice_notation(data["hp"])
+        scores = data["abilities"]
+        return cls(
+            monster_id=monster_id,
+            name=data["name"],
+            ac=data["ac"],
+            hp_dice=data["hp"],
+            hp_count=count,
+            hp_sides=sides,
+            hp_modifier=modifier,
+            ability_scores=(
+                scores["str"], scores["dex"], scores["con"],
+                scores["int"], scores["wis"], scores["cha"]
+            ),
+            actions=ActionTable.compile(data.get("actions", []))
+        )
+
+    def spawn(self, max_hp: int) -> Creature:
+        """
+        Create a new creature from this template.
+
+        Args:
+            max_hp: Rolled maximum HP for the new creature
+
+        Returns:
+            Creature with its own Abilities and condition state, sharing the
+            template's action table
+        """
+        creature = Creature(
+            name=self.name,
+            max_hp=max_hp,
+            ac=self.ac,
+            abilities=Abilities(*self.ability_scores),
+            monster_id=self.monster_id
+        )
+        creature.action_table = self.actions
+        return creature
+
+    def spawn_squad(self, hit_points: Sequence[int]) -> MonsterSquad:
+        """
+        Create a squad of identical creatures from this template.
+
+        Args:
+            hit_points: Rolled maximum HP, one per member
+
+        Returns:
+            MonsterSquad sharing one Abilities object and the template's action table
+        """
+        return MonsterSquad(
+            name=self.name,
+            ac=self.ac,
+            abilities=Abilities(*self.ability_scores),
+            hit_points=hit_points,
+            monster_id=self.monster_id,
+            action_table=self.actions
+        )
+
+
+class MonsterCatalog:
+    """
+    Lookup tables over the monster definitions.
+
+    Built once per version of monsters.json (see DataLoader.load_monster_catalog)
+    so combat code never has to scan the bestiary to find a monster by name.
+    A catalog made by with_fallback() also finds monsters that are only
+    defined in homebrew content packs.
+    """
+
+    def __init__(self, monsters: Mapping[str, Any]):
+        """
+        Build the catalog indexes.
+
+        Args:
+            monsters: Monster definitions keyed by monster ID
+        """
+        self._templates: Dict[str, Mapping[str, Any]] = dict(monsters)
+        self._ids_by_name: Dict[str, str] = {}
+        self._xp: Dict[str, int] = {}
+        self._compiled: Dict[str, MonsterTemplate] = {}
+
+        for monster_id, data in self._templates.items():
+            # First definition wins when several share a display name
+            self._ids_by_name.setdefault(data["name"], monster_id)
+            self._xp[monster_id] = data.get("xp", 0)
+            self._compiled[monster_id] = MonsterTemplate.compile(monster_id, data)
+
+        # Lookup for monsters outside monsters.json (set by with_fallback)
+        self._fallback: Optional[Callable[[str], Optional[Mapping[str, Any]]]] = None
+        self._fallback_compiled: Dict[str, MonsterTemplate] = {}
+
+    def with_fallback(self, lookup: Callable[[str], Optional[Mapping[str, Any]]]) -> "MonsterCatalog":
+        """
+        Get a view of this catalog that also consults another monster source.
+
+        The view shares this catalog's indexes. Monsters found through the
+        lookup are compiled once and kept by the view.
+
+        Args:
+            lookup: Function returning a monster definition by ID, or None
+
+        Returns:
+            MonsterCatalog that falls back to lookup for unknown IDs
+        """
+        view = copy.copy(self)
+        view._fallback = lookup
+        view._fallback_compiled = {}
+        return view
+
+    def _fallback_template(self, monster_id: Optional[str]) -> Optional[Mapping[str, Any]]:
+        """Look up a monster that isn't in monsters.json through the fallback."""
+        if monster_id is None or self._fallback is None:
+            return None
+        return self._fallback(monster_id)
+
+    def __contains__(self, monster_id: object) -> bool:
+        if monster_id in self._templates:
+            return True
+        return isinstance(monster_id, str) and self._fallback_template(monster_id) is not None
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get_template(self, monster_id: Optional[str]) -> Optional[Mapping[str, Any]]:
+        """
+        Get the raw definition for a monster.
+
+        Args:
+            monster_id: ID of the monster (e.g., "goblin")
+
+        Returns:
+            Monster definition, or None if unknown
+        """
+        if monster_id is None:
+            return None
+        template = self._templates.get(monster_id)
+        if template is None:
+            template = self._fallback_template(monster_id)
+        return template
+
+    def get_compiled(self, monster_id: str) -> Optional[MonsterTemplate]:
+        """
+        Get the compiled stat block for a monster.
+
+        Args:
+            monster_id: ID of the monster (e.g., "goblin")
+
+        Returns:
+            MonsterTemplate, or None if unknown
+        """
+        compiled = self._compiled.get(monster_id)
+        if compiled is None:
+            compiled = self._fallback_compiled.get(monster_id)
+        if compiled is None:
+            data = self._fallback_template(monster_id)
+            if data is not None:
+                compiled = self._fallback_compiled[monster_id] = MonsterTemplate.compile(monster_id, data)
+        return compiled
+
+    def id_for_name(self, name: str) -> Optional[str]:
+        """
+        Look up a monster ID by display name.
+
+        Args:
+            name: Display name (e.g., "Goblin")
+
+        Returns:
+            Monster ID, or None if no monster has that name
+        """
+        return self._ids_by_name.get(name)
+
+    def resolve_id(self, creature: Any) -> Optional[str]:
+        """
+        Find the monster ID for a creature.
+
+        Uses the template ID stamped on creatures spawned by DataLoader and falls
+        back to the display name for creatures built elsewhere.
+
+        Args:
+            creature: Creature to resolve
+
+        Returns:
+            Monster ID, or None if the creature isn't a known monster
+        """
+        monster_id = getattr(creature, "monster_id", None)
+        if monster_id in self._templates or self._fallback_template(monster_id) is not None:
+            return monster_id
+        return self._ids_by_name.get(creature.name)
+
+    def get_xp(self, monster_id: Optional[str]) -> int:
+        """
+        Get the XP awarded for defeating a monster.
+
+        Args:
+            monster_id: ID of the monster
+
+        Returns:
+            XP value (0 if unknown)
+        """
+        if monster_id is None:
+            return 0
+        if monster_id in self._xp:
+            return self._xp[monster_id]
+        data = self._fallback_template(monster_id)
+        return data.get("xp", 0) if data is not None else 0
+
+    def get_action_table(self, monster_id: Optional[str]) -> Optional[ActionTable]:
+        """
+        Get the compiled action table for a monster.
+
+        Args:
+            monster_id: ID of the monster
+
+        Returns:
+            ActionTable, or None if unknown
+        """
+        if monster_id is None:
+            return None
+        compiled = self.get_compiled(monster_id)
+        return compiled.actions if compiled is not None else None
+
+    def get_primary_attack(self, monster_id: Optional[str]) -> Optional[Mapping[str, Any]]:
+        """
+        Get the first rollable attack action for a monster.
+
+        Args:
+            monster_id: ID of the monster
+
+        Returns:
+            Action data with attack_bonus and damage, or None if it has none
+        """
+        table = self.get_action_table(monster_id)
+        if table is None or table.primary is None:
+            return None
+        return table.primary.action
@@ -0,0 +1,200 @@
+# ABOUTME: Indexed spell catalog built once from spells.json
+# ABOUTME: Holds compiled Spell objects and set indexes by class, level, school, ritual, concentration, and casting time
+
+import logging
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+from dnd_engine.core.spell import Spell, is_combat_spell, is_out_of_combat_spell
+
+
+logger = logging.getLogger(__name__)
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+def _freeze_index(index: Dict[Any, Set[str]]) -> Dict[Any, FrozenSet[str]]:
+    return {key: frozenset(ids) for key, ids in index.items()}
+
+
+class SpellCatalog(Mapping[str, Mapping[str, Any]]):
+    """
+    Lookup tables over the spell definitions.
+
+    Built once per version of spells.json (see DataLoader.load_spell_catalog).
+    Behaves like the spells.json dict (spell ID -> raw definition), so it can
+    be passed anywhere spell data is expected, and adds compiled Spell objects
+    and set indexes so spell menus are intersections instead of full scans.
+    """
+
+    def __init__(self, spells: Mapping[str, Any]):
+        """
+        Build the catalog indexes.
+
+        Args:
+            spells: Spell definitions keyed by spell ID
+        """
+        self._data: Dict[str, Mapping[str, Any]] = dict(spells)
+        self._spells: Dict[str, Spell] = {}
+        self._sort_keys: Dict[str, Tuple[int, str]] = {}
+
+        by_class: Dict[str, Set[str]] = {}
+        by_level: Dict[int, Set[str]] = {}
+        by_school: Dict[str, Set[str]] = {}
+        by_casting_time: Dict[str, Set[str]] = {}
+        ritual: Set[str] = set()
+        concentration: Set[str] = set()
+        combat: Set[str] = set()
+        out_of_combat: Set[str] = set()
+
+        for spell_id, data in self._data.items():
+            try:
+                spell = Spell.from_dict(spell_id, data)
+            except (KeyError, TypeError, ValueError) as e:
+                # One malformed entry (e.g. from a content pack) must not break every spell menu:
+                # it stays in the menus and the mapping, but has no compiled Spell
+                logger.warning(f"Spell '{spell_id}' could not be compiled: {e!r}")
+                level = data.get("level", 0)
+                self._sort_keys[spell_id] = (level, data.get("name", spell_id))
+                for class_name in data.get("classes", ()):
+                    by_class.setdefault(class_name, set()).add(spell_id)
+                by_level.setdefault(level, set()).add(spell_id)
+            else:
+                self._spells[spell_id] = spell
+                self._sort_keys[spell_id] = (spell.level, spell.name)
+
+                for class_name in spell.classes:
+                    by_class.setdefault(class_name, set()).add(spell_id)
+                by_level.setdefault(spell.level, set()).add(spell_id)
+                by_school.setdefault(spell.school.value, set()).add(spell_id)
+                by_casting_time.setdefault(spell.casting_time, set()).add(spell_id)
+
+                if spell.ritual:
+                    ritual.add(spell_id)
+                if spell.concentration:
+                    concentration.add(spell_id)
+
+            if is_combat_spell(data):
+                combat.add(spell_id)
+            if is_out_of_combat_spell(data):
+                out_of_combat.add(spell_id)
+
+        self._by_class = _freeze_index(by_class)
+        self._by_level = _freeze_index(by_level)
+        self._by_school = _freeze_index(by_school)
+        self._by_casting_time = _freeze_index(by_casting_time)
+        self.ritual_ids: FrozenSet[str] = frozenset(ritual)
+        self.concentration_ids: FrozenSet[str] = frozenset(concentration)
+        self.combat_ids: FrozenSet[str] = frozenset(combat)
+        self.out_of_combat_ids: FrozenSet[str] = frozenset(out_of_combat)
+        self.cantrip_ids: FrozenSet[str] = self._by_level.get(0, _EMPTY)
+
+    def __getitem__(self, spell_id: str) -> Mapping[str, Any]:
+        return self._data[spell_id]
+
+    def __contains__(self, spell_id: object) -> bool:
+        return spell_id in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def get_spell(self, spell_id: str) -> Optional[Spell]:
+        """
+        Get the compiled Spell for an ID.
+
+        Args:
+            spell_id: ID of the spell (e.g., "fireball")
+
+        Returns:
+            Spell, or None if unknown or its definition couldn't be compiled
+        """
+        return self._spells.get(spell_id)
+
+    def sort_key(self, spell_id: str) -> Tuple[int, str]:
+        """
+        Get the (level, name) sort key for a spell.
+
+        Args:
+            spell_id: ID of a spell in the catalog
+
+        Returns:
+            Tuple of (spell level, display name)
+        """
+        return self._sort_keys[spell_id]
+
+    def ids_for_class(self, class_name: str) -> FrozenSet[str]:
+        """Get the IDs of spells on a class's spell list (e.g., "wizard")."""
+        return self._by_class.get(class_name, _EMPTY)
+
+    def ids_for_level(self, level: int) -> FrozenSet[str]:
+        """Get the IDs of spells of a given level (0 for cantrips)."""
+        return self._by_level.get(level, _EMPTY)
+
+    def ids_for_school(self, school: str) -> FrozenSet[str]:
+        """Get the IDs of spells from a school of magic (e.g., "evocation")."""
+        return self._by_school.get(school, _EMPTY)
+
+    def ids_for_casting_time(self, casting_time: str) -> FrozenSet[str]:
+        """Get the IDs of spells with a casting time (e.g., "1 reaction")."""
+        return self._by_casting_time.get(casting_time, _EMPTY)
+
+    def query(
+        self,
+        class_name: Optional[str] = None,
+        level: Optional[int] = None,
+        school: Optional[str] = None,
+        casting_time: Optional[str] = None,
+        ritual: Optional[bool] = None,
+        concentration: Optional[bool] = None
+    ) -> FrozenSet[str]:
+        """
+        Find spells matching every given filter.
+
+        Args:
+            class_name: Class spell list to match
+            level: Spell level to match
+            school: School of magic to match
+            casting_time: Casting time to match
+            ritual: Require (True) or exclude (False) ritual spells
+            concentration: Require (True) or exclude (False) concentration spells
+
+        Returns:
+            Set of matching spell IDs
+        """
+        result: FrozenSet[str] = frozenset(self._data)
+        if class_name is not None:
+            result &= self.ids_for_class(class_name)
+        if level is not None:
+            result &= self.ids_for_level(level)
+        if school is not None:
+            result &= self.ids_for_school(school)
+        if casting_time is not None:
+            result &= self.ids_for_casting_time(casting_time)
+        if ritual is not None:
+            result = result & self.ritual_ids if ritual else result - self.ritual_ids
+        if concentration is not None:
+            result = (result & self.concentration_ids if concentration
+                      else result - self.concentration_ids)
+        return result
+
+    def select(
+        self,
+        spell_ids: Iterable[str],
+        index: Optional[FrozenSet[str]] = None
+    ) -> List[Tuple[str, Mapping[str, Any]]]:
+        """
+        Intersect a character's spell list with an index, keeping list order.
+
+        Args:
+            spell_ids: Spell IDs to filter (e.g., prepared spells)
+            index: Index to intersect with (defaults to every spell in the catalog)
+
+        Returns:
+            List of (spell_id, spell_data) tuples for IDs in both
+        """
+        data = self._data
+        if index is None:
+            return [(spell_id, data[spell_id]) for spell_id in spell_ids if spell_id in data]
+        return [(spell_id, data[spell_id]) for spell_id in spell_ids if spell_id in index]
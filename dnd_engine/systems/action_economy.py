@@ -21,7 +21,7 @@ class ActionType(Enum):
     NO_ACTION = "no_action"
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnState:
     """
     Tracks available actions for a single combat turn.
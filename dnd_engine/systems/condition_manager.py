@@ -1,13 +1,13 @@
 # ABOUTME: Condition management system for D&D 5E status effects
 # ABOUTME: Handles turn-start effects, ability checks to remove conditions, and data-driven condition definitions
 
-import json
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 
 from dnd_engine.core.dice import DiceRoller
 from dnd_engine.core.creature import Creature
+from dnd_engine.rules.loader import get_content_cache
 from dnd_engine.utils.events import Event, EventType, EventBus
 
 
@@ -62,13 +62,12 @@ class ConditionManager:
         self.dice_roller = dice_roller or DiceRoller()
         self.event_bus = event_bus
 
-        # Load conditions data
+        # Load conditions data (parsed once per process through the content cache)
         if conditions_file is None:
             conditions_file = Path(__file__).parent.parent / "data" / "srd" / "conditions.json"
 
-        with open(conditions_file, 'r') as f:
-            data = json.load(f)
-            self.conditions_data: Dict[str, Any] = data.get("conditions", {})
+        data = get_content_cache().get(conditions_file)
+        self.conditions_data: Dict[str, Any] = data.get("conditions", {})
 
     def get_condition_info(self, condition_id: str) -> Optional[Dict[str, Any]]:
         """
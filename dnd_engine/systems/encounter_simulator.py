@@ -0,0 +1,394 @@
+# ABOUTME: Headless encounter simulator for balancing party-vs-monster fights
+# ABOUTME: Runs combats N times with pluggable policies and seeded dice, optionally across processes
+
+import copy
+import random
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from dnd_engine.core.character import Character
+from dnd_engine.core.dice import DiceRoller, format_dice_with_modifier
+from dnd_engine.core.game_state import GameState
+from dnd_engine.core.party import Party
+from dnd_engine.rules.loader import DataLoader
+from dnd_engine.systems.action_economy import ActionType
+from dnd_engine.systems.condition_manager import ConditionManager
+from dnd_engine.systems.enemy_ai import EnemyPolicy
+from dnd_engine.systems.inventory import EquipmentSlot
+from dnd_engine.utils.events import EventBus
+
+
+class CombatPolicy(ABC):
+    """
+    Decides what a party member does on its turn.
+
+    Enemies are driven by an EnemyPolicy instead. Policies must be picklable
+    (module-level classes with plain attributes) so simulations can be sent
+    to worker processes.
+    """
+
+    @abstractmethod
+    def take_turn(self, game_state: GameState, creature: Character) -> None:
+        """
+        Act for a party member on its turn.
+
+        Called only when the character is conscious and able to act. The
+        simulator advances initiative afterwards.
+
+        Args:
+            game_state: Game state for the running encounter
+            creature: The party member whose turn it is
+        """
+
+
+class WeaponAttackPolicy(CombatPolicy):
+    """
+    Party policy: attack the living enemy with the lowest HP using the equipped weapon.
+
+    Mirrors the CLI's attack command (weapon attack and damage bonuses,
+    unarmed fallback to a 1d8 melee attack).
+    """
+
+    def take_turn(self, game_state: GameState, creature: Character) -> None:
+        targets = [enemy for enemy in game_state.active_enemies if enemy.is_alive]
+        if not targets:
+            return
+
+        tracker = game_state.initiative_tracker
+        turn_state = tracker.get_current_turn_state() if tracker is not None else None
+        if turn_state and not turn_state.consume_action(ActionType.ACTION):
+            return
+
+        target = min(targets, key=lambda enemy: enemy.current_hp)
+        items = game_state.data_loader.load_item_registry()
+        weapon_id = creature.inventory.get_equipped_item(EquipmentSlot.WEAPON)
+
+        if weapon_id:
+            attack_bonus = creature.get_attack_bonus(weapon_id, items)
+            damage_bonus = creature.get_damage_bonus(weapon_id, items)
+            damage_dice = items.get_weapon(weapon_id).damage or "1d8"
+        else:
+            attack_bonus = creature.melee_attack_bonus
+            damage_bonus = creature.melee_damage_bonus
+            damage_dice = "1d8"
+
+        game_state.combat_engine.resolve_attack(
+            attacker=creature,
+            defender=target,
+            attack_bonus=attack_bonus,
+            damage_dice=format_dice_with_modifier(damage_dice, damage_bonus),
+            apply_damage=True
+        )
+
+
+@dataclass(frozen=True)
+class EncounterOutcome:
+    """
+    Result of a single simulated encounter.
+
+    Attributes:
+        seed: Seed of the run's dice stream (replays the run exactly)
+        victory: True if every enemy was killed
+        timed_out: True if the round limit was reached first
+        rounds: Combat rounds fought
+        party_hp: Remaining HP of each party member, by name
+    """
+    seed: int
+    victory: bool
+    timed_out: bool
+    rounds: int
+    party_hp: Dict[str, int]
+
+    @property
+    def total_party_hp(self) -> int:
+        """Total HP remaining across the party."""
+        return sum(self.party_hp.values())
+
+
+@dataclass
+class SimulationReport:
+    """
+    Aggregated results of many simulated encounters.
+
+    Distributions are Counters mapping a value to the number of runs with it.
+
+    Attributes:
+        runs: Number of encounters simulated
+        wins: Number of encounters the party won
+        timeouts: Number of encounters stopped at the round limit
+        rounds_to_kill: Rounds taken to kill every enemy, over victories
+        rounds_to_defeat: Rounds until the party went down, over defeats
+        party_hp_remaining: Total party HP left at the end, over all runs
+        member_hp_remaining: HP left at the end per party member, over all runs
+        outcomes: Individual run outcomes, in run order
+    """
+    runs: int = 0
+    wins: int = 0
+    timeouts: int = 0
+    rounds_to_kill: Counter = field(default_factory=Counter)
+    rounds_to_defeat: Counter = field(default_factory=Counter)
+    party_hp_remaining: Counter = field(default_factory=Counter)
+    member_hp_remaining: Dict[str, Counter] = field(default_factory=dict)
+    outcomes: List[EncounterOutcome] = field(default_factory=list)
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of encounters the party won."""
+        return self.wins / self.runs if self.runs else 0.0
+
+    @property
+    def mean_rounds_to_kill(self) -> Optional[float]:
+        """Average rounds to win, or None if the party never won."""
+        if not self.wins:
+            return None
+        total_rounds: int = sum(rounds * count for rounds, count in self.rounds_to_kill.items())
+        return total_rounds / self.wins
+
+    def add(self, outcome: EncounterOutcome) -> None:
+        """
+        Fold a run's outcome into the report.
+
+        Args:
+            outcome: Outcome of a single encounter
+        """
+        self.runs += 1
+        self.outcomes.append(outcome)
+
+        if outcome.victory:
+            self.wins += 1
+            self.rounds_to_kill[outcome.rounds] += 1
+        elif outcome.timed_out:
+            self.timeouts += 1
+        else:
+            self.rounds_to_defeat[outcome.rounds] += 1
+
+        self.party_hp_remaining[outcome.total_party_hp] += 1
+        for name, hp in outcome.party_hp.items():
+            self.member_hp_remaining.setdefault(name, Counter())[hp] += 1
+
+
+class EncounterSimulator:
+    """
+    Runs a party against an encounter many times without any I/O.
+
+    Each run deep-copies the party, spawns fresh monsters, and plays out
+    combat through GameState, InitiativeTracker and CombatEngine, with the
+    given policies choosing every action. A run uses its own DiceRoller
+    seeded from the simulation seed, so results are reproducible and
+    identical whether runs execute serially or across worker processes.
+
+    The encounter ends in victory when every enemy is dead and in defeat
+    when no party member is conscious (unconscious members stop acting,
+    so the fight is lost even if death saves would later stabilize them).
+    """
+
+    def __init__(
+        self,
+        party: Party,
+        enemy_ids: Sequence[str],
+        dungeon_name: str = "test_dungeon",
+        party_policy: Optional[CombatPolicy] = None,
+        enemy_policy: Optional[EnemyPolicy] = None,
+        max_rounds: int = 100
+    ):
+        """
+        Initialize the simulator.
+
+        Args:
+            party: Party to simulate (never modified; each run uses a copy)
+            enemy_ids: Monster IDs in the encounter (e.g., ["goblin", "goblin", "wolf"])
+            dungeon_name: Dungeon the GameState is built on (only its start room is used)
+            party_policy: Policy for party turns (defaults to WeaponAttackPolicy)
+            enemy_policy: Enemy AI (defaults to GameState's FocusWeakestPolicy)
+            max_rounds: Round limit after which a run counts as a timeout
+        """
+        self.party = party
+        self.enemy_ids = list(enemy_ids)
+        self.dungeon_name = dungeon_name
+        self.party_policy = party_policy or WeaponAttackPolicy()
+        self.enemy_policy = enemy_policy
+        self.max_rounds = max_rounds
+
+    @classmethod
+    def from_room(
+        cls,
+        party: Party,
+        dungeon_name: str,
+        room_id: str,
+        data_loader: Optional[DataLoader] = None,
+        **kwargs: Any
+    ) -> "EncounterSimulator":
+        """
+        Create a simulator for the enemies placed in a dungeon room.
+
+        Args:
+            party: Party to simulate
+            dungeon_name: Name of the dungeon
+            room_id: Room whose enemies make up the encounter
+            data_loader: Data loader for the dungeon (creates new if not provided)
+            **kwargs: Passed through to the constructor
+
+        Returns:
+            EncounterSimulator for the room's encounter
+
+        Raises:
+            KeyError: If room_id doesn't exist in the dungeon
+        """
+        dungeon = (data_loader or DataLoader()).load_dungeon(dungeon_name)
+        enemy_ids = dungeon["rooms"][room_id].get("enemies", [])
+        return cls(party, enemy_ids, dungeon_name=dungeon_name, **kwargs)
+
+    def run(
+        self,
+        runs: int,
+        seed: Optional[int] = None,
+        workers: Optional[int] = None
+    ) -> SimulationReport:
+        """
+        Simulate the encounter many times.
+
+        Args:
+            runs: Number of encounters to simulate
+            seed: Simulation seed (random if not provided)
+            workers: Worker processes to use (None or 1 runs in this process)
+
+        Returns:
+            SimulationReport aggregated over every run
+        """
+        seeds = _spawn_seeds(seed, runs)
+        report = SimulationReport()
+
+        if workers is None or workers <= 1 or runs <= 1:
+            outcomes = _simulate_chunk(self, seeds)
+            for outcome in outcomes:
+                report.add(outcome)
+            return report
+
+        # One chunk per worker keeps pickling the party to a handful of sends
+        chunk_size = -(-runs // workers)
+        chunks = [seeds[i:i + chunk_size] for i in range(0, runs, chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for outcomes in executor.map(_simulate_chunk, [self] * len(chunks), chunks):
+                for outcome in outcomes:
+                    report.add(outcome)
+        return report
+
+    def simulate(self, seed: int) -> EncounterOutcome:
+        """
+        Simulate a single encounter.
+
+        Args:
+            seed: Seed for the run's dice stream
+
+        Returns:
+            EncounterOutcome of the run
+        """
+        dice_roller = DiceRoller(seed)
+        party = copy.deepcopy(self.party)
+        for character in party.characters:
+            character._dice_roller = dice_roller
+
+        data_loader = DataLoader()
+        data_loader.dice_roller = dice_roller
+        # Events are delivered in one batch at the end of each turn
+        event_bus = EventBus(queued=True)
+        game_state = GameState(
+            party,
+            self.dungeon_name,
+            event_bus=event_bus,
+            data_loader=data_loader,
+            dice_roller=dice_roller,
+            enemy_policy=self.enemy_policy
+        )
+        condition_manager = ConditionManager(dice_roller=dice_roller, event_bus=event_bus)
+
+        game_state.active_enemies = data_loader.create_monsters(self.enemy_ids)
+        for enemy in game_state.active_enemies:
+            enemy._dice_roller = dice_roller
+        game_state._start_combat()
+
+        tracker = game_state.initiative_tracker
+        if tracker is None:
+            raise RuntimeError("Combat started without an initiative tracker")
+        members = set(party.characters)
+        victory = False
+        timed_out = False
+        rounds = 0
+
+        # Combat rounds are summarized in one TIME_SUMMARY event instead of one per round
+        with game_state.time_manager.batch(reason="simulated_combat"):
+            while True:
+                if all(not enemy.is_alive for enemy in game_state.active_enemies):
+                    victory = True
+                    break
+                if not party.get_living_members():
+                    break
+                if tracker.round_number >= self.max_rounds:
+                    timed_out = True
+                    break
+
+                rounds = tracker.round_number + 1
+                current = tracker.get_current_combatant()
+                if current is None:
+                    break
+                creature = current.creature
+                if creature in members:
+                    self._take_party_turn(game_state, condition_manager, creature)
+                elif creature.is_alive:
+                    condition_manager.process_turn_start_effects(creature)
+                    if creature.is_alive:
+                        game_state.take_enemy_turn(creature, condition_manager)
+
+                tracker.next_turn()
+                event_bus.drain()
+
+                # Killed enemies and dead party members leave the initiative order
+                for entry in tracker.get_all_combatants():
+                    defeated = entry.creature
+                    if defeated.is_dead if defeated in members else not defeated.is_alive:
+                        tracker.remove_combatant(defeated)
+        event_bus.drain()
+
+        return EncounterOutcome(
+            seed=seed,
+            victory=victory,
+            timed_out=timed_out,
+            rounds=rounds,
+            party_hp={character.name: character.current_hp for character in party.characters}
+        )
+
+    def _take_party_turn(
+        self,
+        game_state: GameState,
+        condition_manager: ConditionManager,
+        character: Character
+    ) -> None:
+        """Play a party member's turn the way the CLI game loop does."""
+        if character.is_dead:
+            return
+
+        if character.is_unconscious:
+            character.make_death_save(event_bus=game_state.event_bus)
+            return
+
+        if not character.can_take_actions():
+            character.process_end_of_turn_conditions(game_state.event_bus)
+            return
+
+        condition_manager.process_turn_start_effects(character)
+        if character.is_alive:
+            self.party_policy.take_turn(game_state, character)
+
+
+def _spawn_seeds(seed: Optional[int], runs: int) -> List[int]:
+    """Derive an independent 64-bit seed for each run from the simulation seed."""
+    master = random.Random(seed) if seed is not None else random.Random()
+    return [master.getrandbits(64) for _ in range(runs)]
+
+
+def _simulate_chunk(simulator: EncounterSimulator, seeds: Sequence[int]) -> List[EncounterOutcome]:
+    """Simulate one encounter per seed (module-level so worker processes can run it)."""
+    return [simulator.simulate(seed) for seed in seeds]
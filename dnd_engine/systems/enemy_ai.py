@@ -0,0 +1,185 @@
+# ABOUTME: Enemy AI policies that decide monster actions without any UI
+# ABOUTME: Provides the battlefield view, pluggable target/attack selection, and turn results shared by the CLI and simulations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+from dnd_engine.core.creature import Creature
+from dnd_engine.rules.action_table import ActionTable, AttackOption, AttackStep
+
+if TYPE_CHECKING:
+    from dnd_engine.core.combat import AttackResult
+    from dnd_engine.systems.condition_manager import AbilityCheckResult
+
+
+class Battlefield:
+    """
+    View of who is fighting on which side.
+
+    Built once when combat starts. Side membership is indexed by identity,
+    so policies can tell allies from foes in O(1) and only filter for
+    who is still standing when they pick a target. The enemy list is kept
+    by reference, so monsters that join mid-fight are seen too.
+    """
+
+    def __init__(self, party: Sequence[Creature], enemies: Sequence[Creature]):
+        """
+        Build the battlefield view.
+
+        Args:
+            party: Party members in the fight
+            enemies: Enemies in the fight (e.g., GameState.active_enemies)
+        """
+        self.party: Sequence[Creature] = party
+        self.enemies: Sequence[Creature] = enemies
+        self._party_ids = frozenset(id(creature) for creature in party)
+
+    def is_party_member(self, creature: Creature) -> bool:
+        """Check if a creature fights on the party's side."""
+        return id(creature) in self._party_ids
+
+    def conscious_party(self) -> List[Creature]:
+        """Get party members with HP above 0."""
+        return [creature for creature in self.party if creature.current_hp > 0]
+
+    def living_enemies(self) -> List[Creature]:
+        """Get enemies with HP above 0."""
+        return [creature for creature in self.enemies if creature.current_hp > 0]
+
+    def targets_for(self, creature: Creature) -> List[Creature]:
+        """
+        Get the opponents a creature can attack.
+
+        Args:
+            creature: The attacking creature
+
+        Returns:
+            Opponents with HP above 0
+        """
+        if self.is_party_member(creature):
+            return self.living_enemies()
+        return self.conscious_party()
+
+
+@dataclass
+class EnemyAttack:
+    """
+    One attack made on an enemy's turn.
+
+    Attributes:
+        attack: The attack option used
+        target: Creature that was attacked
+        result: Resolved attack
+        new_conditions: Conditions the target gained from the attack (failed saves)
+    """
+    attack: AttackOption
+    target: Creature
+    result: "AttackResult"
+    new_conditions: Tuple[str, ...] = ()
+
+
+@dataclass
+class EnemyTurnResult:
+    """
+    Everything an enemy did on its turn, for the caller to display or record.
+
+    Attributes:
+        condition_removal: Result of spending the turn trying to end a condition
+        ignored_conditions: Removable conditions the enemy chose to fight through
+        attacks: Attacks made, in order
+        no_attack_available: True if the enemy had targets but no usable attack
+    """
+    condition_removal: Optional["AbilityCheckResult"] = None
+    ignored_conditions: Tuple[str, ...] = ()
+    attacks: List[EnemyAttack] = field(default_factory=list)
+    no_attack_available: bool = False
+
+
+class EnemyPolicy(ABC):
+    """
+    Decides what an enemy does on its turn.
+
+    Policies only choose; GameState.take_enemy_turn resolves the choices,
+    so the CLI and the encounter simulator run the same decisions. Policies
+    must be picklable so simulations can send them to worker processes.
+    """
+
+    def choose_condition_removal(self, enemy: Creature, removable: Tuple[str, ...]) -> Optional[str]:
+        """
+        Decide whether to spend the turn ending a condition.
+
+        Args:
+            enemy: The enemy whose turn it is
+            removable: Conditions on the enemy that can be ended early
+
+        Returns:
+            Condition to try to remove, or None to attack instead
+        """
+        return None
+
+    def choose_attacks(self, enemy: Creature, table: ActionTable) -> Tuple[AttackStep, ...]:
+        """
+        Choose the attacks to make this turn.
+
+        Args:
+            enemy: The enemy whose turn it is
+            table: The enemy's compiled action table
+
+        Returns:
+            Attack steps in order (Multiattack if available by default)
+        """
+        return table.turn_attacks
+
+    @abstractmethod
+    def choose_target(
+        self,
+        enemy: Creature,
+        attack: AttackOption,
+        targets: List[Creature]
+    ) -> Optional[Creature]:
+        """
+        Choose who to hit with an attack.
+
+        Called before each attack, so later attacks in a Multiattack can
+        switch targets when an earlier one drops its target.
+
+        Args:
+            enemy: The attacking enemy
+            attack: The attack about to be made
+            targets: Opponents that can be attacked (never empty)
+
+        Returns:
+            Target creature, or None to skip the attack
+        """
+
+
+class FocusWeakestPolicy(EnemyPolicy):
+    """
+    Default enemy AI: gang up on whoever has the lowest HP.
+
+    Tries to put out flames instead of attacking when one more tick of fire
+    damage (1d4) could be lethal.
+    """
+
+    def __init__(self, extinguish_hp: int = 4):
+        """
+        Initialize the policy.
+
+        Args:
+            extinguish_hp: HP at or below which a burning enemy tries to put itself out
+        """
+        self.extinguish_hp = extinguish_hp
+
+    def choose_condition_removal(self, enemy: Creature, removable: Tuple[str, ...]) -> Optional[str]:
+        if "on_fire" in removable and enemy.current_hp <= self.extinguish_hp:
+            return "on_fire"
+        return None
+
+    def choose_target(
+        self,
+        enemy: Creature,
+        attack: AttackOption,
+        targets: List[Creature]
+    ) -> Optional[Creature]:
+        return min(targets, key=lambda creature: creature.current_hp)
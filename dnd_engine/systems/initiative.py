@@ -1,25 +1,30 @@
 # ABOUTME: Initiative tracking system for turn-based combat
 # ABOUTME: Manages turn order, round counting, and combatant lifecycle
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from typing import List, Optional, Dict, TYPE_CHECKING
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, TYPE_CHECKING
 from dnd_engine.core.dice import DiceRoller
 from dnd_engine.core.creature import Creature
+from dnd_engine.core.squad import SquadMember
 from dnd_engine.systems.action_economy import TurnState
 
 if TYPE_CHECKING:
     from dnd_engine.systems.time_manager import TimeManager
 
 
-@dataclass
+@dataclass(slots=True)
 class InitiativeEntry:
     """
     Represents a combatant in the initiative order.
 
     Combines a creature with their initiative roll for sorting and tracking.
+    Creatures rolling as a group (group initiative) share a group key and
+    act back to back.
     """
     creature: Creature
     initiative_roll: int
+    group: Optional[str] = None
 
     @property
     def initiative_total(self) -> int:
@@ -36,6 +41,37 @@ class InitiativeEntry:
         return f"{self.creature.name}: {self.initiative_roll}+{self.creature.initiative_modifier}={self.initiative_total}"
 
 
+# Sort key: (-initiative total, -DEX modifier, order the slot was first filled)
+SortKey = Tuple[int, int, int]
+
+
+class TurnStateView(Mapping[Creature, TurnState]):
+    """
+    Read-only view of turn states keyed by creature.
+
+    Lookups go through the tracker's identity index, so they never depend
+    on how a creature hashes or compares.
+    """
+
+    def __init__(self, states: Dict[int, Tuple[Creature, TurnState]]):
+        self._states = states
+
+    def __getitem__(self, creature: Creature) -> TurnState:
+        try:
+            return self._states[id(creature)][1]
+        except KeyError:
+            raise KeyError(creature) from None
+
+    def __contains__(self, creature: object) -> bool:
+        return id(creature) in self._states
+
+    def __iter__(self) -> Iterator[Creature]:
+        return (creature for creature, _ in self._states.values())
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
 class InitiativeTracker:
     """
     Manages initiative order and turn tracking for combat.
@@ -46,29 +82,50 @@ class InitiativeTracker:
     - Ties are broken by DEX modifier (higher goes first)
     - Turn order cycles through all combatants
     - Round increments when all combatants have acted
+
+    Combatants are kept in sorted order with a parallel list of sort keys,
+    so inserts and removals are a binary search (plus a list shift) rather
+    than a re-sort or a scan, and an identity index maps each creature to
+    its entry. With group_initiative, identical monsters (same monster ID)
+    roll once and act back to back, as in the DMG's group initiative option.
     """
 
-    def __init__(self, dice_roller: Optional[DiceRoller] = None, time_manager: Optional["TimeManager"] = None):
+    def __init__(
+        self,
+        dice_roller: Optional[DiceRoller] = None,
+        time_manager: Optional["TimeManager"] = None,
+        group_initiative: bool = False
+    ):
         """
         Initialize the initiative tracker.
 
         Args:
             dice_roller: DiceRoller instance (creates new one if not provided)
             time_manager: TimeManager instance for tracking combat time (optional)
+            group_initiative: Roll once for each group of identical monsters
         """
         self.dice_roller = dice_roller if dice_roller is not None else DiceRoller()
         self.time_manager = time_manager
+        self.group_initiative = group_initiative
         self.combatants: List[InitiativeEntry] = []
         self.current_turn_index: int = 0
         self.round_number: int = 0
         self.total_turns_taken: int = 0  # Track total number of turns for narrative context
-        self.turn_states: Dict[Creature, TurnState] = {}  # Maps creature instance to their turn state
+        self._keys: List[SortKey] = []  # Sort keys, parallel to combatants
+        self._entries: Dict[int, InitiativeEntry] = {}  # id(creature) -> entry
+        self._sort_keys: Dict[int, SortKey] = {}  # id(creature) -> sort key
+        self._states: Dict[int, Tuple[Creature, TurnState]] = {}  # id(creature) -> (creature, turn state)
+        self._groups: Dict[str, Tuple[int, SortKey]] = {}  # group key -> (shared roll, sort key)
+        self._next_slot = 0
+        self.turn_states = TurnStateView(self._states)  # Maps creature instance to their turn state
 
     def add_combatant(self, creature: Creature) -> InitiativeEntry:
         """
         Add a combatant and roll their initiative.
 
-        Automatically sorts the initiative order after adding.
+        The combatant is inserted into its place in the order by binary
+        search. If combat is underway and they land before the current
+        combatant, the current turn stays with the same combatant.
 
         Args:
             creature: The creature to add to initiative
@@ -76,21 +133,62 @@ class InitiativeTracker:
         Returns:
             The created InitiativeEntry
         """
-        # Roll initiative (1d20 + DEX modifier)
-        roll = self.dice_roller.roll("1d20")
-        initiative_roll = roll.total
-
-        entry = InitiativeEntry(creature=creature, initiative_roll=initiative_roll)
-        self.combatants.append(entry)
+        entry, key = self._roll_entry(creature)
 
-        # Initialize turn state for this combatant
-        self.turn_states[creature] = TurnState()
+        index = bisect_right(self._keys, key)
+        self._keys.insert(index, key)
+        self.combatants.insert(index, entry)
+        self._index(entry, key)
 
-        # Sort by initiative (highest first), ties broken by DEX modifier
-        self._sort_initiative()
+        if self.total_turns_taken and index <= self.current_turn_index:
+            self.current_turn_index += 1
 
         return entry
 
+    def add_combatants(self, creatures: Iterable[Creature]) -> List[InitiativeEntry]:
+        """
+        Add several combatants with a single sort.
+
+        Produces the same order (and uses the same dice rolls) as adding
+        them one at a time, but sorts once instead of inserting each.
+
+        Args:
+            creatures: Creatures to add, in the order their initiative is rolled
+
+        Returns:
+            The created InitiativeEntry objects, in the order given
+        """
+        creatures = list(creatures)
+
+        # Squads roll their members' initiative in one batch
+        squad_rolls: Dict[int, int] = {}
+        squads = {id(c.squad): c.squad for c in creatures if isinstance(c, SquadMember)}
+        for squad in squads.values():
+            squad.roll_initiative(self.dice_roller)
+        for creature in creatures:
+            if isinstance(creature, SquadMember):
+                squad_rolls[id(creature)] = int(creature.squad.initiative[creature.index])
+
+        rolled = [self._roll_entry(creature, squad_rolls.get(id(creature))) for creature in creatures]
+        current = self.get_current_combatant() if self.total_turns_taken else None
+
+        for entry, key in rolled:
+            self._index(entry, key)
+
+        order = sorted(
+            zip(self._keys + [key for _, key in rolled], self.combatants + [entry for entry, _ in rolled]),
+            key=lambda pair: pair[0]
+        )
+        self._keys = [key for key, _ in order]
+        self.combatants = [entry for _, entry in order]
+
+        if current is not None:
+            # Keep the same combatant's turn now that the order has shifted
+            position = self._position(current.creature)
+            self.current_turn_index = position if position is not None else 0
+
+        return [entry for entry, _ in rolled]
+
     def remove_combatant(self, creature: Creature) -> None:
         """
         Remove a combatant from initiative (e.g., when defeated).
@@ -100,13 +198,7 @@ class InitiativeTracker:
         Args:
             creature: The creature to remove
         """
-        # Find the index of the combatant to remove
-        remove_index = None
-        for i, entry in enumerate(self.combatants):
-            if entry.creature == creature:
-                remove_index = i
-                break
-
+        remove_index = self._position(creature)
         if remove_index is None:
             return  # Not found, nothing to do
 
@@ -118,12 +210,13 @@ class InitiativeTracker:
         elif remove_index == self.current_turn_index and remove_index == len(self.combatants) - 1:
             self.current_turn_index = 0
 
-        # Remove the combatant
+        # Remove the combatant and their turn state
+        del self._keys[remove_index]
         removed_entry = self.combatants.pop(remove_index)
-
-        # Remove their turn state
-        if removed_entry.creature in self.turn_states:
-            del self.turn_states[removed_entry.creature]
+        creature_id = id(removed_entry.creature)
+        del self._entries[creature_id]
+        del self._sort_keys[creature_id]
+        del self._states[creature_id]
 
         # Ensure index is valid
         if self.combatants and self.current_turn_index >= len(self.combatants):
@@ -135,6 +228,40 @@ class InitiativeTracker:
         if current and current.creature in self.turn_states:
             self.turn_states[current.creature].reset()
 
+    def get_entry(self, creature: Creature) -> Optional[InitiativeEntry]:
+        """
+        Look up a combatant's entry by identity in O(1).
+
+        Args:
+            creature: The creature to look up
+
+        Returns:
+            The creature's InitiativeEntry, or None if not in initiative
+        """
+        return self._entries.get(id(creature))
+
+    def get_group(self, creature: Creature) -> List[Creature]:
+        """
+        Get the creatures sharing a combatant's initiative slot.
+
+        Args:
+            creature: A creature in initiative
+
+        Returns:
+            Creatures in the same group, in turn order (just the creature
+            itself when not grouped, empty if not in initiative)
+        """
+        entry = self.get_entry(creature)
+        if entry is None:
+            return []
+        if entry.group is None:
+            return [creature]
+
+        key = self._sort_keys[id(creature)]
+        start = bisect_left(self._keys, key)
+        end = bisect_right(self._keys, key)
+        return [e.creature for e in self.combatants[start:end] if e.group == entry.group]
+
     def get_current_combatant(self) -> Optional[InitiativeEntry]:
         """
         Get the combatant whose turn it currently is.
@@ -208,19 +335,53 @@ class InitiativeTracker:
         """
         return len(self.combatants) <= 1
 
-    def _sort_initiative(self) -> None:
-        """
-        Sort combatants by initiative order.
+    def _roll_entry(self, creature: Creature, roll: Optional[int] = None) -> Tuple[InitiativeEntry, SortKey]:
+        """Roll initiative for a creature (or reuse its group's or a batch roll) and build its sort key."""
+        group = self._group_key(creature)
+        if group is not None and group in self._groups:
+            roll, key = self._groups[group]
+            return InitiativeEntry(creature=creature, initiative_roll=roll, group=group), key
 
-        Sorts by total initiative (descending), with ties broken by DEX modifier.
-        """
-        self.combatants.sort(
-            key=lambda entry: (
-                entry.initiative_total,
-                entry.creature.initiative_modifier
-            ),
-            reverse=True
-        )
+        # Roll initiative (1d20 + DEX modifier)
+        if roll is None:
+            roll = self.dice_roller.roll("1d20").total
+            if isinstance(creature, SquadMember):
+                creature.squad.initiative[creature.index] = roll
+        entry = InitiativeEntry(creature=creature, initiative_roll=roll, group=group)
+
+        # Highest total first, ties broken by DEX modifier, then by arrival
+        key = (-entry.initiative_total, -creature.initiative_modifier, self._next_slot)
+        self._next_slot += 1
+
+        if group is not None:
+            self._groups[group] = (roll, key)
+        return entry, key
+
+    def _group_key(self, creature: Creature) -> Optional[str]:
+        """Get the group a creature rolls initiative with, or None to roll alone."""
+        if not self.group_initiative:
+            return None
+        return getattr(creature, "monster_id", None)
+
+    def _index(self, entry: InitiativeEntry, key: SortKey) -> None:
+        """Add an entry to the identity indexes and give it a fresh turn state."""
+        creature_id = id(entry.creature)
+        self._entries[creature_id] = entry
+        self._sort_keys[creature_id] = key
+        self._states[creature_id] = (entry.creature, TurnState())
+
+    def _position(self, creature: Creature) -> Optional[int]:
+        """Find a creature's index in the order by binary search on its sort key."""
+        key = self._sort_keys.get(id(creature))
+        if key is None:
+            return None
+
+        index = bisect_left(self._keys, key)
+        while index < len(self.combatants) and self._keys[index] == key:
+            if self.combatants[index].creature is creature:
+                return index
+            index += 1
+        return None
 
     def __str__(self) -> str:
         """String representation of the initiative tracker"""
@@ -2,9 +2,10 @@
 # ABOUTME: Handles item storage, equipping, usage, and currency tracking
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from enum import Enum
 from dnd_engine.systems.currency import Currency
+from dnd_engine.rules.item_registry import CP_PER_GP, ItemRegistry
 
 
 class EquipmentSlot(Enum):
@@ -13,7 +14,7 @@ class EquipmentSlot(Enum):
     ARMOR = "armor"
 
 
-@dataclass
+@dataclass(slots=True)
 class InventoryItem:
     """
     Represents an item in inventory with quantity.
@@ -60,6 +61,7 @@ class Inventory:
             EquipmentSlot.ARMOR: None
         }
         self.currency: Currency = Currency()
+        self.equipment_version = 0  # Bumped whenever equipped items change
 
     def add_item(
         self,
@@ -141,6 +143,7 @@ class Inventory:
             for slot, equipped_id in self.equipped.items():
                 if equipped_id == item_id:
                     self.equipped[slot] = None
+                    self.equipment_version += 1
 
         return True
 
@@ -190,6 +193,7 @@ class Inventory:
             return False
 
         self.equipped[slot] = item_id
+        self.equipment_version += 1
         return True
 
     def unequip_item(self, slot: EquipmentSlot) -> Optional[str]:
@@ -204,6 +208,7 @@ class Inventory:
         """
         item_id = self.equipped[slot]
         self.equipped[slot] = None
+        self.equipment_version += 1
         return item_id
 
     def get_equipped_item(self, slot: EquipmentSlot) -> Optional[str]:
@@ -349,16 +354,25 @@ class Inventory:
         """
         return len(self.items)
 
-    def total_value(self, item_data: Dict[str, Dict[str, Any]]) -> int:
+    def total_value(self, item_data: Dict[str, Dict[str, Any]]) -> float:
         """
         Calculate total value of all items in inventory.
 
         Args:
-            item_data: Full items data loaded from items.json
+            item_data: ItemRegistry or full items data loaded from items.json
 
         Returns:
-            Total value in gold pieces (excluding gold itself)
+            Total value in gold pieces, possibly fractional (excluding gold itself)
         """
+        if isinstance(item_data, ItemRegistry):
+            # Sum in copper so fractional values (e.g., 0.5 gp) don't accumulate float error
+            total_cp = 0
+            for item in self.items.values():
+                record = item_data.resolve(item.item_id)
+                if record is not None:
+                    total_cp += record.value_cp * item.quantity
+            return total_cp / CP_PER_GP
+
         total = 0
         for item in self.items.values():
             category_data = item_data.get(item.category, {})
@@ -366,9 +380,11 @@ class Inventory:
             value = item_info.get("value", 0)
             total += value * item.quantity
 
-        return total
+        return float(total)
 
-    def use_item(self, item_id: str, item_data: Dict[str, Dict[str, Any]]) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    def use_item(
+        self, item_id: str, item_data: Mapping[str, Mapping[str, Any]]
+    ) -> Tuple[bool, Optional[Mapping[str, Any]]]:
         """
         Use a consumable item from inventory.
 
@@ -378,10 +394,10 @@ class Inventory:
 
         Args:
             item_id: ID of the item to use
-            item_data: Full items data loaded from items.json
+            item_data: ItemRegistry or full items data loaded from items.json
 
         Returns:
-            Tuple of (success: bool, item_info: Optional[Dict])
+            Tuple of (success: bool, item_info: Optional[Mapping])
             - success: True if item was found and removed from inventory
             - item_info: Item data dict if successful, None if item not found
 
@@ -399,9 +415,11 @@ class Inventory:
         inv_item = self.items[item_id]
         category = inv_item.category
 
-        # Look up full item data
-        category_data = item_data.get(category, {})
-        item_info = category_data.get(item_id)
+        # Look up full item data (the registry also resolves content pack items)
+        if isinstance(item_data, ItemRegistry):
+            item_info = item_data.get_item(item_id)
+        else:
+            item_info = item_data.get(category, {}).get(item_id)
 
         if item_info is None:
             # Item exists in inventory but not in data file (data integrity issue)
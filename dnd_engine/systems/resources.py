@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourcePool:
     """
     Generic resource pool for tracking limited-use abilities.
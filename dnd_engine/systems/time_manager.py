@@ -1,12 +1,16 @@
 # ABOUTME: Time tracking system for managing game time and timed effects
 # ABOUTME: Handles duration parsing, active effect tracking, and automatic expiration
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from typing import Optional, List, Dict, Any, Iterator, Tuple, TYPE_CHECKING
 from enum import Enum
+import heapq
 import re
 import logging
 
+from dnd_engine.utils.events import Event, EventType
+
 if TYPE_CHECKING:
     from dnd_engine.utils.events import EventBus
 
@@ -23,11 +27,14 @@ class EffectType(str, Enum):
     DISEASE = "disease"
 
 
-@dataclass
 class ActiveEffect:
     """
     Represents a timed effect active on a character.
 
+    While an effect is tracked by a TimeManager, remaining_minutes is
+    derived from its absolute expiry time and the manager's clock, so
+    advancing time never has to touch it.
+
     Attributes:
         effect_type: Type of effect (spell, condition, buff, etc.)
         source: What created this effect (spell name, item name, etc.)
@@ -39,20 +46,53 @@ class ActiveEffect:
         caster_name: Name of the caster (for concentration checks)
         effect_data: Additional data specific to the effect
     """
-    effect_type: EffectType
-    source: str
-    duration_minutes: float
-    remaining_minutes: float
-    target_name: str
-    description: str = ""
-    concentration: bool = False
-    caster_name: Optional[str] = None
-    effect_data: Dict[str, Any] = field(default_factory=dict)
-
-    def __post_init__(self):
-        """Ensure remaining_minutes doesn't exceed duration."""
-        if self.remaining_minutes > self.duration_minutes:
-            self.remaining_minutes = self.duration_minutes
+
+    __slots__ = (
+        "effect_type", "source", "duration_minutes", "target_name", "description",
+        "concentration", "caster_name", "effect_data",
+        "_remaining_minutes", "_time_manager", "expires_at", "_schedule_id"
+    )
+
+    def __init__(
+        self,
+        effect_type: EffectType,
+        source: str,
+        duration_minutes: float,
+        remaining_minutes: float,
+        target_name: str,
+        description: str = "",
+        concentration: bool = False,
+        caster_name: Optional[str] = None,
+        effect_data: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self.effect_type = effect_type
+        self.source = source
+        self.duration_minutes = duration_minutes
+        self.target_name = target_name
+        self.description = description
+        self.concentration = concentration
+        self.caster_name = caster_name
+        self.effect_data: Dict[str, Any] = effect_data if effect_data is not None else {}
+        # Scheduling state, set while a TimeManager tracks the effect
+        self._time_manager: Optional["TimeManager"] = None
+        self.expires_at: Optional[float] = None  # Absolute game time (elapsed minutes) of expiry
+        self._schedule_id = 0
+        # Remaining time can't exceed the duration
+        self._remaining_minutes = min(remaining_minutes, duration_minutes)
+
+    @property
+    def remaining_minutes(self) -> float:
+        """Minutes remaining before expiration."""
+        if self._time_manager is not None and self.expires_at is not None:
+            return self.expires_at - self._time_manager.elapsed_minutes
+        return self._remaining_minutes
+
+    @remaining_minutes.setter
+    def remaining_minutes(self, minutes: float) -> None:
+        if self._time_manager is not None:
+            self._time_manager._schedule(self, self._time_manager.elapsed_minutes + minutes)
+        else:
+            self._remaining_minutes = minutes
 
     @property
     def is_expired(self) -> bool:
@@ -72,6 +112,28 @@ class ActiveEffect:
         self.remaining_minutes -= minutes
         return self.is_expired
 
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None  # type: ignore[assignment]  # Mutable value object, like the dataclass it replaced
+
+    def _fields(self) -> Tuple[Any, ...]:
+        """Public state compared by __eq__ and shown by __repr__."""
+        return (
+            self.effect_type, self.source, self.duration_minutes, self.remaining_minutes,
+            self.target_name, self.description, self.concentration, self.caster_name, self.effect_data
+        )
+
+    def __repr__(self) -> str:
+        names = (
+            "effect_type", "source", "duration_minutes", "remaining_minutes", "target_name",
+            "description", "concentration", "caster_name", "effect_data"
+        )
+        fields = ", ".join(f"{name}={value!r}" for name, value in zip(names, self._fields()))
+        return f"{self.__class__.__name__}({fields})"
+
     def get_time_remaining_display(self) -> str:
         """Get a human-readable time remaining string."""
         if self.remaining_minutes <= 0:
@@ -176,12 +238,48 @@ def format_minutes_to_display(minutes: float) -> str:
         return f"{hours} hour{'s' if hours != 1 else ''}, {remaining_minutes} minute{'s' if remaining_minutes != 1 else ''}"
 
 
+@dataclass
+class TimeBatch:
+    """
+    Time advanced in bulk, summarized in a single TIME_SUMMARY event.
+
+    Attributes:
+        reason: Reason for the bulk advancement (e.g., "travel", "long_rest")
+        start_minutes: Elapsed game time when the batch started
+        minutes: Total minutes advanced during the batch
+        hours: Hour boundaries crossed during the batch
+        advances: Number of advance_time calls coalesced into the batch
+        expired_effects: Effects that expired during the batch, in expiry order
+    """
+    reason: str
+    start_minutes: float
+    minutes: float = 0.0
+    hours: int = 0
+    advances: int = 0
+    expired_effects: List[ActiveEffect] = field(default_factory=list)
+
+
 class TimeManager:
     """
     Manages game time and timed effects.
 
     Tracks elapsed time in minutes and manages active effects that expire
     over time. Emits events when time advances and effects expire.
+
+    Effects are scheduled in a min-heap keyed on absolute expiry time, so
+    advancing time only pops the effects that actually expire. Effects are
+    also indexed by target (and source) and by caster for O(1) replacement,
+    removal, and lookup. Removed or rescheduled effects leave stale heap
+    entries behind; they are skipped when popped and compacted away when
+    they outnumber the live ones.
+
+    Long stretches (travel, downtime, rests, simulated combats) can be
+    advanced in bulk with fast_forward() or inside a batch() block. A batch
+    emits one TIME_SUMMARY event with every expiration and hour tick.
+    Subscribers choose their delivery by event type: TIME_SUMMARY for the
+    summary, or TIME_ADVANCED, HOUR_PASSED and EFFECT_EXPIRED for the
+    detailed events. During a batch, detailed events are only built for
+    event types that have subscribers.
     """
 
     def __init__(self, event_bus: Optional["EventBus"] = None) -> None:
@@ -193,7 +291,17 @@ class TimeManager:
         """
         self.event_bus = event_bus
         self.elapsed_minutes: float = 0.0
-        self.active_effects: List[ActiveEffect] = []
+        self._effects: Dict[int, ActiveEffect] = {}  # id(effect) -> effect, in the order added
+        self._expiry_heap: List[Tuple[float, int, ActiveEffect]] = []  # (expires_at, schedule id, effect)
+        self._by_target: Dict[str, Dict[str, ActiveEffect]] = {}  # target -> source -> effect
+        self._by_caster: Dict[str, Dict[int, ActiveEffect]] = {}  # caster -> id(effect) -> effect
+        self._next_schedule_id = 0
+        self._batch: Optional[TimeBatch] = None  # Open bulk advancement, if any
+
+    @property
+    def active_effects(self) -> List[ActiveEffect]:
+        """Active effects, in the order they were added."""
+        return list(self._effects.values())
 
     def get_elapsed_time_display(self) -> str:
         """Get a human-readable display of elapsed game time."""
@@ -223,7 +331,7 @@ class TimeManager:
             reason: Reason for time advancement (for events)
 
         Returns:
-            List of effects that expired during this advancement
+            List of effects that expired during this advancement, in expiry order
         """
         if minutes <= 0:
             if minutes < 0:
@@ -233,32 +341,34 @@ class TimeManager:
         old_elapsed = self.elapsed_minutes
         self.elapsed_minutes += minutes
 
-        # Track expired effects
+        # Pop only the effects whose expiry time has been reached
         expired_effects = []
-
-        # Advance all active effects
-        for effect in self.active_effects[:]:  # Copy list to allow modification
-            if effect.advance_time(minutes):
-                expired_effects.append(effect)
-                self.active_effects.remove(effect)
-
-                # Emit effect expired event
-                if self.event_bus:
-                    from dnd_engine.utils.events import EventType, Event
-                    self.event_bus.emit(Event(
-                        EventType.EFFECT_EXPIRED,
-                        {
-                            "effect": effect,
-                            "target_name": effect.target_name,
-                            "source": effect.source,
-                            "effect_type": effect.effect_type.value
-                        }
-                    ))
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= self.elapsed_minutes:
+            _, schedule_id, effect = heapq.heappop(heap)
+            if effect._time_manager is not self or effect._schedule_id != schedule_id:
+                continue  # Stale entry for a removed or rescheduled effect
+
+            self._untrack(effect)
+            expired_effects.append(effect)
+
+            # Emit effect expired event
+            event_bus = self._detail_bus(EventType.EFFECT_EXPIRED)
+            if event_bus is not None:
+                event_bus.emit(Event(
+                    EventType.EFFECT_EXPIRED,
+                    {
+                        "effect": effect,
+                        "target_name": effect.target_name,
+                        "source": effect.source,
+                        "effect_type": effect.effect_type.value
+                    }
+                ))
 
         # Emit time advanced event
-        if self.event_bus:
-            from dnd_engine.utils.events import EventType, Event
-            self.event_bus.emit(Event(
+        event_bus = self._detail_bus(EventType.TIME_ADVANCED)
+        if event_bus is not None:
+            event_bus.emit(Event(
                 EventType.TIME_ADVANCED,
                 {
                     "minutes": minutes,
@@ -270,10 +380,10 @@ class TimeManager:
         # Check if we passed an hour boundary
         old_hours = int(old_elapsed // 60)
         new_hours = int(self.elapsed_minutes // 60)
-        if new_hours > old_hours and self.event_bus:
-            from dnd_engine.utils.events import EventType, Event
-            hours_passed = new_hours - old_hours
-            self.event_bus.emit(Event(
+        hours_passed = new_hours - old_hours
+        event_bus = self._detail_bus(EventType.HOUR_PASSED) if hours_passed > 0 else None
+        if event_bus is not None:
+            event_bus.emit(Event(
                 EventType.HOUR_PASSED,
                 {
                     "hours": hours_passed,
@@ -281,8 +391,81 @@ class TimeManager:
                 }
             ))
 
+        if self._batch is not None:
+            self._batch.minutes += minutes
+            self._batch.hours += hours_passed
+            self._batch.advances += 1
+            self._batch.expired_effects.extend(expired_effects)
+
         return expired_effects
 
+    def _detail_bus(self, event_type: EventType) -> Optional["EventBus"]:
+        """Get the bus to emit a detailed time event on, or None to skip it (batches skip unsubscribed types)."""
+        if not self.event_bus:
+            return None
+        if self._batch is not None and self.event_bus.subscriber_count(event_type) == 0:
+            return None
+        return self.event_bus
+
+    @contextmanager
+    def batch(self, reason: str = "") -> Iterator[TimeBatch]:
+        """
+        Coalesce every advance_time call in a block into one TIME_SUMMARY event.
+
+        Nested batches join the outermost one.
+
+        Args:
+            reason: Reason for the bulk advancement (for the summary event)
+
+        Yields:
+            The TimeBatch being accumulated
+        """
+        if self._batch is not None:
+            yield self._batch
+            return
+
+        self._batch = TimeBatch(reason=reason, start_minutes=self.elapsed_minutes)
+        try:
+            yield self._batch
+        finally:
+            batch, self._batch = self._batch, None
+            if self.event_bus:
+                self.event_bus.emit(Event(
+                    EventType.TIME_SUMMARY,
+                    {
+                        "reason": batch.reason,
+                        "minutes": batch.minutes,
+                        "start_minutes": batch.start_minutes,
+                        "elapsed_minutes": self.elapsed_minutes,
+                        "advances": batch.advances,
+                        "hours": batch.hours,
+                        "total_hours": int(self.elapsed_minutes // 60),
+                        "expired_effects": [
+                            {
+                                "effect": effect,
+                                "target_name": effect.target_name,
+                                "source": effect.source,
+                                "effect_type": effect.effect_type.value
+                            }
+                            for effect in batch.expired_effects
+                        ]
+                    }
+                ))
+
+    def fast_forward(self, minutes: float, reason: str = "") -> List[ActiveEffect]:
+        """
+        Advance time in bulk (travel, downtime, multi-day rests) with a single summary event.
+
+        Args:
+            minutes: Number of minutes to advance
+            reason: Reason for time advancement (for events)
+
+        Returns:
+            List of effects that expired, in expiry order
+        """
+        with self.batch(reason):
+            return self.advance_time(minutes, reason)
+
     def add_effect(self, effect: ActiveEffect) -> None:
         """
         Add a new timed effect to track.
@@ -301,12 +484,53 @@ class TimeManager:
         """
         # Check if target already has this effect from same source
         # If so, replace it with the new one (recasting refreshes duration)
-        self.active_effects = [
-            e for e in self.active_effects
-            if not (e.target_name == effect.target_name and e.source == effect.source)
-        ]
+        existing = self._by_target.get(effect.target_name, {}).get(effect.source)
+        if existing is not None:
+            self._untrack(existing)
+
+        remaining = effect.remaining_minutes
+        self._effects[id(effect)] = effect
+        self._by_target.setdefault(effect.target_name, {})[effect.source] = effect
+        if effect.caster_name is not None:
+            self._by_caster.setdefault(effect.caster_name, {})[id(effect)] = effect
+        effect._time_manager = self
+        self._schedule(effect, self.elapsed_minutes + remaining)
+
+    def _schedule(self, effect: ActiveEffect, expires_at: float) -> None:
+        """Push an effect's (new) expiry time onto the heap."""
+        self._next_schedule_id += 1
+        effect.expires_at = expires_at
+        effect._schedule_id = self._next_schedule_id
+        heapq.heappush(self._expiry_heap, (expires_at, self._next_schedule_id, effect))
+
+        # Drop stale entries once they make up most of the heap
+        if len(self._expiry_heap) > 2 * len(self._effects) + 64:
+            self._expiry_heap = [
+                (live.expires_at, live._schedule_id, live) for live in self._effects.values()
+                if live.expires_at is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _untrack(self, effect: ActiveEffect) -> None:
+        """
+        Stop tracking an effect, freezing its remaining time.
+
+        Its heap entry becomes stale and is skipped when popped.
+        """
+        effect._remaining_minutes = effect.remaining_minutes
+        effect._time_manager = None
+        del self._effects[id(effect)]
+
+        sources = self._by_target[effect.target_name]
+        del sources[effect.source]
+        if not sources:
+            del self._by_target[effect.target_name]
 
-        self.active_effects.append(effect)
+        if effect.caster_name is not None:
+            caster_effects = self._by_caster[effect.caster_name]
+            del caster_effects[id(effect)]
+            if not caster_effects:
+                del self._by_caster[effect.caster_name]
 
     def remove_effect(self, target_name: str, source: str) -> Optional[ActiveEffect]:
         """
@@ -319,11 +543,10 @@ class TimeManager:
         Returns:
             The removed effect, or None if not found
         """
-        for effect in self.active_effects:
-            if effect.target_name == target_name and effect.source == source:
-                self.active_effects.remove(effect)
-                return effect
-        return None
+        effect = self._by_target.get(target_name, {}).get(source)
+        if effect is not None:
+            self._untrack(effect)
+        return effect
 
     def remove_concentration_effects(self, caster_name: str) -> List[ActiveEffect]:
         """
@@ -336,14 +559,13 @@ class TimeManager:
             List of effects that were removed
         """
         removed = []
-        for effect in self.active_effects[:]:
-            if effect.concentration and effect.caster_name == caster_name:
-                self.active_effects.remove(effect)
+        for effect in list(self._by_caster.get(caster_name, {}).values()):
+            if effect.concentration:
+                self._untrack(effect)
                 removed.append(effect)
 
                 # Emit effect expired event
                 if self.event_bus:
-                    from dnd_engine.utils.events import EventType, Event
                     self.event_bus.emit(Event(
                         EventType.EFFECT_EXPIRED,
                         {
@@ -367,12 +589,14 @@ class TimeManager:
         Returns:
             List of active effects on that character
         """
-        return [e for e in self.active_effects if e.target_name == character_name]
+        return list(self._by_target.get(character_name, {}).values())
 
     def get_all_effects(self) -> List[ActiveEffect]:
         """Get all active effects."""
-        return self.active_effects.copy()
+        return self.active_effects
 
     def clear_all_effects(self) -> None:
         """Remove all active effects."""
-        self.active_effects.clear()
+        for effect in list(self._effects.values()):
+            self._untrack(effect)
+        self._expiry_heap.clear()
@@ -84,12 +84,7 @@ class CharacterCreationWizard:
     def _load_templates(self) -> Dict[str, Any]:
         """Load character templates from JSON."""
         try:
-            import json
-            from pathlib import Path
-
-            templates_path = self.data_loader.data_path / "srd" / "character_templates.json"
-            with open(templates_path, 'r') as f:
-                return json.load(f)
+            return self.data_loader.load_character_templates()
         except Exception as e:
             print_error(f"Warning: Could not load character templates: {e}")
             return {}
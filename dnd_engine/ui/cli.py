@@ -8,6 +8,7 @@ from dnd_engine.core.dice import format_dice_with_modifier
 from dnd_engine.utils.events import Event, EventType
 from dnd_engine.systems.inventory import EquipmentSlot
 from dnd_engine.systems.condition_manager import ConditionManager
+from dnd_engine.systems.enemy_ai import EnemyAttack, EnemyTurnResult
 from dnd_engine.ui.debug_console import DebugConsole
 from dnd_engine.ui.rich_ui import (
     console,
@@ -97,62 +98,23 @@ class CLI:
         basic_desc = room.get("description", self.game_state.get_room_description())
         exits = room.get("exits", [])
 
-        # Check for monsters in the room
-        enemy_ids = room.get("enemies", [])
-        monster_names = []
-        if enemy_ids:
-            # Load monster data to get display names
-            monsters_data = self.game_state.data_loader.load_monsters()
-            for enemy_id in enemy_ids:
-                if enemy_id in monsters_data:
-                    monster_names.append(monsters_data[enemy_id]["name"])
-
-        # Detect if combat is about to start
-        # Combat starts if there are enemies and we're not already in combat
-        combat_starting = bool(enemy_ids) and not self.game_state.in_combat
-
-        # Calculate effective lighting for each party member
-        # (used for both LLM enhancement and UI display)
-        # Also track who actually cast Light spells for narrative purposes
-        from dnd_engine.systems.time_manager import EffectType
-        light_casters = []
-        for effect in self.game_state.time_manager.active_effects:
-            if effect.effect_type == EffectType.SPELL and effect.source.lower() == "light":
-                if effect.caster_name and effect.caster_name not in light_casters:
-                    light_casters.append(effect.caster_name)
-
-        party_lighting = []
-        for char in self.game_state.party.characters:
-            lighting = self.game_state.get_effective_lighting(char)
-            party_lighting.append({
-                "character": char.name,
-                "lighting": lighting,
-                "has_darkvision": char.darkvision_range > 0
-            })
+        # Monsters, lighting and transition state as the LLM enhancer sees them
+        # (party lighting is also used for the UI display)
+        room_data = self.game_state.build_room_narrative_data()
+        party_lighting = room_data["party_lighting"]
 
         # Try to get enhanced description from LLM
         enhanced_desc = None
         if self.llm_enhancer:
-            # Load full monster data for creature-aware prompts
-            monsters_data = self.game_state.data_loader.load_monsters()
-            party_size = len(self.game_state.party.characters)
-
-            room_data = {
-                "id": room.get("id", room_name.lower().replace(" ", "_")),
-                "name": room_name,
-                "description": basic_desc,
-                "monsters": monster_names,  # Include monster info for LLM
-                "combat_starting": combat_starting,  # Flag for combat initiation narrative
-                "monsters_data": monsters_data,  # Full monster definitions for creature-aware prompts
-                "party_size": party_size,  # Party size for combat context
-                "base_lighting": room.get("lighting", "bright"),  # Room's base lighting level
-                "party_lighting": party_lighting,  # Effective lighting for each party member
-                "light_casters": light_casters,  # Characters who cast Light spells
-                "previous_room_id": self.game_state.previous_room_id  # Previous room for transition narrative
-            }
             with console.status("", spinner="dots"):
                 enhanced_desc = self.llm_enhancer.get_room_description_sync(room_data, timeout=20.0)
 
+            # Prepare neighboring rooms while the player is busy in this one
+            self.llm_enhancer.prefetch_room_descriptions([
+                self.game_state.build_room_narrative_data(room_id)
+                for room_id in self.game_state.get_adjacent_room_ids()
+            ])
+
         # Use enhanced description if available, otherwise use basic
         room_text = enhanced_desc if enhanced_desc else basic_desc
 
@@ -1391,17 +1353,10 @@ class CLI:
         if len(living_members) == 1:
             return living_members[0]
 
-        # Load items data to get item type
-        from dnd_engine.core.data_loader import DataLoader
-        data_loader = DataLoader()
-        items_data = data_loader.load_items()
-
-        # Find item details
-        item_details = None
-        for category, category_items in items_data.items():
-            if item_id in category_items:
-                item_details = category_items[item_id]
-                break
+        # Look up item details to get item type
+        items = self.game_state.data_loader.load_item_registry()
+        item_details = items.get_item(item_id)
+        category = items.get_category(item_id)
 
         # Intelligent assignment based on item type
         best_matches = []
@@ -1536,7 +1491,7 @@ class CLI:
         equipped_weapon = attacker.inventory.get_equipped_item(EquipmentSlot.WEAPON)
 
         # Load weapon data
-        items_data = self.game_state.data_loader.load_items()
+        items_data = self.game_state.data_loader.load_item_registry()
 
         # Get attack bonus and damage bonus based on weapon
         if equipped_weapon:
@@ -1592,13 +1547,12 @@ class CLI:
                         defender_armor = f"{armor_type} armor"
             else:
                 # Target is enemy - try to get from monster data or AC source
-                monsters = self.game_state.data_loader.load_monsters()
-                for mid, mdata in monsters.items():
-                    if mdata["name"] == target.name:
-                        ac_source = mdata.get("ac_source", "")
-                        if ac_source:
-                            defender_armor = ac_source
-                        break
+                catalog = self.game_state.data_loader.load_monster_catalog()
+                monster_data = catalog.get_template(catalog.resolve_id(target))
+                if monster_data:
+                    ac_source = monster_data.get("ac_source", "")
+                    if ac_source:
+                        defender_armor = ac_source
 
             with console.status("", spinner="dots"):
                 narrative = self.llm_enhancer.get_combat_narrative_sync(
@@ -1705,7 +1659,7 @@ class CLI:
             return
 
         # Load spells data
-        spells_data = self.game_state.data_loader.load_spells()
+        spells_data = self.game_state.data_loader.load_spell_catalog()
 
         # Get castable spells from game engine (respects prepared/known spells)
         available_spells = caster.get_castable_spells(spells_data)
@@ -2136,64 +2090,17 @@ class CLI:
 
         return False  # No action consumed
 
-    def _should_enemy_attempt_condition_removal(self, enemy) -> bool:
-        """
-        Simple AI to determine if an enemy should attempt to remove a condition.
-
-        Logic:
-        - If on fire and current_hp <= 4 (one more 1d4 could kill), attempt to extinguish
-        - Otherwise, attack normally
-
-        Args:
-            enemy: The enemy creature
-
-        Returns:
-            True if enemy should attempt to remove condition (consumes turn)
-        """
-        # Check each condition for removal options
-        for condition_id in list(enemy.conditions):
-            if not self.condition_manager.can_attempt_early_removal(condition_id):
-                continue
-
-            # Simple AI for on_fire: attempt if low HP
-            if condition_id == "on_fire":
-                # If one more 1d4 damage could kill (HP <= 4), try to extinguish
-                if enemy.current_hp <= 4:
-                    print_status_message(
-                        f"🔥 {enemy.name} is on fire with low HP! Attempting to extinguish...",
-                        "info"
-                    )
-
-                    # Attempt removal
-                    result = self.condition_manager.attempt_condition_removal(enemy, condition_id)
-
-                    if result:
-                        if result.success:
-                            print_status_message(result.message, "success")
-                        else:
-                            print_status_message(result.message, "warning")
-
-                    return True  # Turn was used
-                else:
-                    # Enemy chooses to ignore the flames and attack instead
-                    print_status_message(
-                        f"🔥 {enemy.name} is on fire ({enemy.current_hp}/{enemy.max_hp} HP) but chooses to press the attack rather than extinguish the flames!",
-                        "info"
-                    )
-
-        return False  # No condition removal attempted
-
     def process_enemy_turns(self) -> None:
         """Process all enemy turns until it's a party member's turn again."""
         while self.game_state.in_combat:
             current = self.game_state.initiative_tracker.get_current_combatant()
 
             # If it's a party member's turn, stop
-            is_party_turn = False
-            for character in self.game_state.party.characters:
-                if current.creature == character:
-                    is_party_turn = True
-                    break
+            battlefield = self.game_state.battlefield
+            if battlefield is not None:
+                is_party_turn = battlefield.is_party_member(current.creature)
+            else:
+                is_party_turn = any(current.creature == c for c in self.game_state.party.characters)
 
             if is_party_turn:
                 break
@@ -2214,13 +2121,6 @@ class CLI:
                 self.game_state.initiative_tracker.next_turn()
                 continue
 
-            # Enemy AI: Check if should attempt to remove conditions
-            if self._should_enemy_attempt_condition_removal(enemy):
-                # Enemy attempts to remove condition instead of attacking
-                self.game_state.initiative_tracker.next_turn()
-                continue
-
-            # Choose target from living party members (lowest HP)
             living_party = self.game_state.party.get_living_members()
             if not living_party:
                 # No conscious targets - check if combat should end (party defeated)
@@ -2231,133 +2131,12 @@ class CLI:
                 self.game_state.initiative_tracker.next_turn()
                 break
 
-            target = min(living_party, key=lambda c: c.current_hp)
+            # Enemy AI decides; GameState resolves the attacks
+            turn = self.game_state.take_enemy_turn(enemy, self.condition_manager)
+            self._display_enemy_turn(enemy, turn)
 
-            # Get monster data for attack
-            monsters = self.game_state.data_loader.load_monsters()
-            monster_data = None
-            for mid, mdata in monsters.items():
-                if mdata["name"] == enemy.name:
-                    monster_data = mdata
-                    break
-
-            if monster_data and monster_data.get("actions"):
-                # Find first weapon attack action (skip Multiattack, etc.)
-                action = None
-                for act in monster_data["actions"]:
-                    if "attack_bonus" in act and "damage" in act:
-                        action = act
-                        break
-
-                if not action:
-                    print_error(f"{enemy.name} has no valid attack actions!")
-                    self.game_state.initiative_tracker.next_turn()
-                    continue
-
-                # Track conditions before attack
-                conditions_before = set(target.active_conditions.keys()) if hasattr(target, 'active_conditions') else set()
-
-                result = self.game_state.combat_engine.resolve_attack(
-                    attacker=enemy,
-                    defender=target,
-                    attack_bonus=action["attack_bonus"],
-                    damage_dice=action["damage"],
-                    apply_damage=True,
-                    event_bus=self.game_state.event_bus,
-                    action=action  # Pass action data for saving throw processing
-                )
-
-                # Display saving throw results if triggered
-                if result.hit and "saving_throw" in action:
-                    save_data = action["saving_throw"]
-                    ability = save_data.get("ability", "constitution").title()
-                    dc = save_data.get("dc")
-
-                    # Check if condition was applied (save failed)
-                    if hasattr(target, 'active_conditions'):
-                        conditions_after = set(target.active_conditions.keys())
-                        new_conditions = conditions_after - conditions_before
-
-                        if new_conditions:
-                            # Failed save
-                            for condition in new_conditions:
-                                metadata = target.active_conditions.get(condition, {})
-                                duration = metadata.get('duration_remaining', 0)
-                                print_status_message(
-                                    f"💀 {target.name} fails {ability} save (DC {dc}) - {condition.upper()} for {duration} rounds!",
-                                    "error"
-                                )
-                        else:
-                            # Passed save
-                            print_status_message(
-                                f"✓ {target.name} succeeds on {ability} save (DC {dc})!",
-                                "success"
-                            )
-
-                # Get and display attack narrative FIRST (if hit)
-                if self.llm_enhancer and result.hit:
-                    room = self.game_state.get_current_room()
-                    location = room.get("name", "")
-
-                    # Get weapon name and damage type from action
-                    weapon_name = action.get("name", "weapon")
-                    damage_type = action.get("damage_type", "")
-
-                    # Get attacker type/race from monster data
-                    attacker_race = monster_data.get("type", "")
-
-                    # Get defender armor (target is always a player character here)
-                    defender_armor = ""
-                    items_data = self.game_state.data_loader.load_items()
-                    equipped_armor_id = target.inventory.get_equipped_item(EquipmentSlot.ARMOR)
-                    if equipped_armor_id:
-                        armor_data = items_data.get("armor", {}).get(equipped_armor_id, {})
-                        armor_type = armor_data.get("armor_type", "")
-                        if armor_type:
-                            defender_armor = f"{armor_type} armor"
-
-                    with console.status("", spinner="dots"):
-                        narrative = self.llm_enhancer.get_combat_narrative_sync(
-                            action_data={
-                                "attacker": result.attacker_name,
-                                "defender": result.defender_name,
-                                "damage": result.damage,
-                                "critical": result.critical_hit,
-                                "hit": result.hit,
-                                "location": location,
-                                "weapon": weapon_name,
-                                "damage_type": damage_type,
-                                "attacker_race": attacker_race,
-                                "defender_armor": defender_armor,
-                                "combat_history": self.combat_history,
-                                "battlefield_state": self._build_battlefield_state()
-                            },
-                            timeout=20.0
-                        )
-                    if narrative:
-                        self.display_narrative_panel(narrative)
-
-                # Record this action in combat history
-                self._record_combat_action(result)
-
-                # Display mechanics after narrative
-                console.print(f"[cyan]⚔️  {str(result)}[/cyan]")
-
-                # Check if party member died - show death narrative then message
-                if not target.is_alive:
-                    if self.llm_enhancer:
-                        with console.status("", spinner="dots"):
-                            death_narrative = self.llm_enhancer.get_death_narrative_sync(
-                                character_data={
-                                    "name": target.name,
-                                    "is_player": isinstance(target, Character)
-                                },
-                                timeout=20.0
-                            )
-                        if death_narrative:
-                            self.display_narrative_panel(death_narrative)
-
-                    print_status_message(f"{target.name} has fallen!", "warning")
+            # End of the enemy's action: deliver events held by a queued bus
+            self.game_state.event_bus.drain()
 
             # Next turn
             self.game_state.initiative_tracker.next_turn()
@@ -2366,6 +2145,135 @@ class CLI:
             if self.game_state.party.is_wiped():
                 break
 
+    def _display_enemy_turn(self, enemy: Any, turn: EnemyTurnResult) -> None:
+        """
+        Display the outcome of an enemy's turn.
+
+        Args:
+            enemy: The enemy that acted
+            turn: What the enemy did
+        """
+        if turn.condition_removal is not None:
+            if turn.condition_removal.condition_id == "on_fire":
+                message = f"🔥 {enemy.name} is on fire with low HP! Attempting to extinguish..."
+            else:
+                message = f"{enemy.name} tries to end {turn.condition_removal.condition_id.replace('_', ' ')}..."
+            print_status_message(message, "info")
+            print_status_message(
+                turn.condition_removal.message,
+                "success" if turn.condition_removal.success else "warning"
+            )
+            return
+
+        if "on_fire" in turn.ignored_conditions:
+            print_status_message(
+                f"🔥 {enemy.name} is on fire ({enemy.current_hp}/{enemy.max_hp} HP) but chooses to press the attack rather than extinguish the flames!",
+                "info"
+            )
+
+        if turn.no_attack_available:
+            print_error(f"{enemy.name} has no valid attack actions!")
+            return
+
+        for enemy_attack in turn.attacks:
+            self._display_enemy_attack(enemy, enemy_attack)
+
+    def _display_enemy_attack(self, enemy: Any, enemy_attack: EnemyAttack) -> None:
+        """
+        Display a single enemy attack: save results, narrative, mechanics, and deaths.
+
+        Args:
+            enemy: The attacking enemy
+            enemy_attack: The resolved attack
+        """
+        result = enemy_attack.result
+        target = enemy_attack.target
+        attack = enemy_attack.attack
+
+        # Display saving throw results if triggered
+        if result.hit and attack.saving_throw:
+            ability = attack.saving_throw.get("ability", "constitution").title()
+            dc = attack.saving_throw.get("dc")
+
+            if enemy_attack.new_conditions:
+                # Failed save
+                for condition in enemy_attack.new_conditions:
+                    metadata = target.active_conditions.get(condition, {})
+                    duration = metadata.get('duration_remaining', 0)
+                    print_status_message(
+                        f"💀 {target.name} fails {ability} save (DC {dc}) - {condition.upper()} for {duration} rounds!",
+                        "error"
+                    )
+            else:
+                # Passed save
+                print_status_message(
+                    f"✓ {target.name} succeeds on {ability} save (DC {dc})!",
+                    "success"
+                )
+
+        # Get and display attack narrative FIRST (if hit)
+        if self.llm_enhancer and result.hit:
+            room = self.game_state.get_current_room()
+            location = room.get("name", "")
+
+            # Get attacker type/race from monster data
+            catalog = self.game_state.data_loader.load_monster_catalog()
+            monster_data = catalog.get_template(catalog.resolve_id(enemy)) or {}
+            attacker_race = monster_data.get("type", "")
+
+            # Get defender armor (target is always a player character here)
+            defender_armor = ""
+            items_data = self.game_state.data_loader.load_item_registry()
+            equipped_armor_id = target.inventory.get_equipped_item(EquipmentSlot.ARMOR)
+            if equipped_armor_id:
+                armor_data = items_data.get("armor", {}).get(equipped_armor_id, {})
+                armor_type = armor_data.get("armor_type", "")
+                if armor_type:
+                    defender_armor = f"{armor_type} armor"
+
+            with console.status("", spinner="dots"):
+                narrative = self.llm_enhancer.get_combat_narrative_sync(
+                    action_data={
+                        "attacker": result.attacker_name,
+                        "defender": result.defender_name,
+                        "damage": result.damage,
+                        "critical": result.critical_hit,
+                        "hit": result.hit,
+                        "location": location,
+                        "weapon": attack.name,
+                        "damage_type": attack.damage_type,
+                        "attacker_race": attacker_race,
+                        "defender_armor": defender_armor,
+                        "combat_history": self.combat_history,
+                        "battlefield_state": self._build_battlefield_state()
+                    },
+                    timeout=20.0
+                )
+            if narrative:
+                self.display_narrative_panel(narrative)
+
+        # Record this action in combat history
+        self._record_combat_action(result)
+
+        # Display mechanics after narrative
+        console.print(f"[cyan]⚔️  {str(result)}[/cyan]")
+
+        # Check if party member died - show death narrative then message
+        if not target.is_alive:
+            if self.llm_enhancer:
+                with console.status("", spinner="dots"):
+                    death_narrative = self.llm_enhancer.get_death_narrative_sync(
+                        character_data={
+                            "name": target.name,
+                            "is_player": isinstance(target, Character)
+                        },
+                        timeout=20.0
+                    )
+                if death_narrative:
+                    self.display_narrative_panel(death_narrative)
+
+            print_status_message(f"{target.name} has fallen!", "warning")
+
     def _assign_enemy_numbers(self) -> None:
         """
         Assign sequential numbers to enemies when combat starts.
@@ -2487,7 +2395,7 @@ class CLI:
         """
         import questionary
 
-        items_data = self.game_state.data_loader.load_items()
+        items_data = self.game_state.data_loader.load_item_registry()
         consumables_list = []
 
         # Gather consumables from specified character or all party
@@ -2930,7 +2838,7 @@ class CLI:
                 - Player name (e.g., "gandalf"): Show specific player's inventory
                 - Category (e.g., "potions", "weapons", "armor"): Filter by item type
         """
-        items_data = self.game_state.data_loader.load_items()
+        items_data = self.game_state.data_loader.load_item_registry()
         from dnd_engine.systems.inventory import EquipmentSlot
 
         # Handle summary view
@@ -3016,7 +2924,7 @@ class CLI:
 
     def _display_inventory_summary(self) -> None:
         """Display a summary of consumables across all party members."""
-        items_data = self.game_state.data_loader.load_items()
+        items_data = self.game_state.data_loader.load_item_registry()
 
         # Aggregate consumables across party
         consumable_totals = {}
@@ -3062,7 +2970,7 @@ class CLI:
             return
 
         inventory = character.inventory
-        items_data = self.game_state.data_loader.load_items()
+        items_data = self.game_state.data_loader.load_item_registry()
 
         # Find the item in inventory (by ID or name)
         target_item = None
@@ -3135,7 +3043,7 @@ class CLI:
         item_id = inventory.unequip_item(slot)
 
         if item_id:
-            items_data = self.game_state.data_loader.load_items()
+            items_data = self.game_state.data_loader.load_item_registry()
             category = "weapons" if slot == EquipmentSlot.WEAPON else "armor"
             item_data = items_data[category].get(item_id, {})
             item_name = item_data.get("name", item_id)
@@ -3161,7 +3069,7 @@ class CLI:
         from dnd_engine.systems.item_effects import apply_item_effect
 
         inventory = owner.inventory
-        items_data = self.game_state.data_loader.load_items()
+        items_data = self.game_state.data_loader.load_item_registry()
 
         # Use the item from owner's inventory (removes it)
         success, item_info = inventory.use_item(item_id, items_data)
@@ -3217,7 +3125,7 @@ class CLI:
             return
 
         inventory = character.inventory
-        items_data = self.game_state.data_loader.load_items()
+        items_data = self.game_state.data_loader.load_item_registry()
 
         # Find the item in consumables
         target_item = None
@@ -3281,7 +3189,7 @@ class CLI:
         from dnd_engine.systems.action_economy import ActionType
 
         inventory = character.inventory
-        items_data = self.game_state.data_loader.load_items()
+        items_data = self.game_state.data_loader.load_item_registry()
 
         item_name = item_data.get("name", item_id)
         action_required_str = item_data.get("action_required", "action")
@@ -3368,7 +3276,7 @@ class CLI:
         from dnd_engine.systems.action_economy import ActionType
 
         inventory = user.inventory
-        items_data = self.game_state.data_loader.load_items()
+        items_data = self.game_state.data_loader.load_item_registry()
 
         item_name = item_data.get("name", item_id)
         action_required_str = item_data.get("action_required", "action")
@@ -3549,7 +3457,7 @@ class CLI:
 
         character = current.creature
         inventory = character.inventory
-        items_data = self.game_state.data_loader.load_items()
+        items_data = self.game_state.data_loader.load_item_registry()
 
         # Find the item in consumables
         target_item = None
@@ -3745,9 +3653,9 @@ class CLI:
 
         # Advance time for rest
         if rest_type == "short":
-            self.game_state.time_manager.advance_time(60, reason="short_rest")  # 1 hour
+            self.game_state.time_manager.fast_forward(60, reason="short_rest")  # 1 hour
         else:
-            self.game_state.time_manager.advance_time(480, reason="long_rest")  # 8 hours
+            self.game_state.time_manager.fast_forward(480, reason="long_rest")  # 8 hours
 
         # Display rest results
         self._display_rest_results(results, rest_type, rest_duration)
@@ -3819,7 +3727,7 @@ class CLI:
             return
 
         # Load spell data
-        spells_data = self.game_state.data_loader.load_spells()
+        spells_data = self.game_state.data_loader.load_spell_catalog()
 
         # Get available spells
         cantrips, leveled_spells = character.get_preparable_spells(spells_data)
@@ -3919,7 +3827,7 @@ class CLI:
             return  # User cancelled
 
         # Check if character can cast spells
-        spells_data = self.game_state.data_loader.load_spells()
+        spells_data = self.game_state.data_loader.load_spell_catalog()
         available_spells = caster.get_out_of_combat_spells(spells_data)
 
         if not available_spells:
@@ -113,6 +113,8 @@ class DebugConsole:
             "help": self.cmd_help,
             "reset": self.cmd_reset,
             "disablellm": self.cmd_disable_llm,
+            "verifystats": self.cmd_verify_stats,
+            "eventstats": self.cmd_event_stats,
         }
 
         # God mode tracking (character name -> invulnerable)
@@ -443,6 +445,7 @@ class DebugConsole:
         ability_name = ability_mapping[ability]
         old_value = getattr(character.abilities, ability_name)
         setattr(character.abilities, ability_name, value)
+        character.invalidate_derived_stats()
 
         print_status_message(
             f"{character.name} {ability} changed from {old_value} to {value}",
@@ -484,10 +487,7 @@ class DebugConsole:
                 return
 
             # Create creatures
-            spawned = []
-            for i in range(count):
-                creature = self.game_state.data_loader.create_monster(monster_id)
-                spawned.append(creature)
+            spawned = self.game_state.data_loader.create_monsters([monster_id], count=count)
 
             # If not in combat, start combat
             if not self.game_state.in_combat:
@@ -498,8 +498,7 @@ class DebugConsole:
                 # Add to existing combat
                 self.game_state.active_enemies.extend(spawned)
                 # Add to initiative
-                for creature in spawned:
-                    self.game_state.initiative_tracker.add_combatant(creature)
+                self.game_state.initiative_tracker.add_combatants(spawned)
                 print_status_message(f"Spawned {count}x {monster_name} into combat!", "success")
 
         except Exception as e:
@@ -526,11 +525,7 @@ class DebugConsole:
 
         # Remove from initiative
         if self.game_state.initiative_tracker:
-            # Find and remove from combatants
-            for combatant in self.game_state.initiative_tracker.combatants:
-                if combatant.creature == enemy:
-                    self.game_state.initiative_tracker.combatants.remove(combatant)
-                    break
+            self.game_state.initiative_tracker.remove_combatant(enemy)
 
         print_status_message(f"{enemy.name} removed from combat", "success")
 
@@ -774,7 +769,7 @@ class DebugConsole:
 
         # Clear all conditions
         condition_count = len(character.conditions)
-        character.conditions.clear()
+        character.clear_conditions()
 
         print_status_message(
             f"Cleared {condition_count} condition(s) from {character.name}",
@@ -1457,7 +1452,7 @@ class DebugConsole:
         # System
         table.add_row(
             "System",
-            "/help, /reset, /disablellm"
+            "/help, /reset, /disablellm, /verifystats\n/eventstats"
         )
 
         console.print(table)
@@ -1498,6 +1493,75 @@ class DebugConsole:
             print_message("LLM will now display prompts instead of calling the API")
             self._llm_debug_mode = True
 
+    def cmd_verify_stats(self, args: List[str]) -> None:
+        """Toggle checking cached character stats against fresh computation (stale values are logged)."""
+        if args and args[0].lower() not in ("on", "off"):
+            print_error("Usage: /verifystats [on|off]")
+            return
+
+        enabled = args[0].lower() == "on" if args else not Character.verify_derived_stats
+        Character.verify_derived_stats = enabled
+        print_status_message(f"Derived stat verification {'enabled' if enabled else 'disabled'}", "info")
+
+    def cmd_event_stats(self, args: List[str]) -> None:
+        """Show event handler latency. Usage: /eventstats [on [slow_ms]|off|reset]"""
+        event_bus = self.game_state.event_bus
+        action = args[0].lower() if args else None
+
+        if action == "on":
+            try:
+                threshold = float(args[1]) if len(args) > 1 else None
+            except ValueError:
+                print_error("Usage: /eventstats on [slow_ms]")
+                return
+            event_bus.enable_instrumentation(slow_threshold_ms=threshold)
+            suffix = f" (logging handlers slower than {threshold:g}ms)" if threshold is not None else ""
+            print_status_message(f"Event handler timing enabled{suffix}", "info")
+            return
+
+        if action == "off":
+            event_bus.disable_instrumentation()
+            print_status_message("Event handler timing disabled", "info")
+            return
+
+        if action == "reset":
+            event_bus.reset_handler_stats()
+            print_status_message("Event handler stats cleared", "info")
+            return
+
+        if action is not None:
+            print_error("Usage: /eventstats [on [slow_ms]|off|reset]")
+            return
+
+        if not event_bus.instrumentation_enabled:
+            print_message("Event handler timing is off. Use '/eventstats on' to start recording.")
+            return
+
+        stats = event_bus.handler_stats()
+        if not stats:
+            print_message("No event handlers have run since timing was enabled")
+            return
+
+        print_section("Event Handler Latency")
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Event", style="cyan", no_wrap=True)
+        table.add_column("Handler", style="white")
+        for column in ("Calls", "Total ms", "p50 ms", "p95 ms", "p99 ms", "Max ms"):
+            table.add_column(column, justify="right")
+
+        for entry in stats:
+            table.add_row(
+                entry["event_type"].value,
+                entry["handler"],
+                str(entry["count"]),
+                f"{entry['total_ms']:.2f}",
+                f"{entry['p50_ms']:.3f}",
+                f"{entry['p95_ms']:.3f}",
+                f"{entry['p99_ms']:.3f}",
+                f"{entry['max_ms']:.3f}"
+            )
+        console.print(table)
+
     # =====================================================================
     # Helper Methods
     # =====================================================================
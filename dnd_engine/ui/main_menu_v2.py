@@ -1,7 +1,7 @@
 # ABOUTME: Main menu system with new save slot system and migration support
 # ABOUTME: Handles menu display, save slot selection, character vault integration, and migration
 
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 from pathlib import Path
 
 from dnd_engine.core.save_slot_manager import SaveSlotManager
@@ -39,8 +39,13 @@ class MainMenuV2:
     - Streamlined UI flows
     """
 
-    def __init__(self):
-        """Initialize the main menu with new save system."""
+    def __init__(self, content_packs: Sequence[Path] = ()):
+        """
+        Initialize the main menu with new save system.
+
+        Args:
+            content_packs: Compiled homebrew pack directories to load alongside the SRD data
+        """
         # Check for and handle migration first
         self.migration_manager = MigrationManager()
         self._handle_migration_if_needed()
@@ -48,7 +53,7 @@ class MainMenuV2:
         # Initialize new systems
         self.slot_manager = SaveSlotManager()
         self.vault = CharacterVaultV2()
-        self.data_loader = DataLoader()
+        self.data_loader = DataLoader(content_packs=content_packs)
 
         # Track current slot for save operations
         self.current_slot_number: Optional[int] = None
@@ -229,7 +234,7 @@ class MainMenuV2:
                 return None
 
             # Load game state
-            game_state = self.slot_manager.load_game(slot_num)
+            game_state = self.slot_manager.load_game(slot_num, data_loader=self.data_loader)
 
             print_status_message(f"Loaded: {slot.get_display_name()}", "success")
 
@@ -2,9 +2,18 @@
 # ABOUTME: Enables loose coupling between game engine, LLM enhancement, and UI layers
 
 from enum import Enum
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Any
+from typing import Callable, Deque, Dict, FrozenSet, Iterator, List, Any, Optional, Tuple, Union
+import asyncio
+import inspect
 import logging
+import time
+
+from dnd_engine.utils.latency import LatencyHistogram
+from dnd_engine.utils.logging_config import LoggingConfig, get_logging_config
 
 
 logger = logging.getLogger(__name__)
@@ -77,9 +86,56 @@ class EventType(Enum):
     TIME_ADVANCED = "time_advanced"
     HOUR_PASSED = "hour_passed"
     EFFECT_EXPIRED = "effect_expired"
-
-
-@dataclass
+    TIME_SUMMARY = "time_summary"  # One per bulk advancement (TimeManager.batch/fast_forward)
+
+
+class EventCategory(Enum):
+    """Groups of event types that can be subscribed to as a whole."""
+    COMBAT = "combat"
+    EXPLORATION = "exploration"
+    INVENTORY = "inventory"
+    PROGRESSION = "progression"
+    SKILL = "skill"
+    LLM = "llm"
+    RESET = "reset"
+    REST = "rest"
+    SPELLCASTING = "spellcasting"
+    TIME = "time"
+
+
+# Event types in each category (mirrors the grouping of EventType above)
+EVENT_CATEGORIES: Dict[EventCategory, FrozenSet[EventType]] = {
+    EventCategory.COMBAT: frozenset({
+        EventType.COMBAT_START, EventType.COMBAT_END, EventType.COMBAT_FLED,
+        EventType.TURN_START, EventType.TURN_END, EventType.ATTACK_ROLL,
+        EventType.SAVING_THROW, EventType.DAMAGE_DEALT, EventType.DAMAGE_TAKEN,
+        EventType.HEALING_DONE, EventType.CHARACTER_DEATH, EventType.SNEAK_ATTACK,
+        EventType.DEATH_SAVE, EventType.SPELL_SAVE, EventType.DAMAGE_AT_ZERO_HP,
+        EventType.MASSIVE_DAMAGE_DEATH, EventType.CHARACTER_STABILIZED,
+    }),
+    EventCategory.EXPLORATION: frozenset({EventType.ROOM_ENTER, EventType.ITEM_ACQUIRED}),
+    EventCategory.INVENTORY: frozenset({
+        EventType.ITEM_EQUIPPED, EventType.ITEM_UNEQUIPPED, EventType.ITEM_USED,
+        EventType.GOLD_ACQUIRED, EventType.CONDITION_APPLIED, EventType.CONDITION_REMOVED,
+        EventType.BUFF_APPLIED,
+    }),
+    EventCategory.PROGRESSION: frozenset({EventType.LEVEL_UP, EventType.FEATURE_GRANTED}),
+    EventCategory.SKILL: frozenset({EventType.SKILL_CHECK, EventType.ABILITY_CHECK}),
+    EventCategory.LLM: frozenset({EventType.ENHANCEMENT_STARTED, EventType.DESCRIPTION_ENHANCED}),
+    EventCategory.RESET: frozenset({EventType.RESET_STARTED, EventType.RESET_COMPLETE}),
+    EventCategory.REST: frozenset({EventType.SHORT_REST, EventType.LONG_REST, EventType.SPELLS_PREPARED}),
+    EventCategory.SPELLCASTING: frozenset({EventType.SPELL_CAST}),
+    EventCategory.TIME: frozenset({
+        EventType.TIME_ADVANCED, EventType.HOUR_PASSED, EventType.EFFECT_EXPIRED,
+        EventType.TIME_SUMMARY,
+    }),
+}
+
+# Subscription target that matches every event type
+ALL_EVENTS = "*"
+
+
+@dataclass(slots=True)
 class Event:
     """
     Represents a game event with associated data.
@@ -98,6 +154,34 @@ class Event:
 # Type alias for event handler functions
 EventHandler = Callable[[Event], None]
 
+# Type alias for subscription filters (handler only runs when this returns True)
+EventPredicate = Callable[[Event], bool]
+
+# What a subscription listens to: one event type, a category, or ALL_EVENTS
+SubscriptionTarget = Union[EventType, EventCategory, str]
+
+
+@dataclass(slots=True)
+class Subscription:
+    """A handler registered on an EventBus."""
+    target: SubscriptionTarget
+    handler: EventHandler
+    priority: int = 0
+    predicate: Optional[EventPredicate] = None
+    background: bool = False
+
+    def matches(self, event_type: EventType) -> bool:
+        """Check whether this subscription listens to an event type."""
+        if self.target == ALL_EVENTS:
+            return True
+        if isinstance(self.target, EventCategory):
+            return event_type in EVENT_CATEGORIES[self.target]
+        return self.target is event_type
+
+
+# Compiled dispatch entry: (handler, predicate or None)
+DispatchEntry = Tuple[EventHandler, Optional[EventPredicate]]
+
 
 class EventBus:
     """
@@ -111,64 +195,155 @@ class EventBus:
     This enables loose coupling: the game engine emits events without
     knowing what systems are listening, and systems can react to events
     without modifying the game engine.
+
+    Delivery modes:
+    - Synchronous (default): emit() calls every handler before returning.
+    - Queued: emit() only enqueues; drain() dispatches the queue in FIFO
+      order at defined points (end of an enemy's action, end of a turn).
+      Events emitted by handlers during a drain are appended and delivered
+      in the same drain, after the event being dispatched. deferred()
+      queues for the duration of a block.
+    - Background subscribers (subscribe(..., background=True)) run on a
+      single worker thread, in emit order, or on background_loop for
+      coroutine handlers. Synchronous subscribers are unaffected and still
+      see events in emit order on the emitting thread.
+
+    Subscriptions can target one EventType, an EventCategory, or
+    ALL_EVENTS, and may carry a priority (higher runs first, ties in
+    subscription order) and a predicate filter. They are compiled into a
+    per-EventType dispatch tuple on first emit, and the tables are rebuilt
+    only after subscriptions change.
+
+    Instrumentation (enable_instrumentation()) times every synchronous
+    handler call per (event type, handler). It is off by default, and
+    emit only pays one attribute check for it while it is off.
     """
 
-    def __init__(self):
-        """Initialize the event bus."""
-        # Map of event type -> list of handler functions
-        self._subscribers: Dict[EventType, List[EventHandler]] = {}
+    def __init__(self, queued: bool = False, background_loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Initialize the event bus.
 
-    def subscribe(self, event_type: EventType, handler: EventHandler) -> None:
+        Args:
+            queued: Enqueue emitted events until drain() instead of dispatching them inline
+            background_loop: Event loop that runs coroutine background handlers
+                (they run with asyncio.run on the worker thread if not provided)
         """
-        Subscribe to an event type.
+        # Subscriptions in the order they were made
+        self._subscriptions: List[Subscription] = []
+        # Map of event type -> (synchronous entries, background entries), built on demand
+        self._dispatch_tables: Dict[EventType, Tuple[Tuple[DispatchEntry, ...], Tuple[DispatchEntry, ...]]] = {}
+        self.queued = queued
+        self.background_loop = background_loop
+        self._queue: Deque[Event] = deque()
+        self._draining = False
+        self._deferred_depth = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Map of (event type, handler) -> latency histogram; None while instrumentation is off
+        self._latency: Optional[Dict[Tuple[EventType, EventHandler], LatencyHistogram]] = None
+        self.slow_handler_threshold: Optional[float] = None
+
+    def subscribe(
+        self,
+        event_type: SubscriptionTarget,
+        handler: EventHandler,
+        background: bool = False,
+        priority: int = 0,
+        predicate: Optional[EventPredicate] = None
+    ) -> Subscription:
+        """
+        Subscribe to an event type, a category of event types, or ALL_EVENTS.
 
         Args:
-            event_type: The type of event to subscribe to
-            handler: Function to call when event is emitted
+            event_type: EventType, EventCategory, or ALL_EVENTS
+            handler: Function (or coroutine function, if background) to call when event is emitted
+            background: Run the handler off the game-loop thread
+            priority: Handlers with higher priority run first (default 0)
+            predicate: Only call the handler for events this returns True for
+
+        Returns:
+            The new Subscription
+
+        Raises:
+            ValueError: If event_type is not a valid subscription target
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
+        if not isinstance(event_type, (EventType, EventCategory)) and event_type != ALL_EVENTS:
+            raise ValueError(f"Cannot subscribe to {event_type!r}")
 
-        self._subscribers[event_type].append(handler)
+        subscription = Subscription(event_type, handler, priority, predicate, background)
+        self._subscriptions.append(subscription)
+        self._dispatch_tables.clear()
+        return subscription
 
-    def unsubscribe(self, event_type: EventType, handler: EventHandler) -> None:
+    def unsubscribe(self, event_type: SubscriptionTarget, handler: EventHandler) -> None:
         """
         Unsubscribe from an event type.
 
         Args:
-            event_type: The type of event to unsubscribe from
+            event_type: The EventType, EventCategory, or ALL_EVENTS the handler was subscribed to
             handler: The handler function to remove
         """
-        if event_type in self._subscribers:
-            try:
-                self._subscribers[event_type].remove(handler)
-            except ValueError:
-                # Handler wasn't in the list, that's okay
-                pass
+        for index, subscription in enumerate(self._subscriptions):
+            if subscription.target == event_type and subscription.handler == handler:
+                del self._subscriptions[index]
+                self._dispatch_tables.clear()
+                return
+        # Handler wasn't subscribed, that's okay
 
     def emit(self, event: Event) -> None:
         """
         Emit an event to all subscribers.
 
-        All handlers subscribed to the event type will be called with the event.
+        All handlers subscribed to the event type will be called with the event
+        (immediately, or at the next drain() when the bus is queued).
         If a handler raises an exception, it's logged but doesn't prevent
         other handlers from running.
 
         Args:
             event: The event to emit
         """
-        # Log the event if debug mode is enabled
-        from dnd_engine.utils.logging_config import get_logging_config
-        logging_config = get_logging_config()
-        if logging_config and logging_config.debug_enabled:
-            logging_config.log_event(event.type.name, event.data)
-
-        if event.type not in self._subscribers:
+        if self.queued or self._deferred_depth or self._draining:
+            self._queue.append(event)
             return
 
-        for handler in self._subscribers[event.type]:
+        self._dispatch(event, _debug_event_log())
+
+    def _dispatch_table(self, event_type: EventType) -> Tuple[Tuple[DispatchEntry, ...], Tuple[DispatchEntry, ...]]:
+        """Get the compiled (synchronous, background) handler tuples for an event type."""
+        table = self._dispatch_tables.get(event_type)
+        if table is None:
+            # sorted() is stable, so equal priorities keep subscription order
+            matching = sorted(
+                (subscription for subscription in self._subscriptions if subscription.matches(event_type)),
+                key=lambda subscription: -subscription.priority
+            )
+            table = (
+                tuple((sub.handler, sub.predicate) for sub in matching if not sub.background),
+                tuple((sub.handler, sub.predicate) for sub in matching if sub.background)
+            )
+            self._dispatch_tables[event_type] = table
+        return table
+
+    def _dispatch(self, event: Event, event_log: Optional[LoggingConfig]) -> None:
+        """
+        Deliver an event to its synchronous and background subscribers.
+
+        Args:
+            event: The event to deliver
+            event_log: Debug logging config to record the event with (None when debug logging is off)
+        """
+        if event_log is not None:
+            event_log.log_event(event.type.name, event.data)
+
+        handlers, background_handlers = self._dispatch_table(event.type)
+
+        if self._latency is not None:
+            self._dispatch_timed(event, handlers, self._latency)
+            handlers = ()
+
+        for handler, predicate in handlers:
             try:
-                handler(event)
+                if predicate is None or predicate(event):
+                    handler(event)
             except Exception as e:
                 # Log the exception but continue calling other handlers
                 logger.error(
@@ -176,15 +351,220 @@ class EventBus:
                     exc_info=True
                 )
 
-    def clear_subscribers(self, event_type: EventType) -> None:
+        for handler, predicate in background_handlers:
+            try:
+                if predicate is None or predicate(event):
+                    self._run_in_background(handler, event)
+            except Exception as e:
+                logger.error(
+                    f"Error in event predicate for {event.type.value}: {e}",
+                    exc_info=True
+                )
+
+    def _dispatch_timed(
+        self,
+        event: Event,
+        handlers: Tuple[DispatchEntry, ...],
+        latency: Dict[Tuple[EventType, EventHandler], LatencyHistogram],
+    ) -> None:
+        """Call synchronous handlers, recording how long each one takes."""
+        threshold = self.slow_handler_threshold
+        for handler, predicate in handlers:
+            start = time.perf_counter()
+            failed = False
+            try:
+                if predicate is None or predicate(event):
+                    handler(event)
+                else:
+                    continue
+            except Exception as e:
+                failed = True
+                logger.error(
+                    f"Error in event handler for {event.type.value}: {e}",
+                    exc_info=True
+                )
+            elapsed = time.perf_counter() - start
+
+            histogram = latency.get((event.type, handler))
+            if histogram is None:
+                histogram = latency[(event.type, handler)] = LatencyHistogram()
+            histogram.record(elapsed)
+            if failed:
+                histogram.errors += 1
+
+            if threshold is not None and elapsed >= threshold:
+                logger.warning(
+                    f"Slow event handler {_handler_name(handler)} for {event.type.value}: "
+                    f"{elapsed * 1000:.1f}ms"
+                )
+
+    def enable_instrumentation(self, slow_threshold_ms: Optional[float] = None) -> None:
+        """
+        Start recording per-handler latency.
+
+        Only synchronous handlers are timed; background handlers don't hold up the game loop.
+        Stats recorded earlier are kept.
+
+        Args:
+            slow_threshold_ms: Log a warning for handler calls at least this slow (None disables)
+        """
+        if self._latency is None:
+            self._latency = {}
+        self.slow_handler_threshold = slow_threshold_ms / 1000 if slow_threshold_ms is not None else None
+
+    def disable_instrumentation(self) -> None:
+        """Stop recording handler latency and discard the recorded stats."""
+        self._latency = None
+        self.slow_handler_threshold = None
+
+    @property
+    def instrumentation_enabled(self) -> bool:
+        """Whether handler latency is being recorded."""
+        return self._latency is not None
+
+    def reset_handler_stats(self) -> None:
+        """Discard recorded handler latency, keeping instrumentation on if it was."""
+        if self._latency is not None:
+            self._latency.clear()
+
+    def handler_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get recorded latency for each (event type, handler) pair.
+
+        Returns:
+            List of dicts with event_type, handler and the LatencyHistogram.to_dict()
+            fields (times in milliseconds), slowest cumulative time first
+        """
+        if not self._latency:
+            return []
+
+        stats = [
+            {"event_type": event_type, "handler": _handler_name(handler), **histogram.to_dict()}
+            for (event_type, handler), histogram in self._latency.items()
+        ]
+        stats.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        return stats
+
+    def drain(self) -> int:
+        """
+        Dispatch every queued event, including events emitted while draining.
+
+        Returns:
+            Number of events dispatched
+        """
+        if self._draining:
+            return 0  # Already draining further up the stack; new events join that drain
+
+        dispatched = 0
+        self._draining = True
+        # Debug logging is looked up once per drain, not once per event
+        event_log = _debug_event_log()
+        try:
+            while self._queue:
+                self._dispatch(self._queue.popleft(), event_log)
+                dispatched += 1
+        finally:
+            self._draining = False
+        return dispatched
+
+    @contextmanager
+    def deferred(self) -> Iterator["EventBus"]:
+        """
+        Queue events emitted in a block and dispatch them when the (outermost) block ends.
+
+        Yields:
+            This event bus
+        """
+        self._deferred_depth += 1
+        try:
+            yield self
+        finally:
+            self._deferred_depth -= 1
+            if not self._deferred_depth and not self.queued:
+                self.drain()
+
+    def pending_count(self) -> int:
+        """Get the number of queued events waiting for drain()."""
+        return len(self._queue)
+
+    def _run_in_background(self, handler: EventHandler, event: Event) -> None:
+        """Hand a background handler call to the worker thread or the background loop."""
+        if inspect.iscoroutinefunction(handler) and self.background_loop is not None:
+            future = asyncio.run_coroutine_threadsafe(handler(event), self.background_loop)
+            future.add_done_callback(lambda done: self._log_background_error(event, done))
+            return
+
+        if self._executor is None:
+            # One worker keeps background handlers in emit order
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="event-bus")
+        future = self._executor.submit(self._call_background_handler, handler, event)
+        future.add_done_callback(lambda done: self._log_background_error(event, done))
+
+    @staticmethod
+    def _call_background_handler(handler: EventHandler, event: Event) -> None:
+        """Call a background handler on the worker thread."""
+        if inspect.iscoroutinefunction(handler):
+            asyncio.run(handler(event))
+        else:
+            handler(event)
+
+    @staticmethod
+    def _log_background_error(event: Event, future: Any) -> None:
+        """Log an exception raised by a background handler."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.error(
+                f"Error in background event handler for {event.type.value}: {error}",
+                exc_info=error
+            )
+
+    def wait_for_background(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until background handlers on the worker thread have caught up.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the worker is idle, False on timeout
+        """
+        if self._executor is None:
+            return True
+        try:
+            self._executor.submit(lambda: None).result(timeout=timeout)
+        except FutureTimeoutError:
+            return False
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Dispatch queued events and stop the background worker thread.
+
+        Args:
+            wait: Wait for pending background handlers to finish
+        """
+        self.drain()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def clear_subscribers(self, event_type: SubscriptionTarget) -> None:
         """
         Remove all subscribers for an event type.
 
+        Only subscriptions made to exactly this target are removed; category
+        and ALL_EVENTS subscriptions stay unless cleared by their own target.
+
         Args:
-            event_type: The event type to clear
+            event_type: The EventType, EventCategory, or ALL_EVENTS to clear
         """
-        if event_type in self._subscribers:
-            self._subscribers[event_type].clear()
+        self._subscriptions = [
+            subscription for subscription in self._subscriptions
+            if subscription.target != event_type
+        ]
+        self._dispatch_tables.clear()
 
     def subscriber_count(self, event_type: EventType) -> int:
         """
@@ -194,10 +574,26 @@ class EventBus:
             event_type: The event type to check
 
         Returns:
-            Number of subscribers
+            Number of handlers an event of this type is dispatched to
+            (synchronous and background, including category and ALL_EVENTS subscribers)
         """
-        return len(self._subscribers.get(event_type, []))
+        handlers, background_handlers = self._dispatch_table(event_type)
+        return len(handlers) + len(background_handlers)
 
     def clear_all(self) -> None:
         """Remove all subscribers from all event types."""
-        self._subscribers.clear()
+        self._subscriptions.clear()
+        self._dispatch_tables.clear()
+
+
+def _debug_event_log() -> Optional[LoggingConfig]:
+    """Get the logging config if debug mode is on (events are then written to the debug log)."""
+    logging_config = get_logging_config()
+    if logging_config is not None and logging_config.debug_enabled:
+        return logging_config
+    return None
+
+
+def _handler_name(handler: EventHandler) -> str:
+    """Get a readable name for a handler (e.g. 'GameCLI._on_room_enter')."""
+    return getattr(handler, "__qualname__", None) or repr(handler)
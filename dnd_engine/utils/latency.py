@@ -0,0 +1,97 @@
+# ABOUTME: Fixed-memory latency histograms for per-handler EventBus instrumentation
+# ABOUTME: Records call counts, cumulative time and approximate percentiles in log-scale buckets
+
+import math
+from typing import Any, Dict, List
+
+
+# Bucket i holds durations up to _MIN_SECONDS * _GROWTH ** i (about 19% apart),
+# which covers 1 microsecond to roughly 10 seconds in a fixed number of counters
+_MIN_SECONDS = 1e-6
+_GROWTH = 2 ** 0.25
+_LOG_GROWTH = math.log(_GROWTH)
+BUCKET_COUNT = 96
+
+
+class LatencyHistogram:
+    """
+    Call count, cumulative time and a log-scale histogram of call durations.
+
+    Memory is fixed regardless of how many calls are recorded. Percentiles
+    are the upper bound of the bucket holding the requested rank (capped at
+    the slowest call seen), so they overestimate by at most one bucket.
+    """
+
+    __slots__ = ("count", "total_seconds", "max_seconds", "errors", "_buckets")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.errors = 0
+        self._buckets: List[int] = [0] * BUCKET_COUNT
+
+    def record(self, seconds: float) -> None:
+        """
+        Record one call.
+
+        Args:
+            seconds: Duration of the call
+        """
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+
+        if seconds <= _MIN_SECONDS:
+            index = 0
+        else:
+            index = min(math.ceil(math.log(seconds / _MIN_SECONDS) / _LOG_GROWTH), BUCKET_COUNT - 1)
+        self._buckets[index] += 1
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get an approximate latency percentile.
+
+        Args:
+            percent: Percentile to compute (0 - 100)
+
+        Returns:
+            Duration in seconds (0.0 if nothing was recorded)
+        """
+        if not self.count:
+            return 0.0
+
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index, bucket in enumerate(self._buckets):
+            seen += bucket
+            if seen >= rank:
+                if index == BUCKET_COUNT - 1:
+                    break  # Overflow bucket has no upper bound
+                return min(_MIN_SECONDS * _GROWTH ** index, self.max_seconds)
+        return self.max_seconds
+
+    @property
+    def mean_seconds(self) -> float:
+        """Average call duration in seconds."""
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Summarize the histogram.
+
+        Returns:
+            Dictionary of count, errors, total/mean/max and p50/p95/p99 in milliseconds
+        """
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": self.total_seconds * 1000,
+            "mean_ms": self.mean_seconds * 1000,
+            "max_ms": self.max_seconds * 1000,
+            "p50_ms": self.percentile(50) * 1000,
+            "p95_ms": self.percentile(95) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+        }
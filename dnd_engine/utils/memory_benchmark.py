@@ -0,0 +1,202 @@
+# ABOUTME: Memory benchmark for the slotted game objects kept alive in bulk by simulations and hosted sessions
+# ABOUTME: Measures bytes per instance of each slotted class against a __dict__-backed class holding the same attributes
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class MemoryComparison:
+    """
+    Per-instance memory of one slotted class versus a __dict__-backed equivalent.
+
+    Attributes:
+        class_name: Name of the slotted class
+        slotted_bytes: Bytes allocated per slotted instance
+        dict_bytes: Bytes allocated per instance of a plain class with the same attributes
+    """
+    class_name: str
+    slotted_bytes: float
+    dict_bytes: float
+
+    @property
+    def reduction(self) -> float:
+        """Fraction of per-instance memory saved by slots (0.0 - 1.0)."""
+        if self.dict_bytes <= 0:
+            return 0.0
+        return 1 - self.slotted_bytes / self.dict_bytes
+
+
+def slot_names(cls: type) -> Tuple[str, ...]:
+    """
+    Get every slot declared by a class and its bases.
+
+    Args:
+        cls: Slotted class
+
+    Returns:
+        Slot names, base classes first (excluding __dict__ and __weakref__)
+    """
+    names: List[str] = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(name for name in slots if name not in ("__dict__", "__weakref__"))
+    return tuple(names)
+
+
+def _allocated_bytes(build: Callable[[], Any], count: int) -> float:
+    """Measure the bytes allocated per object when building count objects."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [build() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # The list holding the objects is not part of any object's footprint
+    list_bytes = objects.__sizeof__()
+    del objects
+    return (after - before - list_bytes) / count
+
+
+def measure_class(prototype: Any, count: int = 10000) -> MemoryComparison:
+    """
+    Measure one slotted class.
+
+    Both sides are filled with the prototype's attribute values, so only the
+    instances themselves are counted, not the values they reference.
+
+    Args:
+        prototype: Fully initialized instance of the slotted class
+        count: Number of instances to build per measurement
+
+    Returns:
+        Per-instance comparison
+    """
+    cls: type = type(prototype)
+    values: Dict[str, Any] = {name: getattr(prototype, name) for name in slot_names(cls)}
+    # A dedicated class per comparison, so its instances share one key table like the old classes did
+    bases: Tuple[type, ...] = (object,)
+    namespace: Dict[str, Any] = {}
+    dict_cls: type = type(f"{cls.__name__}WithDict", bases, namespace)
+
+    def build_slotted() -> Any:
+        obj: Any = object.__new__(cls)
+        for name, value in values.items():
+            object.__setattr__(obj, name, value)
+        return obj
+
+    def build_dict_backed() -> Any:
+        obj = dict_cls()
+        for name, value in values.items():
+            setattr(obj, name, value)
+        return obj
+
+    return MemoryComparison(
+        class_name=cls.__name__,
+        slotted_bytes=_allocated_bytes(build_slotted, count),
+        dict_bytes=_allocated_bytes(build_dict_backed, count)
+    )
+
+
+def benchmark_prototypes() -> List[Any]:
+    """Build one instance of each hot game object."""
+    from dnd_engine.core.character import Character, CharacterClass
+    from dnd_engine.core.combat import AttackResult
+    from dnd_engine.core.creature import Abilities, Creature
+    from dnd_engine.core.dice import DiceRoll
+    from dnd_engine.systems.action_economy import TurnState
+    from dnd_engine.systems.initiative import InitiativeEntry
+    from dnd_engine.systems.inventory import InventoryItem
+    from dnd_engine.systems.resources import ResourcePool
+    from dnd_engine.systems.time_manager import ActiveEffect, EffectType
+    from dnd_engine.utils.events import Event, EventType
+
+    goblin = Creature(name="Goblin", max_hp=7, ac=15, abilities=Abilities(8, 14, 10, 10, 8, 8))
+    fighter = Character(
+        name="Fighter",
+        character_class=CharacterClass.FIGHTER,
+        level=1,
+        abilities=Abilities(16, 12, 14, 10, 10, 10),
+        max_hp=12,
+        ac=16
+    )
+    return [
+        goblin,
+        fighter,
+        InventoryItem(item_id="longsword", category="weapons"),
+        ActiveEffect(
+            effect_type=EffectType.SPELL,
+            source="Bless",
+            duration_minutes=1,
+            remaining_minutes=1,
+            target_name="Fighter",
+            concentration=True,
+            caster_name="Cleric"
+        ),
+        InitiativeEntry(creature=goblin, initiative_roll=12),
+        TurnState(),
+        ResourcePool(name="second_wind", current=1, maximum=1, recovery_type="short_rest"),
+        DiceRoll(rolls=[4], modifier=2, notation="1d6+2"),
+        AttackResult(
+            attacker_name="Goblin",
+            defender_name="Fighter",
+            attack_roll=14,
+            attack_bonus=4,
+            target_ac=16,
+            hit=True,
+            damage=5,
+            critical_hit=False,
+            advantage=False,
+            disadvantage=False
+        ),
+        Event(type=EventType.DAMAGE_DEALT, data={"amount": 5}),
+    ]
+
+
+def run_benchmark(count: int = 10000) -> List[MemoryComparison]:
+    """
+    Measure every hot game object.
+
+    Args:
+        count: Number of instances to build per measurement
+
+    Returns:
+        One comparison per class
+    """
+    return [measure_class(prototype, count) for prototype in benchmark_prototypes()]
+
+
+def format_report(results: Sequence[MemoryComparison]) -> str:
+    """Format benchmark results as a text table."""
+    lines = [f"{'Class':<16}{'slots B/obj':>13}{'__dict__ B/obj':>16}{'saved':>8}"]
+    for result in results:
+        lines.append(
+            f"{result.class_name:<16}{result.slotted_bytes:>13.0f}"
+            f"{result.dict_bytes:>16.0f}{result.reduction:>8.0%}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Run the memory benchmark from the command line.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Compare per-object memory of slotted game objects")
+    parser.add_argument("--count", type=int, default=10000, help="Instances built per measurement")
+    args = parser.parse_args(argv)
+
+    print(format_report(run_benchmark(args.count)))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ from dnd_engine.core.character import Character, CharacterClass
 from dnd_engine.core.creature import Abilities
 from dnd_engine.core.game_state import GameState
 from dnd_engine.rules.loader import DataLoader
+from dnd_engine.rules.spell_catalog import SpellCatalog
+from dnd_engine.systems.resources import ResourcePool
 
 
 class TestCLISpellcastingAbilityLookup:
@@ -90,14 +92,14 @@ class TestCLISpellcastingAbilityLookup:
         """Test that spellcasting ability is correctly retrieved from nested 'spellcasting.ability'"""
         # Setup
         mock_game_state.data_loader.load_classes.return_value = classes_data_with_spellcasting
-        mock_game_state.data_loader.load_spells.return_value = {
+        mock_game_state.data_loader.load_spell_catalog.return_value = SpellCatalog({
             "magic_missile": {
                 "name": "Magic Missile",
                 "level": 1,
                 "classes": ["wizard"],
                 "attack_type": "spell_attack"
             }
-        }
+        })
 
         cli = CLI(mock_game_state, Mock(), "test_campaign")
 
@@ -220,14 +222,14 @@ class TestCLISpellcastingAbilityLookup:
             }
         }
         mock_game_state.data_loader.load_classes.return_value = classes_data
-        mock_game_state.data_loader.load_spells.return_value = {
+        mock_game_state.data_loader.load_spell_catalog.return_value = SpellCatalog({
             "magic_missile": {
                 "name": "Magic Missile",
                 "level": 1,
                 "classes": ["wizard"],
                 "attack_type": "spell_attack"
             }
-        }
+        })
 
         cli = CLI(mock_game_state, Mock(), "test_campaign")
 
@@ -254,6 +256,41 @@ class TestCLISpellcastingAbilityLookup:
                         assert not any("cannot cast spells" in msg.lower() for msg in error_messages)
 
 
+    def test_hold_person_is_not_resolved_as_a_spell_attack(
+        self, mock_game_state, classes_data_with_spellcasting
+    ):
+        """Test that casting save-only Hold Person in combat spends nothing and deals no damage"""
+        wizard = Character(
+            name="Test Wizard",
+            character_class=CharacterClass.WIZARD,
+            level=3,
+            abilities=Abilities(8, 14, 12, 16, 10, 8),
+            max_hp=16,
+            ac=12,
+            spellcasting_ability="int",
+            known_spells=["fire_bolt", "hold_person"],
+            prepared_spells=["fire_bolt", "hold_person"]
+        )
+        wizard.add_resource_pool(ResourcePool("spell_slots_level_2", current=2, maximum=2, recovery_type="long_rest"))
+        mock_game_state.data_loader.load_classes.return_value = classes_data_with_spellcasting
+        mock_game_state.data_loader.load_spell_catalog.return_value = DataLoader().load_spell_catalog()
+        cli = CLI(mock_game_state, Mock(), "test_campaign")
+
+        mock_turn_state = Mock()
+        mock_turn_state.is_action_available.return_value = True
+        mock_game_state.party.characters = [wizard]
+        mock_game_state.initiative_tracker.get_current_combatant.return_value.creature = wizard
+        mock_game_state.initiative_tracker.get_current_turn_state.return_value = mock_turn_state
+        slots_before = wizard.get_available_spell_slots(2)
+
+        with patch('dnd_engine.ui.cli.print_error') as mock_print_error:
+            cli.handle_cast_spell("hold person")
+
+        mock_print_error.assert_called_once_with("Unknown spell: hold person")
+        mock_game_state.combat_engine.resolve_spell_attack.assert_not_called()
+        mock_turn_state.consume_action.assert_not_called()
+        assert wizard.get_available_spell_slots(2) == slots_before == 2
+
 class TestSpellcastingAbilityDataStructure:
     """Test the actual data structure from classes.json"""
 
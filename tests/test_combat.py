@@ -155,6 +155,23 @@ class TestCombatEngine:
                 assert 5 <= result.damage <= 19
                 break
 
+    def test_compound_damage_critical_hit(self):
+        """Test that critical hits double every dice group in compound damage"""
+        for _ in range(100):
+            result = self.engine.resolve_attack(
+                attacker=self.fighter,
+                defender=self.goblin,
+                attack_bonus=5,
+                damage_dice="1d8+2d6+3"
+            )
+
+            if result.hit and not result.critical_hit:
+                assert 6 <= result.damage <= 23
+            if result.critical_hit:
+                # Critical: 2d8+4d6+3, so between 9 and 43
+                assert 9 <= result.damage <= 43
+                break
+
     def test_miss_deals_no_damage(self):
         """Test that misses deal no damage"""
         # Keep attacking until we miss
@@ -0,0 +1,171 @@
+# ABOUTME: Unit tests for the compiled condition table and creature condition bitmasks
+# ABOUTME: Tests bit/effect compilation, mask bookkeeping, incapacitation, timed conditions, and condition-driven advantage and saves
+
+from unittest.mock import Mock
+
+import pytest
+
+from dnd_engine.core.character import Character, CharacterClass
+from dnd_engine.core.combat import CombatEngine
+from dnd_engine.core.creature import Abilities, Creature
+from dnd_engine.core.dice import DiceRoll
+from dnd_engine.rules.condition_table import (
+    ConditionEffect,
+    ConditionTable,
+    get_condition_table,
+    resolve_attack_advantage,
+)
+from dnd_engine.rules.loader import DataLoader
+
+
+@pytest.fixture
+def goblin():
+    """Plain creature"""
+    return Creature(name="Goblin", max_hp=7, ac=15, abilities=Abilities(8, 14, 10, 10, 8, 8))
+
+
+@pytest.fixture
+def fighter():
+    """Level 1 fighter"""
+    return Character(
+        name="Aragorn",
+        character_class=CharacterClass.FIGHTER,
+        level=1,
+        abilities=Abilities(16, 12, 14, 10, 10, 10),
+        max_hp=12,
+        ac=16
+    )
+
+
+class TestConditionTable:
+    """Test compiling conditions.json"""
+
+    def test_compile(self):
+        """Test bits and combined effects"""
+        table = ConditionTable.compile({
+            "grappled": {"effects": ["speed_zero"]},
+            "Poisoned": {"effects": ["attacks_have_disadvantage"]}
+        })
+
+        grappled, poisoned = table.bit("grappled"), table.bit("poisoned")
+        assert (grappled, poisoned) == (1, 2)
+        assert table.effects(grappled | poisoned) == (
+            ConditionEffect.SPEED_ZERO | ConditionEffect.ATTACKS_HAVE_DISADVANTAGE
+        )
+        assert table.names(poisoned | grappled) == ("grappled", "poisoned")
+
+    def test_undefined_conditions_get_new_bits(self):
+        """Test that conditions missing from the file get an effect-free bit"""
+        table = ConditionTable.compile({"prone": {}})
+
+        blessed = table.bit("blessed")
+        assert blessed == 2
+        assert table.bit("blessed") == blessed
+        assert table.effects(blessed) == 0
+
+    def test_unknown_effect(self):
+        """Test that a typo in an effect name is reported"""
+        with pytest.raises(ValueError, match="teleported"):
+            ConditionTable.compile({"odd": {"effects": ["teleported"]}})
+
+    def test_srd_table(self):
+        """Test the shared table built from the SRD"""
+        table = get_condition_table()
+
+        assert table is get_condition_table()
+        assert table.effects(table.bit("paralyzed")) & ConditionEffect.AUTO_FAIL_STR_DEX_SAVES
+        assert table.effects(table.bit("on_fire")) == 0
+
+
+class TestCreatureConditionMask:
+    """Test creature condition bookkeeping"""
+
+    def test_mask_follows_conditions(self, goblin):
+        """Test add, metadata, remove, and clear"""
+        table = get_condition_table()
+
+        goblin.add_condition("Prone")
+        goblin.apply_condition_with_metadata("stunned", duration_type="rounds", duration=1)
+        assert goblin.condition_mask == table.bit("prone") | table.bit("stunned")
+        assert goblin.has_condition("STUNNED")
+        assert not goblin.has_condition("poisoned")
+
+        goblin.remove_condition("prone")
+        assert goblin.condition_mask == table.bit("stunned")
+
+        goblin.clear_conditions()
+        assert goblin.condition_mask == 0
+        assert goblin.conditions == set()
+
+    def test_can_take_actions(self, goblin):
+        """Test that every incapacitating condition stops actions"""
+        for condition in ("incapacitated", "paralyzed", "petrified", "stunned", "unconscious"):
+            goblin.add_condition(condition)
+            assert not goblin.can_take_actions(), condition
+            goblin.remove_condition(condition)
+            assert goblin.can_take_actions()
+
+        goblin.add_condition("poisoned")
+        assert goblin.can_take_actions()
+
+    def test_end_of_turn_skips_untimed_conditions(self, goblin):
+        """Test that only timed conditions are processed"""
+        goblin.add_condition("prone")
+        assert not goblin.has_timed_conditions
+        assert goblin.process_end_of_turn_conditions() == []
+
+        goblin.apply_condition_with_metadata("frightened", duration_type="rounds", duration=1)
+        assert goblin.has_timed_conditions
+        assert goblin.process_end_of_turn_conditions() == [
+            {"type": "duration_expired", "condition": "frightened"}
+        ]
+        assert not goblin.has_timed_conditions
+        assert goblin.conditions == {"prone"}
+
+    def test_squad_members_share_bits(self):
+        """Test that squad members use the same condition bits as creatures"""
+        squad = DataLoader().create_squad("goblin", 3)
+        member = squad.members[1]
+
+        member.add_condition("paralyzed")
+
+        assert squad.condition_mask[1] == get_condition_table().bit("paralyzed")
+        assert not member.can_take_actions()
+        assert squad.members[0].can_take_actions()
+        assert squad.count_with_condition("paralyzed") == 1
+
+
+class TestConditionRolls:
+    """Test advantage, disadvantage, and automatic failures from conditions"""
+
+    def test_attack_advantage(self, goblin, fighter):
+        """Test attacker and defender conditions, and cancellation"""
+        assert resolve_attack_advantage(fighter, goblin) == (False, False)
+
+        goblin.add_condition("restrained")
+        assert resolve_attack_advantage(fighter, goblin) == (True, False)
+        assert resolve_attack_advantage(goblin, fighter) == (False, True)
+
+        fighter.add_condition("poisoned")
+        assert resolve_attack_advantage(fighter, goblin) == (False, False)
+        assert resolve_attack_advantage(fighter, goblin, disadvantage=True) == (False, False)
+
+    def test_resolve_attack_rolls_with_condition_advantage(self, goblin, fighter):
+        """Test that CombatEngine applies condition advantage to the d20"""
+        roller = Mock()
+        roller.roll.return_value = DiceRoll(rolls=[15], modifier=0, notation="1d20")
+        engine = CombatEngine(dice_roller=roller)
+        goblin.add_condition("paralyzed")
+
+        engine.resolve_attack(fighter, goblin, attack_bonus=5, damage_dice="1d8+3")
+
+        assert roller.roll.call_args_list[0].kwargs == {"advantage": True, "disadvantage": False}
+
+    def test_auto_fail_strength_and_dexterity_saves(self, goblin, fighter):
+        """Test that a stunned creature fails STR/DEX saves but not others"""
+        for creature in (goblin, fighter):
+            creature.add_condition("stunned")
+
+            assert not creature.make_saving_throw("dex", dc=-100)["success"]
+            assert not creature.make_saving_throw("strength", dc=-100)["success"]
+            assert creature.make_saving_throw("wis", dc=-100)["success"]
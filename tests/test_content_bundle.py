@@ -0,0 +1,122 @@
+# ABOUTME: Unit tests for the prebuilt binary content bundle
+# ABOUTME: Tests building, checksum/version validation, and per-file staleness fallback to JSON
+
+import json
+import os
+
+import pytest
+
+from dnd_engine.rules import content_bundle
+from dnd_engine.rules.content_bundle import CONTENT_BUNDLE_NAME, build_bundle, read_bundle
+from dnd_engine.rules.loader import ContentCache, DataLoader, FrozenDict
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Create a small data directory with SRD and dungeon content"""
+    srd = tmp_path / "srd"
+    srd.mkdir()
+    (srd / "skills.json").write_text(json.dumps({"stealth": {"name": "Stealth", "ability": "dex"}}))
+    (srd / "conditions.json").write_text(json.dumps({"conditions": {"prone": {"name": "Prone"}}}))
+    dungeons = tmp_path / "content" / "dungeons"
+    dungeons.mkdir(parents=True)
+    (dungeons / "tiny.json").write_text(json.dumps({"start_room": "a", "rooms": {"a": {"name": "A"}}}))
+    return tmp_path
+
+
+def touch_later(path):
+    """Bump a file's mtime so it differs from the bundled snapshot"""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestContentBundle:
+    """Test building and reading content bundles"""
+
+    def test_build_includes_srd_and_content(self, data_dir):
+        """Test that every JSON file under srd/ and content/ is bundled"""
+        bundle_path = build_bundle(data_dir)
+        entries = read_bundle(bundle_path, data_dir)
+
+        assert bundle_path == data_dir / CONTENT_BUNDLE_NAME
+        assert set(entries) == {
+            data_dir / "srd" / "skills.json",
+            data_dir / "srd" / "conditions.json",
+            data_dir / "content" / "dungeons" / "tiny.json"
+        }
+        content = entries[data_dir / "srd" / "skills.json"][2]
+        assert isinstance(content, FrozenDict)
+        assert content["stealth"]["ability"] == "dex"
+
+    def test_missing_bundle(self, data_dir):
+        """Test that a missing bundle reads as None"""
+        assert read_bundle(data_dir / CONTENT_BUNDLE_NAME, data_dir) is None
+
+    def test_corrupt_bundle_rejected(self, data_dir):
+        """Test that a bundle with a bad checksum is ignored"""
+        bundle_path = build_bundle(data_dir)
+        raw = bytearray(bundle_path.read_bytes())
+        raw[-1] ^= 0xFF
+        bundle_path.write_bytes(bytes(raw))
+
+        assert read_bundle(bundle_path, data_dir) is None
+
+    def test_other_format_version_rejected(self, data_dir, monkeypatch):
+        """Test that bundles from another format version are ignored"""
+        bundle_path = build_bundle(data_dir)
+        monkeypatch.setattr(content_bundle, "BUNDLE_FORMAT_VERSION", content_bundle.BUNDLE_FORMAT_VERSION + 1)
+
+        assert read_bundle(bundle_path, data_dir) is None
+
+    def test_loader_serves_fresh_bundle(self, data_dir):
+        """Test that fresh files come from the bundle without parsing JSON"""
+        build_bundle(data_dir)
+        loader = DataLoader(data_dir, content_cache=ContentCache())
+
+        assert loader.load_skills()["stealth"]["name"] == "Stealth"
+        assert loader.load_conditions()["prone"]["name"] == "Prone"
+        assert loader.cache_stats()["misses"] == 0
+
+    def test_loader_falls_back_for_stale_file(self, data_dir):
+        """Test that a file edited after the build is re-read from JSON"""
+        build_bundle(data_dir)
+        skills_file = data_dir / "srd" / "skills.json"
+        skills_file.write_text(json.dumps({"arcana": {"name": "Arcana", "ability": "int"}}))
+        touch_later(skills_file)
+
+        loader = DataLoader(data_dir, content_cache=ContentCache())
+
+        assert "arcana" in loader.load_skills()
+        assert loader.load_conditions()["prone"]["name"] == "Prone"
+        assert loader.cache_stats()["reloads"] == 1
+
+    def test_bundle_read_once_per_cache(self, data_dir, monkeypatch):
+        """Test that several loaders sharing a cache read the bundle once"""
+        build_bundle(data_dir)
+        calls = []
+        original = content_bundle.read_bundle
+        monkeypatch.setattr(content_bundle, "read_bundle", lambda *a: calls.append(a) or original(*a))
+
+        cache = ContentCache()
+        DataLoader(data_dir, content_cache=cache)
+        DataLoader(data_dir, content_cache=cache)
+
+        assert len(calls) == 1
+
+    def test_bundled_dungeon_is_mutable_copy(self, data_dir):
+        """Test that dungeons from the bundle are still private copies"""
+        build_bundle(data_dir)
+        loader = DataLoader(data_dir, content_cache=ContentCache())
+
+        dungeon = loader.load_dungeon("tiny")
+        dungeon["rooms"]["a"]["searched"] = True
+
+        assert "searched" not in loader.load_dungeon("tiny")["rooms"]["a"]
+
+    def test_main_builds_bundle(self, data_dir, tmp_path, capsys):
+        """Test the command-line build step"""
+        output = tmp_path / "out.bundle"
+        content_bundle.main(["--data-path", str(data_dir), "--output", str(output)])
+
+        assert read_bundle(output, data_dir) is not None
+        assert "3 content files" in capsys.readouterr().out
@@ -0,0 +1,144 @@
+# ABOUTME: Unit tests for the shared content cache used by DataLoader
+# ABOUTME: Tests parse-once behavior, mtime invalidation, read-only views, and hit/miss counters
+
+import copy
+import json
+import os
+import pickle
+
+import pytest
+
+from dnd_engine.rules.loader import ContentCache, DataLoader, FrozenDict, get_content_cache
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Create a minimal data directory with one monster and one dungeon"""
+    srd = tmp_path / "srd"
+    srd.mkdir()
+    (srd / "monsters.json").write_text(json.dumps({
+        "goblin": {
+            "name": "Goblin",
+            "ac": 15,
+            "hp": "2d6",
+            "abilities": {"str": 8, "dex": 14, "con": 10, "int": 10, "wis": 8, "cha": 8},
+            "actions": [{"name": "Scimitar", "attack_bonus": 4, "damage": "1d6+2"}]
+        }
+    }))
+    dungeons = tmp_path / "content" / "dungeons"
+    dungeons.mkdir(parents=True)
+    (dungeons / "tiny.json").write_text(json.dumps({
+        "start_room": "a",
+        "rooms": {"a": {"name": "A", "searched": False}}
+    }))
+    return tmp_path
+
+
+class TestContentCache:
+    """Test the ContentCache class"""
+
+    def test_parses_file_once(self, data_dir):
+        """Test that repeated loads are served from the cache"""
+        loader = DataLoader(data_dir, content_cache=ContentCache(), use_bundle=False)
+
+        first = loader.load_monsters()
+        second = loader.load_monsters()
+
+        assert first is second
+        assert loader.cache_stats() == {"hits": 1, "misses": 1, "reloads": 0, "files": 1}
+
+    def test_reloads_when_file_changes(self, data_dir):
+        """Test that a modified file is re-read"""
+        loader = DataLoader(data_dir, content_cache=ContentCache(), use_bundle=False)
+        monsters_file = data_dir / "srd" / "monsters.json"
+
+        assert loader.load_monsters()["goblin"]["ac"] == 15
+
+        data = json.loads(monsters_file.read_text())
+        data["goblin"]["ac"] = 17
+        monsters_file.write_text(json.dumps(data))
+        stat = monsters_file.stat()
+        os.utime(monsters_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert loader.load_monsters()["goblin"]["ac"] == 17
+        assert loader.cache_stats()["reloads"] == 1
+
+    def test_content_is_read_only(self, data_dir):
+        """Test that cached content can't be modified in place"""
+        loader = DataLoader(data_dir, content_cache=ContentCache(), use_bundle=False)
+        monsters = loader.load_monsters()
+
+        with pytest.raises(TypeError):
+            monsters["goblin"]["ac"] = 99
+        with pytest.raises(TypeError):
+            monsters["goblin"]["actions"].append({})
+        with pytest.raises(TypeError):
+            monsters.pop("goblin")
+
+        assert loader.load_monsters()["goblin"]["ac"] == 15
+
+    def test_copies_are_mutable(self, data_dir):
+        """Test that copies of cached content are plain containers"""
+        loader = DataLoader(data_dir, content_cache=ContentCache(), use_bundle=False)
+        monsters = loader.load_monsters()
+
+        deep = copy.deepcopy(monsters)
+        deep["goblin"]["actions"].append({"name": "Bite"})
+        assert type(deep["goblin"]) is dict
+
+        shallow = copy.copy(monsters)
+        shallow["wolf"] = {}
+        assert "wolf" not in monsters
+
+        # Pickling keeps content read-only (used by content bundles)
+        restored = pickle.loads(pickle.dumps(monsters))
+        assert restored == monsters
+        assert isinstance(restored["goblin"], FrozenDict)
+
+        assert json.loads(json.dumps(monsters)) == monsters
+
+    def test_dungeon_is_private_copy(self, data_dir):
+        """Test that each dungeon load returns independent mutable state"""
+        loader = DataLoader(data_dir, content_cache=ContentCache(), use_bundle=False)
+
+        dungeon = loader.load_dungeon("tiny")
+        dungeon["rooms"]["a"]["searched"] = True
+
+        assert loader.load_dungeon("tiny")["rooms"]["a"]["searched"] is False
+        assert loader.cache_stats()["misses"] == 1
+
+    def test_missing_dungeon_raises(self, data_dir):
+        """Test that missing dungeon files still raise FileNotFoundError"""
+        loader = DataLoader(data_dir, content_cache=ContentCache(), use_bundle=False)
+
+        with pytest.raises(FileNotFoundError):
+            loader.load_dungeon("nowhere")
+
+    def test_create_monster_uses_cache(self, data_dir):
+        """Test that spawning monsters doesn't re-read the bestiary"""
+        loader = DataLoader(data_dir, content_cache=ContentCache(), use_bundle=False)
+
+        for _ in range(5):
+            goblin = loader.create_monster("goblin")
+            assert goblin.name == "Goblin"
+
+        stats = loader.cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 4
+
+    def test_loaders_share_process_cache(self):
+        """Test that default DataLoaders share one cache"""
+        assert DataLoader().content_cache is get_content_cache()
+        assert DataLoader().load_items() is DataLoader().load_items()
+
+    def test_invalidate_and_reset_stats(self, data_dir):
+        """Test dropping cached entries and resetting counters"""
+        cache = ContentCache()
+        loader = DataLoader(data_dir, content_cache=cache, use_bundle=False)
+        loader.load_monsters()
+
+        cache.invalidate()
+        cache.reset_stats()
+        loader.load_monsters()
+
+        assert cache.stats() == {"hits": 0, "misses": 1, "reloads": 0, "files": 1}
@@ -0,0 +1,192 @@
+# ABOUTME: Unit tests for the lazy, sharded content store used by homebrew content packs
+# ABOUTME: Tests on-demand lookups, LRU behavior, iteration, and DataLoader pack integration
+
+import json
+
+import pytest
+
+from dnd_engine.rules.content_store import (
+    ContentPack,
+    LazyContentStore,
+    build_content_pack,
+    build_content_store,
+)
+from dnd_engine.rules.loader import DataLoader, FrozenDict
+from dnd_engine.systems.inventory import Inventory
+
+
+def make_spells(count):
+    """Build a synthetic spell list"""
+    return {
+        f"spell_{i}": {"name": f"Spell {i}", "level": i % 10, "school": "evocation"}
+        for i in range(count)
+    }
+
+
+@pytest.fixture
+def spell_store(tmp_path):
+    """Store holding 500 spells across 8 shards"""
+    build_content_store(make_spells(500), tmp_path / "spells", shard_count=8)
+    store = LazyContentStore(tmp_path / "spells", cache_size=4)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def homebrew_pack(tmp_path):
+    """Compiled pack with one monster, one spell, one weapon, and one consumable"""
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "monsters.json").write_text(json.dumps({
+        "bone_golem": {
+            "name": "Bone Golem",
+            "ac": 14,
+            "hp": "8d10+16",
+            "abilities": {"str": 18, "dex": 9, "con": 15, "int": 3, "wis": 8, "cha": 1},
+            "xp": 700,
+            "actions": [{"name": "Slam", "attack_bonus": 6, "damage": "2d8+4"}]
+        }
+    }))
+    (source / "spells.json").write_text(json.dumps({
+        "bone_spike": {"name": "Bone Spike", "level": 1}
+    }))
+    (source / "items.json").write_text(json.dumps({
+        "weapons": {"bone_club": {"name": "Bone Club", "damage": "1d6"}},
+        "consumables": {"marrow_tonic": {"name": "Marrow Tonic", "effect_type": "healing", "healing": "1d4"}}
+    }))
+    return build_content_pack(source, tmp_path / "pack", shard_count=2)
+
+
+class TestLazyContentStore:
+    """Test the LazyContentStore class"""
+
+    def test_lookup_decodes_single_entry(self, spell_store):
+        """Test fetching one entry by ID"""
+        spell = spell_store["spell_123"]
+
+        assert spell["name"] == "Spell 123"
+        assert isinstance(spell, FrozenDict)
+        assert spell_store.stats()["cached"] == 1
+
+    def test_missing_key(self, spell_store):
+        """Test that unknown IDs raise KeyError and aren't contained"""
+        with pytest.raises(KeyError):
+            spell_store["fireball"]
+        assert "fireball" not in spell_store
+        assert spell_store.get("fireball") is None
+
+    def test_lru_is_bounded(self, spell_store):
+        """Test that the LRU never holds more than cache_size entries"""
+        for i in range(50):
+            spell_store[f"spell_{i}"]
+
+        assert spell_store.stats()["cached"] == 4
+
+    def test_lru_hits(self, spell_store):
+        """Test that hot entries are served from the LRU"""
+        first = spell_store["spell_7"]
+        second = spell_store["spell_7"]
+
+        assert first is second
+        assert spell_store.stats()["hits"] == 1
+        assert spell_store.stats()["misses"] == 1
+
+    def test_only_touched_shards_are_opened(self, spell_store):
+        """Test that shards are mapped lazily"""
+        spell_store["spell_1"]
+        assert spell_store.stats()["open_shards"] == 1
+
+    def test_len_and_iteration(self, spell_store):
+        """Test that iteration yields every key exactly once"""
+        assert len(spell_store) == 500
+        assert sorted(spell_store) == sorted(make_spells(500))
+
+    def test_invalid_shard_count(self, tmp_path):
+        """Test that shard_count must be positive"""
+        with pytest.raises(ValueError):
+            build_content_store({}, tmp_path / "empty", shard_count=0)
+
+    def test_unsupported_format(self, tmp_path):
+        """Test that stores from another format version are rejected"""
+        store_dir = build_content_store({"a": 1}, tmp_path / "store", shard_count=1)
+        (store_dir / "store.json").write_text(json.dumps({"format_version": 999}))
+
+        with pytest.raises(ValueError):
+            LazyContentStore(store_dir)
+
+
+class TestContentPack:
+    """Test content packs and DataLoader integration"""
+
+    def test_pack_lookups(self, homebrew_pack):
+        """Test looking up each kind of content in a pack"""
+        pack = ContentPack(homebrew_pack)
+
+        assert pack.get_monster("bone_golem")["xp"] == 700
+        assert pack.get_spell("bone_spike")["level"] == 1
+        assert pack.get_item("bone_club") == ("weapons", {"name": "Bone Club", "damage": "1d6"})
+        assert pack.get_item("potion_of_healing") is None
+        pack.close()
+
+    def test_loader_get_spell_falls_back_to_pack(self, homebrew_pack):
+        """Test that get_spell checks the SRD first and then the packs"""
+        loader = DataLoader(content_packs=[homebrew_pack])
+
+        assert loader.get_spell("bone_spike")["name"] == "Bone Spike"
+        assert loader.get_spell("fire_bolt")["name"] == "Fire Bolt"
+        with pytest.raises(KeyError):
+            loader.get_spell("wish")
+
+    def test_loader_spawns_pack_monsters(self, homebrew_pack):
+        """Test that create_monsters spawns monsters defined only in a pack"""
+        loader = DataLoader(content_packs=[homebrew_pack])
+
+        golems = loader.create_monsters(["bone_golem", "goblin"])
+
+        assert golems[0].name == "Bone Golem"
+        assert golems[0].monster_id == "bone_golem"
+        assert 24 <= golems[0].max_hp <= 96
+        assert golems[1].name == "Goblin"
+        assert loader.get_monster("bone_golem")["ac"] == 14
+
+    def test_monster_catalog_knows_pack_monsters(self, homebrew_pack):
+        """Test that pack monsters resolve and award their XP"""
+        loader = DataLoader(content_packs=[homebrew_pack])
+        catalog = loader.load_monster_catalog()
+        golem = loader.create_monsters(["bone_golem"])[0]
+
+        assert "bone_golem" in catalog
+        assert catalog.resolve_id(golem) == "bone_golem"
+        assert catalog.get_xp("bone_golem") == 700
+        assert catalog.get_action_table("bone_golem").primary.name == "Slam"
+        assert catalog.get_xp("goblin") == 50
+
+    def test_pack_monsters_do_not_leak_into_shared_catalog(self, homebrew_pack):
+        """Test that loaders without packs still see only the SRD monsters"""
+        DataLoader(content_packs=[homebrew_pack]).load_monster_catalog().get_xp("bone_golem")
+
+        catalog = DataLoader().load_monster_catalog()
+
+        assert "bone_golem" not in catalog
+        assert catalog.get_xp("bone_golem") == 0
+
+    def test_item_registry_knows_pack_items(self, homebrew_pack):
+        """Test that pack items resolve through the item registry"""
+        registry = DataLoader(content_packs=[homebrew_pack]).load_item_registry()
+
+        assert registry.get_item("bone_club")["name"] == "Bone Club"
+        assert registry.get_category("marrow_tonic") == "consumables"
+        assert registry.get_item("potion_of_healing")["name"] == "Potion of Healing"
+        assert registry.get_item("unknown_item") is None
+
+    def test_inventory_uses_pack_consumables(self, homebrew_pack):
+        """Test that Inventory.use_item finds consumables defined only in a pack"""
+        registry = DataLoader(content_packs=[homebrew_pack]).load_item_registry()
+        inventory = Inventory()
+        inventory.add_item("marrow_tonic", "consumables")
+
+        success, item_info = inventory.use_item("marrow_tonic", registry)
+
+        assert success
+        assert item_info["healing"] == "1d4"
+        assert not inventory.has_item("marrow_tonic")
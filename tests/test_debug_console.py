@@ -403,12 +403,47 @@ class TestCharacterManipulation:
         party = Party([character])
         game_state = GameState(party, "test_dungeon")
         console = DebugConsole(game_state, enabled=True)
+        assert character.get_saving_throw_modifier("int") == 3
 
         # Set INT to 20
         console.cmd_set_stat(["Gandalf", "INT", "20"])
 
-        # Verify stat changed
+        # Verify stat changed (and cached modifiers were refreshed)
         assert character.abilities.intelligence == 20
+        assert character.get_saving_throw_modifier("int") == 5
+
+    def test_verify_stats_toggle(self):
+        """Test /verifystats switches derived stat verification on and off"""
+        game_state = GameState(Party([]), "test_dungeon")
+        console = DebugConsole(game_state, enabled=True)
+
+        try:
+            console.cmd_verify_stats(["on"])
+            assert Character.verify_derived_stats is True
+            console.cmd_verify_stats([])
+            assert Character.verify_derived_stats is False
+        finally:
+            Character.verify_derived_stats = False
+
+    def test_event_stats_toggle(self, capsys):
+        """Test /eventstats turns handler timing on, reports it, and turns it off"""
+        from dnd_engine.utils.events import Event, EventType
+
+        game_state = GameState(Party([]), "test_dungeon")
+        console = DebugConsole(game_state, enabled=True)
+        bus = game_state.event_bus
+        bus.subscribe(EventType.TURN_END, lambda event: None)
+
+        console.cmd_event_stats(["on", "50"])
+        assert bus.instrumentation_enabled
+        assert bus.slow_handler_threshold == pytest.approx(0.05)
+
+        bus.emit(Event(type=EventType.TURN_END))
+        console.cmd_event_stats([])
+        assert "turn_end" in capsys.readouterr().out
+
+        console.cmd_event_stats(["off"])
+        assert not bus.instrumentation_enabled
 
 
 class TestCombatManipulation:
@@ -0,0 +1,131 @@
+# ABOUTME: Unit tests for the Character derived-stat cache
+# ABOUTME: Tests cache hits, invalidation on level/ability/proficiency/equipment/condition changes, and the verify switch
+
+import copy
+import logging
+
+import pytest
+
+from dnd_engine.core.character import Character, CharacterClass
+from dnd_engine.core.creature import Abilities
+from dnd_engine.rules.loader import DataLoader
+from dnd_engine.systems.inventory import EquipmentSlot
+
+
+@pytest.fixture
+def items():
+    """Compiled item registry"""
+    return DataLoader().load_item_registry()
+
+
+@pytest.fixture
+def fighter():
+    """Level 4 fighter proficient with martial weapons"""
+    character = Character(
+        name="Aragorn",
+        character_class=CharacterClass.FIGHTER,
+        level=4,
+        abilities=Abilities(16, 14, 14, 10, 12, 10),
+        max_hp=36,
+        ac=16,
+        saving_throw_proficiencies=["str", "con"],
+        skill_proficiencies=["athletics"],
+        weapon_proficiencies=["simple", "martial"],
+        spellcasting_ability="wis"
+    )
+    character.inventory.add_item("longsword", "weapons")
+    return character
+
+
+class TestDerivedStatCache:
+    """Test cached derived stats"""
+
+    def test_repeated_lookups_hit_the_cache(self, fighter, items, monkeypatch):
+        """Test that a second lookup doesn't recompute"""
+        assert fighter.get_attack_bonus("longsword", items) == 5
+
+        monkeypatch.setattr(fighter, "_compute_attack_bonus", lambda *args: pytest.fail("recomputed"))
+        assert fighter.get_attack_bonus("longsword", items) == 5
+
+    def test_keyed_by_weapon_and_source(self, fighter, items):
+        """Test that different weapons and different item data are separate entries"""
+        assert fighter.get_attack_bonus("longsword", items) == 5
+        assert fighter.get_attack_bonus("longbow", items) == 4
+
+        finesse_longsword = {"weapons": {"longsword": {"damage": "1d8", "properties": ["finesse"], "weapon_type": "martial"}}}
+        fighter.abilities = Abilities(10, 18, 14, 10, 12, 10)
+        assert fighter.get_attack_bonus("longsword", finesse_longsword) == 6
+
+    def test_level_up_invalidates(self, fighter, items):
+        """Test that a new level refreshes proficiency-based stats"""
+        assert fighter.get_saving_throw_modifier("str") == 5
+        assert fighter.get_spell_save_dc() == 11
+
+        fighter.level = 5
+
+        assert fighter.get_saving_throw_modifier("str") == 6
+        assert fighter.get_spell_save_dc() == 12
+        assert fighter.get_attack_bonus("longsword", items) == 6
+
+    def test_reassigned_inputs_invalidate(self, fighter, items):
+        """Test that replacing abilities or proficiency lists refreshes stats"""
+        skills = DataLoader().load_skills()
+        assert fighter.get_skill_modifier("athletics", skills) == 5
+        assert fighter.get_damage_bonus("longsword", items) == 3
+
+        fighter.abilities = Abilities(18, 14, 14, 10, 12, 10)
+        fighter.skill_proficiencies = []
+
+        assert fighter.get_skill_modifier("athletics", skills) == 4
+        assert fighter.get_damage_bonus("longsword", items) == 4
+
+    def test_in_place_edits_need_explicit_invalidation(self, fighter):
+        """Test invalidate_derived_stats after editing an ability score in place"""
+        assert fighter.get_saving_throw_modifier("dex") == 2
+
+        fighter.abilities.dexterity = 18
+        fighter.invalidate_derived_stats()
+
+        assert fighter.get_saving_throw_modifier("dex") == 4
+
+    def test_equipment_and_conditions_invalidate(self, fighter, items):
+        """Test that equipping and condition changes drop the cache"""
+        fighter.get_attack_bonus("longsword", items)
+
+        fighter.inventory.equip_item("longsword", EquipmentSlot.WEAPON)
+        fighter.get_saving_throw_modifier("str")
+        assert ("attack", "longsword") not in fighter._derived_stats
+
+        fighter.add_condition("poisoned")
+        assert fighter._derived_stats == {}
+
+    def test_errors_are_not_cached(self, fighter):
+        """Test that invalid lookups keep raising"""
+        with pytest.raises(ValueError):
+            fighter.get_saving_throw_modifier("luck")
+        with pytest.raises(ValueError):
+            fighter.get_saving_throw_modifier("luck")
+
+    def test_copies_start_with_an_empty_cache(self, fighter, items):
+        """Test that deep copies don't carry the cache (or the item data it references)"""
+        fighter.get_attack_bonus("longsword", items)
+
+        clone = copy.deepcopy(fighter)
+
+        assert clone._derived_stats == {}
+        assert clone.get_attack_bonus("longsword", items) == 5
+
+
+class TestVerifyDerivedStats:
+    """Test the debug verification switch"""
+
+    def test_stale_value_is_logged_and_corrected(self, fighter, caplog, monkeypatch):
+        """Test that verification catches an in-place edit that wasn't invalidated"""
+        monkeypatch.setattr(Character, "verify_derived_stats", True)
+        assert fighter.get_saving_throw_modifier("wis") == 1
+
+        fighter.abilities.wisdom = 16
+        with caplog.at_level(logging.WARNING, logger="dnd_engine.core.character"):
+            assert fighter.get_saving_throw_modifier("wis") == 3
+
+        assert "Stale derived stat" in caplog.text
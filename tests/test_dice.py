@@ -2,7 +2,8 @@
 # ABOUTME: Tests dice notation parsing, rolling mechanics, and advantage/disadvantage
 
 import pytest
-from dnd_engine.core.dice import DiceRoller, DiceRoll, format_dice_with_modifier
+from dnd_engine.core import dice as dice_module
+from dnd_engine.core.dice import DiceRoller, DiceRoll, compile_dice, format_dice_with_modifier, parse_dice_notation
 
 
 class TestDiceRoller:
@@ -259,3 +260,147 @@ class TestFormatDiceWithModifier:
         notation = format_dice_with_modifier("1d6", 0)
         result = roller.roll(notation)
         assert result.modifier == 0
+
+
+class TestBatchRolls:
+    """Test roll_many and roll_matrix"""
+
+    @pytest.fixture(params=["numpy", "python"])
+    def backend(self, request, monkeypatch):
+        """Run each test with NumPy and with the pure Python fallback"""
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(dice_module, "np", None)
+        return request.param
+
+    def test_totals_in_range(self, backend):
+        """Test that every total is within the expression's range"""
+        totals = DiceRoller(seed=1).roll_many("2d6+3", 1000)
+
+        assert len(totals) == 1000
+        assert min(totals) >= 5
+        assert max(totals) <= 15
+
+    def test_faces_add_up_to_totals(self, backend):
+        """Test that returned faces match the totals"""
+        totals, faces = DiceRoller(seed=2).roll_many("3d4-1", 50, faces=True)
+
+        assert len(faces) == 50
+        for total, row in zip(totals, faces):
+            assert len(row) == 3
+            assert all(1 <= face <= 4 for face in row)
+            assert total == sum(row) - 1
+
+    def test_reproducible_under_seed(self, backend):
+        """Test that the same seed gives the same batch"""
+        first = DiceRoller(seed=42).roll_many("1d20+5", 200)
+        second = DiceRoller(seed=42).roll_many("1d20+5", 200)
+
+        assert list(first) == list(second)
+
+    def test_batch_stream_independent_of_scalar_rolls(self, backend):
+        """Test that scalar rolls don't shift the batch stream"""
+        plain = DiceRoller(seed=7)
+        interleaved = DiceRoller(seed=7)
+        interleaved.roll("1d20")
+
+        assert list(plain.roll_many("1d8", 20)) == list(interleaved.roll_many("1d8", 20))
+
+    def test_advantage_and_disadvantage(self, backend):
+        """Test best/worst of two per roll"""
+        totals, faces = DiceRoller(seed=3).roll_many("1d20", 100, faces=True, advantage=True)
+        assert all(total == max(row) for total, row in zip(totals, faces))
+
+        totals, faces = DiceRoller(seed=3).roll_many("1d20", 100, faces=True, disadvantage=True)
+        assert all(total == min(row) for total, row in zip(totals, faces))
+
+    def test_roll_matrix(self, backend):
+        """Test one row of totals per expression"""
+        matrix = DiceRoller(seed=4).roll_matrix(["1d20", "2d6+3"], 10)
+
+        assert len(matrix) == 2
+        assert all(1 <= total <= 20 for total in matrix[0])
+        assert all(5 <= total <= 15 for total in matrix[1])
+
+    def test_invalid_arguments(self):
+        """Test validation of batch arguments"""
+        roller = DiceRoller()
+
+        with pytest.raises(ValueError):
+            roller.roll_many("1d20", -1)
+        with pytest.raises(ValueError):
+            roller.roll_many("2d20", 5, advantage=True)
+        with pytest.raises(ValueError):
+            roller.roll_many("bogus", 5)
+
+
+class TestDiceExpression:
+    """Test compiled dice expressions"""
+
+    def test_compound_expression(self):
+        """Test parsing several dice groups and modifiers"""
+        expression = compile_dice("1d8+2d6+3")
+
+        assert [(t.count, t.sides, t.sign) for t in expression.terms] == [(1, 8, 1), (2, 6, 1)]
+        assert expression.modifier == 3
+        assert expression.canonical == "1d8+2d6+3"
+
+    def test_compiled_once(self):
+        """Test that the same notation returns the cached expression"""
+        assert compile_dice("2d6+3") is compile_dice("2d6+3")
+
+    def test_min_max_mean(self):
+        """Test expression statistics"""
+        expression = compile_dice("1d8+2d6+3")
+        assert (expression.min, expression.max, expression.mean) == (6, 23, 14.5)
+
+        subtracted = compile_dice("2d6-1d4")
+        assert (subtracted.min, subtracted.max, subtracted.mean) == (-2, 11, 4.5)
+
+    def test_crit_doubles_dice_not_modifier(self):
+        """Test critical hit expressions"""
+        assert compile_dice("1d8+2d6+3").crit().notation == "2d8+4d6+3"
+        assert compile_dice("d8-1").crit().notation == "2d8-1"
+        assert compile_dice("1d8+3").crit() is compile_dice("2d8+3")
+
+    def test_roll_compound(self):
+        """Test rolling a compound expression"""
+        roller = DiceRoller(seed=1)
+        for _ in range(50):
+            result = roller.roll("1d8+2d6+3")
+            assert len(result.rolls) == 3
+            assert 6 <= result.total <= 23
+            assert result.total == sum(result.rolls) + 3
+
+    def test_subtracted_dice_are_negative(self):
+        """Test that subtracted dice count against the total"""
+        result = DiceRoller(seed=2).roll("1d6-1d6")
+        assert result.rolls[1] < 0
+        assert result.total == sum(result.rolls)
+
+    def test_roll_many_compound(self):
+        """Test batch rolling a compiled compound expression"""
+        expression = compile_dice("1d8+2d6+3")
+        totals = expression.roll_many(DiceRoller(seed=3), 500)
+
+        assert min(totals) >= expression.min
+        assert max(totals) <= expression.max
+
+    def test_invalid_compound_notation(self):
+        """Test malformed compound expressions"""
+        for notation in ["1d8+", "1d8 2d6", "3", "1d8++2", "1d8+x"]:
+            with pytest.raises(ValueError):
+                compile_dice(notation)
+
+    def test_zero_dice_or_sides_rejected(self):
+        """Test that dice groups need at least one die with at least one side"""
+        for notation in ["1d0", "0d6", "d0", "1d8+0d6", "2d6-1d0"]:
+            with pytest.raises(ValueError, match="Invalid dice notation"):
+                compile_dice(notation)
+
+    def test_parse_dice_notation_rejects_compound(self):
+        """Test that the single-group parser still rejects compound notation"""
+        assert parse_dice_notation("3d8+5") == (3, 8, 5)
+        with pytest.raises(ValueError):
+            parse_dice_notation("1d8+2d6")
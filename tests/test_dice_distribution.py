@@ -0,0 +1,134 @@
+# ABOUTME: Unit tests for exact dice and attack probability distributions
+# ABOUTME: Tests convolution, advantage/disadvantage, crit doubling, and CombatEngine odds helpers
+
+from fractions import Fraction
+from itertools import product
+
+import pytest
+
+from dnd_engine.core.combat import CombatEngine
+from dnd_engine.core.dice import DiceRoller
+from dnd_engine.core.dice_distribution import (
+    Distribution,
+    attack_odds,
+    dice_distribution,
+    die_distribution,
+    mixture,
+)
+
+
+def brute_force(count, sides, modifier=0):
+    """Enumerate every outcome of NdS+M"""
+    counts = {}
+    for faces in product(range(1, sides + 1), repeat=count):
+        total = sum(faces) + modifier
+        counts[total] = counts.get(total, 0) + 1
+    return {value: Fraction(n, sides ** count) for value, n in counts.items()}
+
+
+class TestDiceDistribution:
+    """Test distributions of dice expressions"""
+
+    @pytest.mark.parametrize("notation,count,sides,modifier", [
+        ("1d20", 1, 20, 0),
+        ("2d6+3", 2, 6, 3),
+        ("3d4-1", 3, 4, -1),
+        ("5d6", 5, 6, 0),
+    ])
+    def test_matches_enumeration(self, notation, count, sides, modifier):
+        """Test convolution against brute-force enumeration"""
+        assert dict(dice_distribution(notation).items()) == brute_force(count, sides, modifier)
+
+    def test_compound_expression(self):
+        """Test a compound expression's range and mean"""
+        distribution = dice_distribution("1d8+2d6+3")
+
+        assert (distribution.min, distribution.max) == (6, 23)
+        assert distribution.mean == Fraction(29, 2)
+        assert sum(p for _, p in distribution.items()) == 1
+
+    def test_subtracted_dice(self):
+        """Test that subtracted groups are negated"""
+        distribution = dice_distribution("1d4-1d4")
+
+        assert (distribution.min, distribution.max) == (-3, 3)
+        assert distribution.probability(0) == Fraction(4, 16)
+
+    def test_advantage_and_disadvantage(self):
+        """Test keep-highest and keep-lowest of two d20s"""
+        assert dice_distribution("1d20", advantage=True).probability(20) == Fraction(39, 400)
+        assert dice_distribution("1d20", disadvantage=True).probability(1) == Fraction(39, 400)
+        assert dice_distribution("1d20+5", advantage=True).min == 6
+
+        with pytest.raises(ValueError):
+            dice_distribution("2d20", advantage=True)
+
+    def test_critical_doubles_dice(self):
+        """Test crit doubling keeps the modifier"""
+        assert dict(dice_distribution("1d8+3", critical=True).items()) == brute_force(2, 8, 3)
+
+    def test_at_least(self):
+        """Test tail probabilities"""
+        d20 = die_distribution(20)
+
+        assert d20.at_least(11) == Fraction(1, 2)
+        assert d20.at_least(25) == 0
+        assert d20.at_least(-5) == 1
+
+    def test_clamp_min(self):
+        """Test folding negative outcomes into zero"""
+        clamped = dice_distribution("1d4-2").clamp_min(0)
+
+        assert clamped.min == 0
+        assert clamped.probability(0) == Fraction(2, 4)
+
+    def test_mixture_must_sum_to_one(self):
+        """Test mixture validation"""
+        with pytest.raises(ValueError):
+            mixture([(Fraction(1, 2), Distribution.constant(0))])
+
+
+class TestAttackOdds:
+    """Test attack odds and CombatEngine helpers"""
+
+    def test_hit_and_crit_chance(self):
+        """Test hit chance against an AC"""
+        odds = attack_odds("1d8+3", 15, 5)
+
+        # Needs 10+ on the d20: 11 faces out of 20
+        assert odds.hit_chance == Fraction(11, 20)
+        assert odds.crit_chance == Fraction(1, 20)
+
+    def test_natural_rules(self):
+        """Test that a natural 20 always hits and a natural 1 always misses"""
+        assert attack_odds("1d6", 40, 0).hit_chance == Fraction(1, 20)
+        assert attack_odds("1d6", 1, 30).hit_chance == Fraction(19, 20)
+
+    def test_expected_damage(self):
+        """Test expected damage including crits"""
+        odds = attack_odds("1d8+3", 15, 5)
+
+        # 10/20 normal hits * 7.5 + 1/20 crits * 12
+        assert odds.expected_damage == Fraction(10, 20) * Fraction(15, 2) + Fraction(1, 20) * 12
+        assert odds.damage.probability(0) == Fraction(9, 20)
+
+    def test_memoized(self):
+        """Test that odds are cached per (expression, AC, bonus)"""
+        assert attack_odds("1d8+3", 15, 5) is attack_odds("1d8+3", 15, 5)
+
+    def test_combat_engine_helpers(self):
+        """Test the CombatEngine wrappers"""
+        engine = CombatEngine()
+
+        assert engine.get_hit_chance(5, 15) == Fraction(11, 20)
+        assert engine.get_hit_chance(5, 15, advantage=True) > engine.get_hit_chance(5, 15)
+        assert engine.get_crit_chance(advantage=True) == Fraction(39, 400)
+        distribution = engine.get_damage_distribution(5, 15, "2d6+3")
+        assert (distribution.min, distribution.max) == (0, 27)
+
+    def test_matches_simulation(self):
+        """Test the exact hit chance against a seeded batch of rolls"""
+        rolls = DiceRoller(seed=11).roll_many("1d20", 20000)
+        hits = sum(1 for roll in rolls if roll == 20 or (roll != 1 and roll + 4 >= 16))
+
+        assert abs(hits / 20000 - float(attack_odds("1d6", 16, 4).hit_chance)) < 0.02
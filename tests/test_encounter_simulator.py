@@ -0,0 +1,144 @@
+# ABOUTME: Unit tests for the headless encounter simulator
+# ABOUTME: Tests reproducible seeded runs, process-pool parity, policies, and report aggregation
+
+import pytest
+
+from dnd_engine.core.character import Character, CharacterClass
+from dnd_engine.core.creature import Abilities
+from dnd_engine.core.party import Party
+from dnd_engine.systems.encounter_simulator import (
+    CombatPolicy,
+    EncounterOutcome,
+    EncounterSimulator,
+    SimulationReport,
+)
+from dnd_engine.systems.enemy_ai import EnemyPolicy
+from dnd_engine.systems.inventory import EquipmentSlot
+
+
+def make_fighter(name):
+    """Level 1 fighter with a longsword"""
+    fighter = Character(
+        name=name,
+        character_class=CharacterClass.FIGHTER,
+        level=1,
+        abilities=Abilities(16, 12, 14, 10, 10, 10),
+        max_hp=12,
+        ac=16,
+        weapon_proficiencies=["simple", "martial"]
+    )
+    fighter.inventory.add_item("longsword", "weapons")
+    fighter.inventory.equip_item("longsword", EquipmentSlot.WEAPON)
+    return fighter
+
+
+@pytest.fixture
+def party():
+    """Two fighters"""
+    return Party([make_fighter("Aragorn"), make_fighter("Boromir")])
+
+
+class PassivePolicy(CombatPolicy):
+    """Party policy that never acts"""
+
+    def take_turn(self, game_state, creature):
+        pass
+
+
+class PassiveEnemyPolicy(EnemyPolicy):
+    """Enemy policy that never attacks"""
+
+    def choose_target(self, enemy, attack, targets):
+        return None
+
+
+class TestEncounterSimulator:
+    """Test the EncounterSimulator class"""
+
+    def test_seeded_runs_are_reproducible(self, party):
+        """Test that the same seed replays the same encounters"""
+        simulator = EncounterSimulator(party, ["goblin", "goblin"])
+
+        assert simulator.run(20, seed=7).outcomes == simulator.run(20, seed=7).outcomes
+        assert simulator.run(20, seed=7).outcomes != simulator.run(20, seed=8).outcomes
+
+    def test_single_run_replays_from_its_seed(self, party):
+        """Test that an outcome's seed reproduces it"""
+        simulator = EncounterSimulator(party, ["goblin", "wolf"])
+        outcome = simulator.run(5, seed=3).outcomes[2]
+
+        assert simulator.simulate(outcome.seed) == outcome
+
+    def test_process_pool_matches_serial(self, party):
+        """Test that worker processes produce the same results as a serial run"""
+        simulator = EncounterSimulator(party, ["goblin", "goblin", "wolf"])
+
+        serial = simulator.run(12, seed=1)
+        parallel = simulator.run(12, seed=1, workers=2)
+
+        assert parallel.outcomes == serial.outcomes
+        assert parallel.win_rate == serial.win_rate
+
+    def test_party_is_not_modified(self, party):
+        """Test that runs use copies of the party"""
+        EncounterSimulator(party, ["ghoul", "goblin_boss"]).run(5, seed=2)
+
+        assert [c.current_hp for c in party.characters] == [12, 12]
+
+    def test_outcomes_are_consistent(self, party):
+        """Test every run ends in a victory or a downed party"""
+        report = EncounterSimulator(party, ["goblin", "goblin"]).run(30, seed=5)
+
+        for outcome in report.outcomes:
+            assert outcome.rounds >= 1
+            if not outcome.victory:
+                assert outcome.total_party_hp == 0
+
+    def test_custom_policy_times_out(self, party):
+        """Test that a policy that never attacks can't win"""
+        simulator = EncounterSimulator(
+            party,
+            ["goblin"],
+            party_policy=PassivePolicy(),
+            enemy_policy=PassiveEnemyPolicy(),
+            max_rounds=3
+        )
+        report = simulator.run(4, seed=1)
+
+        assert report.wins == 0
+        assert report.timeouts == 4
+        assert report.party_hp_remaining == {24: 4}
+
+    def test_from_room(self, party):
+        """Test building an encounter from a dungeon room"""
+        simulator = EncounterSimulator.from_room(party, "the_unquiet_dead_crypt", "northern_crypt")
+
+        assert simulator.enemy_ids == ["skeleton", "skeleton", "skeleton"]
+        assert simulator.dungeon_name == "the_unquiet_dead_crypt"
+
+
+class TestSimulationReport:
+    """Test report aggregation"""
+
+    def test_aggregates_distributions(self):
+        """Test win rate and distributions"""
+        report = SimulationReport()
+        report.add(EncounterOutcome(1, True, False, 3, {"A": 5, "B": 0}))
+        report.add(EncounterOutcome(2, True, False, 5, {"A": 2, "B": 3}))
+        report.add(EncounterOutcome(3, False, False, 4, {"A": 0, "B": 0}))
+        report.add(EncounterOutcome(4, False, True, 100, {"A": 1, "B": 1}))
+
+        assert report.win_rate == 0.5
+        assert report.timeouts == 1
+        assert report.rounds_to_kill == {3: 1, 5: 1}
+        assert report.rounds_to_defeat == {4: 1}
+        assert report.mean_rounds_to_kill == 4
+        assert report.party_hp_remaining == {5: 2, 0: 1, 2: 1}
+        assert report.member_hp_remaining["A"] == {5: 1, 2: 1, 0: 1, 1: 1}
+
+    def test_empty_report(self):
+        """Test an empty report"""
+        report = SimulationReport()
+
+        assert report.win_rate == 0.0
+        assert report.mean_rounds_to_kill is None
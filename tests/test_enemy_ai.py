@@ -0,0 +1,214 @@
+# ABOUTME: Unit tests for compiled monster action tables and enemy AI policies
+# ABOUTME: Tests Multiattack parsing, battlefield targeting, and GameState enemy turns with swappable policies
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from dnd_engine.core.character import Character, CharacterClass
+from dnd_engine.core.combat import AttackResult
+from dnd_engine.core.creature import Abilities
+from dnd_engine.core.dice import DiceRoller
+from dnd_engine.core.game_state import GameState
+from dnd_engine.core.party import Party
+from dnd_engine.rules.action_table import ActionTable
+from dnd_engine.rules.loader import DataLoader
+from dnd_engine.systems.enemy_ai import Battlefield, EnemyPolicy, FocusWeakestPolicy
+
+
+def make_character(name, hp):
+    """Level 1 fighter with the given HP"""
+    return Character(
+        name=name,
+        character_class=CharacterClass.FIGHTER,
+        level=1,
+        abilities=Abilities(14, 12, 14, 10, 10, 10),
+        max_hp=20,
+        ac=14,
+        current_hp=hp
+    )
+
+
+@pytest.fixture
+def game_state():
+    """Game state with a two-member party fighting a goblin boss"""
+    party = Party([make_character("Aragorn", 15), make_character("Boromir", 6)])
+    state = GameState(party, "test_dungeon", dice_roller=DiceRoller(seed=1))
+    state.active_enemies = state.data_loader.create_monsters(["goblin_boss"])
+    state._start_combat()
+    return state
+
+
+def attack_result(attacker, defender, hit=True):
+    """AttackResult stub for mocked attacks"""
+    return AttackResult(
+        attacker_name=attacker.name,
+        defender_name=defender.name,
+        attack_roll=15,
+        attack_bonus=4,
+        target_ac=defender.ac,
+        hit=hit,
+        damage=5 if hit else 0,
+        critical_hit=False,
+        advantage=False,
+        disadvantage=False
+    )
+
+
+class TestActionTable:
+    """Test compiled action tables"""
+
+    def test_multiattack_with_disadvantage(self):
+        """Test "makes two scimitar attacks. The second attack has disadvantage." """
+        table = DataLoader().load_monster_catalog().get_action_table("goblin_boss")
+
+        steps = table.turn_attacks
+        assert [step.attack.name for step in steps] == ["Scimitar", "Scimitar"]
+        assert [step.disadvantage for step in steps] == [False, True]
+
+    def test_named_multiattack(self):
+        """Test "one with its bite and one with its claws" """
+        table = ActionTable.compile([
+            {"name": "Multiattack", "description": "The beast makes two attacks: one with its bite and one with its claws."},
+            {"name": "Bite", "attack_bonus": 5, "damage": "1d8+3"},
+            {"name": "Claws", "attack_bonus": 5, "damage": "2d6+3"}
+        ])
+
+        assert [step.attack.name for step in table.turn_attacks] == ["Bite", "Claws"]
+
+    def test_unrecognized_multiattack_falls_back_to_primary(self):
+        """Test that a description naming unknown attacks is ignored"""
+        table = ActionTable.compile([
+            {"name": "Multiattack", "description": "The beast makes two tentacle attacks."},
+            {"name": "Bite", "attack_bonus": 5, "damage": "1d8+3"}
+        ])
+
+        assert table.multiattack == ()
+        assert [step.attack.name for step in table.turn_attacks] == ["Bite"]
+
+    def test_reach_range_and_riders(self):
+        """Test melee/ranged flags and saving throw riders"""
+        catalog = DataLoader().load_monster_catalog()
+        goblin = catalog.get_action_table("goblin")
+        ghoul = catalog.get_action_table("ghoul")
+        javelin = catalog.get_action_table("goblin_boss").find("javelin")
+
+        assert [a.name for a in goblin.melee_attacks] == ["Scimitar"]
+        assert [a.name for a in goblin.ranged_attacks] == ["Shortbow"]
+        assert javelin.melee and javelin.ranged
+        assert ghoul.primary.saving_throw["ability"] == "constitution"
+        assert goblin.primary.expected_damage == 5.5
+
+    def test_spawned_creatures_share_table(self):
+        """Test that the table is attached at spawn, not looked up per turn"""
+        loader = DataLoader()
+        goblins = loader.create_monsters(["goblin"], count=2)
+
+        assert goblins[0].action_table is goblins[1].action_table
+        assert goblins[0].action_table is loader.load_monster_catalog().get_action_table("goblin")
+
+
+class TestBattlefield:
+    """Test the battlefield view"""
+
+    def test_sides_and_targets(self):
+        """Test side membership and conscious targets"""
+        hero, downed = make_character("Hero", 10), make_character("Downed", 0)
+        goblin = DataLoader().create_monster("goblin")
+        battlefield = Battlefield([hero, downed], [goblin])
+
+        assert battlefield.is_party_member(hero)
+        assert not battlefield.is_party_member(goblin)
+        assert battlefield.targets_for(goblin) == [hero]
+        assert battlefield.targets_for(hero) == [goblin]
+
+
+class TestFocusWeakestPolicy:
+    """Test the default enemy AI"""
+
+    def test_targets_lowest_hp(self):
+        """Test that the weakest target is chosen"""
+        policy = FocusWeakestPolicy()
+        strong, weak = make_character("Strong", 15), make_character("Weak", 3)
+
+        assert policy.choose_target(None, None, [strong, weak]) is weak
+
+    def test_extinguish_at_low_hp(self):
+        """Test the on_fire decision"""
+        policy = FocusWeakestPolicy()
+        goblin = DataLoader().create_monster("goblin")
+
+        goblin.current_hp = 4
+        assert policy.choose_condition_removal(goblin, ("on_fire",)) == "on_fire"
+        goblin.current_hp = 5
+        assert policy.choose_condition_removal(goblin, ("on_fire",)) is None
+
+
+class TestEnemyTurns:
+    """Test GameState.take_enemy_turn"""
+
+    def test_multiattack_turn(self, game_state):
+        """Test that the goblin boss attacks twice, the second with disadvantage"""
+        boss = game_state.active_enemies[0]
+        game_state.combat_engine.resolve_attack = MagicMock(
+            side_effect=lambda **kwargs: attack_result(kwargs["attacker"], kwargs["defender"], hit=False)
+        )
+
+        turn = game_state.take_enemy_turn(boss)
+
+        calls = game_state.combat_engine.resolve_attack.call_args_list
+        assert [call.kwargs["disadvantage"] for call in calls] == [False, True]
+        assert all(call.kwargs["defender"].name == "Boromir" for call in calls)
+        assert len(turn.attacks) == 2
+
+    def test_retargets_after_a_kill(self, game_state):
+        """Test that a Multiattack switches target when the first attack drops it"""
+        boss = game_state.active_enemies[0]
+
+        def knock_out(**kwargs):
+            kwargs["defender"].current_hp = 0
+            return attack_result(kwargs["attacker"], kwargs["defender"])
+
+        game_state.combat_engine.resolve_attack = MagicMock(side_effect=knock_out)
+        turn = game_state.take_enemy_turn(boss)
+
+        assert [attack.target.name for attack in turn.attacks] == ["Boromir", "Aragorn"]
+
+    def test_policy_is_swappable(self, game_state):
+        """Test plugging in a different policy"""
+
+        class FocusStrongestPolicy(EnemyPolicy):
+            def choose_attacks(self, enemy, table):
+                return table.turn_attacks[:1]
+
+            def choose_target(self, enemy, attack, targets):
+                return max(targets, key=lambda creature: creature.current_hp)
+
+        game_state.enemy_policy = FocusStrongestPolicy()
+        game_state.combat_engine.resolve_attack = MagicMock(
+            side_effect=lambda **kwargs: attack_result(kwargs["attacker"], kwargs["defender"], hit=False)
+        )
+
+        turn = game_state.take_enemy_turn(game_state.active_enemies[0])
+
+        assert [attack.target.name for attack in turn.attacks] == ["Aragorn"]
+
+    def test_records_failed_save_conditions(self, game_state):
+        """Test that conditions from saving throw riders are reported"""
+        ghoul = game_state.data_loader.create_monster("ghoul")
+
+        def paralyze(**kwargs):
+            kwargs["defender"].add_condition("paralyzed")
+            return attack_result(kwargs["attacker"], kwargs["defender"])
+
+        game_state.combat_engine.resolve_attack = MagicMock(side_effect=paralyze)
+        turn = game_state.take_enemy_turn(ghoul)
+
+        assert turn.attacks[0].new_conditions == ("paralyzed",)
+
+    def test_no_attacks(self, game_state):
+        """Test an enemy without rollable attacks"""
+        boss = game_state.active_enemies[0]
+        boss.action_table = ActionTable()
+
+        assert game_state.take_enemy_turn(boss).no_attack_available
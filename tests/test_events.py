@@ -3,7 +3,15 @@
 
 import pytest
 from typing import List
-from dnd_engine.utils.events import EventBus, Event, EventType
+from unittest.mock import Mock
+from dnd_engine.utils.events import (
+    ALL_EVENTS,
+    EVENT_CATEGORIES,
+    Event,
+    EventBus,
+    EventCategory,
+    EventType,
+)
 
 
 class TestEvent:
@@ -228,3 +236,284 @@ class TestEventTypes:
         # Event types should be unique
         event_values = [e.value for e in EventType]
         assert len(event_values) == len(set(event_values)), "Event type values should be unique"
+
+
+class TestQueuedEventBus:
+    """Test queued delivery and batched draining"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.bus = EventBus(queued=True)
+        self.received: List[str] = []
+
+    def test_emit_enqueues_until_drain(self):
+        """Test that a queued bus holds events until drain()"""
+        self.bus.subscribe(EventType.DAMAGE_DEALT, lambda e: self.received.append(e.data['n']))
+
+        self.bus.emit(Event(type=EventType.DAMAGE_DEALT, data={'n': 1}))
+        self.bus.emit(Event(type=EventType.DAMAGE_DEALT, data={'n': 2}))
+
+        assert self.received == []
+        assert self.bus.pending_count() == 2
+
+        assert self.bus.drain() == 2
+        assert self.received == [1, 2]
+        assert self.bus.pending_count() == 0
+
+    def test_events_emitted_while_draining_join_the_drain(self):
+        """Test that cascaded events are delivered after the event that caused them"""
+        def on_damage(event: Event):
+            self.received.append('damage')
+            self.bus.emit(Event(type=EventType.SNEAK_ATTACK))
+
+        self.bus.subscribe(EventType.DAMAGE_DEALT, on_damage)
+        self.bus.subscribe(EventType.DAMAGE_DEALT, lambda e: self.received.append('damage-2'))
+        self.bus.subscribe(EventType.SNEAK_ATTACK, lambda e: self.received.append('sneak'))
+
+        self.bus.emit(Event(type=EventType.DAMAGE_DEALT))
+
+        assert self.bus.drain() == 2
+        assert self.received == ['damage', 'damage-2', 'sneak']
+
+    def test_deferred_block_on_synchronous_bus(self):
+        """Test that deferred() queues events and drains when the outermost block ends"""
+        bus = EventBus()
+        bus.subscribe(EventType.TURN_END, lambda e: self.received.append(e.data['n']))
+
+        with bus.deferred():
+            bus.emit(Event(type=EventType.TURN_END, data={'n': 1}))
+            with bus.deferred():
+                bus.emit(Event(type=EventType.TURN_END, data={'n': 2}))
+            assert self.received == []
+
+        assert self.received == [1, 2]
+
+        bus.emit(Event(type=EventType.TURN_END, data={'n': 3}))
+        assert self.received == [1, 2, 3]
+
+    def test_debug_logging_looked_up_once_per_drain(self, monkeypatch):
+        """Test that the debug logging config is checked once per drain, not per event"""
+        logging_config = Mock(debug_enabled=True)
+        get_config = Mock(return_value=logging_config)
+        monkeypatch.setattr("dnd_engine.utils.events.get_logging_config", get_config)
+
+        for n in range(3):
+            self.bus.emit(Event(type=EventType.DAMAGE_DEALT, data={'n': n}))
+
+        assert self.bus.drain() == 3
+        assert get_config.call_count == 1
+        assert logging_config.log_event.call_count == 3
+
+
+class TestBackgroundSubscribers:
+    """Test subscribers that run off the game-loop thread"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.bus = EventBus()
+
+    def teardown_method(self):
+        """Stop the worker thread"""
+        self.bus.shutdown()
+
+    def test_background_handlers_run_in_order_off_thread(self):
+        """Test that background handlers see events in emit order on another thread"""
+        import threading
+
+        received = []
+        threads = set()
+
+        def handler(event: Event):
+            threads.add(threading.current_thread())
+            received.append(event.data['n'])
+
+        self.bus.subscribe(EventType.ATTACK_ROLL, handler, background=True)
+        for n in range(20):
+            self.bus.emit(Event(type=EventType.ATTACK_ROLL, data={'n': n}))
+
+        assert self.bus.wait_for_background(timeout=5)
+        assert received == list(range(20))
+        assert threading.current_thread() not in threads
+        assert self.bus.subscriber_count(EventType.ATTACK_ROLL) == 1
+
+    def test_coroutine_background_handler(self):
+        """Test that coroutine handlers run without a background loop"""
+        received = []
+
+        async def handler(event: Event):
+            received.append(event.type)
+
+        self.bus.subscribe(EventType.ROOM_ENTER, handler, background=True)
+        self.bus.emit(Event(type=EventType.ROOM_ENTER))
+
+        assert self.bus.wait_for_background(timeout=5)
+        assert received == [EventType.ROOM_ENTER]
+
+    def test_background_error_doesnt_break_synchronous_handlers(self):
+        """Test that a failing background handler leaves other handlers alone"""
+        received = []
+
+        def bad_handler(event: Event):
+            raise ValueError("Background error")
+
+        self.bus.subscribe(EventType.HEALING_DONE, bad_handler, background=True)
+        self.bus.subscribe(EventType.HEALING_DONE, received.append)
+        self.bus.emit(Event(type=EventType.HEALING_DONE))
+
+        assert self.bus.wait_for_background(timeout=5)
+        assert len(received) == 1
+
+    def test_unsubscribe_background_handler(self):
+        """Test removing a background handler"""
+        def handler(event: Event):
+            pass
+
+        self.bus.subscribe(EventType.HEALING_DONE, handler, background=True)
+        self.bus.unsubscribe(EventType.HEALING_DONE, handler)
+
+        assert self.bus.subscriber_count(EventType.HEALING_DONE) == 0
+
+
+class TestSubscriptionTargets:
+    """Test priority, predicate and category/wildcard subscriptions"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.bus = EventBus()
+        self.received: List[str] = []
+
+    def test_every_event_type_has_one_category(self):
+        """Test that categories cover each event type exactly once"""
+        for event_type in EventType:
+            owners = [c for c, types in EVENT_CATEGORIES.items() if event_type in types]
+            assert len(owners) == 1, f"{event_type.name} should belong to exactly one category"
+
+    def test_priority_order(self):
+        """Test that higher priority handlers run first, ties in subscription order"""
+        self.bus.subscribe(EventType.DAMAGE_DEALT, lambda e: self.received.append('low'), priority=-5)
+        self.bus.subscribe(EventType.DAMAGE_DEALT, lambda e: self.received.append('first'))
+        self.bus.subscribe(EventType.DAMAGE_DEALT, lambda e: self.received.append('high'), priority=10)
+        self.bus.subscribe(EventType.DAMAGE_DEALT, lambda e: self.received.append('second'))
+
+        self.bus.emit(Event(type=EventType.DAMAGE_DEALT))
+
+        assert self.received == ['high', 'first', 'second', 'low']
+
+    def test_predicate_filters_events(self):
+        """Test that a predicate limits which events reach the handler"""
+        self.bus.subscribe(
+            EventType.DAMAGE_DEALT,
+            lambda e: self.received.append(e.data['target']),
+            predicate=lambda e: e.data.get('damage', 0) >= 10
+        )
+
+        self.bus.emit(Event(type=EventType.DAMAGE_DEALT, data={'target': 'Goblin', 'damage': 3}))
+        self.bus.emit(Event(type=EventType.DAMAGE_DEALT, data={'target': 'Ogre', 'damage': 12}))
+
+        assert self.received == ['Ogre']
+
+    def test_category_subscription(self):
+        """Test subscribing to all combat events at once"""
+        self.bus.subscribe(EventCategory.COMBAT, lambda e: self.received.append(e.type.name))
+
+        self.bus.emit(Event(type=EventType.ATTACK_ROLL))
+        self.bus.emit(Event(type=EventType.ROOM_ENTER))
+        self.bus.emit(Event(type=EventType.DEATH_SAVE))
+
+        assert self.received == ['ATTACK_ROLL', 'DEATH_SAVE']
+        assert self.bus.subscriber_count(EventType.SNEAK_ATTACK) == 1
+        assert self.bus.subscriber_count(EventType.ROOM_ENTER) == 0
+
+    def test_all_events_subscription(self):
+        """Test subscribing to every event type"""
+        self.bus.subscribe(ALL_EVENTS, lambda e: self.received.append(e.type.name))
+
+        self.bus.emit(Event(type=EventType.LEVEL_UP))
+        self.bus.emit(Event(type=EventType.TIME_SUMMARY))
+
+        assert self.received == ['LEVEL_UP', 'TIME_SUMMARY']
+
+    def test_dispatch_table_rebuilt_after_subscription_change(self):
+        """Test that handlers added or removed after an emit are picked up"""
+        def handler(event: Event):
+            self.received.append('typed')
+
+        self.bus.emit(Event(type=EventType.HEALING_DONE))
+        self.bus.subscribe(EventType.HEALING_DONE, handler)
+        self.bus.subscribe(EventCategory.COMBAT, lambda e: self.received.append('category'))
+        self.bus.emit(Event(type=EventType.HEALING_DONE))
+
+        self.bus.unsubscribe(EventType.HEALING_DONE, handler)
+        self.bus.emit(Event(type=EventType.HEALING_DONE))
+
+        self.bus.clear_subscribers(EventCategory.COMBAT)
+        self.bus.emit(Event(type=EventType.HEALING_DONE))
+
+        assert self.received == ['typed', 'category', 'category']
+
+    def test_invalid_target_rejected(self):
+        """Test that subscribing to an unknown target raises"""
+        with pytest.raises(ValueError):
+            self.bus.subscribe("damage_dealt", lambda e: None)
+
+
+class TestHandlerInstrumentation:
+    """Test per-handler latency recording"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.bus = EventBus()
+
+    def test_disabled_by_default(self):
+        """Test that nothing is recorded until instrumentation is enabled"""
+        self.bus.subscribe(EventType.ATTACK_ROLL, lambda e: None)
+        self.bus.emit(Event(type=EventType.ATTACK_ROLL))
+
+        assert not self.bus.instrumentation_enabled
+        assert self.bus.handler_stats() == []
+
+    def test_records_calls_per_handler(self):
+        """Test call counts and errors per (event type, handler)"""
+        def fast(event: Event):
+            pass
+
+        def broken(event: Event):
+            raise ValueError("boom")
+
+        self.bus.subscribe(EventType.ATTACK_ROLL, fast)
+        self.bus.subscribe(EventType.ATTACK_ROLL, broken)
+        self.bus.subscribe(EventType.ATTACK_ROLL, fast, predicate=lambda e: False)
+        self.bus.enable_instrumentation()
+
+        for _ in range(3):
+            self.bus.emit(Event(type=EventType.ATTACK_ROLL))
+
+        stats = {entry['handler']: entry for entry in self.bus.handler_stats()}
+        assert stats[fast.__qualname__]['count'] == 3
+        assert stats[fast.__qualname__]['errors'] == 0
+        assert stats[broken.__qualname__]['count'] == 3
+        assert stats[broken.__qualname__]['errors'] == 3
+        assert stats[fast.__qualname__]['event_type'] == EventType.ATTACK_ROLL
+
+        self.bus.reset_handler_stats()
+        assert self.bus.handler_stats() == []
+        assert self.bus.instrumentation_enabled
+
+        self.bus.disable_instrumentation()
+        assert not self.bus.instrumentation_enabled
+
+    def test_slow_handler_logged(self, caplog):
+        """Test that calls over the threshold log a warning"""
+        import time
+
+        def slow(event: Event):
+            time.sleep(0.002)
+
+        self.bus.subscribe(EventType.DAMAGE_DEALT, slow)
+        self.bus.enable_instrumentation(slow_threshold_ms=1)
+
+        with caplog.at_level("WARNING", logger="dnd_engine.utils.events"):
+            self.bus.emit(Event(type=EventType.DAMAGE_DEALT))
+
+        assert "Slow event handler" in caplog.text
+        assert self.bus.handler_stats()[0]['max_ms'] >= 2
@@ -358,6 +358,107 @@ class TestInitiativeTracker:
         assert self.tracker.combatants[0].creature == goblin2
 
 
+class TestMassBattle:
+    """Test bulk insertion, group initiative, and indexed lookups"""
+
+    def make_creatures(self, count, monster_id=None, dex=12):
+        """Creatures with distinct names"""
+        abilities = Abilities(10, dex, 10, 10, 10, 10)
+        return [
+            Creature(f"{monster_id or 'Creature'} {i}", 7, 12, abilities, monster_id=monster_id)
+            for i in range(count)
+        ]
+
+    def test_bulk_add_matches_sequential_add(self):
+        """Test that add_combatants gives the same order as repeated add_combatant"""
+        creatures = self.make_creatures(50)
+
+        bulk = InitiativeTracker(DiceRoller(seed=3))
+        bulk.add_combatants(creatures)
+        sequential = InitiativeTracker(DiceRoller(seed=3))
+        for creature in creatures:
+            sequential.add_combatant(creature)
+
+        assert [e.creature for e in bulk.combatants] == [e.creature for e in sequential.combatants]
+        totals = [e.initiative_total for e in bulk.combatants]
+        assert totals == sorted(totals, reverse=True)
+
+    def test_get_entry(self):
+        """Test looking up a creature's entry"""
+        tracker = InitiativeTracker(DiceRoller(seed=1))
+        creatures = self.make_creatures(10)
+        tracker.add_combatants(creatures)
+
+        assert tracker.get_entry(creatures[4]).creature is creatures[4]
+        assert tracker.get_entry(self.make_creatures(1)[0]) is None
+
+    def test_insert_mid_combat_keeps_current_turn(self):
+        """Test that reinforcements don't change whose turn it is"""
+        tracker = InitiativeTracker(DiceRoller(seed=5))
+        tracker.add_combatants(self.make_creatures(6))
+        tracker.next_turn()
+        tracker.next_turn()
+        current = tracker.get_current_combatant().creature
+
+        tracker.add_combatants(self.make_creatures(20, monster_id="goblin"))
+        assert tracker.get_current_combatant().creature is current
+
+        tracker.add_combatant(self.make_creatures(1, monster_id="wolf")[0])
+        assert tracker.get_current_combatant().creature is current
+
+    def test_group_initiative_shares_roll(self):
+        """Test that identical monsters act together on one roll"""
+        tracker = InitiativeTracker(DiceRoller(seed=2), group_initiative=True)
+        goblins = self.make_creatures(8, monster_id="goblin")
+        wolves = self.make_creatures(4, monster_id="wolf", dex=15)
+        tracker.add_combatants(goblins + wolves)
+
+        goblin_rolls = {tracker.get_entry(goblin).initiative_roll for goblin in goblins}
+        assert len(goblin_rolls) == 1
+        assert tracker.get_group(goblins[0]) == goblins
+
+        order = [e.creature for e in tracker.combatants]
+        first = order.index(goblins[0])
+        assert order[first:first + 8] == goblins
+
+    def test_group_initiative_off_by_default(self):
+        """Test that each monster rolls separately by default"""
+        tracker = InitiativeTracker(DiceRoller(seed=2))
+        goblins = self.make_creatures(8, monster_id="goblin")
+        tracker.add_combatants(goblins)
+
+        assert tracker.get_group(goblins[0]) == [goblins[0]]
+        assert len({tracker.get_entry(goblin).initiative_roll for goblin in goblins}) > 1
+
+    def test_remove_from_large_order(self):
+        """Test removing many combatants keeps the order and turn states consistent"""
+        tracker = InitiativeTracker(DiceRoller(seed=9))
+        creatures = self.make_creatures(300)
+        tracker.add_combatants(creatures)
+        current = tracker.get_current_combatant().creature
+
+        doomed = [c for i, c in enumerate(creatures) if i % 3 == 0 and c is not current]
+        for creature in doomed:
+            tracker.remove_combatant(creature)
+
+        assert len(tracker.combatants) == 300 - len(doomed)
+        assert tracker.get_current_combatant().creature is current
+        assert all(tracker.get_entry(creature) is None for creature in doomed)
+        assert doomed[0] not in tracker.turn_states
+        assert len(tracker.turn_states) == len(tracker.combatants)
+
+    def test_turn_states_by_creature(self):
+        """Test the turn state mapping"""
+        tracker = InitiativeTracker(DiceRoller(seed=1))
+        creatures = self.make_creatures(3)
+        tracker.add_combatants(creatures)
+
+        assert set(tracker.turn_states) == set(creatures)
+        assert tracker.get_current_turn_state() is tracker.turn_states[tracker.get_current_combatant().creature]
+        with pytest.raises(KeyError):
+            tracker.turn_states[self.make_creatures(1)[0]]
+
+
 class TestInitiativeEntry:
     """Test the InitiativeEntry class"""
 
@@ -0,0 +1,138 @@
+# ABOUTME: Unit tests for the flat item registry
+# ABOUTME: Tests ID resolution across categories, compiled fields, and registry-backed combat and inventory lookups
+
+import pytest
+
+from dnd_engine.core.character import Character, CharacterClass
+from dnd_engine.core.creature import Abilities
+from dnd_engine.rules.item_registry import ItemRegistry
+from dnd_engine.rules.loader import DataLoader
+from dnd_engine.systems.inventory import Inventory
+
+
+@pytest.fixture
+def registry():
+    """Registry over the SRD items"""
+    return DataLoader().load_item_registry()
+
+
+@pytest.fixture
+def rogue():
+    """Rogue with higher DEX than STR"""
+    return Character(
+        name="Test Rogue",
+        character_class=CharacterClass.ROGUE,
+        level=1,
+        abilities=Abilities(10, 16, 12, 10, 10, 10),
+        max_hp=9,
+        ac=14,
+        weapon_proficiencies=["simple", "rapiers", "shortswords"]
+    )
+
+
+class TestItemRegistry:
+    """Test the ItemRegistry class"""
+
+    def test_resolves_any_category(self, registry):
+        """Test that IDs resolve without knowing their category"""
+        assert registry.get_category("longsword") == "weapons"
+        assert registry.get_category("chain_mail") == "armor"
+        assert registry.get_category("potion_of_healing") == "consumables"
+        assert registry.get_category("thieves_tools") == "tools"
+        assert registry.get_category("vorpal_sword") is None
+        assert registry.resolve("vorpal_sword") is None
+
+    def test_compiled_weapon_fields(self, registry):
+        """Test precomputed damage dice and weapon flags"""
+        rapier = registry.resolve("rapier")
+        longbow = registry.resolve("longbow")
+
+        assert rapier.damage_dice == (1, 8, 0)
+        assert rapier.is_finesse and not rapier.is_ranged
+        assert longbow.is_ranged and not longbow.is_finesse
+        assert registry.resolve("alchemists_fire").damage_dice == (1, 4, 0)
+
+    def test_compiled_armor_and_value(self, registry):
+        """Test armor type and value in copper"""
+        chain_mail = registry.resolve("chain_mail")
+
+        assert chain_mail.armor_type == "heavy"
+        assert chain_mail.base_ac == 16
+        assert chain_mail.value_cp == chain_mail.value * 100
+
+    def test_behaves_like_items_dict(self, registry):
+        """Test that the registry can stand in for the items.json dict"""
+        items = DataLoader().load_items()
+
+        assert set(registry) == set(items)
+        assert registry["weapons"] is items["weapons"]
+        assert registry.get_item("dagger") is items["weapons"]["dagger"]
+
+    def test_get_weapon_rejects_non_weapons(self, registry):
+        """Test that get_weapon only returns weapons"""
+        with pytest.raises(KeyError):
+            registry.get_weapon("chain_mail")
+
+    def test_registry_is_shared(self):
+        """Test that the registry is built once and reused"""
+        assert DataLoader().load_item_registry() is DataLoader().load_item_registry()
+
+
+class TestRegistryLookups:
+    """Test that registry-backed lookups match the dictionary walks"""
+
+    @pytest.mark.parametrize("weapon_id", ["rapier", "longbow", "greataxe", "dagger", "shortsword"])
+    def test_attack_and_damage_bonus_match_dict(self, rogue, registry, weapon_id):
+        """Test weapon bonuses with both data sources"""
+        items = DataLoader().load_items()
+
+        assert rogue.get_attack_bonus(weapon_id, registry) == rogue.get_attack_bonus(weapon_id, items)
+        assert rogue.get_damage_bonus(weapon_id, registry) == rogue.get_damage_bonus(weapon_id, items)
+        assert (rogue.is_proficient_with_weapon(weapon_id, registry)
+                == rogue.is_proficient_with_weapon(weapon_id, items))
+
+    def test_unknown_weapon_raises(self, rogue, registry):
+        """Test that unknown weapons still raise KeyError"""
+        with pytest.raises(KeyError):
+            rogue.get_attack_bonus("vorpal_sword", registry)
+
+    def test_total_value_matches_dict(self, registry):
+        """Test inventory value with both data sources"""
+        inventory = Inventory()
+        inventory.add_item("longsword", "weapons")
+        inventory.add_item("potion_of_healing", "consumables", quantity=3)
+        inventory.add_item("chain_mail", "armor")
+
+        assert inventory.total_value(registry) == inventory.total_value(DataLoader().load_items())
+
+    def test_total_value_in_copper(self):
+        """Test that fractional gold values are summed exactly"""
+        registry = ItemRegistry({"consumables": {"torch": {"name": "Torch", "value": 0.01}}})
+        inventory = Inventory()
+        inventory.add_item("torch", "consumables", quantity=30)
+
+        assert inventory.total_value(registry) == 0.3
+
+
+class TestCombatAttackItems:
+    """Test registry-backed combat attack items in GameState"""
+
+    def test_throw_alchemists_fire(self, rogue):
+        """Test that throwing Alchemist's Fire consumes it and resolves an attack"""
+        from dnd_engine.core.creature import Creature
+        from dnd_engine.core.game_state import GameState
+        from dnd_engine.core.party import Party
+        from dnd_engine.systems.initiative import InitiativeTracker
+
+        game_state = GameState(Party([rogue]), "the_unquiet_dead_crypt")
+        target = Creature(name="Goblin", max_hp=7, ac=10, abilities=Abilities(8, 14, 10, 10, 8, 8))
+        game_state.initiative_tracker = InitiativeTracker(game_state.dice_roller)
+        game_state.initiative_tracker.add_combatant(rogue)
+        rogue.inventory.add_item("alchemists_fire", "consumables")
+
+        result = game_state.use_combat_attack_item(rogue, "alchemists_fire", target)
+
+        assert result.success is True
+        assert result.attack_result is not None
+        assert result.item_name == "Alchemist's Fire"
+        assert not rogue.inventory.has_item("alchemists_fire")
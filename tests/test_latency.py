@@ -0,0 +1,63 @@
+# ABOUTME: Unit tests for the fixed-memory latency histogram
+# ABOUTME: Tests counts, cumulative time, and percentile accuracy
+
+import pytest
+from dnd_engine.utils.latency import LatencyHistogram, BUCKET_COUNT
+
+
+class TestLatencyHistogram:
+    """Test the LatencyHistogram class"""
+
+    def test_empty_histogram(self):
+        """Test that an empty histogram reports zeros"""
+        histogram = LatencyHistogram()
+
+        assert histogram.count == 0
+        assert histogram.mean_seconds == 0.0
+        assert histogram.percentile(99) == 0.0
+
+    def test_totals(self):
+        """Test count, total, mean and max"""
+        histogram = LatencyHistogram()
+        for seconds in (0.001, 0.002, 0.003):
+            histogram.record(seconds)
+
+        assert histogram.count == 3
+        assert histogram.total_seconds == pytest.approx(0.006)
+        assert histogram.mean_seconds == pytest.approx(0.002)
+        assert histogram.max_seconds == pytest.approx(0.003)
+
+    def test_percentiles_within_one_bucket(self):
+        """Test that percentiles are within one bucket (~19%) of the exact value"""
+        histogram = LatencyHistogram()
+        for micros in range(1, 1001):
+            histogram.record(micros / 1_000_000)
+
+        for percent, exact in ((50, 500e-6), (95, 950e-6), (99, 990e-6)):
+            value = histogram.percentile(percent)
+            assert exact <= value <= exact * 1.19 + 1e-9
+
+        assert histogram.percentile(100) == pytest.approx(1000e-6)
+
+    def test_fixed_memory(self):
+        """Test that extreme values land in the edge buckets"""
+        histogram = LatencyHistogram()
+        histogram.record(0.0)
+        histogram.record(1000.0)
+
+        assert len(histogram._buckets) == BUCKET_COUNT
+        assert histogram._buckets[0] == 1
+        assert histogram._buckets[-1] == 1
+        assert histogram.percentile(100) == 1000.0
+
+    def test_to_dict_in_milliseconds(self):
+        """Test the summary dictionary"""
+        histogram = LatencyHistogram()
+        histogram.record(0.004)
+
+        summary = histogram.to_dict()
+
+        assert summary['count'] == 1
+        assert summary['errors'] == 0
+        assert summary['total_ms'] == pytest.approx(4.0)
+        assert summary['p50_ms'] == pytest.approx(4.0)
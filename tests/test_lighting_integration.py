@@ -305,3 +305,28 @@ class TestCompleteWorkflow:
         # Still bright due to Light spell
         assert game_state.get_effective_lighting(wizard_with_light_spell) == "bright"
         assert game_state.get_effective_lighting(dwarf_cleric) == "bright"
+
+
+class TestRoomNarrativeData:
+    """Test room data built for LLM narration of current and neighboring rooms."""
+
+    def test_adjacent_room_data_matches_data_on_arrival(self, wizard_with_light_spell, dwarf_cleric):
+        """Test that data built for a neighbor matches the data built after moving there."""
+        from dnd_engine.llm.enhancer import LLMEnhancer
+
+        party = Party([wizard_with_light_spell, dwarf_cleric])
+        game_state = GameState(party, "the_unquiet_dead_crypt")
+        game_state.mark_room_displayed()
+
+        assert "hall_of_the_dead" in game_state.get_adjacent_room_ids()
+        predicted = game_state.build_room_narrative_data("hall_of_the_dead")
+
+        # Lighting is for the neighboring room, not the current one
+        assert [entry["lighting"] for entry in predicted["party_lighting"]] == ["dark", "dim"]
+        assert predicted["previous_room_id"] == "graveyard_entrance"
+
+        assert game_state.move("down") is True
+        actual = game_state.build_room_narrative_data()
+
+        assert predicted == actual
+        assert LLMEnhancer._room_cache_key(predicted) == LLMEnhancer._room_cache_key(actual)
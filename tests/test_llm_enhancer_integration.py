@@ -1,6 +1,7 @@
 """Integration tests for LLM enhancer with event bus."""
 
 import asyncio
+import time
 from typing import Optional
 from unittest.mock import AsyncMock, MagicMock
 
@@ -571,3 +572,158 @@ class TestLLMEnhancer:
         description4 = enhancer.get_room_description_sync(room_data_bright, timeout=3.0)
         assert description4 == "Description 2"  # Same cached response
         assert mock_provider.call_count == 2  # No new call
+
+
+class TestPersistentNarrativeCache:
+    """Test the enhancer with an on-disk narrative cache."""
+
+    def test_new_session_reuses_room_description(self, tmp_path) -> None:
+        """Test that a second session answers from the cache without calling the provider."""
+        from dnd_engine.llm.narrative_cache import NarrativeCache
+
+        path = tmp_path / "llm_cache.sqlite3"
+        room_data = {"id": "crypt", "name": "Crypt", "description": "A cold crypt"}
+
+        provider = MockLLMProvider(response="Bones rattle in the dark.")
+        enhancer = LLMEnhancer(provider, EventBus(), narrative_cache=NarrativeCache(path))
+        assert enhancer.get_room_description_sync(room_data, timeout=3.0) == "Bones rattle in the dark."
+        enhancer.shutdown()
+        enhancer.narrative_cache.close()
+
+        provider = MockLLMProvider(response="Something else")
+        enhancer = LLMEnhancer(provider, EventBus(), narrative_cache=NarrativeCache(path))
+        assert enhancer.get_room_description_sync(room_data, timeout=3.0) == "Bones rattle in the dark."
+        assert provider.call_count == 0
+        assert enhancer.narrative_cache.stats()["hits"] == 1
+        enhancer.shutdown()
+
+    def test_failed_generation_not_cached(self) -> None:
+        """Test that empty provider responses are not stored."""
+        from dnd_engine.llm.narrative_cache import NarrativeCache
+
+        provider = MockLLMProvider(response=None)
+        enhancer = LLMEnhancer(provider, EventBus(), narrative_cache=NarrativeCache(":memory:"))
+
+        assert enhancer.get_death_narrative_sync({"name": "Thorin"}, timeout=3.0) is None
+        assert len(enhancer.narrative_cache) == 0
+        enhancer.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_async_handler_uses_cache(self) -> None:
+        """Test that event-driven enhancements share the persistent cache."""
+        from dnd_engine.llm.narrative_cache import NarrativeCache
+
+        provider = MockLLMProvider(response="The heroes stand victorious!")
+        event_bus = EventBus()
+        enhancer = LLMEnhancer(provider, event_bus, narrative_cache=NarrativeCache(":memory:"))
+
+        texts = []
+        event_bus.subscribe(EventType.DESCRIPTION_ENHANCED, lambda event: texts.append(event.data["text"]))
+
+        for _ in range(2):
+            event_bus.emit(Event(EventType.COMBAT_END, {"enemies": ["Goblin"]}))
+            await asyncio.sleep(0.1)
+
+        assert texts == ["The heroes stand victorious!"] * 2
+        assert provider.call_count == 1
+        enhancer.shutdown()
+
+
+class SlowMockProvider(MockLLMProvider):
+    """Mock provider that tracks how many generations run at once."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        super().__init__(response=None)
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.prompts = []
+
+    async def generate(self, prompt: str, temperature: float = 0.7) -> Optional[str]:
+        """Return a description naming the room after a delay."""
+        self.call_count += 1
+        self.prompts.append(prompt)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return f"Described: {prompt.count('Room')}"
+
+
+def _neighbor(room_id: str) -> dict:
+    """Room data for a neighbor entered from room_a."""
+    return {
+        "id": room_id,
+        "name": f"Room {room_id}",
+        "description": f"Room {room_id} is empty",
+        "previous_room_id": "room_a",
+        "party_lighting": [{"character": "Tim", "lighting": "bright"}],
+    }
+
+
+class TestRoomPrefetch:
+    """Test speculative prefetch of neighboring room descriptions."""
+
+    def test_prefetch_warms_cache_for_next_room(self) -> None:
+        """Test that moving into a prefetched room needs no new LLM call."""
+        provider = SlowMockProvider(delay=0.01)
+        enhancer = LLMEnhancer(provider, EventBus())
+
+        enhancer.prefetch_room_descriptions([_neighbor("room_b"), _neighbor("room_c")])
+        time.sleep(0.2)
+        assert provider.call_count == 2
+
+        description = enhancer.get_room_description_sync(_neighbor("room_b"), timeout=3.0)
+        assert description is not None
+        assert provider.call_count == 2
+        enhancer.shutdown()
+
+    def test_sync_call_waits_for_in_flight_prefetch(self) -> None:
+        """Test that a visit during a prefetch reuses it instead of generating twice."""
+        provider = SlowMockProvider(delay=0.2)
+        enhancer = LLMEnhancer(provider, EventBus())
+
+        enhancer.prefetch_room_descriptions([_neighbor("room_b")])
+        description = enhancer.get_room_description_sync(_neighbor("room_b"), timeout=3.0)
+
+        assert description is not None
+        assert provider.call_count == 1
+        enhancer.shutdown()
+
+    def test_concurrency_budget(self) -> None:
+        """Test that no more than prefetch_concurrency generations run at once."""
+        provider = SlowMockProvider(delay=0.05)
+        enhancer = LLMEnhancer(provider, EventBus(), prefetch_concurrency=2)
+
+        enhancer.prefetch_room_descriptions([_neighbor(f"room_{n}") for n in range(5)])
+        time.sleep(0.5)
+
+        assert provider.call_count == 5
+        assert provider.max_active == 2
+        enhancer.shutdown()
+
+    def test_irrelevant_prefetches_cancelled(self) -> None:
+        """Test that prefetches for rooms no longer adjacent are cancelled."""
+        provider = SlowMockProvider(delay=0.2)
+        enhancer = LLMEnhancer(provider, EventBus(), prefetch_concurrency=1)
+
+        enhancer.prefetch_room_descriptions([_neighbor("room_b"), _neighbor("room_c")])
+        stale = dict(enhancer._prefetches)
+        enhancer.prefetch_room_descriptions([_neighbor("room_d")])
+
+        assert all(future.cancelled() for future in stale.values())
+        assert list(enhancer._prefetches) == [LLMEnhancer._room_cache_key(_neighbor("room_d"))]
+        enhancer.shutdown()
+
+    def test_prefetch_disabled(self) -> None:
+        """Test that a zero budget turns prefetch off."""
+        provider = SlowMockProvider(delay=0.01)
+        enhancer = LLMEnhancer(provider, EventBus(), prefetch_concurrency=0)
+
+        enhancer.prefetch_room_descriptions([_neighbor("room_b")])
+        time.sleep(0.1)
+
+        assert provider.call_count == 0
+        enhancer.shutdown()
@@ -0,0 +1,83 @@
+# ABOUTME: Unit tests for slotted game objects and the memory benchmark
+# ABOUTME: Tests that hot objects have no per-instance __dict__ and use less memory than dict-backed equivalents
+
+import copy
+import pickle
+
+import pytest
+
+from dnd_engine.core.character import Character, CharacterClass
+from dnd_engine.core.creature import Abilities
+from dnd_engine.utils.memory_benchmark import (
+    benchmark_prototypes,
+    format_report,
+    measure_class,
+    run_benchmark,
+    slot_names,
+)
+
+
+@pytest.fixture
+def fighter():
+    """Level 1 fighter"""
+    return Character(
+        name="Aragorn",
+        character_class=CharacterClass.FIGHTER,
+        level=1,
+        abilities=Abilities(16, 12, 14, 10, 10, 10),
+        max_hp=12,
+        ac=16
+    )
+
+
+class TestSlottedObjects:
+    """Test that hot objects are slotted"""
+
+    @pytest.mark.parametrize("prototype", benchmark_prototypes(), ids=lambda obj: type(obj).__name__)
+    def test_no_instance_dict(self, prototype):
+        """Test that no __dict__ is allocated for a normally built object"""
+        assert slot_names(type(prototype))
+        if isinstance(prototype, Character):
+            # Characters keep a lazily allocated __dict__ for ad-hoc attributes
+            assert not object.__getattribute__(prototype, "__dict__")
+        else:
+            assert not hasattr(prototype, "__dict__")
+
+    def test_character_ad_hoc_attributes(self, fighter):
+        """Test that extension attributes still work on characters"""
+        fighter.tool_proficiencies = ["thieves_tools"]
+
+        assert fighter.tool_proficiencies == ["thieves_tools"]
+        assert "tool_proficiencies" not in slot_names(Character)
+
+    def test_character_copy_and_pickle(self, fighter):
+        """Test that slot state survives copying and the derived-stat cache does not"""
+        fighter.get_saving_throw_modifier("str")
+        fighter.tool_proficiencies = ["thieves_tools"]
+
+        for clone in (copy.deepcopy(fighter), pickle.loads(pickle.dumps(fighter))):
+            assert clone.name == "Aragorn"
+            assert clone.level == 1
+            assert clone.tool_proficiencies == ["thieves_tools"]
+            assert clone._derived_stats == {}
+            assert clone.get_saving_throw_modifier("str") == fighter.get_saving_throw_modifier("str")
+
+
+class TestMemoryBenchmark:
+    """Test the memory benchmark"""
+
+    def test_slots_are_smaller(self):
+        """Test that every slotted class beats its dict-backed equivalent"""
+        results = run_benchmark(count=500)
+
+        assert len(results) == len(benchmark_prototypes())
+        for result in results:
+            assert result.slotted_bytes < result.dict_bytes, result.class_name
+            assert 0 < result.reduction < 1
+
+    def test_measure_class(self, fighter):
+        """Test a single comparison and the report"""
+        result = measure_class(fighter, count=200)
+
+        assert result.class_name == "Character"
+        assert "Character" in format_report([result])
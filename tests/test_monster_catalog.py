@@ -0,0 +1,164 @@
+# ABOUTME: Unit tests for the indexed monster catalog
+# ABOUTME: Tests name/id, XP, and primary attack lookups and template IDs on spawned creatures
+
+import pytest
+
+from dnd_engine.core.creature import Abilities, Creature
+from dnd_engine.rules.loader import DataLoader
+from dnd_engine.rules.monster_catalog import MonsterCatalog
+
+
+@pytest.fixture
+def catalog():
+    """Catalog over a small hand-written bestiary"""
+    abilities = {"str": 10, "dex": 14, "con": 10, "int": 10, "wis": 8, "cha": 8}
+    return MonsterCatalog({
+        "goblin_boss": {
+            "name": "Goblin Boss",
+            "ac": 17,
+            "hp": "6d6",
+            "abilities": abilities,
+            "xp": 200,
+            "actions": [
+                {"name": "Multiattack", "description": "Two attacks"},
+                {"name": "Scimitar", "attack_bonus": 4, "damage": "1d6+2"}
+            ]
+        },
+        "goblin": {
+            "name": "Goblin",
+            "ac": 15,
+            "hp": "2d6",
+            "abilities": abilities,
+            "xp": 50,
+            "actions": [{"name": "Scimitar", "attack_bonus": 4, "damage": "1d6+2"}]
+        },
+        "shrieker": {"name": "Shrieker", "ac": 5, "hp": "5d8", "abilities": abilities, "actions": []}
+    })
+
+
+def make_creature(name, monster_id=None):
+    """Create a bare creature for lookup tests"""
+    abilities = Abilities(10, 10, 10, 10, 10, 10)
+    return Creature(name=name, max_hp=5, ac=10, abilities=abilities, monster_id=monster_id)
+
+
+class TestMonsterCatalog:
+    """Test the MonsterCatalog class"""
+
+    def test_name_to_id(self, catalog):
+        """Test looking up IDs by display name"""
+        assert catalog.id_for_name("Goblin Boss") == "goblin_boss"
+        assert catalog.id_for_name("Owlbear") is None
+
+    def test_xp_lookup(self, catalog):
+        """Test XP values, defaulting to 0"""
+        assert catalog.get_xp("goblin") == 50
+        assert catalog.get_xp("shrieker") == 0
+        assert catalog.get_xp(None) == 0
+
+    def test_primary_attack_skips_multiattack(self, catalog):
+        """Test that the primary attack is the first rollable action"""
+        assert catalog.get_primary_attack("goblin_boss")["name"] == "Scimitar"
+        assert catalog.get_primary_attack("shrieker") is None
+
+    def test_resolve_prefers_template_id(self, catalog):
+        """Test that a creature's template ID wins over its display name"""
+        renamed = make_creature("Grik the Sneaky", monster_id="goblin")
+        assert catalog.resolve_id(renamed) == "goblin"
+
+    def test_resolve_falls_back_to_name(self, catalog):
+        """Test resolving creatures that weren't spawned from a template"""
+        assert catalog.resolve_id(make_creature("Goblin")) == "goblin"
+        assert catalog.resolve_id(make_creature("Villager")) is None
+
+    def test_contains_and_len(self, catalog):
+        """Test membership and size"""
+        assert "goblin" in catalog
+        assert "owlbear" not in catalog
+        assert len(catalog) == 3
+
+
+class TestDataLoaderCatalog:
+    """Test catalog integration with DataLoader"""
+
+    def test_catalog_is_shared(self):
+        """Test that the catalog is built once and reused"""
+        assert DataLoader().load_monster_catalog() is DataLoader().load_monster_catalog()
+
+    def test_spawned_creature_carries_template_id(self):
+        """Test that create_monster stamps the monster ID on the creature"""
+        goblin = DataLoader().create_monster("goblin")
+        assert goblin.monster_id == "goblin"
+
+    def test_unknown_monster_raises(self):
+        """Test that unknown monster IDs still raise KeyError"""
+        with pytest.raises(KeyError):
+            DataLoader().create_monster("not_a_monster")
+
+
+class TestMonsterTemplates:
+    """Test compiled templates and batch spawning"""
+
+    def test_template_is_compiled(self, catalog):
+        """Test that stat blocks are compiled into parsed fields"""
+        template = catalog.get_compiled("goblin_boss")
+
+        assert template.hp_count == 6
+        assert template.hp_sides == 6
+        assert template.hp_modifier == 0
+        assert template.ability_scores == (10, 14, 10, 10, 8, 8)
+
+    def test_template_is_immutable(self, catalog):
+        """Test that templates can't be modified"""
+        template = catalog.get_compiled("goblin")
+
+        with pytest.raises(AttributeError):
+            template.ac = 30
+
+    def test_spawned_creatures_are_independent(self, catalog):
+        """Test that clones don't share mutable state"""
+        template = catalog.get_compiled("goblin")
+        first = template.spawn(7)
+        second = template.spawn(5)
+
+        first.abilities.strength = 20
+        first.add_condition("prone")
+
+        assert second.abilities.strength == 10
+        assert not second.has_condition("prone")
+        assert (first.max_hp, second.max_hp) == (7, 5)
+
+    def test_create_monsters_batch(self):
+        """Test spawning several monsters of several types at once"""
+        loader = DataLoader()
+        creatures = loader.create_monsters(["goblin", "wolf"], count=3)
+
+        assert [c.monster_id for c in creatures] == ["goblin"] * 3 + ["wolf"] * 3
+        assert len({id(c.abilities) for c in creatures}) == 6
+        for creature in creatures:
+            assert 1 <= creature.max_hp
+            assert creature.current_hp == creature.max_hp
+
+    def test_create_monsters_hp_in_dice_range(self):
+        """Test that rolled HP stays within the hit dice range"""
+        creatures = DataLoader().create_monsters(["skeleton"], count=50)
+        template = DataLoader().load_monster_catalog().get_compiled("skeleton")
+        low = max(1, template.hp_count + template.hp_modifier)
+        high = template.hp_count * template.hp_sides + template.hp_modifier
+
+        assert all(low <= c.max_hp <= high for c in creatures)
+
+    def test_create_monsters_is_reproducible(self):
+        """Test that seeded loaders spawn identical HP"""
+        first = DataLoader()
+        second = DataLoader()
+        first.dice_roller.random.seed(42)
+        second.dice_roller.random.seed(42)
+
+        assert ([c.max_hp for c in first.create_monsters(["goblin"], count=20)]
+                == [c.max_hp for c in second.create_monsters(["goblin"], count=20)])
+
+    def test_create_monsters_validates_before_spawning(self):
+        """Test that an unknown ID anywhere in the batch raises KeyError"""
+        with pytest.raises(KeyError):
+            DataLoader().create_monsters(["goblin", "not_a_monster"])
@@ -0,0 +1,121 @@
+# ABOUTME: Unit tests for the persistent LLM narrative cache
+# ABOUTME: Tests keying, persistence across instances, TTL expiry, LRU eviction and statistics
+
+from argparse import Namespace
+
+import pytest
+from dnd_engine.llm.narrative_cache import NarrativeCache
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestNarrativeCache:
+    """Test the NarrativeCache class"""
+
+    def test_key_depends_on_every_part(self):
+        """Test that provider, model, prompt and temperature all change the key"""
+        base = NarrativeCache.make_key("OpenAIProvider", "gpt-4o-mini", "Describe the crypt", 0.7)
+
+        assert base == NarrativeCache.make_key("OpenAIProvider", "gpt-4o-mini", "Describe the crypt", 0.7)
+        assert base != NarrativeCache.make_key("AnthropicProvider", "gpt-4o-mini", "Describe the crypt", 0.7)
+        assert base != NarrativeCache.make_key("OpenAIProvider", "gpt-4o", "Describe the crypt", 0.7)
+        assert base != NarrativeCache.make_key("OpenAIProvider", "gpt-4o-mini", "Describe the hall", 0.7)
+        assert base != NarrativeCache.make_key("OpenAIProvider", "gpt-4o-mini", "Describe the crypt", 0.8)
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that a new session reads narratives written by an earlier one"""
+        path = tmp_path / "cache" / "llm_cache.sqlite3"
+        first = NarrativeCache(path)
+        first.put("crypt", "Bones rattle in the dark.")
+        first.close()
+
+        second = NarrativeCache(path)
+        assert second.get("crypt") == "Bones rattle in the dark."
+        assert len(second) == 1
+        second.close()
+
+    def test_ttl_expiry(self, tmp_path):
+        """Test that entries older than the TTL are misses and get removed"""
+        clock = FakeClock()
+        cache = NarrativeCache(tmp_path / "cache.sqlite3", ttl_seconds=60, clock=clock)
+        cache.put("crypt", "Old text")
+
+        clock.now += 59
+        assert cache.get("crypt") == "Old text"
+
+        clock.now += 1
+        assert cache.get("crypt") is None
+        assert len(cache) == 0
+        assert cache.stats()['expirations'] == 1
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used entry is evicted over the size cap"""
+        clock = FakeClock()
+        cache = NarrativeCache(tmp_path / "cache.sqlite3", max_entries=2, clock=clock)
+        cache.put("a", "A")
+        clock.now += 1
+        cache.put("b", "B")
+        clock.now += 1
+        cache.get("a")  # "b" is now least recently used
+        clock.now += 1
+        cache.put("c", "C")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert cache.get("c") == "C"
+        assert cache.stats()['evictions'] == 1
+
+    def test_stats(self):
+        """Test hit and miss counting"""
+        cache = NarrativeCache(":memory:")
+        cache.put("a", "A")
+        cache.get("a")
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert stats['entries'] == 1
+        assert stats['hits'] == 2
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == pytest.approx(2 / 3)
+
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestNarrativeCacheStartup:
+    """Test that the game starts without the cache when it can't be opened"""
+
+    def test_corrupt_cache_file_is_skipped(self, tmp_path, monkeypatch):
+        """Test that a corrupt cache file disables caching instead of stopping the game"""
+        from dnd_engine import main_v2
+
+        cache_file = tmp_path / "llm_cache.sqlite3"
+        cache_file.write_bytes(b"this is not a sqlite database" * 100)
+        monkeypatch.setattr("dnd_engine.llm.narrative_cache.DEFAULT_CACHE_PATH", cache_file)
+
+        assert main_v2.initialize_narrative_cache(Namespace(no_llm_cache=False)) is None
+
+    def test_unwritable_cache_directory_is_skipped(self, tmp_path, monkeypatch):
+        """Test that a cache path that can't be created disables caching"""
+        from dnd_engine import main_v2
+
+        blocker = tmp_path / "not_a_directory"
+        blocker.write_text("")
+        monkeypatch.setattr("dnd_engine.llm.narrative_cache.DEFAULT_CACHE_PATH", blocker / "llm_cache.sqlite3")
+
+        assert main_v2.initialize_narrative_cache(Namespace(no_llm_cache=False)) is None
+
+    def test_disabled_by_flag(self):
+        """Test that --no-llm-cache skips the cache"""
+        from dnd_engine import main_v2
+
+        assert main_v2.initialize_narrative_cache(Namespace(no_llm_cache=True)) is None
@@ -10,6 +10,7 @@ from dnd_engine.core.game_state import GameState
 from dnd_engine.core.party import Party
 from dnd_engine.core.character import Character, CharacterClass
 from dnd_engine.core.creature import Abilities
+from dnd_engine.rules.item_registry import ItemRegistry
 from dnd_engine.utils.events import EventBus
 
 
@@ -130,6 +131,7 @@ def game_state_multi_char(sample_characters):
                 }
             }
         }
+        mock_loader.load_item_registry.return_value = ItemRegistry(mock_loader.load_items.return_value)
         mock_loader_class.return_value = mock_loader
 
         game_state = GameState(
@@ -0,0 +1,150 @@
+# ABOUTME: Unit tests for the indexed spell catalog
+# ABOUTME: Tests compiled Spell objects, class/level/school indexes, and index-based character spell menus
+
+import pytest
+
+from dnd_engine.core.character import Character, CharacterClass
+from dnd_engine.core.creature import Abilities
+from dnd_engine.core.spell import DurationType, Spell, SpellSchool
+from dnd_engine.rules.loader import DataLoader
+from dnd_engine.rules.spell_catalog import SpellCatalog
+
+
+@pytest.fixture
+def catalog():
+    """Catalog over the SRD spells"""
+    return DataLoader().load_spell_catalog()
+
+
+@pytest.fixture
+def wizard():
+    """Wizard with a mix of combat and utility spells"""
+    known = [
+        "fire_bolt", "light", "mage_hand", "magic_missile", "shield",
+        "detect_magic", "identify", "sleep", "hold_person", "fireball"
+    ]
+    return Character(
+        name="Test Wizard",
+        character_class=CharacterClass.WIZARD,
+        level=5,
+        abilities=Abilities(8, 14, 12, 16, 10, 8),
+        max_hp=25,
+        ac=12,
+        spellcasting_ability="int",
+        known_spells=known,
+        prepared_spells=known[:]
+    )
+
+
+class TestSpellCatalog:
+    """Test the SpellCatalog class"""
+
+    def test_compiles_spells(self, catalog):
+        """Test that definitions are compiled into Spell objects"""
+        fireball = catalog.get_spell("fireball")
+
+        assert isinstance(fireball, Spell)
+        assert fireball.school == SpellSchool.EVOCATION
+        assert fireball.damage.dice == "8d6"
+        assert fireball.saving_throw.ability == "dexterity"
+        assert fireball.components.material
+        assert catalog.get_spell("wish") is None
+
+    def test_behaves_like_spell_dict(self, catalog):
+        """Test that the catalog can stand in for the spells.json dict"""
+        spells = DataLoader().load_spells()
+
+        assert len(catalog) == len(spells)
+        assert set(catalog) == set(spells)
+        assert catalog["light"] is spells["light"]
+        assert catalog.get("wish") is None
+
+    def test_indexes(self, catalog):
+        """Test class, level, school, casting time, ritual, and concentration indexes"""
+        assert "sacred_flame" in catalog.ids_for_class("cleric")
+        assert "sacred_flame" not in catalog.ids_for_class("wizard")
+        assert catalog.ids_for_level(0) == catalog.cantrip_ids
+        assert catalog.ids_for_school("abjuration") >= {"shield", "counterspell"}
+        assert catalog.ids_for_casting_time("1 reaction") == {"shield", "counterspell"}
+        assert catalog.ritual_ids == {"detect_magic", "identify"}
+        assert {"hold_person", "detect_magic"} <= catalog.concentration_ids
+        assert catalog.ids_for_class("bard") == frozenset()
+
+    def test_query_intersects_indexes(self, catalog):
+        """Test combining filters"""
+        assert catalog.query(class_name="wizard", level=1, ritual=True) == {"detect_magic", "identify"}
+        assert "detect_magic" not in catalog.query(class_name="wizard", ritual=False)
+        assert catalog.query(school="evocation", casting_time="1 bonus action") == {"spiritual_weapon"}
+
+    def test_catalog_is_shared(self):
+        """Test that the catalog is built once and reused"""
+        assert DataLoader().load_spell_catalog() is DataLoader().load_spell_catalog()
+
+    def test_minimal_definitions(self):
+        """Test that optional fields fall back to defaults"""
+        catalog = SpellCatalog({
+            "zap": {"name": "Zap", "level": 0, "school": "evocation", "saving_throw_type": "dexterity"}
+        })
+        zap = catalog.get_spell("zap")
+
+        assert zap.duration == DurationType.INSTANTANEOUS
+        assert zap.saving_throw.ability == "dexterity"
+        assert catalog.combat_ids == {"zap"}
+
+
+    def test_malformed_definitions_stay_in_menus(self, caplog):
+        """Test that entries without a valid school don't break the catalog"""
+        catalog = SpellCatalog({
+            "zap": {"name": "Zap", "level": 0, "classes": ["wizard"], "attack_type": "ranged"},
+            "fizzle": {"name": "Fizzle", "level": 1, "school": "chronomancy", "classes": ["wizard"]},
+            "light": {"name": "Light", "level": 0, "school": "evocation", "classes": ["wizard"]}
+        })
+
+        assert catalog.get_spell("zap") is None
+        assert catalog.get_spell("fizzle") is None
+        assert catalog.get_spell("light").name == "Light"
+        assert "zap" in catalog.combat_ids
+        assert catalog.cantrip_ids == {"zap", "light"}
+        assert catalog.ids_for_class("wizard") == {"zap", "fizzle", "light"}
+        assert catalog.sort_key("fizzle") == (1, "Fizzle")
+        assert "could not be compiled" in caplog.text
+
+class TestCharacterSpellQueries:
+    """Test that catalog-backed spell menus match the dictionary scans"""
+
+    def test_castable_spells_match_dict(self, wizard, catalog):
+        """Test combat spell menu"""
+        from_catalog = wizard.get_castable_spells(catalog)
+        from_dict = wizard.get_castable_spells(DataLoader().load_spells())
+
+        assert from_catalog == from_dict
+        assert [spell_id for spell_id, _ in from_catalog] == [
+            "fire_bolt", "magic_missile", "shield", "fireball"
+        ]
+
+    def test_save_only_spells_are_not_castable(self, wizard, catalog):
+        """Test that spells with a saving throw but no damage stay out of the combat menu"""
+        castable = [spell_id for spell_id, _ in wizard.get_castable_spells(catalog)]
+        assert "hold_person" not in castable
+        assert "hold_person" not in catalog.combat_ids
+
+    def test_out_of_combat_spells_match_dict(self, wizard, catalog):
+        """Test exploration spell menu"""
+        from_catalog = wizard.get_out_of_combat_spells(catalog)
+
+        assert from_catalog == wizard.get_out_of_combat_spells(DataLoader().load_spells())
+        assert "fire_bolt" not in [spell_id for spell_id, _ in from_catalog]
+        assert "identify" in [spell_id for spell_id, _ in from_catalog]
+
+    def test_preparable_spells_match_dict(self, wizard, catalog):
+        """Test preparation menu"""
+        cantrips, leveled = wizard.get_preparable_spells(catalog)
+
+        assert (cantrips, leveled) == wizard.get_preparable_spells(DataLoader().load_spells())
+        assert cantrips == ["fire_bolt", "light", "mage_hand"]
+        assert [spell_id for spell_id, _ in leveled][:2] == ["detect_magic", "identify"]
+
+    def test_unknown_spells_are_skipped(self, wizard, catalog):
+        """Test that IDs missing from the catalog are ignored"""
+        wizard.prepared_spells.append("not_a_spell")
+        assert "not_a_spell" not in [spell_id for spell_id, _ in wizard.get_castable_spells(catalog)]
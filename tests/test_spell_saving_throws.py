@@ -1,12 +1,15 @@
 # ABOUTME: Unit tests for spell saving throw mechanics
 # ABOUTME: Tests spell save DC, save resolution, damage calculation, and upcasting
 
+from unittest.mock import patch
+
 import pytest
 from dnd_engine.core.character import Character, CharacterClass
 from dnd_engine.core.creature import Creature, Abilities
 from dnd_engine.core.combat import CombatEngine
 from dnd_engine.core.dice import DiceRoller
 from dnd_engine.core.spell import Spell, SpellDamage, SavingThrow, SpellSchool, CastingTime, SpellComponents, DurationType
+from dnd_engine.rules.loader import DataLoader
 from dnd_engine.utils.events import EventBus, EventType
 
 
@@ -580,3 +583,129 @@ class TestErrorHandling:
                 targets=[self.goblin],
                 spell=spell
             )
+
+
+class TestBatchedSpellSaves:
+    """Test resolving area spells against many targets in one batch"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.wizard = Character(
+            name="Wizard",
+            character_class=CharacterClass.WIZARD,
+            level=5,
+            abilities=Abilities(8, 14, 12, 18, 10, 10),  # DC 15
+            max_hp=30,
+            ac=12,
+            spellcasting_ability="int"
+        )
+        self.fireball = {
+            "id": "fireball",
+            "name": "Fireball",
+            "level": 3,
+            "damage": {"dice": "8d6", "damage_type": "fire"},
+            "saving_throw": {"ability": "dexterity", "on_success": "half"}
+        }
+        self.combat = CombatEngine(DiceRoller(seed=5))
+        self.event_bus = EventBus()
+
+    def test_single_aggregated_event(self):
+        """Test that a crowd of targets produces one SPELL_SAVE event and no per-target events"""
+        squad = DataLoader().create_squad("goblin", 40)
+        events = []
+        self.event_bus.subscribe(EventType.SPELL_SAVE, events.append)
+        self.event_bus.subscribe(EventType.SAVING_THROW, events.append)
+
+        result = self.combat.resolve_spell_save(
+            caster=self.wizard,
+            targets=squad.members + [self.wizard],
+            spell=self.fireball,
+            event_bus=self.event_bus
+        )
+
+        assert [event.type for event in events] == [EventType.SPELL_SAVE]
+        data = events[0].data
+        assert len(data["targets"]) == 41
+        assert data["successes"] + data["failures"] == 41
+        assert data["successes"] == sum(1 for target in result["targets"] if target["success"])
+        assert data["total_damage"] == sum(target["damage"] for target in result["targets"])
+
+    def test_per_target_results(self):
+        """Test save math and damage for every target"""
+        squad = DataLoader().create_squad("goblin", 20)
+
+        result = self.combat.resolve_spell_save(
+            caster=self.wizard,
+            targets=squad.members,
+            spell=self.fireball
+        )
+
+        full = max(target["damage"] for target in result["targets"])
+        for target in result["targets"]:
+            assert target["modifier"] == 2
+            assert target["total"] == target["roll"] + 2
+            assert target["success"] == (target["total"] >= 15)
+            assert target["damage"] == (full // 2 if target["success"] else full)
+
+    def test_damage_applied_to_squads_and_creatures(self):
+        """Test that squad members and individual creatures both take damage"""
+        squad = DataLoader().create_squad("goblin", 10)
+        ogre = Creature("Ogre", 59, 11, Abilities(19, 8, 16, 5, 7, 7))
+        hp_before = list(squad.hp)
+
+        result = self.combat.resolve_spell_save(
+            caster=self.wizard,
+            targets=squad.members + [ogre],
+            spell=self.fireball,
+            apply_damage=True
+        )
+
+        for index, target in enumerate(result["targets"][:10]):
+            assert squad.hp[index] == max(0, hp_before[index] - target["damage"])
+        assert ogre.current_hp == 59 - result["targets"][10]["damage"]
+
+    def test_character_save_proficiency(self):
+        """Test that characters use their saving throw modifier"""
+        rogue = Character(
+            name="Rogue",
+            character_class=CharacterClass.ROGUE,
+            level=5,
+            abilities=Abilities(10, 16, 12, 10, 10, 10),
+            max_hp=30,
+            ac=14,
+            saving_throw_proficiencies=["dex", "int"]
+        )
+
+        result = self.combat.resolve_spell_save(caster=self.wizard, targets=[rogue], spell=self.fireball)
+
+        assert result["targets"][0]["modifier"] == rogue.get_saving_throw_modifier("dex")
+
+    def test_seeded_results_are_reproducible(self):
+        """Test that the engine's seed fixes every save"""
+        targets = DataLoader().create_squad("goblin", 15).members
+
+        first = self.combat.resolve_spell_save(caster=self.wizard, targets=targets, spell=self.fireball)
+        self.combat.dice_roller = DiceRoller(seed=5)
+        again = self.combat.resolve_spell_save(caster=self.wizard, targets=targets, spell=self.fireball)
+
+        assert first == again
+
+    def test_conditions_set_each_targets_roll_mode(self):
+        """Test that restrained targets roll Dexterity saves with disadvantage and paralyzed ones auto-fail"""
+        squad = DataLoader().create_squad("goblin", 6)
+        squad.members[1].add_condition("restrained")
+        squad.members[2].add_condition("paralyzed")
+        roller = self.combat.dice_roller
+
+        with patch.object(roller, "roll_many", wraps=roller.roll_many) as roll_many:
+            result = self.combat.resolve_spell_save(
+                caster=self.wizard,
+                targets=squad.members,
+                spell=self.fireball
+            )
+
+        modes = sorted(
+            (call.kwargs["disadvantage"], call.args[1]) for call in roll_many.call_args_list
+        )
+        assert modes == [(False, 5), (True, 1)]
+        assert not result["targets"][2]["success"]
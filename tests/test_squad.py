@@ -0,0 +1,238 @@
+# ABOUTME: Unit tests for array-backed monster squads
+# ABOUTME: Tests member views, column-wise saves/damage/conditions, squad spawning, and squads in combat
+
+from unittest.mock import Mock
+
+import pytest
+
+from dnd_engine.core.character import Character, CharacterClass
+from dnd_engine.core.creature import Abilities, Creature
+from dnd_engine.core.dice import DiceRoller
+from dnd_engine.core.game_state import GameState
+from dnd_engine.core.party import Party
+from dnd_engine.core.squad import MonsterSquad, SquadMember
+from dnd_engine.rules.loader import DataLoader
+from dnd_engine.systems.initiative import InitiativeTracker
+
+
+@pytest.fixture
+def squad():
+    """Five goblins with known HP"""
+    squad = MonsterSquad(
+        name="Goblin",
+        ac=15,
+        abilities=Abilities(8, 14, 10, 10, 8, 8),
+        hit_points=[7, 6, 5, 7, 4],
+        monster_id="goblin"
+    )
+    squad._dice_roller = DiceRoller(seed=11)
+    return squad
+
+
+class TestSquadMember:
+    """Test members behaving like individual creatures"""
+
+    def test_member_is_a_creature(self, squad):
+        """Test stat block and HP reads"""
+        goblin = squad.members[2]
+
+        assert isinstance(goblin, Creature)
+        assert goblin.name == "Goblin"
+        assert goblin.ac == 15
+        assert goblin.max_hp == 5
+        assert goblin.current_hp == 5
+        assert goblin.initiative_modifier == 2
+        assert goblin.abilities is squad.members[0].abilities
+
+    def test_damage_and_healing_write_the_column(self, squad):
+        """Test that Creature HP methods update the squad"""
+        goblin = squad.members[0]
+
+        goblin.take_damage(3)
+        assert squad.hp[0] == 4
+        goblin.heal(10)
+        assert goblin.current_hp == 7
+        goblin.take_damage(20)
+        assert not goblin.is_alive
+        assert squad.members[1].is_alive
+        assert squad.living_members() == squad.members[1:]
+
+    def test_conditions(self, squad):
+        """Test condition add/remove and in-place metadata updates"""
+        goblin = squad.members[1]
+
+        goblin.add_condition("Prone")
+        goblin.apply_condition_with_metadata("frightened", duration_type="rounds", duration=1)
+
+        assert goblin.has_condition("prone")
+        assert goblin.conditions == {"prone", "frightened"}
+        assert not squad.members[0].has_condition("prone")
+
+        results = goblin.process_end_of_turn_conditions()
+        assert results == [{"type": "duration_expired", "condition": "frightened"}]
+        assert list(goblin.active_conditions) == ["prone"]
+
+        goblin.remove_condition("prone")
+        assert goblin.conditions == set()
+
+    def test_member_saving_throw_uses_squad_roller(self, squad):
+        """Test that seeding the squad seeds its members' saves"""
+        first = squad.members[0].make_saving_throw("dex", 12)
+        squad._dice_roller = DiceRoller(seed=11)
+        again = squad.members[0].make_saving_throw("dex", 12)
+
+        assert first == again
+        assert first["modifier"] == 2
+
+
+class TestSquadColumns:
+    """Test whole-squad operations"""
+
+    def test_save_many(self, squad):
+        """Test batch saving throws for the living members"""
+        squad.members[3].take_damage(7)
+
+        saves = squad.save_many("dexterity", 13)
+
+        assert list(saves.members) == [0, 1, 2, 4]
+        assert list(saves.totals) == [roll + 2 for roll in saves.rolls]
+        assert list(saves.successes) == [total >= 13 for total in saves.totals]
+        assert saves.ability == "dex"
+        assert 0 <= saves.success_count <= 4
+
+    def test_save_many_is_reproducible(self, squad):
+        """Test that a seeded squad rolls the same saves"""
+        first = squad.save_many("con", 10)
+        squad._dice_roller = DiceRoller(seed=11)
+
+        assert list(squad.save_many("con", 10).rolls) == list(first.rolls)
+
+    def test_save_many_applies_conditions(self, squad):
+        """Test that restrained members roll with disadvantage and paralyzed members fail"""
+        squad.add_condition_many("restrained", [1])
+        squad.add_condition_many("paralyzed", [2])
+        roller = squad._dice_roller
+        roller.roll_many = Mock(wraps=roller.roll_many)
+
+        saves = squad.save_many("dex", 1)
+
+        modes = sorted((call.kwargs["disadvantage"], call.args[1]) for call in roller.roll_many.call_args_list)
+        assert modes == [(False, 4), (True, 1)]
+        assert list(saves.successes) == [True, True, False, True, True]
+
+    def test_damage_many(self, squad):
+        """Test per-member and uniform damage"""
+        squad.damage_many([0, 1, 4], [3, 10, 1])
+        assert [m.current_hp for m in squad] == [4, 0, 5, 7, 3]
+
+        squad.damage_many([2, 3], 5)
+        assert [m.current_hp for m in squad] == [4, 0, 0, 2, 3]
+
+    def test_add_condition_many(self, squad):
+        """Test giving a condition to several members at once"""
+        squad.add_condition_many("Poisoned", [0, 2, 3])
+
+        assert squad.count_with_condition("poisoned") == 3
+        assert squad.members[2].has_condition("poisoned")
+        assert not squad.members[1].has_condition("poisoned")
+        assert squad.count_with_condition("stunned") == 0
+
+    def test_invalid_ability(self, squad):
+        """Test that an unknown ability is rejected"""
+        with pytest.raises(ValueError):
+            squad.save_many("luck", 10)
+
+
+class TestSquadSpawning:
+    """Test spawning squads from monster templates"""
+
+    def test_create_squad(self):
+        """Test a squad built from the SRD"""
+        loader = DataLoader()
+        squad = loader.create_squad("goblin", 30)
+
+        assert len(squad) == 30
+        assert squad.monster_id == "goblin"
+        assert squad.action_table is loader.load_monster_catalog().get_action_table("goblin")
+        assert all(1 <= member.max_hp <= 12 for member in squad)
+
+    def test_threshold_groups_identical_monsters(self):
+        """Test that only monsters reaching the threshold become squads"""
+        creatures = DataLoader().create_monsters(
+            ["goblin", "wolf", "goblin", "goblin"], squad_threshold=3
+        )
+
+        assert [c.name for c in creatures] == ["Goblin", "Wolf", "Goblin", "Goblin"]
+        assert isinstance(creatures[0], SquadMember)
+        assert not isinstance(creatures[1], SquadMember)
+        assert creatures[0].squad is creatures[3].squad
+        assert [creatures[i].index for i in (0, 2, 3)] == [0, 1, 2]
+
+    def test_squad_initiative_is_batch_rolled(self):
+        """Test that the tracker rolls a squad's initiative in one batch"""
+        squad = DataLoader().create_squad("goblin", 12)
+        tracker = InitiativeTracker(DiceRoller(seed=4))
+
+        entries = tracker.add_combatants(squad.members)
+
+        assert [entry.initiative_roll for entry in entries] == list(squad.initiative)
+        assert all(1 <= roll <= 20 for roll in squad.initiative)
+
+
+class TestSquadsInCombat:
+    """Test squad members as combat targets"""
+
+    @pytest.fixture
+    def game_state(self):
+        """A fighter against a squad of goblins"""
+        fighter = Character(
+            name="Aragorn",
+            character_class=CharacterClass.FIGHTER,
+            level=1,
+            abilities=Abilities(16, 12, 14, 10, 10, 10),
+            max_hp=12,
+            ac=16
+        )
+        state = GameState(Party([fighter]), "test_dungeon", dice_roller=DiceRoller(seed=3))
+        state.active_enemies = state.data_loader.create_monsters(["goblin"], count=6, squad_threshold=2)
+        state._start_combat()
+        return state
+
+    def test_targeting_by_number_and_name(self, game_state):
+        """Test that the CLI numbers and finds squad members like creatures"""
+        from dnd_engine.ui.cli import CLI
+
+        cli = CLI(game_state, Mock(), "test_campaign", auto_save_enabled=False)
+        cli._assign_enemy_numbers()
+
+        assert cli._find_enemy_by_target("3") is game_state.active_enemies[2]
+        assert cli._find_enemy_by_target("goblin 5") is game_state.active_enemies[4]
+        assert cli._find_enemy_by_target("goblin") is None  # ambiguous
+
+        for goblin in game_state.active_enemies[1:]:
+            goblin.take_damage(goblin.max_hp)
+        assert cli._find_enemy_by_target("goblin") is game_state.active_enemies[0]
+
+    def test_attacks_damage_the_squad(self, game_state):
+        """Test resolving a real attack against a squad member"""
+        goblin = game_state.active_enemies[1]
+        squad = goblin.squad
+
+        result = game_state.combat_engine.resolve_attack(
+            attacker=game_state.party.characters[0],
+            defender=goblin,
+            attack_bonus=30,
+            damage_dice="1d8+3",
+            apply_damage=True
+        )
+
+        assert result.hit
+        assert squad.hp[1] == max(0, squad.max_hp[1] - result.damage)
+        assert [squad.hp[i] for i in (0, 2)] == [squad.max_hp[0], squad.max_hp[2]]
+
+    def test_members_take_enemy_turns(self, game_state):
+        """Test that a squad member attacks with the shared action table"""
+        turn = game_state.take_enemy_turn(game_state.active_enemies[0])
+
+        assert [attack.attack.name for attack in turn.attacks] == ["Scimitar"]
+        assert turn.attacks[0].target is game_state.party.characters[0]
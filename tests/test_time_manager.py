@@ -437,6 +437,87 @@ class TestTimeManager:
         assert len(tm.active_effects) == 0
 
 
+class TestEffectScheduler:
+    """Test heap-based expiry scheduling."""
+
+    @staticmethod
+    def make_effect(source, minutes, target="Target", caster=None, concentration=False):
+        return ActiveEffect(
+            effect_type=EffectType.SPELL,
+            source=source,
+            duration_minutes=minutes,
+            remaining_minutes=minutes,
+            target_name=target,
+            concentration=concentration,
+            caster_name=caster
+        )
+
+    def test_expiry_order(self):
+        """Test that effects expiring in one advance come back in expiry order."""
+        tm = TimeManager()
+        for source, minutes in [("Long", 30.0), ("Short", 1.0), ("Medium", 10.0), ("Forever", 1440.0)]:
+            tm.add_effect(self.make_effect(source, minutes))
+
+        expired = tm.advance_time(480.0, reason="long_rest")
+
+        assert [effect.source for effect in expired] == ["Short", "Medium", "Long"]
+        assert [effect.source for effect in tm.active_effects] == ["Forever"]
+        assert tm.active_effects[0].remaining_minutes == 960.0
+
+    def test_removed_effect_does_not_expire(self):
+        """Test that stale heap entries are skipped."""
+        tm = TimeManager()
+        effect = self.make_effect("Bless", 1.0)
+        tm.add_effect(effect)
+        tm.remove_effect("Target", "Bless")
+
+        assert tm.advance_time(5.0) == []
+        assert effect.remaining_minutes == 1.0  # Frozen when removed
+
+    def test_refreshed_effect_expires_once(self):
+        """Test recasting reschedules instead of expiring the old cast."""
+        tm = TimeManager()
+        tm.add_effect(self.make_effect("Light", 60.0))
+        tm.advance_time(50.0)
+        refreshed = self.make_effect("Light", 60.0)
+        tm.add_effect(refreshed)
+
+        assert tm.advance_time(20.0) == []
+        assert tm.advance_time(40.0) == [refreshed]
+
+    def test_changing_remaining_time_reschedules(self):
+        """Test that setting remaining_minutes on a tracked effect moves its expiry."""
+        tm = TimeManager()
+        effect = self.make_effect("Haste", 10.0)
+        tm.add_effect(effect)
+
+        effect.remaining_minutes = 2.0
+        assert tm.advance_time(2.0) == [effect]
+
+    def test_target_and_caster_indexes(self):
+        """Test per-target lookup and per-caster concentration removal."""
+        tm = TimeManager()
+        haste = self.make_effect("Haste", 10.0, target="Fighter", caster="Wizard", concentration=True)
+        bless = self.make_effect("Bless", 10.0, target="Fighter", caster="Cleric", concentration=True)
+        armor = self.make_effect("Mage Armor", 480.0, target="Wizard", caster="Wizard")
+        for effect in (haste, bless, armor):
+            tm.add_effect(effect)
+
+        assert tm.get_effects_for_character("Fighter") == [haste, bless]
+        assert tm.remove_concentration_effects("Wizard") == [haste]
+        assert tm.get_effects_for_character("Fighter") == [bless]
+        assert tm.get_effects_for_character("Wizard") == [armor]
+
+    def test_many_effects_compact_heap(self):
+        """Test that repeated recasting doesn't grow the heap without bound."""
+        tm = TimeManager()
+        for _ in range(1000):
+            tm.add_effect(self.make_effect("Light", 60.0))
+
+        assert len(tm.active_effects) == 1
+        assert len(tm._expiry_heap) <= 2 * len(tm.active_effects) + 65
+
+
 class TestTimeManagerEvents:
     """Test TimeManager event emission."""
 
@@ -557,3 +638,75 @@ class TestTimeManagerEvents:
         assert len(events_received) == 1
         assert events_received[0].type == EventType.EFFECT_EXPIRED
         assert events_received[0].data["reason"] == "concentration_broken"
+
+
+class TestBulkAdvancement:
+    """Test coalesced time advancement."""
+
+    @staticmethod
+    def make_manager():
+        event_bus = EventBus()
+        tm = TimeManager(event_bus=event_bus)
+        for source, minutes in [("Light", 60.0), ("Mage Armor", 480.0), ("Aid", 600.0)]:
+            tm.add_effect(ActiveEffect(
+                effect_type=EffectType.SPELL,
+                source=source,
+                duration_minutes=minutes,
+                remaining_minutes=minutes,
+                target_name="Wizard"
+            ))
+        return tm, event_bus
+
+    def test_fast_forward_summary(self):
+        """Test that a multi-day rest produces one summary event."""
+        tm, event_bus = self.make_manager()
+        summaries = []
+        event_bus.subscribe(EventType.TIME_SUMMARY, summaries.append)
+
+        expired = tm.fast_forward(3 * 24 * 60, reason="downtime")
+
+        assert [effect.source for effect in expired] == ["Light", "Mage Armor", "Aid"]
+        assert len(summaries) == 1
+        data = summaries[0].data
+        assert data["reason"] == "downtime"
+        assert data["minutes"] == 3 * 24 * 60
+        assert data["hours"] == 72
+        assert [e["source"] for e in data["expired_effects"]] == ["Light", "Mage Armor", "Aid"]
+
+    def test_batch_coalesces_advances(self):
+        """Test that many small advances in a batch are summarized together."""
+        tm, event_bus = self.make_manager()
+        summaries = []
+        event_bus.subscribe(EventType.TIME_SUMMARY, summaries.append)
+
+        with tm.batch(reason="travel") as batch:
+            for _ in range(10):
+                tm.advance_time(60.0, reason="travel_hour")
+            with tm.batch(reason="nested"):
+                tm.advance_time(30.0)
+
+        assert batch.advances == 11
+        assert len(summaries) == 1
+        assert summaries[0].data["hours"] == 10
+        assert summaries[0].data["elapsed_minutes"] == 630.0
+        assert len(summaries[0].data["expired_effects"]) == 3
+
+    def test_detailed_subscribers_still_notified(self):
+        """Test that subscribers to detailed events keep receiving them in a batch."""
+        tm, event_bus = self.make_manager()
+        expired_events = []
+        event_bus.subscribe(EventType.EFFECT_EXPIRED, expired_events.append)
+
+        tm.fast_forward(480.0, reason="long_rest")
+
+        assert [event.data["source"] for event in expired_events] == ["Light", "Mage Armor"]
+
+    def test_advance_time_outside_batch_is_detailed(self):
+        """Test that plain advance_time emits no summary."""
+        tm, event_bus = self.make_manager()
+        summaries = []
+        event_bus.subscribe(EventType.TIME_SUMMARY, summaries.append)
+
+        tm.advance_time(60.0)
+
+        assert summaries == []